@@ -1,21 +1,87 @@
+import asyncio
+import os
 import uuid
-from datetime import date
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from contextlib import asynccontextmanager
+from datetime import date, timedelta
+from fastapi import FastAPI, Header, HTTPException, Request, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel, Field
 from fastapi.middleware.cors import CORSMiddleware
 
 # src 폴더의 모듈들을 가져옵니다.
 from src.models.user import User, UserRole
 from src.models.caravan import Caravan, CaravanStatus
+from src.models.geo import BoundingBox, GeoArea, GeoCircle
 from src.repositories.user_repository import UserRepository
 from src.repositories.caravan_repository import CaravanRepository
 from src.repositories.reservation_repository import ReservationRepository
-from src.services.reservation_validator import ReservationValidator
-from src.services.reservation_service import ReservationService
-from src.exceptions.reservation import ReservationError
+from src.repositories.blocking_executor import BlockingExecutor
+from src.repositories.async_repositories import AsyncUserRepository, AsyncReservationRepository
+from src.repositories.columnar_store import ColumnarReservationStore
+from src.repositories.availability_calendar import AvailabilityCalendar
+from src.repositories.user_reservation_index import UserReservationIndex
+from src.repositories.review_repository import ReviewRepository
+from src.repositories.rating_index import RatingIndex
+from src.repositories.search_index import CaravanSearchIndex
+from src.repositories.nightly_occupancy import NightlyOccupancy
+from src.services.reservation_validator import ReservationValidator, MAX_STAY_NIGHTS
+from src.services.reservation_service import ReservationService, BookingRequest, BulkMode
+from src.services.async_reservation_service import AsyncReservationService
+from src.services.availability_service import AvailabilityService
+from src.services.caravan_listing_service import CaravanListingService, CaravanQuery
+from src.services.reporting_service import ReportingService
+from src.services.reservation_listing_service import ReservationListingService
+from src.services.reservation_sweeper import ReservationSweeper
+from src.services.review_service import ReviewService
+from src.services.search_service import SearchService, SearchQuery
+from src.services.serialization import dumps
+from src.services.bulk_transfer import BulkImporter, ENTITIES, FORMATS, export_records
+from src.services.metrics import MetricsRegistry
+from src.services.profiler import RequestProfiler
+from src.services.request_metrics import RequestMetricsMiddleware
+from src.services.startup import Startup, ReadinessGate
+from src.exceptions.reservation import ReservationError, InvalidStatusTransitionError, IdempotencyKeyMismatchError
+from src.exceptions.review import ReviewNotAllowedError, DuplicateReviewError
+from owner import create_pricing_engine, create_payment_service, seed_data, owner_authkey
 
 # --- FastAPI 애플리케이션 설정 ---
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    구성요소 생성과 데이터 적재는 백그라운드 스레드에서 진행하므로, 서버는 바로 연결을 받고
+    상태 확인(`/health/live`, `/health/ready`)에 응답합니다. 준비가 끝나기 전의 API 요청은 503을 받습니다.
+    준비가 끝나면 종료된 예약을 주기적으로 완료 처리하고, 결제를 백그라운드에서 정산합니다.
+    이벤트 로그를 사용하는 경우 종료 시 스냅샷을 남겨 다음 시작을 빠르게 합니다.
+    """
+    starting = asyncio.create_task(start_dependencies())
+    yield
+    # 적재 중인 스레드는 중단할 수 없으므로 끝날 때까지 기다린 뒤 정리합니다.
+    await starting
+    if not startup.ready:
+        return
+    await sweeper.stop()
+    if payment_service is not None:
+        await payment_service.stop()
+    if journal is not None:
+        journal.snapshot()
+        journal.close()
+
+async def start_dependencies():
+    """구성요소를 적재하고, 준비되면 백그라운드 작업을 시작합니다."""
+    await startup.start()
+    if startup.ready:
+        sweeper.start()
+        if payment_service is not None:
+            payment_service.start()
+
+app = FastAPI(lifespan=lifespan)
+
+# --- 지표와 프로파일러 ---
+# CARAVANSHARE_METRICS=0이면 지표를 기록하지 않으며, 이때 계측한 메서드의 추가 비용은 플래그 확인 한 번입니다.
+metrics = MetricsRegistry(enabled=os.environ.get("CARAVANSHARE_METRICS", "1") != "0")
+# CARAVANSHARE_PROFILE이 설정되면 X-Profile: 1 헤더가 있는 요청과, 지정한 비율만큼의 요청을 샘플링 프로파일링합니다.
+profile_rate = os.environ.get("CARAVANSHARE_PROFILE")
+request_profiler = RequestProfiler(float(profile_rate)) if profile_rate is not None else None
 
 # --- CORS 미들웨어 설정 ---
 # 프론트엔드 (React) 애플리케이션이 3000번 포트에서 실행될 것이므로, 해당 주소에서의 요청을 허용합니다.
@@ -34,41 +100,173 @@ app.add_middleware(
 # --- 의존성 설정 ---
 def setup_dependencies():
     """애플리케이션 실행에 필요한 모든 구성요소를 생성하고 연결합니다."""
-    user_repo = UserRepository()
-    caravan_repo = CaravanRepository()
-    reservation_repo = ReservationRepository()
-    validator = ReservationValidator(reservation_repo)
-    reservation_service = ReservationService(
-        reservation_repo, caravan_repo, user_repo, validator
+    db_path = os.environ.get("CARAVANSHARE_DB")
+    if db_path:
+        # 데이터베이스 파일이 지정되면 재시작 후에도 상태가 유지되는 SQLite 리포지토리를 사용합니다.
+        from src.repositories.sqlite.connection_pool import SQLiteConnectionPool
+        from src.repositories.sqlite.user_repository import SQLiteUserRepository
+        from src.repositories.sqlite.caravan_repository import SQLiteCaravanRepository
+        from src.repositories.sqlite.reservation_repository import SQLiteReservationRepository
+
+        pool = SQLiteConnectionPool(db_path)
+        user_repo = SQLiteUserRepository(pool)
+        caravan_repo = SQLiteCaravanRepository(pool)
+        reservation_repo = SQLiteReservationRepository(pool)
+    else:
+        user_repo = UserRepository()
+        caravan_repo = CaravanRepository()
+        reservation_repo = ReservationRepository()
+    journal = None
+    feed = None
+    owner_address = os.environ.get("CARAVANSHARE_OWNER")
+    data_dir = os.environ.get("CARAVANSHARE_DATA_DIR")
+    if owner_address:
+        # 다중 워커 모드: 쓰기는 소유자 프로세스(owner.py)가 처리하고,
+        # 이 워커는 소유자가 보내는 변경 이벤트로 유지되는 복제본에서 읽습니다.
+        from src.repositories.replication import ReplicaFeed
+
+        user_repo = UserRepository()
+        caravan_repo = CaravanRepository()
+        reservation_repo = ReservationRepository()
+        authkey = owner_authkey(owner_address)
+        feed = ReplicaFeed(owner_address, user_repo, caravan_repo, reservation_repo, authkey)
+        feed.connect()
+    elif data_dir and not db_path:
+        # 인메모리 리포지토리의 모든 변경을 이벤트 로그에 기록하고, 주기적으로 스냅샷을 남깁니다.
+        # 재시작 시 최신 스냅샷을 읽고 그 이후의 로그만 재생합니다.
+        from src.repositories.durable.journal import Journal
+
+        journal = Journal(data_dir, user_repo, caravan_repo, reservation_repo, snapshot_interval=600)
+        journal.recover()
+    # 서비스·검증기·리포지토리의 핫 경로 메서드마다 실행 시간과 예외 종류별 횟수를 기록합니다.
+    metrics.instrument(user_repo, "user_repository", ["get_by_id"])
+    metrics.instrument(caravan_repo, "caravan_repository", ["get_by_id"])
+    metrics.instrument(reservation_repo, "reservation_repository", ["add", "add_many", "find_conflict", "update_status"])
+    pricing_engine = create_pricing_engine()
+    if feed is not None:
+        from src.services.remote_reservation_service import RemoteReservationService
+
+        reservation_service = RemoteReservationService(owner_address, feed, authkey)
+    else:
+        validator = ReservationValidator(reservation_repo)
+        metrics.instrument(validator, "reservation_validator", [
+            "_validate_dates", "_validate_caravan_status", "_validate_booking_conflict",
+        ])
+        reservation_service = ReservationService(
+            reservation_repo, caravan_repo, user_repo, validator, pricing_engine
+        )
+    metrics.instrument(reservation_service, "reservation_service", [
+        "create_reservation", "create_reservations_bulk", "approve_reservation", "reject_reservation",
+        "cancel_reservation", "complete_reservation", "complete_past_reservations",
+    ])
+    availability_service = AvailabilityService(caravan_repo, reservation_repo)
+    # 리뷰가 추가될 때마다 카라반·호스트별 평점 요약(개수, 합계, 분포)을 갱신해 두므로
+    # 목록의 평균 평점 표시와 평점순 정렬이 리뷰를 다시 읽지 않습니다.
+    # 리뷰는 아직 이 프로세스 메모리에만 보관되므로 다중 워커 모드에서는 제공하지 않습니다.
+    review_repo = None
+    ratings = None
+    review_service = None
+    if feed is None:
+        review_repo = ReviewRepository()
+        ratings = RatingIndex(caravan_repo)
+        ratings.load(review_repo.get_all())
+        review_repo.subscribe(ratings)
+        review_service = ReviewService(review_repo, reservation_repo, ratings)
+    # 평점순 목록을 위해 카라반을 평점 순서로 유지하며, 리뷰가 추가되면 해당 카라반의 위치만 옮깁니다.
+    # 평점은 RatingIndex가 갱신된 뒤에 읽어야 하므로 그 다음에 구독합니다.
+    listing_service = CaravanListingService(caravan_repo, ratings=ratings)
+    if ratings is not None:
+        listing_service.load(caravan_repo.get_all())
+        caravan_repo.subscribe(listing_service)
+        review_repo.subscribe(listing_service)
+    # 검색 인덱스는 가격·평점 점수 순으로 카라반을 정렬해 두고, 검색은 상위 k개만 힙으로 고릅니다.
+    # 평점은 RatingIndex가 갱신된 뒤에 읽어야 하므로 그 다음에 구독합니다.
+    search_index = CaravanSearchIndex(ratings)
+    search_index.load(caravan_repo.get_all())
+    caravan_repo.subscribe(search_index)
+    if review_repo is not None:
+        review_repo.subscribe(search_index)
+    # 날짜가 있는 검색은 밤마다 예약된 카라반을 비트셋으로 모아 둔 인덱스에서 예약 여부를 읽습니다.
+    occupancy = NightlyOccupancy(search_index)
+    occupancy.load(reservation_repo.get_all())
+    reservation_repo.subscribe(occupancy)
+    search_service = SearchService(reservation_repo, search_index, occupancy=occupancy)
+    # 리포트용 컬럼형 저장소는 기존 예약을 적재한 뒤 이후 변경을 구독합니다.
+    report_store = ColumnarReservationStore()
+    report_store.load(reservation_repo.get_all())
+    reservation_repo.subscribe(report_store)
+    reporting_service = ReportingService(report_store, caravan_repo)
+    # 예약 달력도 같은 방식으로 예약 변경을 구독합니다.
+    availability_calendar = AvailabilityCalendar()
+    availability_calendar.load(reservation_repo.get_all())
+    reservation_repo.subscribe(availability_calendar)
+    # 사용자(게스트/호스트)별 예약 목록 인덱스
+    user_reservation_index = UserReservationIndex(caravan_repo)
+    user_reservation_index.load(reservation_repo.get_all())
+    reservation_repo.subscribe(user_reservation_index)
+    reservation_listing_service = ReservationListingService(user_reservation_index)
+    # 결제는 예약 요청 경로를 막지 않도록 큐에 넣고 백그라운드에서 묶어서 정산합니다.
+    # 다중 워커 모드에서는 소유자 프로세스가 결제를 처리합니다.
+    payment_service = None
+    if feed is None:
+        payment_service = create_payment_service()
+        reservation_repo.subscribe(payment_service)
+    # 핸들러는 이벤트 루프에서 실행되므로, 블로킹 I/O가 있는 호출(SQLite, 소유자 프로세스)만 스레드로 넘깁니다.
+    executor = BlockingExecutor(offload=bool(db_path or feed))
+    async_user_repo = AsyncUserRepository(user_repo, executor)
+    async_reservation_service = AsyncReservationService(
+        reservation_service, AsyncReservationRepository(reservation_repo, executor), executor
     )
+    sweeper = ReservationSweeper(async_reservation_service)
+    # 대량 가져오기는 묶음 단위로 검증·저장합니다. 다중 워커 모드의 쓰기는 소유자 프로세스만 하므로 제공하지 않습니다.
+    bulk_importer = BulkImporter(user_repo, caravan_repo, reservation_repo) if feed is None else None
     
-    # 초기 데이터 생성
-    if not user_repo.get_all():
-        host = User(name="Host Alice", contact="host@example.com", role=UserRole.HOST)
-        guest = User(name="Guest Bob", contact="guest@example.com", role=UserRole.GUEST)
-        user_repo.add(host)
-        user_repo.add(guest)
-
-        caravan1 = Caravan(
-            host_id=host.id,
-            name="Cozy Camper",
-            location="Seoul",
-            capacity=4,
-            daily_rate=150.0
-        )
-        caravan2 = Caravan(
-            host_id=host.id,
-            name="Luxury Land-Yacht",
-            location="Busan",
-            capacity=6,
-            daily_rate=250.0
-        )
-        caravan_repo.add(caravan1)
-        caravan_repo.add(caravan2)
-        
-    return user_repo, caravan_repo, reservation_repo, reservation_service
+    # 초기 데이터 생성 (다중 워커 모드에서는 소유자 프로세스가 생성합니다)
+    if feed is None and not user_repo.get_all():
+        seed_data(user_repo, caravan_repo)
+    if feed is not None:
+        # 리스너가 모두 구독한 뒤에 이후 변경 이벤트를 적용하기 시작합니다.
+        feed.start()
+
+    return (
+        user_repo, caravan_repo, reservation_repo,
+        reservation_service, availability_service, listing_service,
+        executor, async_user_repo, async_reservation_service, reporting_service,
+        availability_calendar, pricing_engine, sweeper, reservation_listing_service,
+        journal, payment_service, review_service, search_service, bulk_importer,
+    )
 
-user_repo, caravan_repo, reservation_repo, reservation_service = setup_dependencies()
+def load_dependencies():
+    """구성요소를 생성하여 핸들러가 사용하는 모듈 전역 변수에 연결합니다."""
+    global user_repo, caravan_repo, reservation_repo
+    global reservation_service, availability_service, listing_service
+    global executor, async_user_repo, async_reservation_service, reporting_service
+    global availability_calendar, pricing_engine, sweeper, reservation_listing_service
+    global journal, payment_service, review_service, search_service, bulk_importer
+    (
+        user_repo, caravan_repo, reservation_repo,
+        reservation_service, availability_service, listing_service,
+        executor, async_user_repo, async_reservation_service, reporting_service,
+        availability_calendar, pricing_engine, sweeper, reservation_listing_service,
+        journal, payment_service, review_service, search_service, bulk_importer,
+    ) = setup_dependencies()
+
+def warm_up():
+    """
+    첫 요청이 캐시를 채우는 비용을 치르지 않도록 미리 계산해 둡니다.
+    전체 카라반 목록을 한 번 만들면 카라반별 JSON 인코딩과 목록 본문이 캐시됩니다.
+    """
+    listing_service.get_page(CaravanQuery())
+
+# 서버 프로세스에서는 lifespan이 백그라운드 스레드에서 실행하고,
+# 벤치마크처럼 lifespan 없이 앱을 호출하는 코드는 `startup.run()`을 직접 호출합니다.
+startup = Startup(load_dependencies, warm_up)
+
+# --- 요청 지표 미들웨어 ---
+# 준비가 끝나기 전에는 상태 확인과 지표를 제외한 요청에 503을 반환합니다.
+app.add_middleware(ReadinessGate, startup=startup, exempt=("/health/live", "/health/ready", "/metrics"))
+# 요청마다 메서드·경로 템플릿·상태 코드별 처리 시간을 기록하고, 선택된 요청을 프로파일러에 넘깁니다.
+app.add_middleware(RequestMetricsMiddleware, registry=metrics, profiler=request_profiler)
 
 # --- Pydantic 모델 (데이터 유효성 검사) ---
 class ReservationRequest(BaseModel):
@@ -76,35 +274,487 @@ class ReservationRequest(BaseModel):
     start_date: date
     end_date: date
 
+class BatchReservationRequest(BaseModel):
+    items: list[ReservationRequest]
+    mode: BulkMode = BulkMode.BEST_EFFORT
+
+class ReviewRequest(BaseModel):
+    rating: int = Field(ge=1, le=5)
+    comment: str = ""
+
+async def get_default_guest() -> User:
+    """
+    현재는 CLI에서 사용하던 'guest' 사용자를 하드코딩하여 사용합니다.
+    향후 실제 사용자 인증 시스템이 도입되면 이 부분을 수정해야 합니다.
+    """
+    users = await async_user_repo.get_all()
+    guest = next((user for user in users if user.role == UserRole.GUEST), None)
+    if not guest:
+        raise HTTPException(status_code=404, detail="Guest user not found.")
+    return guest
+
+def parse_area(
+    lat: float | None, lon: float | None, radius_km: float | None, bbox: str | None
+) -> GeoArea | None:
+    """
+    위치 조건을 해석합니다. `lat`, `lon`, `radius_km`는 반경 검색,
+    `bbox=남,서,북,동`은 경계 상자 검색이며 둘 중 하나만 지정할 수 있습니다.
+    """
+    circle = (lat, lon, radius_km)
+    if bbox is None and all(v is None for v in circle):
+        return None
+    try:
+        if bbox is not None:
+            if any(v is not None for v in circle):
+                raise ValueError("Use either lat/lon/radius_km or bbox, not both.")
+            south, west, north, east = (float(v) for v in bbox.split(","))
+            return BoundingBox(south, west, north, east)
+        if any(v is None for v in circle):
+            raise ValueError("lat, lon and radius_km must be given together.")
+        return GeoCircle(lat, lon, radius_km)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid area: {e}")
+
 # --- API 엔드포인트 ---
 @app.get("/api/caravans")
-def get_caravans():
-    """모든 카라반의 목록을 반환합니다."""
-    return caravan_repo.get_all()
+async def get_caravans(
+    request: Request,
+    location: str | None = None,
+    min_capacity: int | None = None,
+    max_capacity: int | None = None,
+    min_daily_rate: float | None = None,
+    max_daily_rate: float | None = None,
+    cursor: str | None = None,
+    limit: int | None = None,
+    format: str = "json",
+    sort: str | None = None,
+    lat: float | None = None,
+    lon: float | None = None,
+    radius_km: float | None = None,
+    bbox: str | None = None,
+):
+    """
+    카라반 목록을 반환합니다. 조건이 주어지면 리포지토리 인덱스로 필터링합니다.
+
+    - `lat`, `lon`, `radius_km`(반경) 또는 `bbox`(경계 상자)로 위치를 지정하면 좌표가 있는 카라반만 반환합니다.
+
+    - 각 카라반에는 평균 평점과 리뷰 수가 `rating`으로 포함됩니다.
+    - `sort=rating`이면 평균 평점이 높은 순(같으면 리뷰가 많은 순)으로 정렬합니다.
+    - `limit`을 지정하면 다음 페이지의 커서가 `X-Next-Cursor` 헤더로 전달됩니다. (최대 500개)
+    - `format=ndjson`이면 목록 전체를 NDJSON 스트림으로 전송합니다.
+    - 목록이 바뀌지 않았다면 `If-None-Match` 요청에 304로 응답합니다.
+    """
+    if sort not in (None, "rating"):
+        raise HTTPException(status_code=400, detail=f"Unsupported sort: {sort}")
+    if limit is not None and limit <= 0:
+        raise HTTPException(status_code=400, detail="Limit must be positive.")
+    area = parse_area(lat, lon, radius_km, bbox)
+    etag = await executor.run(listing_service.etag)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    query = CaravanQuery(
+        location=location,
+        min_capacity=min_capacity,
+        max_capacity=max_capacity,
+        min_daily_rate=min_daily_rate,
+        max_daily_rate=max_daily_rate,
+        area=area,
+        sort_by_rating=sort == "rating",
+    )
+    try:
+        if format == "ndjson":
+            # 스트리밍 중 발생하는 오류를 피하기 위해 커서를 먼저 검증합니다.
+            chunks = listing_service.stream(query, cursor)
+            first = await executor.run(next, chunks, b"")
+            def body():
+                yield first
+                yield from chunks
+            return StreamingResponse(body(), media_type="application/x-ndjson", headers={"ETag": etag})
+        page = await executor.run(listing_service.get_page, query, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {e}")
+
+    headers = {"ETag": etag}
+    if page.next_cursor:
+        headers["X-Next-Cursor"] = page.next_cursor
+    return Response(content=page.body, media_type="application/json", headers=headers)
+
+@app.get("/api/caravans/available")
+async def get_available_caravans(
+    start: date,
+    end: date,
+    location: str | None = None,
+    min_capacity: int | None = None,
+    lat: float | None = None,
+    lon: float | None = None,
+    radius_km: float | None = None,
+    bbox: str | None = None,
+):
+    """
+    지정한 기간 동안 예약 가능한 카라반의 목록을 반환합니다.
+    반경(`lat`, `lon`, `radius_km`)을 지정하면 가까운 순으로, `bbox`로는 경계 상자 안에서 찾습니다.
+    """
+    area = parse_area(lat, lon, radius_km, bbox)
+    try:
+        return await executor.run(
+            availability_service.find_available_caravans,
+            start_date=start,
+            end_date=end,
+            location=location,
+            min_capacity=min_capacity,
+            area=area,
+        )
+    except ReservationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/api/search")
+async def search_caravans(
+    start: date | None = None,
+    end: date | None = None,
+    guests: int | None = None,
+    location: str | None = None,
+    min_daily_rate: float | None = None,
+    max_daily_rate: float | None = None,
+    limit: int = 20,
+):
+    """
+    조건에 맞는 예약 가능한 카라반을 점수가 높은 순으로 최대 `limit`개 반환합니다.
+    점수는 가격, 인원 대비 크기, 평점, 요청 기간의 예약 가능 여부를 가중합한 값입니다.
+    """
+    query = SearchQuery(
+        start_date=start,
+        end_date=end,
+        guests=guests,
+        location=location,
+        min_daily_rate=min_daily_rate,
+        max_daily_rate=max_daily_rate,
+    )
+    try:
+        results = await executor.run(search_service.search, query, limit)
+    except (ReservationError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Response(
+        content=dumps([{"caravan": r.caravan, "score": round(r.score, 4)} for r in results]),
+        media_type="application/json",
+    )
+
+async def get_caravan_or_404(caravan_id: uuid.UUID) -> Caravan:
+    caravan = await executor.run(caravan_repo.get_by_id, caravan_id)
+    if caravan is None:
+        raise HTTPException(status_code=404, detail="Caravan not found.")
+    return caravan
+
+@app.get("/api/caravans/{caravan_id}/calendar")
+async def get_caravan_calendar(caravan_id: uuid.UUID, year: int, month: int):
+    """
+    카라반의 월별 예약 달력을 반환합니다.
+    `available`의 각 항목은 해당 날짜의 숙박 가능 여부이며, 달력 범위를 벗어난 날짜는 null입니다.
+    """
+    await get_caravan_or_404(caravan_id)
+    if not date.min.year <= year <= date.max.year:
+        raise HTTPException(status_code=400, detail=f"Year must be between {date.min.year} and {date.max.year}.")
+    if not 1 <= month <= 12:
+        raise HTTPException(status_code=400, detail="Month must be between 1 and 12.")
+    return {
+        "caravan_id": caravan_id,
+        "year": year,
+        "month": month,
+        "available": availability_calendar.month_view(caravan_id, year, month),
+    }
+
+@app.get("/api/caravans/{caravan_id}/next-available")
+async def get_next_available_window(caravan_id: uuid.UUID, nights: int, earliest: date | None = None):
+    """`earliest` 이후 `nights`박 연속으로 예약 가능한 가장 이른 기간을 반환합니다."""
+    await get_caravan_or_404(caravan_id)
+    try:
+        start = availability_calendar.first_free_window(caravan_id, nights, earliest)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if start is None:
+        raise HTTPException(status_code=404, detail="No free window within the calendar horizon.")
+    return {"start_date": start, "end_date": start + timedelta(days=nights)}
+
+# 견적은 이벤트 루프에서 박 수에 비례하는 계산을 하므로 예약과 같은 최대 숙박 기간으로 제한합니다.
+MAX_QUOTE_NIGHTS = MAX_STAY_NIGHTS
+
+@app.get("/api/caravans/{caravan_id}/quote")
+async def get_quote(caravan_id: uuid.UUID, start: date, end: date):
+    """예약하지 않고 지정한 기간(최대 365박)의 박별 요금과 총 요금을 계산합니다."""
+    caravan = await get_caravan_or_404(caravan_id)
+    try:
+        quote = pricing_engine.quote(caravan, start, end, max_nights=MAX_QUOTE_NIGHTS)
+    except ReservationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return Response(content=dumps(quote), media_type="application/json")
 
 @app.post("/api/reservations")
-def create_reservation(request: ReservationRequest):
-    """새로운 예약을 생성합니다."""
+async def create_reservation(request: ReservationRequest, idempotency_key: str | None = Header(default=None)):
+    """
+    새로운 예약을 생성합니다.
+    `Idempotency-Key` 헤더가 있으면 같은 키로 재시도한 요청은 다시 검증하지 않고 처음 결과를 그대로 돌려받습니다.
+    """
     try:
-        # 현재는 CLI에서 사용하던 'guest' 사용자를 하드코딩하여 사용합니다.
-        # 향후 실제 사용자 인증 시스템이 도입되면 이 부분을 수정해야 합니다.
-        guest = next((user for user in user_repo.get_all() if user.role == UserRole.GUEST), None)
-        if not guest:
-            raise HTTPException(status_code=404, detail="Guest user not found.")
+        guest = await get_default_guest()
 
-        new_reservation = reservation_service.create_reservation(
+        new_reservation = await async_reservation_service.create_reservation(
             guest_id=guest.id,
             caravan_id=request.caravan_id,
             start_date=request.start_date,
-            end_date=request.end_date
+            end_date=request.end_date,
+            idempotency_key=idempotency_key,
         )
         return new_reservation
+    except IdempotencyKeyMismatchError as e:
+        raise HTTPException(status_code=422, detail=str(e))
     except ReservationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred: {e}")
 
+@app.post("/api/reservations/batch")
+async def create_reservations_batch(request: BatchReservationRequest):
+    """
+    여러 예약을 한 번에 생성하고 항목별 결과를 요청 순서대로 반환합니다.
+    `mode`가 `atomic`이면 하나라도 실패할 경우 어떤 예약도 생성하지 않습니다.
+    """
+    guest = await get_default_guest()
+    results = await async_reservation_service.create_reservations_bulk(
+        [
+            BookingRequest(guest.id, item.caravan_id, item.start_date, item.end_date)
+            for item in request.items
+        ],
+        mode=request.mode,
+    )
+    # 대량 응답은 FastAPI의 범용 인코더 대신 직접 직렬화합니다.
+    return Response(
+        content=dumps({
+            "created": sum(1 for r in results if r.ok),
+            "results": [{"reservation": r.reservation, "error": r.error} for r in results],
+        }),
+        media_type="application/json",
+    )
+
+async def change_reservation_status(transition, reservation_id: uuid.UUID):
+    """예약 상태 변경을 실행하고 오류를 HTTP 응답으로 변환합니다."""
+    try:
+        return await transition(reservation_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except InvalidStatusTransitionError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+@app.post("/api/reservations/{reservation_id}/approve")
+async def approve_reservation(reservation_id: uuid.UUID):
+    """대기 중인 예약을 승인합니다."""
+    return await change_reservation_status(async_reservation_service.approve_reservation, reservation_id)
+
+@app.post("/api/reservations/{reservation_id}/reject")
+async def reject_reservation(reservation_id: uuid.UUID):
+    """대기 중인 예약을 거절합니다."""
+    return await change_reservation_status(async_reservation_service.reject_reservation, reservation_id)
+
+@app.post("/api/reservations/{reservation_id}/cancel")
+async def cancel_reservation(reservation_id: uuid.UUID):
+    """대기 중이거나 승인된 예약을 취소합니다."""
+    return await change_reservation_status(async_reservation_service.cancel_reservation, reservation_id)
+
+@app.post("/api/reservations/{reservation_id}/complete")
+async def complete_reservation(reservation_id: uuid.UUID):
+    """숙박이 끝난 승인 예약을 완료 처리합니다."""
+    return await change_reservation_status(async_reservation_service.complete_reservation, reservation_id)
+
+@app.get("/api/reservations/{reservation_id}/payments")
+async def get_reservation_payments(reservation_id: uuid.UUID):
+    """예약의 결제 내역(결제, 환불 상태)을 오래된 순으로 반환합니다."""
+    if payment_service is None:
+        raise HTTPException(status_code=503, detail="Payments are handled by the owner process in multi-worker mode.")
+    if await async_reservation_service.get_by_id(reservation_id) is None:
+        raise HTTPException(status_code=404, detail="Reservation not found.")
+    return payment_service.get_for_reservation(reservation_id)
+
+def require_reviews() -> ReviewService:
+    if review_service is None:
+        raise HTTPException(status_code=503, detail="Reviews are not available in multi-worker mode.")
+    return review_service
+
+def rating_summary(summary) -> dict:
+    return {"average": summary.average, "count": summary.count, "histogram": summary.histogram}
+
+@app.post("/api/reservations/{reservation_id}/review")
+async def review_reservation(reservation_id: uuid.UUID, request: ReviewRequest):
+    """완료된 숙박에 대한 게스트의 리뷰를 남깁니다. 평점은 카라반과 호스트 모두에 반영됩니다."""
+    reviews = require_reviews()
+    guest = await get_default_guest()
+    try:
+        return reviews.review_stay(reservation_id, guest.id, request.rating, request.comment)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ReviewNotAllowedError as e:
+        raise HTTPException(status_code=403, detail=str(e))
+    except DuplicateReviewError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+
+@app.get("/api/caravans/{caravan_id}/reviews")
+async def get_caravan_reviews(caravan_id: uuid.UUID, cursor: str | None = None, limit: int = 20):
+    """
+    카라반의 평점 요약과 리뷰 목록을 최신순으로 반환합니다.
+    다음 페이지가 있으면 커서가 `X-Next-Cursor` 헤더로 전달됩니다.
+    """
+    reviews = require_reviews()
+    await get_caravan_or_404(caravan_id)
+    try:
+        page = reviews.list_reviews(caravan_id, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else {}
+    return Response(
+        content=dumps({"summary": rating_summary(page.summary), "reviews": page.reviews}),
+        media_type="application/json",
+        headers=headers,
+    )
+
+@app.get("/api/users/{user_id}/rating")
+async def get_user_rating(user_id: uuid.UUID):
+    """호스트가 소유한 모든 카라반의 리뷰를 합친 평점 요약을 반환합니다."""
+    reviews = require_reviews()
+    if await async_user_repo.get_by_id(user_id) is None:
+        raise HTTPException(status_code=404, detail="User not found.")
+    return rating_summary(reviews.summary(user_id))
+
+@app.get("/api/users/{user_id}/reservations")
+async def get_user_reservations(
+    user_id: uuid.UUID,
+    start_from: date | None = None,
+    start_before: date | None = None,
+    cursor: str | None = None,
+    limit: int = 50,
+):
+    """
+    사용자의 예약 목록을 시작일 순으로 반환합니다. 호스트는 소유한 모든 카라반의 예약을 조회합니다.
+
+    - `start_from`, `start_before`로 시작일 범위를 지정할 수 있습니다.
+    - 다음 페이지가 있으면 커서가 `X-Next-Cursor` 헤더로 전달됩니다.
+    """
+    user = await async_user_repo.get_by_id(user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found.")
+    try:
+        page = reservation_listing_service.list_for_user(user, start_from, start_before, cursor, limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    headers = {"X-Next-Cursor": page.next_cursor} if page.next_cursor else {}
+    return Response(content=dumps(page.reservations), media_type="application/json", headers=headers)
+
+@app.get("/api/reports/occupancy")
+async def get_occupancy_report(start: date, end: date, monthly: bool = False):
+    """
+    기간 내 카라반별 점유율을 반환합니다.
+    `monthly=true`이면 카라반별, 월별 점유 박수를 반환합니다.
+    """
+    try:
+        if monthly:
+            return await executor.run(reporting_service.monthly_occupancy, start, end)
+        return await executor.run(reporting_service.occupancy_rates, start, end)
+    except ReservationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/api/reports/revenue-by-location")
+async def get_revenue_by_location(start: date, end: date):
+    """기간 내 지역별 매출을 반환합니다."""
+    try:
+        return await executor.run(reporting_service.revenue_by_location, start, end)
+    except ReservationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.get("/api/reports/host-payouts")
+async def get_host_payouts(start: date, end: date, commission_rate: float = 0.0):
+    """기간 내 호스트별 정산 금액을 반환합니다."""
+    try:
+        return await executor.run(reporting_service.host_payouts, start, end, commission_rate)
+    except (ReservationError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv; charset=utf-8"}
+
+def check_transfer(entity: str, format: str) -> None:
+    if entity not in ENTITIES:
+        raise HTTPException(status_code=404, detail=f"Unknown entity: {entity}")
+    if format not in FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
+
+@app.get("/api/export/{entity}")
+async def export_data(entity: str, format: str = "ndjson"):
+    """
+    사용자(`users`), 카라반(`caravans`), 예약(`reservations`) 전체를 NDJSON 또는 CSV(`format=csv`)로 내보냅니다.
+    리포지토리를 순회하면서 천 건씩 인코딩해 전송하므로, 응답 본문 전체를 메모리에 만들지 않습니다.
+    """
+    check_transfer(entity, format)
+    source = {"users": user_repo, "caravans": caravan_repo, "reservations": reservation_repo}[entity]
+    return StreamingResponse(
+        export_records(entity, source.iter_all(), format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{entity}.{format}"'},
+    )
+
+async def request_lines(request: Request):
+    """요청 본문을 받는 대로 줄 단위로 나눕니다. 본문 전체를 메모리에 올리지 않습니다."""
+    pending = b""
+    async for chunk in request.stream():
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line.decode("utf-8", errors="replace") + "\n"
+    if pending:
+        yield pending.decode("utf-8", errors="replace")
+
+@app.post("/api/import/{entity}")
+async def import_data(entity: str, request: Request, format: str = "ndjson"):
+    """
+    NDJSON 또는 CSV(`format=csv`, 첫 줄은 헤더) 본문을 읽어 사용자·카라반·예약을 가져옵니다.
+
+    - 본문은 받는 대로 묶음 단위로 검증·저장하며, 예약은 기존 예약과 같은 묶음의 예약 모두와 겹치지 않아야 합니다.
+    - 잘못되었거나 겹치는 줄만 건너뛰고, 가져온 수·거부된 수와 처음 몇 개 줄의 거부 사유를 반환합니다.
+    - 카라반은 호스트를, 예약은 게스트와 카라반을 먼저 가져와야 합니다.
+    """
+    check_transfer(entity, format)
+    if bulk_importer is None:
+        raise HTTPException(status_code=503, detail="Imports are not available in multi-worker mode.")
+    session = bulk_importer.start(entity, format)
+    # 한 묶음씩 저장하므로, 인메모리 저장소를 쓰더라도 묶음 사이에 다른 요청이 처리됩니다.
+    lines = []
+    async for line in request_lines(request):
+        lines.append(line)
+        if len(lines) >= bulk_importer.batch_size:
+            await executor.run(session.feed, lines)
+            lines = []
+    await executor.run(session.feed, lines)
+    report = await executor.run(session.finish)
+    return {
+        "imported": report.imported,
+        "rejected": report.rejected,
+        "errors": [{"line": line, "error": error} for line, error in report.errors],
+    }
+
+@app.get("/health/live")
+async def liveness():
+    """프로세스가 요청을 처리할 수 있으면 200을 반환합니다. 시작에 실패했으면 재시작되도록 503을 반환합니다."""
+    if startup.error is not None:
+        return JSONResponse(status_code=503, content=startup.status())
+    return {"status": "ok"}
+
+@app.get("/health/ready")
+async def readiness():
+    """구성요소 적재와 캐시 준비가 끝났으면 200, 아직 시작 중이거나 실패했으면 503을 반환합니다."""
+    status = startup.status()
+    return JSONResponse(status_code=200 if startup.ready else 503, content=status)
+
+@app.get("/metrics")
+async def get_metrics():
+    """수집한 지표를 Prometheus 텍스트 형식으로 반환합니다."""
+    return Response(content=metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
 @app.get("/")
-def read_root():
+async def read_root():
     return {"message": "Welcome to the CaravanShare API"}
 
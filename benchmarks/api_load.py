@@ -0,0 +1,105 @@
+"""
+Load test comparing async API handlers with threadpool (plain `def`) handlers.
+
+Simulates many concurrent clients against the ASGI app in-process. Each
+client issues a mix of listing reads and booking writes; per-request latency
+percentiles are reported for the real `api.app` (async handlers) and for an
+equivalent app whose handlers are plain functions run on FastAPI's threadpool.
+
+Usage:
+    python -m benchmarks.api_load [--clients N] [--requests-per-client N]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+import uuid
+from datetime import date, timedelta
+
+from fastapi import FastAPI, HTTPException, Response
+
+from benchmarks.asgi import request
+from src.exceptions.reservation import ReservationError
+from src.models.caravan import Caravan
+
+
+def build_threadpool_app(api_module) -> FastAPI:
+    """The listing and booking endpoints written as plain `def` handlers."""
+    app = FastAPI()
+
+    @app.get("/api/caravans")
+    def get_caravans():
+        page = api_module.listing_service.get_page(api_module.CaravanQuery())
+        return Response(content=page.body, media_type="application/json")
+
+    @app.post("/api/reservations")
+    def create_reservation(body: api_module.ReservationRequest):
+        guest = next(u for u in api_module.user_repo.get_all() if u.role == api_module.UserRole.GUEST)
+        try:
+            return api_module.reservation_service.create_reservation(
+                guest.id, body.caravan_id, body.start_date, body.end_date
+            )
+        except ReservationError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    return app
+
+
+async def client(app, caravan_ids: list, client_no: int, requests: int, latencies: list, t0: float) -> None:
+    base = date.today() + timedelta(days=1 + client_no * 3)
+    # Latency is measured from the moment the client wants to send, so time
+    # spent waiting for the event loop or a worker thread is included.
+    wants_to_send = t0
+    for i in range(requests):
+        await asyncio.sleep(0)
+        if i % 4 == 3:
+            start = base + timedelta(days=i * 1000)
+            await request(app, "POST", "/api/reservations", body={
+                "caravan_id": caravan_ids[client_no % len(caravan_ids)],
+                "start_date": start.isoformat(),
+                "end_date": (start + timedelta(days=2)).isoformat(),
+            })
+        else:
+            await request(app, "GET", "/api/caravans")
+        finished = time.perf_counter()
+        latencies.append(finished - wants_to_send)
+        wants_to_send = finished
+
+
+async def run(app, caravan_ids: list, clients: int, requests: int) -> tuple[float, float, float]:
+    latencies: list = []
+    started = time.perf_counter()
+    await asyncio.gather(*(client(app, caravan_ids, n, requests, latencies, started) for n in range(clients)))
+    elapsed = time.perf_counter() - started
+    cuts = statistics.quantiles(latencies, n=100)
+    return cuts[49] * 1e3, cuts[98] * 1e3, len(latencies) / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=1000)
+    parser.add_argument("--requests-per-client", type=int, default=8)
+    parser.add_argument("--caravans", type=int, default=200)
+    args = parser.parse_args()
+
+    import api
+
+    api.startup.run()
+
+    host_id = uuid.uuid4()
+    caravan_ids = []
+    for i in range(args.caravans):
+        caravan = Caravan(host_id=host_id, name=f"Load {i}", location="Seoul", capacity=4, daily_rate=100.0)
+        api.caravan_repo.add(caravan)
+        caravan_ids.append(str(caravan.id))
+
+    print(f"{args.clients} concurrent clients x {args.requests_per_client} requests "
+          f"({args.caravans + 2} caravans listed per read)")
+    print(f"{'handlers':<12} {'p50 (ms)':>10} {'p99 (ms)':>10} {'req/s':>10}")
+    for label, app in (("threadpool", build_threadpool_app(api)), ("async", api.app)):
+        p50, p99, rate = asyncio.run(run(app, caravan_ids, args.clients, args.requests_per_client))
+        print(f"{label:<12} {p50:>10.1f} {p99:>10.1f} {rate:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Minimal in-process ASGI client for benchmarks.
+
+Calls the application directly, without sockets or an HTTP client library,
+so measurements include routing, validation and serialization but no
+network overhead.
+"""
+import asyncio
+import json
+from typing import Any, Dict, Tuple
+
+
+async def request(
+    app,
+    method: str,
+    path: str,
+    query: str = "",
+    body: Any = None,
+    headers: Dict[str, str] | None = None,
+) -> Tuple[int, Dict[str, str], bytes]:
+    """Sends one request through the ASGI app and returns (status, headers, body)."""
+    payload = b"" if body is None else json.dumps(body).encode()
+    raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    if body is not None:
+        raw_headers.append((b"content-type", b"application/json"))
+    raw_headers.append((b"content-length", str(len(payload)).encode()))
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": query.encode(),
+        "headers": raw_headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+    sent = False
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": payload, "more_body": False}
+        await asyncio.sleep(3600)
+
+    status = 0
+    response_headers: Dict[str, str] = {}
+    chunks = []
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers.update((k.decode(), v.decode()) for k, v in message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            chunks.append(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, response_headers, b"".join(chunks)
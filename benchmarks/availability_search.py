@@ -0,0 +1,72 @@
+"""
+Benchmark for fleet-wide availability search.
+
+Builds a synthetic fleet where every caravan has a year of booking history
+and measures AvailabilityService.find_available_caravans latency.
+
+Usage:
+    python -m benchmarks.availability_search
+"""
+import random
+import timeit
+import uuid
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.services.availability_service import AvailabilityService
+
+FLEET_SIZES = (1_000, 10_000, 50_000)
+BOOKINGS_PER_CARAVAN = 20
+LOCATIONS = ("Seoul", "Busan", "Incheon", "Daegu", "Gwangju", "Jeju")
+
+
+def build_fleet(size: int, seed: int = 42) -> AvailabilityService:
+    """Creates `size` caravans, each with a series of non-overlapping future bookings."""
+    rng = random.Random(seed)
+    caravan_repo = CaravanRepository()
+    reservation_repo = ReservationRepository()
+    host_id = uuid.uuid4()
+    guest_id = uuid.uuid4()
+    today = date.today()
+    for i in range(size):
+        caravan = Caravan(
+            host_id=host_id,
+            name=f"Caravan {i}",
+            location=rng.choice(LOCATIONS),
+            capacity=rng.randint(2, 8),
+            daily_rate=float(rng.randint(50, 300)),
+        )
+        caravan_repo.add(caravan)
+        day = today + timedelta(days=rng.randint(0, 10))
+        for _ in range(BOOKINGS_PER_CARAVAN):
+            nights = rng.randint(1, 7)
+            reservation_repo.add(Reservation(
+                guest_id=guest_id,
+                caravan_id=caravan.id,
+                start_date=day,
+                end_date=day + timedelta(days=nights),
+                total_price=nights * caravan.daily_rate,
+            ))
+            day += timedelta(days=nights + rng.randint(0, 14))
+    return AvailabilityService(caravan_repo, reservation_repo)
+
+
+def main() -> None:
+    start = date.today() + timedelta(days=30)
+    end = start + timedelta(days=3)
+    print(f"{'caravans':>10} {'all (ms)':>10} {'location+capacity (ms)':>24} {'available':>10}")
+    for size in FLEET_SIZES:
+        service = build_fleet(size)
+        everything = min(timeit.repeat(lambda: service.find_available_caravans(start, end), number=5, repeat=3)) / 5
+        filtered = min(timeit.repeat(
+            lambda: service.find_available_caravans(start, end, location="Seoul", min_capacity=6),
+            number=5, repeat=3)) / 5
+        count = len(service.find_available_caravans(start, end))
+        print(f"{size:>10} {everything * 1e3:>10.2f} {filtered * 1e3:>24.2f} {count:>10}")
+
+
+if __name__ == "__main__":
+    main()
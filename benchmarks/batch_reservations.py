@@ -0,0 +1,76 @@
+"""
+Throughput of the batch reservation endpoint versus one request per booking.
+
+Both variants go through the ASGI app in-process, so the numbers include
+routing, request validation and response serialization.
+
+Usage:
+    python -m benchmarks.batch_reservations [--bookings N] [--batch-size N]
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import date, timedelta
+
+from benchmarks.asgi import request
+from src.models.caravan import Caravan
+
+
+def make_bookings(app_module, count: int) -> list:
+    """Adds fresh caravans and returns `count` non-overlapping booking payloads for them."""
+    host_id = uuid.uuid4()
+    caravans = []
+    for i in range(max(1, count // 50)):
+        caravan = Caravan(host_id=host_id, name=f"Bench {i}", location="Seoul", capacity=4, daily_rate=100.0)
+        app_module.caravan_repo.add(caravan)
+        caravans.append(caravan)
+    base = date.today() + timedelta(days=1)
+    bookings = []
+    for i in range(count):
+        start = base + timedelta(days=(i // len(caravans)) * 3)
+        bookings.append({
+            "caravan_id": str(caravans[i % len(caravans)].id),
+            "start_date": start.isoformat(),
+            "end_date": (start + timedelta(days=2)).isoformat(),
+        })
+    return bookings
+
+
+async def single(app, bookings: list) -> float:
+    started = time.perf_counter()
+    for booking in bookings:
+        status, _, _ = await request(app, "POST", "/api/reservations", body=booking)
+        assert status == 200, status
+    return len(bookings) / (time.perf_counter() - started)
+
+
+async def batched(app, bookings: list, batch_size: int) -> float:
+    started = time.perf_counter()
+    for i in range(0, len(bookings), batch_size):
+        status, _, _ = await request(
+            app, "POST", "/api/reservations/batch", body={"items": bookings[i:i + batch_size]}
+        )
+        assert status == 200, status
+    return len(bookings) / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bookings", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+
+    import api
+
+    api.startup.run()
+
+    single_rate = asyncio.run(single(api.app, make_bookings(api, args.bookings)))
+    batch_rate = asyncio.run(batched(api.app, make_bookings(api, args.bookings), args.batch_size))
+    print(f"single endpoint: {single_rate:>10.0f} bookings/s")
+    print(f"batch endpoint:  {batch_rate:>10.0f} bookings/s  (batch size {args.batch_size}, "
+          f"{batch_rate / single_rate:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
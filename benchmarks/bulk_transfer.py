@@ -0,0 +1,153 @@
+"""
+Throughput of the streaming bulk import and export.
+
+Reservations are written to an NDJSON file, which is imported with
+BulkImporter in batches and then, into a fresh store, with a batch size of
+one, i.e. a lock, lookups, conflict check and insert per row as a
+hand-written loader would do. The export is measured for throughput and
+for its peak traced memory, next to building the whole body as one string.
+
+By default the in-memory repositories are used; `--sqlite` runs the same
+comparison against SQLite files in a temporary directory.
+
+Usage:
+    python -m benchmarks.bulk_transfer [--reservations N] [--caravans N] [--batch-size N] [--sqlite]
+"""
+import argparse
+import gc
+import json
+import os
+import shutil
+import tempfile
+import time
+import tracemalloc
+import uuid
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.user import User, UserRole
+from src.repositories.user_repository import UserRepository
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.services.bulk_transfer import BulkImporter, export_records
+
+
+class Store:
+    """One set of repositories with a host, a guest and `caravans` caravans."""
+    def __init__(self, caravans: int, sqlite_dir: str | None, like: "Store | None" = None):
+        self._pool = None
+        if sqlite_dir is None:
+            self.repos = (UserRepository(), CaravanRepository(), ReservationRepository())
+        else:
+            from src.repositories.sqlite.connection_pool import SQLiteConnectionPool
+            from src.repositories.sqlite.user_repository import SQLiteUserRepository
+            from src.repositories.sqlite.caravan_repository import SQLiteCaravanRepository
+            from src.repositories.sqlite.reservation_repository import SQLiteReservationRepository
+
+            self._pool = SQLiteConnectionPool(os.path.join(sqlite_dir, f"{uuid.uuid4()}.db"))
+            self.repos = (
+                SQLiteUserRepository(self._pool), SQLiteCaravanRepository(self._pool),
+                SQLiteReservationRepository(self._pool),
+            )
+        users, fleet, _ = self.repos
+        self.host = like.host if like else User(name="Host", contact="host@example.com", role=UserRole.HOST)
+        self.guest = like.guest if like else User(name="Guest", contact="guest@example.com", role=UserRole.GUEST)
+        users.add(self.host)
+        users.add(self.guest)
+        self.caravan_ids = []
+        for i in range(caravans):
+            caravan = Caravan(
+                host_id=self.host.id, name=f"Bench {i}", location="Seoul", capacity=4, daily_rate=100.0,
+                id=uuid.UUID(like.caravan_ids[i]) if like else uuid.uuid4(),
+            )
+            fleet.add(caravan)
+            self.caravan_ids.append(str(caravan.id))
+
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.close()
+
+
+def reservation_lines(store: Store, count: int):
+    """Yields `count` NDJSON reservations, one in forty overlapping the caravan's previous stay."""
+    base = date(2020, 1, 1)
+    caravans = len(store.caravan_ids)
+    guest_id = str(store.guest.id)
+    for i in range(count):
+        slot = i // caravans
+        start = base + timedelta(days=slot * 3 - (2 if slot % 2 and i % 20 == 0 else 0))
+        yield json.dumps({
+            "guest_id": guest_id, "caravan_id": store.caravan_ids[i % caravans],
+            "start_date": start.isoformat(), "end_date": (start + timedelta(days=2)).isoformat(),
+            "total_price": 200.0, "status": "completed",
+        }) + "\n"
+
+
+def write_reservations(path: str, store: Store, count: int) -> None:
+    with open(path, "w", encoding="utf-8") as stream:
+        stream.writelines(reservation_lines(store, count))
+
+
+def measure_import(store: Store, path: str, batch_size: int) -> tuple:
+    importer = BulkImporter(*store.repos, batch_size=batch_size)
+    started = time.perf_counter()
+    with open(path, encoding="utf-8") as stream:
+        report = importer.import_lines("reservations", "ndjson", stream)
+    return (report.imported + report.rejected) / (time.perf_counter() - started), report.imported
+
+
+def measure_export(store: Store) -> tuple:
+    _, _, reservations = store.repos
+    started = time.perf_counter()
+    rows = sum(chunk.count("\n") for chunk in export_records("reservations", reservations.iter_all(), "ndjson"))
+    rate = rows / (time.perf_counter() - started)
+    tracemalloc.start()
+    for _ in export_records("reservations", reservations.iter_all(), "ndjson"):
+        pass
+    streamed = tracemalloc.get_traced_memory()[1]
+    tracemalloc.reset_peak()
+    body = "".join(export_records("reservations", reservations.iter_all(), "ndjson"))
+    materialized = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del body
+    return rate, streamed, materialized
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reservations", type=int, default=200_000)
+    parser.add_argument("--caravans", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--sqlite", action="store_true", help="use SQLite repositories instead of in-memory ones")
+    args = parser.parse_args()
+
+    tmpdir = tempfile.mkdtemp()
+    sqlite_dir = tmpdir if args.sqlite else None
+    path = os.path.join(tmpdir, "reservations.ndjson")
+    gc.disable()
+    try:
+        store = Store(args.caravans, sqlite_dir)
+        write_reservations(path, store, args.reservations)
+        batched_rate, batched_count = measure_import(store, path, args.batch_size)
+        export_rate, streamed, materialized = measure_export(store)
+        store.close()
+        # A fresh store with the same host, guest and caravan IDs.
+        single = Store(args.caravans, sqlite_dir, like=store)
+        single_rate, single_count = measure_import(single, path, 1)
+        single.close()
+    finally:
+        gc.enable()
+        shutil.rmtree(tmpdir)
+    assert batched_count == single_count, (batched_count, single_count)
+
+    backend = "sqlite" if args.sqlite else "memory"
+    print(f"{backend}: {args.reservations} reservations over {args.caravans} caravans, {batched_count} imported")
+    print(f"import, one by one:    {single_rate:>10,.0f} rows/s  (batch size 1)")
+    print(f"import, batched:       {batched_rate:>10,.0f} rows/s  (batch size {args.batch_size}, "
+          f"{batched_rate / single_rate:.1f}x)")
+    print(f"export, streamed:      {export_rate:>10,.0f} rows/s")
+    print(f"export peak memory:    {streamed / 2**20:>10.1f} MiB streamed vs {materialized / 2**20:.1f} MiB as one body")
+
+
+if __name__ == "__main__":
+    main()
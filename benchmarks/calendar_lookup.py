@@ -0,0 +1,69 @@
+"""
+Micro-benchmark for calendar-style availability questions.
+
+Compares answering "is this range free" and "when is the first free window
+of N nights" through the repository's availability index (as the validator
+does) with the precomputed AvailabilityCalendar bitmaps.
+
+Usage:
+    python -m benchmarks.calendar_lookup [--nights N]
+"""
+import argparse
+import timeit
+import uuid
+from datetime import date, timedelta
+
+from src.models.reservation import Reservation
+from src.repositories.availability_calendar import AvailabilityCalendar
+from src.repositories.reservation_repository import ReservationRepository
+
+TODAY = date(2030, 1, 1)
+
+
+def first_free_window_by_index(repo: ReservationRepository, caravan_id: uuid.UUID, nights: int) -> date | None:
+    """Walks forward day by day, asking the availability index about each candidate window."""
+    start = TODAY
+    for _ in range(730 - nights + 1):
+        end = start + timedelta(days=nights)
+        conflict = repo.find_conflict(caravan_id, start, end)
+        if conflict is None:
+            return start
+        start = conflict.end_date
+    return None
+
+
+def measure(fn, number: int) -> float:
+    """Returns the best per-call latency in microseconds over a few repeats."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nights", type=int, default=5)
+    args = parser.parse_args()
+
+    repo = ReservationRepository()
+    calendar = AvailabilityCalendar(today=lambda: TODAY)
+    repo.subscribe(calendar)
+    caravan_id = uuid.uuid4()
+    # A busy caravan: 3-night stays with single free nights in between for a year.
+    start = TODAY
+    while start < TODAY + timedelta(days=365):
+        repo.add(Reservation(uuid.uuid4(), caravan_id, start, start + timedelta(days=3), 300.0))
+        start += timedelta(days=4)
+
+    expected = first_free_window_by_index(repo, caravan_id, args.nights)
+    assert calendar.first_free_window(caravan_id, args.nights) == expected
+
+    probe_start, probe_end = TODAY + timedelta(days=200), TODAY + timedelta(days=203)
+    index_range = measure(lambda: repo.find_conflict(caravan_id, probe_start, probe_end), 100_000)
+    calendar_range = measure(lambda: calendar.is_range_free(caravan_id, probe_start, probe_end), 100_000)
+    index_window = measure(lambda: first_free_window_by_index(repo, caravan_id, args.nights), 200)
+    calendar_window = measure(lambda: calendar.first_free_window(caravan_id, args.nights), 20_000)
+    print(f"{'query':<32} {'index (us)':>12} {'calendar (us)':>14}")
+    print(f"{'range free':<32} {index_range:>12.2f} {calendar_range:>14.2f}")
+    print(f"{f'first free {args.nights}-night window':<32} {index_window:>12.2f} {calendar_window:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Throughput of concurrent bookings with per-caravan lock striping versus a
+single global lock.
+
+Thousands of overlapping requests are fired through a thread pool against
+real in-memory components. Under the GIL pure-Python work does not run in
+parallel, so the difference shows up once the critical section waits on
+storage; `--latency-us` simulates that wait inside `add`.
+
+Usage:
+    python -m benchmarks.concurrent_booking [--requests N] [--latency-us US]
+"""
+import argparse
+import random
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from src.exceptions.reservation import BookingConflictError
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation
+from src.models.user import User, UserRole
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.services.reservation_service import ReservationService
+from src.services.reservation_validator import ReservationValidator
+
+
+class SlowReservationRepository(ReservationRepository):
+    """Adds a fixed blocking delay to every insert, like a round trip to storage."""
+    def __init__(self, latency: float, lock_stripes: int):
+        super().__init__(lock_stripes=lock_stripes)
+        self._latency = latency
+
+    def add(self, reservation: Reservation) -> None:
+        if self._latency:
+            time.sleep(self._latency)
+        super().add(reservation)
+
+
+def run(lock_stripes: int, requests: int, caravans: int, workers: int, latency: float) -> tuple[float, int]:
+    """Returns (requests per second, accepted bookings)."""
+    user_repo = UserRepository()
+    caravan_repo = CaravanRepository()
+    reservation_repo = SlowReservationRepository(latency, lock_stripes)
+    service = ReservationService(reservation_repo, caravan_repo, user_repo, ReservationValidator(reservation_repo))
+    guest = User(name="Guest", contact="guest@example.com", role=UserRole.GUEST)
+    user_repo.add(guest)
+    host_id = uuid.uuid4()
+    fleet = [Caravan(host_id=host_id, name=f"C{i}", location="Seoul", capacity=4, daily_rate=100.0)
+             for i in range(caravans)]
+    for caravan in fleet:
+        caravan_repo.add(caravan)
+
+    rng = random.Random(1)
+    base = date.today() + timedelta(days=1)
+    work = []
+    for _ in range(requests):
+        start = base + timedelta(days=rng.randint(0, 365))
+        work.append((rng.choice(fleet).id, start, start + timedelta(days=rng.randint(1, 7))))
+
+    def attempt(item):
+        try:
+            service.create_reservation(guest.id, *item)
+            return 1
+        except BookingConflictError:
+            return 0
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        accepted = sum(pool.map(attempt, work))
+    return requests / (time.perf_counter() - started), accepted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--caravans", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--latency-us", type=float, default=100.0)
+    args = parser.parse_args()
+
+    latency = args.latency_us / 1e6
+    print(f"{args.requests} requests, {args.caravans} caravans, {args.workers} threads, "
+          f"{args.latency_us:.0f} us simulated storage latency")
+    for label, stripes in (("global lock", 1), ("striped (64)", 64)):
+        throughput, accepted = run(stripes, args.requests, args.caravans, args.workers, latency)
+        print(f"  {label:<14} {throughput:>10.0f} req/s  ({accepted} accepted)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Micro-benchmark for booking conflict checks.
+
+Compares the linear scan previously used by ReservationValidator with the
+repository's sorted availability index at several history sizes.
+
+Usage:
+    python -m benchmarks.conflict_check
+"""
+import timeit
+import uuid
+from datetime import date, timedelta
+
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.reservation_repository import ReservationRepository
+
+SIZES = (10, 1_000, 100_000)
+BASE_DATE = date(2000, 1, 1)
+
+
+def build_repository(size: int) -> tuple[ReservationRepository, uuid.UUID]:
+    """Creates a repository holding `size` back-to-back 3-night bookings of one caravan."""
+    repo = ReservationRepository()
+    caravan_id = uuid.uuid4()
+    guest_id = uuid.uuid4()
+    for i in range(size):
+        start = BASE_DATE + timedelta(days=i * 4)
+        repo.add(Reservation(
+            guest_id=guest_id,
+            caravan_id=caravan_id,
+            start_date=start,
+            end_date=start + timedelta(days=3),
+            total_price=300.0,
+        ))
+    return repo, caravan_id
+
+
+def linear_scan(repo: ReservationRepository, caravan_id: uuid.UUID, start_date: date, end_date: date):
+    """The O(n) conflict check the validator used before the index existed."""
+    for r in repo.get_for_caravan(caravan_id):
+        if r.status in [ReservationStatus.CANCELLED, ReservationStatus.REJECTED]:
+            continue
+        if r.start_date < end_date and r.end_date > start_date:
+            return r
+    return None
+
+
+def measure(fn, number: int) -> float:
+    """Returns the best per-call latency in microseconds over a few repeats."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    print(f"{'reservations':>12} {'linear scan (us)':>18} {'index (us)':>12}")
+    for size in SIZES:
+        repo, caravan_id = build_repository(size)
+        # A free gap right after the last booking: the worst case for the linear scan.
+        start = BASE_DATE + timedelta(days=size * 4)
+        end = start + timedelta(days=2)
+        number = max(10, 100_000 // size)
+        linear = measure(lambda: linear_scan(repo, caravan_id, start, end), number)
+        indexed = measure(lambda: repo.find_conflict(caravan_id, start, end), 100_000)
+        print(f"{size:>12} {linear:>18.2f} {indexed:>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark for API time-to-first-request on a large dataset.
+
+Builds an event-log data directory holding N reservations (as
+benchmarks.startup does), then starts the API in a fresh interpreter
+pointed at it, driving the ASGI lifespan in-process like a server would,
+and records from process launch:
+
+    accepting   the app answers requests (liveness)
+    ready       /health/ready returns 200 (polled every 50 ms)
+    first       the first GET /api/caravans succeeded, and how long it took
+
+"blocking" wires everything before accepting connections, as the API did
+when setup ran at import time; "background" is the lifespan startup.
+
+Usage:
+    python -m benchmarks.first_request [--reservations N] [--tail T]
+"""
+import argparse
+import asyncio
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.startup import populate
+
+
+async def serve(mode: str) -> dict:
+    from benchmarks.asgi import request
+    import api
+
+    events = {"imported": time.time()}
+    if mode == "blocking":
+        api.startup.run()
+    lifespan = api.app.router.lifespan_context(api.app)
+    await lifespan.__aenter__()
+    events["accepting"] = time.time()
+    while (await request(api.app, "GET", "/health/ready"))[0] != 200:
+        await asyncio.sleep(0.05)
+    events["ready"] = time.time()
+    started = time.perf_counter()
+    status, _, _ = await request(api.app, "GET", "/api/caravans", "limit=50")
+    assert status == 200, status
+    events["first_request_ms"] = (time.perf_counter() - started) * 1e3
+    events["first"] = time.time()
+    events["startup"] = api.startup.status()
+    return events
+
+
+def launch(mode: str, directory: str) -> dict:
+    env = dict(os.environ, CARAVANSHARE_DATA_DIR=directory)
+    launched = time.time()
+    output = subprocess.run(
+        [sys.executable, "-m", "benchmarks.first_request", "--serve", mode],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    events = json.loads(output.strip().splitlines()[-1])
+    for name in ("imported", "accepting", "ready", "first"):
+        events[name] -= launched
+    return events
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reservations", type=int, default=500_000)
+    parser.add_argument("--tail", type=int, default=10_000)
+    parser.add_argument("--serve", choices=("blocking", "background"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        print(json.dumps(asyncio.run(serve(args.serve))), flush=True)
+        # Skip the shutdown snapshot so every run starts from the same directory.
+        os._exit(0)
+
+    directory = tempfile.mkdtemp()
+    try:
+        populate(directory, args.reservations, args.tail)
+        print(f"{args.reservations} reservations in snapshot, {args.tail} in log tail")
+        print(f"{'startup':<12}{'accepting':>11}{'ready':>9}{'first ok':>10}{'first req':>11}  (load / warm-up)")
+        for mode in ("blocking", "background"):
+            e = launch(mode, directory)
+            print(f"{mode:<12}{e['accepting']:>10.2f}s{e['ready']:>8.2f}s{e['first']:>9.2f}s"
+                  f"{e['first_request_ms']:>8.1f} ms  ({e['startup']['load_seconds']:.2f}s"
+                  f" / {e['startup']['warm_up_seconds']:.2f}s)")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Benchmark for location queries.
+
+Scatters `--caravans` caravans (each with one reservation) over South Korea
+and compares the caravan repository's grid index with a brute-force
+haversine scan of the fleet, for radius queries, bounding-box queries and
+radius queries combined with date availability.
+
+Usage:
+    python -m benchmarks.geo_search [--caravans N] [--queries N] [--radius KM]
+"""
+import argparse
+import random
+import time
+import uuid
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.geo import BoundingBox, GeoCircle, haversine_km
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.services.availability_service import AvailabilityService
+
+SOUTH, NORTH, WEST, EAST = 33.0, 38.6, 124.6, 131.0
+
+
+def setup(caravans: int, rng: random.Random):
+    caravan_repo, reservation_repo = CaravanRepository(), ReservationRepository()
+    host_id = uuid.uuid4()
+    today = date.today()
+    for _ in range(caravans):
+        caravan = Caravan(
+            host_id=host_id, name="Van", location="Korea", capacity=4, daily_rate=100.0,
+            latitude=rng.uniform(SOUTH, NORTH), longitude=rng.uniform(WEST, EAST),
+        )
+        caravan_repo.add(caravan)
+        start = today + timedelta(days=rng.randint(1, 60))
+        reservation_repo.add(Reservation(
+            uuid.uuid4(), caravan.id, start, start + timedelta(days=3), 300.0, status=ReservationStatus.APPROVED,
+        ))
+    return caravan_repo, reservation_repo
+
+
+def measure(fn, queries) -> float:
+    started = time.perf_counter()
+    for query in queries:
+        fn(query)
+    return (time.perf_counter() - started) / len(queries)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--caravans", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--radius", type=float, default=50.0)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    caravan_repo, reservation_repo = setup(args.caravans, rng)
+    fleet = caravan_repo.get_all()
+    availability = AvailabilityService(caravan_repo, reservation_repo)
+    start = date.today() + timedelta(days=20)
+    end = start + timedelta(days=2)
+
+    circles = [GeoCircle(rng.uniform(SOUTH, NORTH), rng.uniform(WEST, EAST), args.radius) for _ in range(args.queries)]
+    boxes = [c.bounding_box() for c in circles]
+
+    def scan_radius(circle):
+        return [
+            c for c in fleet
+            if haversine_km(circle.latitude, circle.longitude, c.latitude, c.longitude) <= circle.radius_km
+        ]
+
+    def scan_box(box: BoundingBox):
+        return [c for c in fleet if box.contains(c.latitude, c.longitude)]
+
+    def scan_available(circle):
+        return reservation_repo.filter_available(scan_radius(circle), start, end)
+
+    found = sum(len(caravan_repo.query(area=c)) for c in circles) / len(circles)
+    print(f"{args.caravans} caravans, {args.queries} queries, {args.radius:.0f} km radius (~{found:.0f} matches each)")
+    print("                              grid index   haversine scan")
+    rows = [
+        ("radius", lambda c: caravan_repo.query(area=c), scan_radius, circles),
+        ("bounding box", lambda b: caravan_repo.query(area=b), scan_box, boxes),
+        ("radius + availability", lambda c: availability.find_available_caravans(start, end, area=c), scan_available, circles),
+    ]
+    for label, indexed, scan, queries in rows:
+        print(f"  {label:<24}{measure(indexed, queries) * 1e3:>10.2f} ms{measure(scan, queries) * 1e3:>14.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Micro-benchmark for retried booking requests.
+
+Simulates a retry storm: every booking is sent several times. Without an
+idempotency key each retry is looked up, validated and rejected with a
+BookingConflictError against its own earlier booking; with a key the retry
+is answered from the IdempotencyCache.
+
+Usage:
+    python -m benchmarks.idempotent_retries [--bookings N] [--retries N] [--existing N]
+"""
+import argparse
+import time
+import uuid
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation
+from src.models.user import User, UserRole
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.services.reservation_service import ReservationService
+from src.services.reservation_validator import ReservationValidator
+from src.exceptions.reservation import BookingConflictError
+
+BASE_DATE = date(2030, 1, 1)
+
+
+def setup(existing: int):
+    user_repo, caravan_repo, reservation_repo = UserRepository(), CaravanRepository(), ReservationRepository()
+    guest = User(name="Guest", contact="guest@example.com", role=UserRole.GUEST)
+    user_repo.add(guest)
+    caravan = Caravan(host_id=guest.id, name="Van", location="Seoul", capacity=4, daily_rate=100.0)
+    caravan_repo.add(caravan)
+    for i in range(existing):
+        start = BASE_DATE - timedelta(days=3 * (i + 1))
+        reservation_repo.add(Reservation(guest.id, caravan.id, start, start + timedelta(days=2), 200.0))
+    service = ReservationService(reservation_repo, caravan_repo, user_repo, ReservationValidator(reservation_repo))
+    return service, guest.id, caravan.id
+
+
+def storm(service, guest_id, caravan_id, bookings: int, retries: int, keyed: bool) -> float:
+    """Returns the mean time per retried request in microseconds."""
+    elapsed = 0.0
+    for i in range(bookings):
+        start = BASE_DATE + timedelta(days=3 * i)
+        args = (guest_id, caravan_id, start, start + timedelta(days=2))
+        key = str(uuid.uuid4()) if keyed else None
+        service.create_reservation(*args, idempotency_key=key)
+        began = time.perf_counter()
+        for _ in range(retries):
+            try:
+                service.create_reservation(*args, idempotency_key=key)
+            except BookingConflictError:
+                pass
+        elapsed += time.perf_counter() - began
+    return elapsed / (bookings * retries) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bookings", type=int, default=2_000)
+    parser.add_argument("--retries", type=int, default=5)
+    parser.add_argument("--existing", type=int, default=1_000)
+    args = parser.parse_args()
+
+    plain = storm(*setup(args.existing), args.bookings, args.retries, keyed=False)
+    keyed = storm(*setup(args.existing), args.bookings, args.retries, keyed=True)
+    print(f"{args.bookings} bookings x {args.retries} retries, caravan with {args.existing} earlier stays")
+    print(f"  without key (validate + conflict): {plain:>7.2f} us per retry")
+    print(f"  with Idempotency-Key:              {keyed:>7.2f} us per retry  ({plain / keyed:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
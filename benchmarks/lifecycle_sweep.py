@@ -0,0 +1,95 @@
+"""
+Benchmark for the sweep that completes ended reservations.
+
+Compares completing every ended reservation one `update_status` call at a
+time with a single `transition_ended` bulk call, for both repository
+implementations.
+
+Usage:
+    python -m benchmarks.lifecycle_sweep [--reservations N]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.sqlite.connection_pool import SQLiteConnectionPool
+from src.repositories.sqlite.reservation_repository import SQLiteReservationRepository
+
+BASE_DATE = date(2000, 1, 1)
+SWEEP_DATE = date(2030, 1, 1)
+
+
+def make_reservations(count: int) -> list:
+    """Approved 3-night stays over 100 caravans; half of them ended before SWEEP_DATE."""
+    caravans = [uuid.uuid4() for _ in range(100)]
+    guest_id = uuid.uuid4()
+    result = []
+    for i in range(count):
+        start = BASE_DATE + timedelta(days=(i // len(caravans)) * 4)
+        if i % 2:
+            start += timedelta(days=365 * 40)
+        result.append(Reservation(
+            guest_id=guest_id, caravan_id=caravans[i % len(caravans)], start_date=start,
+            end_date=start + timedelta(days=3), total_price=300.0, status=ReservationStatus.APPROVED,
+        ))
+    return result
+
+
+def per_object(repo) -> int:
+    ended = [r for r in repo.get_all() if r.status == ReservationStatus.APPROVED and r.end_date <= SWEEP_DATE]
+    for reservation in ended:
+        repo.update_status(reservation.id, ReservationStatus.COMPLETED)
+    return len(ended)
+
+
+def bulk(repo) -> int:
+    return len(repo.transition_ended(ReservationStatus.APPROVED, ReservationStatus.COMPLETED, SWEEP_DATE))
+
+
+def timed(build, sweep) -> tuple[float, int]:
+    repo = build()
+    started = time.perf_counter()
+    count = sweep(repo)
+    return (time.perf_counter() - started) * 1000, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reservations", type=int, default=20_000)
+    args = parser.parse_args()
+    tmpdir = tempfile.mkdtemp()
+    pools = []
+
+    def in_memory():
+        repo = ReservationRepository()
+        repo.add_many(make_reservations(args.reservations))
+        return repo
+
+    def sqlite():
+        pool = SQLiteConnectionPool(os.path.join(tmpdir, f"sweep-{len(pools)}.db"))
+        pools.append(pool)
+        repo = SQLiteReservationRepository(pool)
+        repo.add_many(make_reservations(args.reservations))
+        return repo
+
+    try:
+        print(f"{'backend':<10} {'per object (ms)':>16} {'bulk (ms)':>10} {'completed':>10}")
+        for name, build in (("memory", in_memory), ("sqlite", sqlite)):
+            slow, count = timed(build, per_object)
+            fast, bulk_count = timed(build, bulk)
+            assert count == bulk_count
+            print(f"{name:<10} {slow:>16.1f} {fast:>10.1f} {count:>10}")
+    finally:
+        for pool in pools:
+            pool.close()
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark for the cost of metrics instrumentation.
+
+Times an empty method and ReservationService.create_reservation (against a
+fleet of `--caravans` caravans) three ways: uninstrumented, instrumented
+with the registry disabled, and instrumented with it enabled. Also times
+rendering /metrics for the resulting registry.
+
+Usage:
+    python -m benchmarks.metrics_overhead [--calls N] [--caravans N]
+"""
+import argparse
+import time
+import uuid
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.user import User, UserRole
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.services.metrics import MetricsRegistry
+from src.services.reservation_service import ReservationService
+from src.services.reservation_validator import ReservationValidator
+
+
+class Empty:
+    def noop(self):
+        pass
+
+
+def setup(caravans: int, metrics: MetricsRegistry | None):
+    user_repo, caravan_repo, reservation_repo = UserRepository(), CaravanRepository(), ReservationRepository()
+    guest = User(name="Guest", contact="guest@example.com", role=UserRole.GUEST)
+    user_repo.add(guest)
+    host_id = uuid.uuid4()
+    fleet = [Caravan(host_id=host_id, name="Van", location="Seoul", capacity=4, daily_rate=100.0) for _ in range(caravans)]
+    for caravan in fleet:
+        caravan_repo.add(caravan)
+    validator = ReservationValidator(reservation_repo)
+    if metrics is not None:
+        metrics.instrument(user_repo, "user_repository", ["get_by_id"])
+        metrics.instrument(caravan_repo, "caravan_repository", ["get_by_id"])
+        metrics.instrument(reservation_repo, "reservation_repository", ["add", "find_conflict"])
+        metrics.instrument(validator, "reservation_validator", [
+            "_validate_dates", "_validate_caravan_status", "_validate_booking_conflict",
+        ])
+    service = ReservationService(reservation_repo, caravan_repo, user_repo, validator)
+    if metrics is not None:
+        metrics.instrument(service, "reservation_service", ["create_reservation"])
+    return service, guest, fleet
+
+
+def measure(fn, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - started) / calls
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--caravans", type=int, default=10_000)
+    args = parser.parse_args()
+
+    print("                              empty method   create_reservation")
+    plain = Empty()
+    registry = None
+    for label, enabled in (("uninstrumented", None), ("instrumented, disabled", False), ("instrumented, enabled", True)):
+        target = Empty()
+        registry = MetricsRegistry(enabled=bool(enabled)) if enabled is not None else None
+        if registry is not None:
+            registry.instrument(target, "benchmark", ["noop"])
+        noop = measure(target.noop if registry is not None else plain.noop, args.calls)
+
+        service, guest, fleet = setup(args.caravans, registry)
+        bookings = iter(
+            (caravan.id, date.today() + timedelta(days=1 + 3 * week), date.today() + timedelta(days=3 + 3 * week))
+            for week in range(10**9) for caravan in fleet
+        )
+
+        def book():
+            caravan_id, start, end = next(bookings)
+            service.create_reservation(guest.id, caravan_id, start, end)
+
+        booking = measure(book, min(args.calls, 10 * args.caravans))
+        print(f"  {label:<26}{noop * 1e9:>10.0f} ns{booking * 1e6:>17.2f} us")
+
+    started = time.perf_counter()
+    text = registry.render()
+    print(f"render /metrics: {(time.perf_counter() - started) * 1e3:.2f} ms ({len(text.splitlines())} lines)")
+
+
+if __name__ == "__main__":
+    main()
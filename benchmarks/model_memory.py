@@ -0,0 +1,87 @@
+"""
+Memory per stored reservation before and after the compact model changes.
+
+"before" rebuilds the original layout: a dataclass with a per-instance
+__dict__, and fresh UUID and date objects per reservation as they come out
+of request parsing. "after" uses the slotted Reservation model with IDs
+shared with the stored guest/caravan and interned dates, as
+ReservationService now creates them.
+
+Usage:
+    python -m benchmarks.model_memory [--count N]
+"""
+import argparse
+import dataclasses
+import gc
+import tracemalloc
+import uuid
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.interning import intern_date
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.user import User, UserRole
+
+
+@dataclasses.dataclass
+class LegacyReservation:
+    guest_id: uuid.UUID
+    caravan_id: uuid.UUID
+    start_date: date
+    end_date: date
+    total_price: float
+    id: uuid.UUID = dataclasses.field(default_factory=uuid.uuid4)
+    status: ReservationStatus = ReservationStatus.PENDING
+
+
+def measure(build, count: int) -> float:
+    """Returns the bytes allocated per item by `build(i)`, keeping all items alive."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    items = [build(i) for i in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del items
+    return (after - before) / count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=200_000)
+    args = parser.parse_args()
+
+    guests = [User(name=f"G{i}", contact="g@example.com", role=UserRole.GUEST) for i in range(1000)]
+    caravans = [Caravan(host_id=uuid.uuid4(), name=f"C{i}", location="Seoul", capacity=4, daily_rate=100.0)
+                for i in range(500)]
+    base = date(2030, 1, 1)
+
+    def legacy(i: int) -> LegacyReservation:
+        start = base + timedelta(days=i % 730)
+        return LegacyReservation(
+            guest_id=uuid.UUID(str(guests[i % len(guests)].id)),
+            caravan_id=uuid.UUID(str(caravans[i % len(caravans)].id)),
+            start_date=date.fromordinal(start.toordinal()),
+            end_date=start + timedelta(days=3),
+            total_price=300.0,
+        )
+
+    def compact(i: int) -> Reservation:
+        start = base + timedelta(days=i % 730)
+        return Reservation(
+            guest_id=guests[i % len(guests)].id,
+            caravan_id=caravans[i % len(caravans)].id,
+            start_date=intern_date(start),
+            end_date=intern_date(start + timedelta(days=3)),
+            total_price=300.0,
+        )
+
+    before = measure(legacy, args.count)
+    after = measure(compact, args.count)
+    print(f"{args.count} reservations")
+    print(f"  before: {before:>7.1f} bytes/reservation")
+    print(f"  after:  {after:>7.1f} bytes/reservation  ({(1 - after / before) * 100:.0f}% less)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark for payment settlement.
+
+Books N reservations against a gateway that takes `--latency` seconds per
+call, and compares charging each payment inside the booking call with
+queueing it for PaymentService's batched background settlement. Reports
+the booking latency and the time until every payment is settled.
+
+Usage:
+    python -m benchmarks.payments [--bookings N] [--latency S] [--batch-size N]
+"""
+import argparse
+import asyncio
+import time
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.payment import Payment, PaymentStatus
+from src.models.user import User, UserRole
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.payment_repository import PaymentRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.services.payment_gateway import FakePaymentGateway
+from src.services.payment_service import PaymentService
+from src.services.reservation_service import ReservationService
+from src.services.reservation_validator import ReservationValidator
+
+BASE_DATE = date(2030, 1, 1)
+
+
+def setup():
+    user_repo, caravan_repo, reservation_repo = UserRepository(), CaravanRepository(), ReservationRepository()
+    guest = User(name="Guest", contact="guest@example.com", role=UserRole.GUEST)
+    user_repo.add(guest)
+    caravan = Caravan(host_id=guest.id, name="Van", location="Seoul", capacity=4, daily_rate=100.0)
+    caravan_repo.add(caravan)
+    service = ReservationService(reservation_repo, caravan_repo, user_repo, ReservationValidator(reservation_repo))
+    return service, reservation_repo, guest.id, caravan.id
+
+
+def book(service, guest_id, caravan_id, i: int):
+    start = BASE_DATE + timedelta(days=3 * i)
+    return service.create_reservation(guest_id, caravan_id, start, start + timedelta(days=2))
+
+
+async def charge_inline(bookings: int, latency: float):
+    """Each booking waits for its own gateway call."""
+    service, _, guest_id, caravan_id = setup()
+    gateway = FakePaymentGateway(latency=latency)
+    started = time.perf_counter()
+    for i in range(bookings):
+        reservation = book(service, guest_id, caravan_id, i)
+        await gateway.charge([Payment(reservation.id, reservation.total_price)])
+    elapsed = time.perf_counter() - started
+    return elapsed / bookings, elapsed
+
+
+async def charge_queued(bookings: int, latency: float, batch_size: int):
+    """Bookings only queue their payment; PaymentService settles them in batches."""
+    service, reservation_repo, guest_id, caravan_id = setup()
+    payment_repo = PaymentRepository()
+    payments = PaymentService(payment_repo, FakePaymentGateway(latency=latency), batch_size=batch_size)
+    reservation_repo.subscribe(payments)
+    payments.start()
+    started = time.perf_counter()
+    for i in range(bookings):
+        book(service, guest_id, caravan_id, i)
+        await asyncio.sleep(0)  # Let the settlement task run between requests.
+    booked = time.perf_counter() - started
+    while any(p.status is PaymentStatus.PENDING for p in payment_repo.get_all()):
+        await asyncio.sleep(0.001)
+    settled = time.perf_counter() - started
+    await payments.stop()
+    return booked / bookings, settled
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bookings", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--batch-size", type=int, default=100)
+    args = parser.parse_args()
+
+    inline_booking, inline_total = asyncio.run(charge_inline(args.bookings, args.latency))
+    queued_booking, queued_total = asyncio.run(charge_queued(args.bookings, args.latency, args.batch_size))
+    print(f"{args.bookings} bookings, gateway latency {args.latency * 1000:.0f} ms per call")
+    print(f"  charge in booking call:  booking {inline_booking * 1e6:>9.1f} us   all settled {inline_total:>6.2f} s")
+    print(f"  queued, batched:         booking {queued_booking * 1e6:>9.1f} us   all settled {queued_total:>6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
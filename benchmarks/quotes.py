@@ -0,0 +1,46 @@
+"""
+Micro-benchmark for price quotes.
+
+Measures a quote computed through the full rule pipeline against one served
+from the PricingEngine's LRU cache, for a typical one-week stay.
+
+Usage:
+    python -m benchmarks.quotes
+"""
+import timeit
+import uuid
+from datetime import date
+
+from src.models.caravan import Caravan
+from src.services.pricing_engine import (
+    PricingEngine, WeekendMultiplier, SeasonalMultiplier, LengthOfStayDiscount, LocationSurcharge,
+)
+
+RULES = [
+    WeekendMultiplier(1.2),
+    SeasonalMultiplier(frozenset({7, 8}), 1.3),
+    LocationSurcharge("Seoul", 10.0),
+    LengthOfStayDiscount(7, 0.1),
+]
+
+
+def measure(fn, number: int) -> float:
+    """Returns the best per-call latency in microseconds over a few repeats."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    caravan = Caravan(host_id=uuid.uuid4(), name="C", location="Seoul", capacity=4, daily_rate=150.0)
+    start, end = date(2030, 7, 26), date(2030, 8, 2)
+    uncached = PricingEngine(RULES, cache_size=0)
+    cached = PricingEngine(RULES)
+    cached.quote(caravan, start, end)
+
+    computed = measure(lambda: uncached.quote(caravan, start, end), 20_000)
+    hit = measure(lambda: cached.quote(caravan, start, end), 200_000)
+    print(f"computed quote: {computed:>6.2f} us")
+    print(f"cached quote:   {hit:>6.2f} us  ({computed / hit:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
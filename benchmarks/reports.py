@@ -0,0 +1,81 @@
+"""
+Benchmark for occupancy and revenue reports.
+
+Compares aggregating over Reservation objects, as a report built on
+`ReservationRepository.get_all()` would, with the scan over the typed
+columns of ColumnarReservationStore.
+
+Usage:
+    python -m benchmarks.reports [--count N] [--caravans N]
+"""
+import argparse
+import time
+import uuid
+from datetime import date, timedelta
+from typing import Dict, List
+
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.availability_index import INACTIVE_STATUSES
+from src.repositories.columnar_store import ColumnarReservationStore
+
+BASE_DATE = date(2030, 1, 1)
+
+
+def object_occupancy(reservations: List[Reservation], start_date: date, end_date: date) -> Dict[uuid.UUID, int]:
+    """Per-caravan occupied nights, computed by walking Reservation objects."""
+    totals: Dict[uuid.UUID, int] = {}
+    for r in reservations:
+        if r.status in INACTIVE_STATUSES or r.start_date >= end_date or r.end_date <= start_date:
+            continue
+        nights = (min(r.end_date, end_date) - max(r.start_date, start_date)).days
+        totals[r.caravan_id] = totals.get(r.caravan_id, 0) + nights
+    return totals
+
+
+def timed(fn) -> float:
+    """Returns the best wall time of a few runs, in milliseconds."""
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--caravans", type=int, default=5_000)
+    args = parser.parse_args()
+
+    caravan_ids = [uuid.uuid4() for _ in range(args.caravans)]
+    guest_id = uuid.uuid4()
+    statuses = list(ReservationStatus)
+    reservations = []
+    for i in range(args.count):
+        start = BASE_DATE + timedelta(days=(i * 7) % 730)
+        reservations.append(Reservation(
+            guest_id=guest_id,
+            caravan_id=caravan_ids[i % len(caravan_ids)],
+            start_date=start,
+            end_date=start + timedelta(days=1 + i % 5),
+            total_price=100.0 * (1 + i % 5),
+            status=statuses[i % len(statuses)],
+        ))
+    store = ColumnarReservationStore()
+    store.load(reservations)
+
+    start, end = date(2030, 3, 1), date(2030, 9, 1)
+    assert object_occupancy(reservations, start, end) == store.occupied_nights(start, end)
+
+    objects = timed(lambda: object_occupancy(reservations, start, end))
+    columnar = timed(lambda: store.occupied_nights(start, end))
+    revenue = timed(lambda: store.revenue(start, end))
+    print(f"{args.count} reservations, {args.caravans} caravans")
+    print(f"  occupancy, object scan:   {objects:>8.1f} ms")
+    print(f"  occupancy, columnar scan: {columnar:>8.1f} ms  ({objects / columnar:.1f}x)")
+    print(f"  revenue, columnar scan:   {revenue:>8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Compares the in-memory and SQLite repository implementations.
+
+Measures bulk insert throughput, conflict-check latency and lookup-by-ID
+latency for one long-lived caravan and a small fleet.
+
+Usage:
+    python -m benchmarks.repository_backends [--reservations N]
+"""
+import argparse
+import os
+import shutil
+import tempfile
+import time
+import timeit
+import uuid
+from datetime import date, timedelta
+
+from src.models.reservation import Reservation
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.sqlite.connection_pool import SQLiteConnectionPool
+from src.repositories.sqlite.reservation_repository import SQLiteReservationRepository
+
+BASE_DATE = date(2000, 1, 1)
+
+
+def make_reservations(count: int, caravans: list) -> list:
+    """Back-to-back 3-night bookings spread round-robin over the caravans."""
+    guest_id = uuid.uuid4()
+    result = []
+    for i in range(count):
+        start = BASE_DATE + timedelta(days=(i // len(caravans)) * 4)
+        result.append(Reservation(
+            guest_id=guest_id,
+            caravan_id=caravans[i % len(caravans)],
+            start_date=start,
+            end_date=start + timedelta(days=3),
+            total_price=300.0,
+        ))
+    return result
+
+
+def run(label: str, repo, reservations: list, caravans: list) -> None:
+    started = time.perf_counter()
+    for r in reservations:
+        repo.add(r)
+    insert_rate = len(reservations) / (time.perf_counter() - started)
+
+    caravan_id = caravans[0]
+    last = max(r.end_date for r in reservations)
+    free = (last + timedelta(days=1), last + timedelta(days=3))
+    taken = (reservations[0].start_date, reservations[0].end_date)
+    probe = reservations[len(reservations) // 2].id
+    number = 2000
+
+    def per_call(fn):
+        return min(timeit.repeat(fn, number=number, repeat=3)) / number * 1e6
+
+    conflict_free = per_call(lambda: repo.find_conflict(caravan_id, *free))
+    conflict_hit = per_call(lambda: repo.find_conflict(caravan_id, *taken))
+    lookup = per_call(lambda: repo.get_by_id(probe))
+    print(f"{label:<10} {insert_rate:>12.0f} {conflict_free:>14.2f} {conflict_hit:>14.2f} {lookup:>12.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reservations", type=int, default=50_000)
+    parser.add_argument("--caravans", type=int, default=10)
+    args = parser.parse_args()
+
+    caravans = [uuid.uuid4() for _ in range(args.caravans)]
+    reservations = make_reservations(args.reservations, caravans)
+    print(f"{args.reservations} reservations over {args.caravans} caravans")
+    print(f"{'backend':<10} {'inserts/s':>12} {'free (us)':>14} {'conflict (us)':>14} {'by id (us)':>12}")
+
+    run("memory", ReservationRepository(), reservations, caravans)
+
+    tmpdir = tempfile.mkdtemp()
+    try:
+        pool = SQLiteConnectionPool(os.path.join(tmpdir, "bench.db"))
+        run("sqlite", SQLiteReservationRepository(pool), reservations, caravans)
+        pool.close()
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()
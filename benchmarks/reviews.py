@@ -0,0 +1,84 @@
+"""
+Benchmark for rating summaries.
+
+Writes `--reviews` reviews spread over `--caravans` caravans, then compares
+reading a caravan's average rating by scanning its reviews with reading the
+running summary kept by RatingIndex, and times a rating-sorted caravan
+listing page built from the summaries.
+
+Usage:
+    python -m benchmarks.reviews [--caravans N] [--reviews N]
+"""
+import argparse
+import random
+import time
+import uuid
+
+from src.models.caravan import Caravan
+from src.models.review import Review
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.rating_index import RatingIndex
+from src.repositories.review_repository import ReviewRepository
+from src.services.caravan_listing_service import CaravanListingService, CaravanQuery
+
+
+def setup(caravans: int, reviews: int):
+    caravan_repo, review_repo = CaravanRepository(), ReviewRepository()
+    hosts = [uuid.uuid4() for _ in range(max(1, caravans // 10))]
+    ids = []
+    for i in range(caravans):
+        caravan = Caravan(host_id=hosts[i % len(hosts)], name=f"Van {i}", location="Seoul", capacity=4, daily_rate=100.0)
+        caravan_repo.add(caravan)
+        ids.append(caravan.id)
+    ratings = RatingIndex(caravan_repo)
+    review_repo.subscribe(ratings)
+    rng = random.Random(0)
+    for _ in range(reviews):
+        review_repo.add(Review(uuid.uuid4(), uuid.uuid4(), rng.choice(ids), rng.randint(1, 5), ""))
+    return caravan_repo, review_repo, ratings, ids
+
+
+def measure(fn, targets) -> float:
+    started = time.perf_counter()
+    for target in targets:
+        fn(target)
+    return (time.perf_counter() - started) / len(targets)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--caravans", type=int, default=1_000)
+    parser.add_argument("--reviews", type=int, default=200_000)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    caravan_repo, review_repo, ratings, ids = setup(args.caravans, args.reviews)
+    write = (time.perf_counter() - started) / args.reviews
+    targets = ids[:200]
+
+    def scan(target):
+        reviews = review_repo.get_for_target(target)
+        return sum(r.rating for r in reviews) / len(reviews) if reviews else None
+
+    scanned = measure(scan, targets)
+    summarized = measure(lambda target: ratings.summary(target).average, targets)
+
+    listing = CaravanListingService(caravan_repo, ratings=ratings)
+    listing.load(caravan_repo.get_all())
+    query = CaravanQuery(sort_by_rating=True)
+    started = time.perf_counter()
+    listing.get_page(query, limit=50)
+    cold = time.perf_counter() - started
+    started = time.perf_counter()
+    listing.get_page(query, limit=50)
+    warm = time.perf_counter() - started
+
+    print(f"{args.reviews} reviews over {args.caravans} caravans ({write * 1e6:.1f} us per review written)")
+    print(f"  average by scanning reviews:   {scanned * 1e6:>9.1f} us")
+    print(f"  average from running summary:  {summarized * 1e6:>9.1f} us")
+    print(f"  rating-sorted page, uncached:  {cold * 1e3:>9.2f} ms")
+    print(f"  rating-sorted page, cached:    {warm * 1e3:>9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
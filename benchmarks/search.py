@@ -0,0 +1,166 @@
+"""
+Benchmark for ranked caravan search.
+
+Builds a fleet of `--caravans` caravans with reviews and reservations, then
+runs a mix of search queries (with and without dates, guests, location and
+price range) and reports latency percentiles of SearchService's heap-based
+top-k selection, with and without a NightlyOccupancy, next to scoring and
+sorting every caravan. The same is then measured for dated queries in a
+week when every caravan is booked.
+
+Usage:
+    python -m benchmarks.search [--caravans N] [--queries N] [--k N]
+"""
+import argparse
+import random
+import statistics
+import time
+import uuid
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan, CaravanStatus
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.review import Review
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.rating_index import RatingIndex
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.review_repository import ReviewRepository
+from src.repositories.search_index import CaravanSearchIndex
+from src.repositories.nightly_occupancy import NightlyOccupancy
+from src.services.search_service import SearchQuery, SearchService
+
+LOCATIONS = ["Seoul", "Busan", "Incheon", "Daegu", "Daejeon", "Gwangju", "Ulsan", "Jeju"]
+# Days from today of the sold-out stretch, after every regular booking and query.
+SOLD_OUT_FROM = 70
+
+
+def setup(caravans: int, seed: int = 0):
+    rng = random.Random(seed)
+    caravan_repo, reservation_repo, review_repo = CaravanRepository(), ReservationRepository(), ReviewRepository()
+    ratings = RatingIndex(caravan_repo)
+    review_repo.subscribe(ratings)
+    index = CaravanSearchIndex(ratings)
+    caravan_repo.subscribe(index)
+    review_repo.subscribe(index)
+    occupancy = NightlyOccupancy(index)
+    reservation_repo.subscribe(occupancy)
+    hosts = [uuid.uuid4() for _ in range(max(1, caravans // 20))]
+    today = date.today()
+    for _ in range(caravans):
+        caravan = Caravan(
+            host_id=rng.choice(hosts),
+            name="Van",
+            location=rng.choice(LOCATIONS),
+            capacity=rng.randint(2, 8),
+            daily_rate=float(rng.randrange(50, 400, 5)),
+        )
+        caravan_repo.add(caravan)
+        for _ in range(rng.randint(0, 3)):
+            review_repo.add(Review(uuid.uuid4(), uuid.uuid4(), caravan.id, rng.randint(1, 5), ""))
+        start = today + timedelta(days=rng.randint(1, 60))
+        reservation_repo.add(Reservation(
+            uuid.uuid4(), caravan.id, start, start + timedelta(days=rng.randint(1, 7)), 0.0,
+            status=ReservationStatus.APPROVED,
+        ))
+        # The whole fleet is booked during the sold-out week.
+        reservation_repo.add(Reservation(
+            uuid.uuid4(), caravan.id, today + timedelta(days=SOLD_OUT_FROM), today + timedelta(days=SOLD_OUT_FROM + 8),
+            0.0, status=ReservationStatus.APPROVED,
+        ))
+        if rng.random() < 0.05:
+            caravan_repo.update_status(caravan.id, CaravanStatus.MAINTENANCE)
+    services = SearchService(reservation_repo, index, occupancy=occupancy), SearchService(reservation_repo, index)
+    return services, caravan_repo, reservation_repo, index
+
+
+def random_query(rng: random.Random) -> SearchQuery:
+    start = date.today() + timedelta(days=rng.randint(1, 60)) if rng.random() < 0.7 else None
+    low = float(rng.randrange(50, 300, 10)) if rng.random() < 0.3 else None
+    return SearchQuery(
+        start_date=start,
+        end_date=start + timedelta(days=rng.randint(1, 7)) if start else None,
+        guests=rng.randint(1, 6) if rng.random() < 0.7 else None,
+        location=rng.choice(LOCATIONS) if rng.random() < 0.5 else None,
+        min_daily_rate=low,
+        max_daily_rate=low + 50 if low is not None else None,
+    )
+
+
+def sold_out_query(rng: random.Random) -> SearchQuery:
+    start = date.today() + timedelta(days=SOLD_OUT_FROM + rng.randint(0, 5))
+    return SearchQuery(
+        start_date=start,
+        end_date=start + timedelta(days=rng.randint(1, 3)),
+        guests=rng.randint(1, 6) if rng.random() < 0.7 else None,
+        location=rng.choice(LOCATIONS) if rng.random() < 0.5 else None,
+    )
+
+
+def sort_everything(caravan_repo, reservation_repo, index, sequences, query: SearchQuery, k: int):
+    """Scores every matching caravan and sorts them all."""
+    weights = index.weights
+    candidates = caravan_repo.query(
+        location=query.location,
+        status=CaravanStatus.AVAILABLE,
+        min_capacity=query.guests,
+        min_daily_rate=query.min_daily_rate,
+        max_daily_rate=query.max_daily_rate,
+    )
+    scored = []
+    for caravan in candidates:
+        score = index.base_score(sequences[caravan.id])
+        score += weights.capacity * (min(1.0, query.guests / caravan.capacity) if query.guests else 1.0)
+        if query.start_date is None or reservation_repo.find_conflict(
+            caravan.id, query.start_date, query.end_date
+        ) is None:
+            score += weights.availability
+        scored.append((score, caravan))
+    scored.sort(key=lambda item: item[0], reverse=True)
+    return scored[:k]
+
+
+def percentiles(samples):
+    samples = sorted(samples)
+    pick = lambda q: samples[min(len(samples) - 1, int(q * len(samples)))] * 1e3
+    return statistics.fmean(samples) * 1e3, pick(0.5), pick(0.99), samples[-1] * 1e3
+
+
+def measure(fn, queries):
+    samples = []
+    for query in queries:
+        started = time.perf_counter()
+        fn(query)
+        samples.append(time.perf_counter() - started)
+    return percentiles(samples)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--caravans", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--k", type=int, default=20)
+    args = parser.parse_args()
+
+    (service, without_occupancy), caravan_repo, reservation_repo, index = setup(args.caravans)
+    sequences = {caravan.id: seq for seq, caravan in enumerate(caravan_repo.get_all())}
+    rng = random.Random(1)
+    workloads = [
+        ("mixed queries", [random_query(rng) for _ in range(args.queries)]),
+        ("sold-out dates", [sold_out_query(rng) for _ in range(args.queries)]),
+    ]
+    rows = [
+        ("heap top-k", lambda q: service.search(q, args.k)),
+        ("  without occupancy", lambda q: without_occupancy.search(q, args.k)),
+        ("score and sort all", lambda q: sort_everything(caravan_repo, reservation_repo, index, sequences, q, args.k)),
+    ]
+
+    print(f"{args.caravans} caravans, {args.queries} queries, top {args.k}")
+    for workload, queries in workloads:
+        print(f"{workload:<26}mean ms    p50 ms    p99 ms    max ms")
+        for label, fn in rows:
+            mean, p50, p99, worst = measure(fn, queries)
+            print(f"  {label:<22}{mean:>9.2f}{p50:>10.2f}{p99:>10.2f}{worst:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+Benchmark for restarting the in-memory repositories from disk.
+
+Builds a data directory with a snapshot of N reservations plus a log tail
+of T more, then times reading the snapshot and bulk-loading the repository
+on their own, and a complete cold `Journal.recover` including tail replay.
+
+Usage:
+    python -m benchmarks.startup [--reservations N] [--tail T]
+"""
+import argparse
+import gc
+import os
+import shutil
+import tempfile
+import time
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.user import User, UserRole
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.repositories.durable.journal import Journal, SNAPSHOT_FILE
+from src.repositories.durable.snapshot import read_snapshot
+
+BASE_DATE = date(2020, 1, 1)
+
+
+def populate(directory: str, count: int, tail: int) -> None:
+    """Journals `count` reservations into a snapshot and `tail` more into the log after it."""
+    repos = (UserRepository(), CaravanRepository(), ReservationRepository())
+    journal = Journal(directory, *repos)
+    journal.recover()
+    users, caravans, reservations = repos
+    host = User(name="Host", contact="host@example.com", role=UserRole.HOST)
+    users.add(host)
+    guests = [User(name=f"G{i}", contact="g@example.com", role=UserRole.GUEST) for i in range(1000)]
+    for guest in guests:
+        users.add(guest)
+    fleet = [Caravan(host_id=host.id, name=f"C{i}", location="Seoul", capacity=4, daily_rate=100.0)
+             for i in range(max(1, count // 1000))]
+    for caravan in fleet:
+        caravans.add(caravan)
+
+    statuses = list(ReservationStatus)
+    def make(i: int) -> Reservation:
+        start = BASE_DATE + timedelta(days=(i // len(fleet)) * 4 % 5000)
+        return Reservation(guests[i % len(guests)].id, fleet[i % len(fleet)].id, start,
+                           start + timedelta(days=3), 300.0, status=statuses[i % len(statuses)])
+
+    reservations.restore(make(i) for i in range(count))
+    journal.snapshot()
+    for i in range(count, count + tail):
+        reservations.add(make(i))
+    journal.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reservations", type=int, default=1_000_000)
+    parser.add_argument("--tail", type=int, default=10_000)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp()
+    try:
+        populate(directory, args.reservations, args.tail)
+        size = os.path.getsize(os.path.join(directory, SNAPSHOT_FILE))
+
+        gc.disable()
+        started = time.perf_counter()
+        snapshot = read_snapshot(os.path.join(directory, SNAPSHOT_FILE))
+        read = time.perf_counter() - started
+        started = time.perf_counter()
+        ReservationRepository().restore(snapshot.reservations)
+        restore = time.perf_counter() - started
+        del snapshot
+        gc.enable()
+        gc.collect()
+
+        repos = (UserRepository(), CaravanRepository(), ReservationRepository())
+        journal = Journal(directory, *repos)
+        started = time.perf_counter()
+        journal.recover()
+        total = time.perf_counter() - started
+        journal.close()
+        assert len(repos[2].get_all()) == args.reservations + args.tail
+
+        print(f"{args.reservations} reservations in snapshot ({size / 1e6:.0f} MB), {args.tail} in log tail")
+        print(f"  read snapshot:      {read:>6.2f} s")
+        print(f"  bulk-load indexes:  {restore:>6.2f} s")
+        print(f"  full recover:       {total:>6.2f} s  (incl. tail replay)")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
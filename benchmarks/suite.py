@@ -0,0 +1,361 @@
+"""
+Reproducible benchmark suite for the reservation hot path.
+
+For each scale, generates a synthetic fleet and booking history from a
+fixed seed, loads it into the application's repositories and measures:
+
+    create_reservation     bookings per second through the wired service
+    conflict_check         find_conflict latency (p50/p99)
+    list_caravans          GET /api/caravans latency through the ASGI app
+    memory                 bytes per user, caravan and reservation, indexes included
+
+Throughput is the best of `--repeat` runs and latencies the median, with
+the garbage collector paused while timing. Results are written as JSON, and
+can be compared against a baseline file from another commit: any metric
+that is worse by more than `--threshold` (relative) is reported as a
+regression and the exit status is 1.
+
+Usage:
+    python -m benchmarks.suite [--scales small,medium,large] [--repeat N] [--seed N]
+                               [--output FILE] [--compare BASELINE] [--threshold 0.15]
+    python -m benchmarks.suite --compare BASELINE --current FILE
+"""
+import argparse
+import asyncio
+import gc
+import importlib
+import json
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Tuple
+
+from benchmarks.asgi import request
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.user import User, UserRole
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+
+
+@dataclass(frozen=True)
+class Scale:
+    caravans: int
+    reservations_per_caravan: int
+    guests: int
+
+
+SCALES = {
+    "small": Scale(caravans=100, reservations_per_caravan=10, guests=50),
+    "medium": Scale(caravans=1_000, reservations_per_caravan=20, guests=500),
+    "large": Scale(caravans=10_000, reservations_per_caravan=20, guests=5_000),
+}
+LOCATIONS = ("Seoul", "Busan", "Incheon", "Daegu", "Daejeon", "Gwangju", "Gangneung", "Jeju")
+BOOKINGS_PER_RUN = 2_000
+CONFLICT_QUERIES = 20_000
+LIST_REQUESTS = 200
+# Histories are laid out around this day rather than today, so a seed always yields the same data.
+REFERENCE_DATE = date(2026, 1, 1)
+
+
+@dataclass
+class Fleet:
+    hosts: List[User]
+    guests: List[User]
+    caravans: List[Caravan]
+    reservations: List[Reservation]
+    # First day after every caravan's history, where new bookings go.
+    horizon: date
+
+
+def generate(scale: Scale, seed: int) -> Fleet:
+    """Builds the same fleet and history for the same scale and seed."""
+    rng = random.Random(seed)
+    new_id = lambda: uuid.UUID(int=rng.getrandbits(128), version=4)
+    hosts = [User(name=f"Host {i}", contact=f"host{i}@example.com", role=UserRole.HOST, id=new_id())
+             for i in range(max(1, scale.caravans // 10))]
+    guests = [User(name=f"Guest {i}", contact=f"guest{i}@example.com", role=UserRole.GUEST, id=new_id())
+              for i in range(scale.guests)]
+    caravans = [
+        Caravan(
+            host_id=rng.choice(hosts).id, name=f"Caravan {i}", location=rng.choice(LOCATIONS),
+            capacity=rng.randint(2, 8), daily_rate=float(rng.randrange(60, 300, 5)),
+            latitude=rng.uniform(33.0, 38.6), longitude=rng.uniform(124.6, 131.0), id=new_id(),
+        )
+        for i in range(scale.caravans)
+    ]
+    today = REFERENCE_DATE
+    reservations = []
+    horizon = today
+    for caravan in caravans:
+        # Back-to-back stays of 1-7 nights with 0-5 day gaps, from before the reference day into the months after.
+        start = today - timedelta(days=scale.reservations_per_caravan * 4)
+        for _ in range(scale.reservations_per_caravan):
+            start += timedelta(days=rng.randint(0, 5))
+            end = start + timedelta(days=rng.randint(1, 7))
+            if end <= today:
+                status = ReservationStatus.COMPLETED
+            else:
+                status = rng.choice((ReservationStatus.APPROVED, ReservationStatus.PENDING, ReservationStatus.CANCELLED))
+            reservations.append(Reservation(
+                guest_id=rng.choice(guests).id, caravan_id=caravan.id, start_date=start, end_date=end,
+                total_price=caravan.daily_rate * (end - start).days, id=new_id(), status=status,
+            ))
+            start = end
+        horizon = max(horizon, start + timedelta(days=1))
+    return Fleet(hosts, guests, caravans, reservations, horizon)
+
+
+def load_app(fleet: Fleet):
+    """Returns a freshly wired `api` module holding the fleet."""
+    api = importlib.reload(sys.modules["api"]) if "api" in sys.modules else importlib.import_module("api")
+    api.startup.run()
+    for user in fleet.hosts + fleet.guests:
+        api.user_repo.add(user)
+    for caravan in fleet.caravans:
+        api.caravan_repo.add(caravan)
+    api.reservation_repo.add_many(fleet.reservations)
+    return api
+
+
+@contextmanager
+def quiet_gc():
+    """Runs a timed section with the cyclic garbage collector paused, as timeit does."""
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+def percentile(samples: List[float], p: int) -> float:
+    return statistics.quantiles(samples, n=100)[p - 1]
+
+
+def measure_bookings(api, fleet: Fleet, run: int) -> float:
+    """Returns bookings per second for a batch of non-conflicting bookings."""
+    service = api.reservation_service
+    caravans, guests = fleet.caravans, fleet.guests
+    rounds = -(-BOOKINGS_PER_RUN // len(caravans))
+    # New bookings cannot start in the past, however far today is from the reference day.
+    first_week = max(fleet.horizon, date.today())
+    bookings = []
+    for i in range(BOOKINGS_PER_RUN):
+        # Every caravan is booked once per round; each round of each run gets its own week after the history.
+        week = run * rounds + i // len(caravans)
+        start = first_week + timedelta(days=7 * week)
+        bookings.append((guests[i % len(guests)].id, caravans[i % len(caravans)].id, start, start + timedelta(days=2)))
+    with quiet_gc():
+        started = time.perf_counter()
+        for guest_id, caravan_id, start, end in bookings:
+            service.create_reservation(guest_id, caravan_id, start, end)
+        elapsed = time.perf_counter() - started
+    return BOOKINGS_PER_RUN / elapsed
+
+
+def measure_conflicts(api, fleet: Fleet, rng: random.Random) -> Tuple[float, float]:
+    """Returns p50 and p99 find_conflict latency in microseconds."""
+    find_conflict = api.reservation_repo.find_conflict
+    today = REFERENCE_DATE
+    span = (fleet.horizon - today).days * 2
+    queries = []
+    for _ in range(CONFLICT_QUERIES):
+        first = today - timedelta(days=span // 2) + timedelta(days=rng.randrange(span))
+        queries.append((rng.choice(fleet.caravans).id, first, first + timedelta(days=rng.randint(1, 7))))
+    clock = time.perf_counter_ns
+    samples = []
+    with quiet_gc():
+        for caravan_id, first, last in queries:
+            started = clock()
+            find_conflict(caravan_id, first, last)
+            samples.append((clock() - started) / 1e3)
+    return percentile(samples, 50), percentile(samples, 99)
+
+
+def measure_listing(api, rng: random.Random) -> Tuple[float, float]:
+    """Returns p50 and p99 GET /api/caravans latency in milliseconds for mixed filtered pages."""
+    queries = ["limit=50"] + [
+        f"location={rng.choice(LOCATIONS)}&min_capacity={rng.randint(2, 6)}&limit=50" for _ in range(LIST_REQUESTS - 1)
+    ]
+
+    async def run() -> List[float]:
+        samples = []
+        for query in queries:
+            started = time.perf_counter()
+            status, _, _ = await request(api.app, "GET", "/api/caravans", query)
+            samples.append((time.perf_counter() - started) * 1e3)
+            assert status == 200, status
+        return samples
+
+    with quiet_gc():
+        samples = asyncio.run(run())
+    return percentile(samples, 50), percentile(samples, 99)
+
+
+def measure_memory(fleet: Fleet) -> Dict[str, float]:
+    """Returns bytes allocated per stored entity, indexes included, in fresh repositories."""
+    def per_entity(build, count: int) -> float:
+        gc.collect()
+        tracemalloc.start()
+        before = tracemalloc.get_traced_memory()[0]
+        repo = build()
+        after = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del repo
+        return (after - before) / count
+
+    users, caravans, reservations = fleet.hosts + fleet.guests, fleet.caravans, fleet.reservations
+    # Fresh copies, down to their IDs, strings, dates and floats, are stored so the
+    # entities and their fields are counted along with the indexes. Enum members
+    # and small ints are shared singletons either way.
+    copy_id = lambda value: uuid.UUID(int=value.int)
+    copy_str = lambda value: (value + ".")[:-1]
+    copy_date = lambda value: date.fromordinal(value.toordinal())
+    copy_float = lambda value: None if value is None else value + 0.0
+
+    def build_users():
+        repo = UserRepository()
+        for user in users:
+            repo.add(User(copy_str(user.name), copy_str(user.contact), user.role, copy_id(user.id)))
+        return repo
+
+    def build_caravans():
+        repo = CaravanRepository()
+        for c in caravans:
+            repo.add(Caravan(
+                host_id=copy_id(c.host_id), name=copy_str(c.name), location=copy_str(c.location),
+                capacity=c.capacity, daily_rate=copy_float(c.daily_rate),
+                latitude=copy_float(c.latitude), longitude=copy_float(c.longitude), id=copy_id(c.id),
+            ))
+        return repo
+
+    def build_reservations():
+        repo = ReservationRepository()
+        repo.add_many(Reservation(
+            guest_id=copy_id(r.guest_id), caravan_id=copy_id(r.caravan_id), start_date=copy_date(r.start_date),
+            end_date=copy_date(r.end_date), total_price=copy_float(r.total_price), id=copy_id(r.id), status=r.status,
+        ) for r in reservations)
+        return repo
+
+    return {
+        "user": per_entity(build_users, len(users)),
+        "caravan": per_entity(build_caravans, len(caravans)),
+        "reservation": per_entity(build_reservations, len(reservations)),
+    }
+
+
+def run_scale(name: str, scale: Scale, seed: int, repeat: int) -> List[dict]:
+    fleet = generate(scale, seed)
+    api = load_app(fleet)
+    rng = random.Random(seed + 1)
+    bookings = [measure_bookings(api, fleet, run) for run in range(repeat)]
+    conflicts = [measure_conflicts(api, fleet, rng) for _ in range(repeat)]
+    listings = [measure_listing(api, rng) for _ in range(repeat)]
+    memory = measure_memory(fleet)
+    median = lambda runs, i: statistics.median(run[i] for run in runs)
+    results = [
+        ("create_reservation.throughput", max(bookings), "ops/s", "higher"),
+        ("conflict_check.p50", median(conflicts, 0), "us", "lower"),
+        ("conflict_check.p99", median(conflicts, 1), "us", "lower"),
+        ("list_caravans.p50", median(listings, 0), "ms", "lower"),
+        ("list_caravans.p99", median(listings, 1), "ms", "lower"),
+    ] + [(f"memory.{entity}", size, "bytes", "lower") for entity, size in memory.items()]
+    return [
+        {"scale": name, "metric": metric, "value": round(value, 3), "unit": unit, "better": better}
+        for metric, value, unit, better in results
+    ]
+
+
+def metadata(seed: int, repeat: int) -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "seed": seed,
+        "repeat": repeat,
+    }
+
+
+def compare(baseline: dict, current: dict, threshold: float) -> List[str]:
+    """Prints each metric's change from the baseline and returns the regressed ones."""
+    before = {(r["scale"], r["metric"]): r for r in baseline["results"]}
+    regressions = []
+    print(f"baseline {baseline['meta'].get('commit')} -> current {current['meta'].get('commit')}"
+          f" (threshold {threshold:.0%})")
+    for result in current["results"]:
+        key = (result["scale"], result["metric"])
+        if key not in before or not before[key]["value"]:
+            continue
+        change = result["value"] / before[key]["value"] - 1
+        worse = -change if result["better"] == "higher" else change
+        flag = ""
+        if worse > threshold:
+            flag = "  REGRESSION"
+            regressions.append(f"{key[0]} {key[1]}")
+        print(f"  {key[0]:<8}{key[1]:<32}{before[key]['value']:>12.2f} -> {result['value']:>12.2f}"
+              f" {result['unit']:<6}{change:>+8.1%}{flag}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scales", default="small,medium")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON results to compare against")
+    parser.add_argument("--current", metavar="FILE", help="compare this results file instead of running")
+    parser.add_argument("--threshold", type=float, default=0.15)
+    args = parser.parse_args()
+
+    if args.current:
+        if not args.compare:
+            parser.error("--current requires --compare")
+        with open(args.current) as f:
+            current = json.load(f)
+    else:
+        names = args.scales.split(",")
+        unknown = [n for n in names if n not in SCALES]
+        if unknown:
+            parser.error(f"unknown scales: {', '.join(unknown)}")
+        results = []
+        for name in names:
+            scale = SCALES[name]
+            print(f"{name}: {scale.caravans} caravans, {scale.caravans * scale.reservations_per_caravan} reservations",
+                  file=sys.stderr)
+            results.extend(run_scale(name, scale, args.seed, args.repeat))
+        current = {"meta": metadata(args.seed, args.repeat), "results": results}
+        if args.output:
+            with open(args.output, "w") as f:
+                json.dump(current, f, indent=2)
+        for r in results:
+            print(f"  {r['scale']:<8}{r['metric']:<32}{r['value']:>12.2f} {r['unit']}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
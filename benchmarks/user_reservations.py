@@ -0,0 +1,75 @@
+"""
+Micro-benchmark for listing a host's reservations.
+
+Compares collecting a host's upcoming bookings caravan by caravan, as the
+repository's per-caravan index allows, with one lookup in the
+UserReservationIndex, for a host owning many caravans.
+
+Usage:
+    python -m benchmarks.user_reservations [--caravans N] [--per-caravan N]
+"""
+import argparse
+import timeit
+import uuid
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_reservation_index import UserReservationIndex
+
+BASE_DATE = date(2030, 1, 1)
+
+
+def per_caravan(caravans, reservation_repo, start_from: date, limit: int):
+    """Scans every caravan of the host, then sorts and pages the merged result."""
+    upcoming = [
+        r for caravan in caravans
+        for r in reservation_repo.get_for_caravan(caravan.id)
+        if r.start_date >= start_from
+    ]
+    upcoming.sort(key=lambda r: r.start_date)
+    return upcoming[:limit]
+
+
+def measure(fn, number: int) -> float:
+    """Returns the best per-call latency in microseconds over a few repeats."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--caravans", type=int, default=300)
+    parser.add_argument("--per-caravan", type=int, default=100)
+    args = parser.parse_args()
+
+    host_id = uuid.uuid4()
+    caravan_repo = CaravanRepository()
+    reservation_repo = ReservationRepository()
+    index = UserReservationIndex(caravan_repo)
+    reservation_repo.subscribe(index)
+    caravans = [Caravan(host_id=host_id, name=f"C{i}", location="Seoul", capacity=4, daily_rate=100.0)
+                for i in range(args.caravans)]
+    for caravan in caravans:
+        caravan_repo.add(caravan)
+    for i in range(args.per_caravan):
+        for caravan in caravans:
+            start = BASE_DATE + timedelta(days=i * 4)
+            reservation_repo.add(Reservation(uuid.uuid4(), caravan.id, start, start + timedelta(days=3), 300.0))
+
+    start_from = BASE_DATE + timedelta(days=args.per_caravan * 2)
+    expected = per_caravan(caravans, reservation_repo, start_from, 50)
+    actual = index.for_host(host_id, start_from=start_from, limit=50)
+    assert [r.start_date for r in actual] == [r.start_date for r in expected]
+
+    scan = measure(lambda: per_caravan(caravans, reservation_repo, start_from, 50), 20)
+    indexed = measure(lambda: index.for_host(host_id, start_from=start_from, limit=50), 20_000)
+    total = args.caravans * args.per_caravan
+    print(f"host with {args.caravans} caravans, {total} reservations, page of 50")
+    print(f"  per-caravan scan: {scan:>10.1f} us")
+    print(f"  host index:       {indexed:>10.1f} us  ({scan / indexed:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""
+Benchmark for the multi-process worker mode.
+
+Starts a ReservationOwner holding a populated state, then runs 1..N worker
+processes, each with its own replica fed by the owner, issuing reads (a
+page of a guest's reservations from the UserReservationIndex) as fast as
+they can. Reads never touch the owner, so aggregate throughput should grow
+with the worker count up to the number of CPU cores.
+
+Also reports the round trip of a booking sent through the owner against the
+same booking made in-process.
+
+Usage:
+    python -m benchmarks.workers [--max-workers N] [--guests N] [--reservations N] [--seconds S]
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import shutil
+import tempfile
+import time
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation
+from src.models.user import User, UserRole
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.replication import EventPublisher, ReplicaFeed
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.repositories.user_reservation_index import UserReservationIndex
+from src.services.remote_reservation_service import RemoteReservationService
+from src.services.reservation_owner import ReservationOwner, load_or_create_authkey, read_authkey
+from src.services.reservation_service import ReservationService
+from src.services.reservation_validator import ReservationValidator
+
+BASE_DATE = date(2030, 1, 1)
+
+
+def populate(guests: int, reservations: int):
+    user_repo, caravan_repo, reservation_repo = UserRepository(), CaravanRepository(), ReservationRepository()
+    host = User(name="Host", contact="host@example.com", role=UserRole.HOST)
+    user_repo.add(host)
+    guest_ids = []
+    for i in range(guests):
+        guest = User(name=f"G{i}", contact=f"g{i}@example.com", role=UserRole.GUEST)
+        user_repo.add(guest)
+        guest_ids.append(guest.id)
+    caravans = [Caravan(host_id=host.id, name=f"C{i}", location="Seoul", capacity=4, daily_rate=100.0)
+                for i in range(max(1, reservations // 100))]
+    for caravan in caravans:
+        caravan_repo.add(caravan)
+    for i in range(reservations):
+        caravan = caravans[i % len(caravans)]
+        start = BASE_DATE + timedelta(days=(i // len(caravans)) * 3)
+        reservation_repo.add(Reservation(guest_ids[i % guests], caravan.id, start, start + timedelta(days=2), 200.0))
+    return user_repo, caravan_repo, reservation_repo, guest_ids, caravans
+
+
+def reader(address: str, guest_ids, seconds: float, ready, go, results) -> None:
+    """A worker process: replicates the owner's state, then reads for `seconds`."""
+    repos = (UserRepository(), CaravanRepository(), ReservationRepository())
+    feed = ReplicaFeed(address, *repos, read_authkey(address + ".key"))
+    feed.connect()
+    index = UserReservationIndex(repos[1])
+    index.load(repos[2].get_all())
+    repos[2].subscribe(index)
+    feed.start()
+
+    rng = random.Random(os.getpid())
+    ready.release()
+    go.wait()
+    reads = 0
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(100):
+            index.for_guest(guest_ids[rng.randrange(len(guest_ids))], limit=20)
+        reads += 100
+    results.put(reads)
+    feed.close()
+
+
+def read_throughput(address: str, guest_ids, workers: int, seconds: float) -> float:
+    """Returns the aggregate reads per second of `workers` reader processes."""
+    context = multiprocessing.get_context("spawn")
+    ready, go, results = context.Semaphore(0), context.Event(), context.Queue()
+    processes = [
+        context.Process(target=reader, args=(address, guest_ids, seconds, ready, go, results))
+        for _ in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    for _ in processes:
+        ready.acquire()
+    go.set()
+    total = sum(results.get() for _ in processes)
+    for process in processes:
+        process.join()
+    return total / seconds
+
+
+def booking_latency(book, caravans, count: int, offset: int) -> float:
+    """Returns the mean latency of `count` bookings in microseconds."""
+    started = time.perf_counter()
+    for i in range(count):
+        start = BASE_DATE + timedelta(days=3650 + offset + (i // len(caravans)) * 3)
+        book(caravans[i % len(caravans)].id, start, start + timedelta(days=2))
+    return (time.perf_counter() - started) / count * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--guests", type=int, default=1_000)
+    parser.add_argument("--reservations", type=int, default=100_000)
+    parser.add_argument("--seconds", type=float, default=2.0)
+    args = parser.parse_args()
+
+    user_repo, caravan_repo, reservation_repo, guest_ids, caravans = populate(args.guests, args.reservations)
+    publisher = EventPublisher(user_repo, caravan_repo, reservation_repo)
+    for repo in (user_repo, caravan_repo, reservation_repo):
+        repo.subscribe(publisher)
+    service = ReservationService(reservation_repo, caravan_repo, user_repo, ReservationValidator(reservation_repo))
+    directory = tempfile.mkdtemp()
+    address = os.path.join(directory, "owner.sock")
+    authkey = load_or_create_authkey(address + ".key")
+    owner = ReservationOwner(service, publisher, address, authkey)
+    owner.start()
+
+    try:
+        print(f"{args.reservations} reservations, {args.guests} guests, {os.cpu_count()} CPU cores")
+        print("read throughput (guest reservation page of 20):")
+        single = None
+        for workers in range(1, args.max_workers + 1):
+            throughput = read_throughput(address, guest_ids, workers, args.seconds)
+            single = single or throughput
+            print(f"  {workers:>2} worker(s): {throughput:>12,.0f} reads/s  ({throughput / single:.2f}x)")
+
+        feed = ReplicaFeed(address, UserRepository(), CaravanRepository(), ReservationRepository(), authkey)
+        feed.connect()
+        feed.start()
+        remote = RemoteReservationService(address, feed, authkey)
+        guest_id = guest_ids[0]
+        local = booking_latency(lambda *a: service.create_reservation(guest_id, *a), caravans, 2_000, 0)
+        through_owner = booking_latency(lambda *a: remote.create_reservation(guest_id, *a), caravans, 2_000, 1_000)
+        print("booking latency:")
+        print(f"  in-process:    {local:>8.1f} us")
+        print(f"  through owner: {through_owner:>8.1f} us  (including replica catch-up)")
+        remote.close()
+        feed.close()
+    finally:
+        owner.close()
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,7 @@
+import argparse
+import os
+import sys
+import time
 import uuid
 from datetime import datetime, date
 
@@ -9,6 +13,7 @@ from src.repositories.caravan_repository import CaravanRepository
 from src.repositories.reservation_repository import ReservationRepository
 from src.services.reservation_validator import ReservationValidator
 from src.services.reservation_service import ReservationService
+from src.services.bulk_transfer import BulkImporter, ENTITIES, FORMATS, export_records
 from src.exceptions.reservation import ReservationError
 
 def setup_dependencies():
@@ -98,6 +103,109 @@ def make_reservation(reservation_service: ReservationService, guest: User, carav
         print(f"\n❌ 예상치 못한 오류가 발생했습니다: {e}")
 
 
+def open_storage(db_path: str | None, data_dir: str | None):
+    """
+    가져오기·내보내기에 사용할 영구 저장소의 리포지토리를 엽니다.
+    (user_repo, caravan_repo, reservation_repo, close)를 반환하며, 작업이 끝나면 close()를 호출해야 합니다.
+    """
+    if db_path:
+        from src.repositories.sqlite.connection_pool import SQLiteConnectionPool
+        from src.repositories.sqlite.user_repository import SQLiteUserRepository
+        from src.repositories.sqlite.caravan_repository import SQLiteCaravanRepository
+        from src.repositories.sqlite.reservation_repository import SQLiteReservationRepository
+
+        pool = SQLiteConnectionPool(db_path)
+        return (
+            SQLiteUserRepository(pool), SQLiteCaravanRepository(pool), SQLiteReservationRepository(pool), pool.close
+        )
+    from src.repositories.durable.journal import Journal
+
+    user_repo = UserRepository()
+    caravan_repo = CaravanRepository()
+    reservation_repo = ReservationRepository()
+    journal = Journal(data_dir, user_repo, caravan_repo, reservation_repo)
+    journal.recover()
+
+    def close():
+        # 다음 시작 시 가져온 데이터를 로그 재생 없이 스냅샷에서 바로 읽도록 합니다.
+        journal.snapshot()
+        journal.close()
+
+    return user_repo, caravan_repo, reservation_repo, close
+
+def file_format(args) -> str:
+    """--format이 없으면 파일 확장자로 형식을 정합니다 (.csv는 CSV, 그 외는 NDJSON)."""
+    if args.format:
+        return args.format
+    return "csv" if args.file.lower().endswith(".csv") else "ndjson"
+
+def import_data(args) -> int:
+    """파일(또는 표준 입력)의 데이터를 묶음 단위로 가져오고 결과를 출력합니다."""
+    user_repo, caravan_repo, reservation_repo, close = open_storage(args.db, args.data_dir)
+    importer = BulkImporter(user_repo, caravan_repo, reservation_repo, batch_size=args.batch_size)
+    started = time.perf_counter()
+    try:
+        if args.file == "-":
+            report = importer.import_lines(args.entity, file_format(args), sys.stdin)
+        else:
+            with open(args.file, encoding="utf-8", newline="") as stream:
+                report = importer.import_lines(args.entity, file_format(args), stream)
+    finally:
+        close()
+    elapsed = time.perf_counter() - started
+    total = report.imported + report.rejected
+    print(
+        f"✅ {args.entity}: {report.imported}건 가져옴, {report.rejected}건 거부 "
+        f"({elapsed:.1f}초, 초당 {total / elapsed if elapsed else 0:,.0f}건)",
+        file=sys.stderr,
+    )
+    for line, error in report.errors:
+        print(f"  ❌ {line}행: {error}", file=sys.stderr)
+    return 1 if report.rejected else 0
+
+def export_data(args) -> int:
+    """저장소의 데이터를 순회하면서 조각 단위로 파일(또는 표준 출력)에 씁니다."""
+    user_repo, caravan_repo, reservation_repo, close = open_storage(args.db, args.data_dir)
+    source = {"users": user_repo, "caravans": caravan_repo, "reservations": reservation_repo}[args.entity]
+    try:
+        chunks = export_records(args.entity, source.iter_all(), file_format(args))
+        if args.file == "-":
+            sys.stdout.writelines(chunks)
+        else:
+            with open(args.file, "w", encoding="utf-8", newline="") as stream:
+                stream.writelines(chunks)
+    finally:
+        close()
+    return 0
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(
+        description="CaravanShare CLI. 명령 없이 실행하면 대화형 메뉴를 시작합니다."
+    )
+    commands = parser.add_subparsers(dest="command")
+    for name, help_text, file_help in (
+        ("import", "NDJSON/CSV 파일의 데이터를 가져옵니다.", "읽을 파일 ('-'이면 표준 입력)"),
+        ("export", "데이터를 NDJSON/CSV로 내보냅니다.", "쓸 파일 ('-'이면 표준 출력)"),
+    ):
+        command = commands.add_parser(name, help=help_text, description=help_text)
+        command.add_argument("entity", choices=ENTITIES)
+        command.add_argument("file", nargs="?", default="-", help=file_help)
+        command.add_argument("--format", choices=FORMATS, help="기본값은 파일 확장자로 정합니다 (.csv 외에는 ndjson)")
+        command.add_argument(
+            "--db", default=os.environ.get("CARAVANSHARE_DB"),
+            help="SQLite 데이터베이스 파일 (기본값: CARAVANSHARE_DB)",
+        )
+        command.add_argument(
+            "--data-dir", default=os.environ.get("CARAVANSHARE_DATA_DIR"),
+            help="이벤트 로그 디렉터리 (기본값: CARAVANSHARE_DATA_DIR). 서버가 사용 중이지 않을 때만 사용하세요.",
+        )
+        if name == "import":
+            command.add_argument("--batch-size", type=int, default=5000, help="한 번에 검증·저장할 레코드 수")
+    args = parser.parse_args(argv)
+    if args.command and not (args.db or args.data_dir):
+        parser.error("--db 또는 --data-dir로 저장소를 지정해야 합니다.")
+    return args
+
 def main():
     """CLI 애플리케이션의 메인 루프입니다."""
     user_repo, caravan_repo, reservation_repo, reservation_service = setup_dependencies()
@@ -123,4 +231,10 @@ def main():
             print("잘못된 입력입니다. 다시 시도해주세요.")
 
 if __name__ == "__main__":
-    main()
+    args = parse_args()
+    if args.command == "import":
+        sys.exit(import_data(args))
+    elif args.command == "export":
+        sys.exit(export_data(args))
+    else:
+        main()
@@ -0,0 +1,158 @@
+"""
+예약 소유자(owner) 프로세스
+
+`uvicorn api:app --workers N`으로 여러 워커를 실행하면 워커마다 리포지토리가 따로 생겨
+상태가 어긋납니다. 이 프로세스가 유일한 원본 리포지토리를 소유하고 모든 쓰기(예약 생성,
+상태 변경)를 하나의 쓰기 스레드에서 순서대로 처리합니다. 각 워커는 유닉스 소켓으로
+변경 이벤트를 받아 로컬 복제본을 유지하므로, 읽기는 IPC 없이 워커마다 병렬로 처리됩니다.
+
+사용법:
+    python owner.py --socket /tmp/caravanshare.sock
+    CARAVANSHARE_OWNER=/tmp/caravanshare.sock uvicorn api:app --workers 4
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+from typing import TYPE_CHECKING
+
+from src.models.user import User, UserRole
+from src.models.caravan import Caravan
+from src.repositories.user_repository import UserRepository
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.payment_repository import PaymentRepository
+from src.services.reservation_validator import ReservationValidator
+from src.services.reservation_service import ReservationService
+from src.services.payment_gateway import FakePaymentGateway
+from src.services.payment_service import PaymentService
+from src.services.pricing_engine import PricingEngine, rules_from_config
+
+if TYPE_CHECKING:
+    from src.services.reservation_owner import ReservationOwner
+
+DEFAULT_SOCKET = "/tmp/caravanshare.sock"
+
+def create_pricing_engine() -> PricingEngine:
+    """
+    요금 엔진을 만듭니다. 기본값은 규칙 없음(`박 수 * 일일 요금`)이며,
+    `CARAVANSHARE_PRICING_RULES`에 규칙 목록 JSON 파일 경로를 지정하면 그 규칙을 순서대로 적용합니다.
+    예: [{"rule": "weekend", "multiplier": 1.2}, {"rule": "length_of_stay", "min_nights": 7, "discount": 0.1}]
+    소유자 프로세스(예약 금액)와 API 워커(견적)가 같은 규칙을 사용해야 하므로 같은 파일을 지정합니다.
+    """
+    path = os.environ.get("CARAVANSHARE_PRICING_RULES")
+    if not path:
+        return PricingEngine()
+    with open(path, encoding="utf-8") as f:
+        return PricingEngine(rules_from_config(json.load(f)))
+
+def create_payment_service() -> PaymentService:
+    """
+    예약 생성 시 결제를 큐에 넣고 백그라운드에서 묶어서 정산하는 결제 서비스를 만듭니다.
+    실제 결제 대행사(PG) 연동 전까지는 가짜 게이트웨이를 사용합니다.
+    """
+    return PaymentService(PaymentRepository(), FakePaymentGateway(latency=0.2))
+
+def seed_data(user_repo: UserRepository, caravan_repo: CaravanRepository):
+    """저장된 데이터가 없을 때 사용할 초기 데이터를 생성합니다."""
+    host = User(name="Host Alice", contact="host@example.com", role=UserRole.HOST)
+    guest = User(name="Guest Bob", contact="guest@example.com", role=UserRole.GUEST)
+    user_repo.add(host)
+    user_repo.add(guest)
+
+    caravan1 = Caravan(
+        host_id=host.id,
+        name="Cozy Camper",
+        location="Seoul",
+        capacity=4,
+        daily_rate=150.0,
+        latitude=37.5665,
+        longitude=126.9780,
+    )
+    caravan2 = Caravan(
+        host_id=host.id,
+        name="Luxury Land-Yacht",
+        location="Busan",
+        capacity=6,
+        daily_rate=250.0,
+        latitude=35.1796,
+        longitude=129.0756,
+    )
+    caravan_repo.add(caravan1)
+    caravan_repo.add(caravan2)
+
+def owner_authkey(address: str, create: bool = False) -> bytes:
+    """
+    소유자와 워커가 공유하는 인증 키입니다. 명령은 pickle로 오가므로 키 없이는 연결을 받지 않습니다.
+    `CARAVANSHARE_OWNER_KEY`가 없으면 소유자가 `<소켓 경로>.key`에 무작위 키를 만들어(권한 0600)
+    두고, 같은 사용자로 실행되는 워커가 이 파일을 읽습니다. 다른 사용자가 만든 파일이나
+    다른 사용자도 읽을 수 있는 파일은 거부합니다.
+    """
+    key = os.environ.get("CARAVANSHARE_OWNER_KEY")
+    if key:
+        return key.encode()
+    from src.services.reservation_owner import load_or_create_authkey, read_authkey
+
+    path = address + ".key"
+    return load_or_create_authkey(path) if create else read_authkey(path)
+
+async def run_until_stopped(owner: "ReservationOwner", payment_service: PaymentService):
+    """종료 신호를 받을 때까지 워커의 요청을 처리하고 결제를 정산합니다."""
+    owner.start()
+    payment_service.start()
+    stopped = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGINT, stopped.set)
+    loop.add_signal_handler(signal.SIGTERM, stopped.set)
+    await stopped.wait()
+    # 새 쓰기를 먼저 막은 뒤 남은 결제를 정산합니다.
+    owner.close()
+    await payment_service.stop()
+
+def main():
+    parser = argparse.ArgumentParser(description="CaravanShare 예약 소유자 프로세스")
+    parser.add_argument("--socket", default=os.environ.get("CARAVANSHARE_OWNER", DEFAULT_SOCKET))
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+    # API 워커도 이 모듈의 요금·결제·초기 데이터 함수를 가져가므로, 소유자 프로세스에서만 쓰는
+    # 복제(multiprocessing) 모듈은 여기서 가져와 워커 시작을 가볍게 합니다.
+    from src.repositories.replication import EventPublisher
+    from src.services.reservation_owner import ReservationOwner
+
+    user_repo = UserRepository()
+    caravan_repo = CaravanRepository()
+    reservation_repo = ReservationRepository()
+    journal = None
+    data_dir = os.environ.get("CARAVANSHARE_DATA_DIR")
+    if data_dir:
+        # 소유자 프로세스의 상태를 이벤트 로그와 스냅샷으로 보존합니다.
+        from src.repositories.durable.journal import Journal
+
+        journal = Journal(data_dir, user_repo, caravan_repo, reservation_repo, snapshot_interval=600)
+        journal.recover()
+    if not user_repo.get_all():
+        seed_data(user_repo, caravan_repo)
+
+    # 모든 변경을 워커들에게 전달합니다.
+    publisher = EventPublisher(user_repo, caravan_repo, reservation_repo)
+    user_repo.subscribe(publisher)
+    caravan_repo.subscribe(publisher)
+    reservation_repo.subscribe(publisher)
+
+    validator = ReservationValidator(reservation_repo)
+    reservation_service = ReservationService(
+        reservation_repo, caravan_repo, user_repo, validator, create_pricing_engine()
+    )
+    payment_service = create_payment_service()
+    reservation_repo.subscribe(payment_service)
+    owner = ReservationOwner(reservation_service, publisher, args.socket, owner_authkey(args.socket, create=True))
+    asyncio.run(run_until_stopped(owner, payment_service))
+
+    if journal is not None:
+        journal.snapshot()
+        journal.close()
+
+if __name__ == "__main__":
+    main()
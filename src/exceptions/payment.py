@@ -0,0 +1,11 @@
+class PaymentError(Exception):
+    """Base exception for payment-related errors."""
+    pass
+
+class PaymentGatewayError(PaymentError):
+    """Raised when a payment gateway call fails as a whole and may be retried."""
+    pass
+
+class InvalidPaymentStatusError(PaymentError):
+    """Raised when a payment cannot move from its current status to the requested one."""
+    pass
@@ -13,3 +13,11 @@ class CaravanNotAvailableError(ReservationError):
 class BookingConflictError(ReservationError):
     """Raised when a caravan is already booked for the selected dates."""
     pass
+
+class InvalidStatusTransitionError(ReservationError):
+    """Raised when a reservation cannot move from its current status to the requested one."""
+    pass
+
+class IdempotencyKeyMismatchError(ReservationError):
+    """Raised when an idempotency key is reused for a different reservation request."""
+    pass
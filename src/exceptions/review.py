@@ -0,0 +1,11 @@
+class ReviewError(Exception):
+    """Base exception for review-related errors."""
+    pass
+
+class ReviewNotAllowedError(ReviewError):
+    """Raised when a user may not review a reservation (not their stay, or not completed yet)."""
+    pass
+
+class DuplicateReviewError(ReviewError):
+    """Raised when a reservation has already been reviewed."""
+    pass
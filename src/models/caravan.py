@@ -8,7 +8,7 @@ class CaravanStatus(Enum):
     RESERVED = "reserved"
     MAINTENANCE = "maintenance"
 
-@dataclass
+@dataclass(slots=True)
 class Caravan:
     # Fields without default values first
     host_id: uuid.UUID
@@ -22,3 +22,12 @@ class Caravan:
     amenities: List[str] = field(default_factory=list)
     photos: List[str] = field(default_factory=list)
     status: CaravanStatus = CaravanStatus.AVAILABLE
+    # Optional position, for radius and bounding-box searches
+    latitude: float | None = None
+    longitude: float | None = None
+
+    def __post_init__(self):
+        if (self.latitude is None) != (self.longitude is None):
+            raise ValueError("Latitude and longitude must be given together")
+        if self.latitude is not None and not (-90 <= self.latitude <= 90 and -180 <= self.longitude <= 180):
+            raise ValueError("Latitude must be between -90 and 90 and longitude between -180 and 180")
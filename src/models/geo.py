@@ -0,0 +1,87 @@
+import math
+from dataclasses import dataclass
+
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Returns the great-circle distance between two points in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _check_point(latitude: float, longitude: float) -> None:
+    if not -90 <= latitude <= 90 or not -180 <= longitude <= 180:
+        raise ValueError("Latitude must be between -90 and 90 and longitude between -180 and 180")
+
+
+@dataclass(frozen=True, slots=True)
+class BoundingBox:
+    """
+    A latitude/longitude rectangle, edges included.
+    A box whose west edge lies east of its east edge crosses the antimeridian.
+    """
+    south: float
+    west: float
+    north: float
+    east: float
+
+    def __post_init__(self):
+        _check_point(self.south, self.west)
+        _check_point(self.north, self.east)
+        if self.south > self.north:
+            raise ValueError("South edge must not lie north of the north edge")
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        if not self.south <= latitude <= self.north:
+            return False
+        if self.west <= self.east:
+            return self.west <= longitude <= self.east
+        return longitude >= self.west or longitude <= self.east
+
+    def bounding_box(self) -> "BoundingBox":
+        return self
+
+
+@dataclass(frozen=True, slots=True)
+class GeoCircle:
+    """All points within `radius_km` of a centre, by great-circle distance."""
+    latitude: float
+    longitude: float
+    radius_km: float
+
+    def __post_init__(self):
+        _check_point(self.latitude, self.longitude)
+        if self.radius_km < 0:
+            raise ValueError("Radius must not be negative")
+
+    def distance_km(self, latitude: float, longitude: float) -> float:
+        return haversine_km(self.latitude, self.longitude, latitude, longitude)
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        return self.distance_km(latitude, longitude) <= self.radius_km
+
+    def bounding_box(self) -> BoundingBox:
+        """Returns the smallest box around the circle, for index lookups."""
+        angle = self.radius_km / EARTH_RADIUS_KM
+        dlat = math.degrees(angle)
+        south, north = self.latitude - dlat, self.latitude + dlat
+        if south <= -90 or north >= 90:
+            # The circle covers a pole, so it spans every longitude.
+            return BoundingBox(max(south, -90.0), -180.0, min(north, 90.0), 180.0)
+        ratio = math.sin(angle) / math.cos(math.radians(self.latitude))
+        if ratio >= 1:
+            return BoundingBox(south, -180.0, north, 180.0)
+        dlon = math.degrees(math.asin(ratio))
+        west, east = self.longitude - dlon, self.longitude + dlon
+        if west < -180:
+            west += 360
+        if east > 180:
+            east -= 360
+        return BoundingBox(south, west, north, east)
+
+
+GeoArea = BoundingBox | GeoCircle
@@ -0,0 +1,13 @@
+from datetime import date
+from typing import Dict
+
+# Reservations cluster on a few thousand distinct days, so sharing one date
+# object per day saves two allocations per stored reservation.
+_dates: Dict[date, date] = {}
+
+
+def intern_date(value: date) -> date:
+    """Returns a shared date instance equal to `value`."""
+    if type(value) is not date:
+        return value
+    return _dates.setdefault(value, value)
@@ -8,8 +8,9 @@ class PaymentStatus(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
     REFUNDED = "refunded"
+    CANCELLED = "cancelled"  # Voided before it was settled
 
-@dataclass
+@dataclass(slots=True)
 class Payment:
     # Fields without default values first
     reservation_id: uuid.UUID
@@ -10,7 +10,7 @@ class ReservationStatus(Enum):
     COMPLETED = "completed"
     CANCELLED = "cancelled"
 
-@dataclass
+@dataclass(slots=True)
 class Reservation:
     # Fields without default values first
     guest_id: uuid.UUID
@@ -2,7 +2,7 @@ import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 
-@dataclass
+@dataclass(slots=True)
 class Review:
     # Fields without default values first
     reservation_id: uuid.UUID
@@ -18,3 +18,21 @@ class Review:
     def __post_init__(self):
         if not 1 <= self.rating <= 5:
             raise ValueError("Rating must be between 1 and 5")
+
+@dataclass(frozen=True, slots=True)
+class RatingSummary:
+    """Running totals of the ratings given to one target."""
+    count: int = 0
+    total: int = 0
+    # Number of 1- to 5-star ratings
+    histogram: tuple = (0, 0, 0, 0, 0)
+
+    @property
+    def average(self) -> float | None:
+        return round(self.total / self.count, 2) if self.count else None
+
+    def with_rating(self, rating: int) -> "RatingSummary":
+        """Returns the summary including one more rating."""
+        histogram = list(self.histogram)
+        histogram[rating - 1] += 1
+        return RatingSummary(self.count + 1, self.total + rating, tuple(histogram))
@@ -6,7 +6,7 @@ class UserRole(Enum):
     GUEST = "guest"
     HOST = "host"
 
-@dataclass
+@dataclass(slots=True)
 class User:
     # Fields without default values first
     name: str
@@ -0,0 +1,57 @@
+import uuid
+from datetime import date
+from typing import Collection, Iterable, List
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.user import User
+from src.repositories.blocking_executor import BlockingExecutor
+
+
+class AsyncUserRepository:
+    """Async view of a synchronous user repository."""
+    def __init__(self, repo, executor: BlockingExecutor):
+        self._repo = repo
+        self._executor = executor
+
+    async def add(self, user: User) -> None:
+        await self._executor.run(self._repo.add, user)
+
+    async def get_by_id(self, user_id: uuid.UUID) -> User | None:
+        return await self._executor.run(self._repo.get_by_id, user_id)
+
+    async def get_all(self) -> List[User]:
+        return await self._executor.run(self._repo.get_all)
+
+
+class AsyncReservationRepository:
+    """Async view of a synchronous reservation repository."""
+    def __init__(self, repo, executor: BlockingExecutor):
+        self._repo = repo
+        self._executor = executor
+
+    async def add(self, reservation: Reservation) -> None:
+        await self._executor.run(self._repo.add, reservation)
+
+    async def add_many(self, reservations: Iterable[Reservation]) -> None:
+        await self._executor.run(self._repo.add_many, list(reservations))
+
+    async def get_by_id(self, reservation_id: uuid.UUID) -> Reservation | None:
+        return await self._executor.run(self._repo.get_by_id, reservation_id)
+
+    async def get_for_caravan(self, caravan_id: uuid.UUID) -> List[Reservation]:
+        return await self._executor.run(self._repo.get_for_caravan, caravan_id)
+
+    async def find_conflict(self, caravan_id: uuid.UUID, start_date: date, end_date: date) -> Reservation | None:
+        return await self._executor.run(self._repo.find_conflict, caravan_id, start_date, end_date)
+
+    async def update_status(
+        self,
+        reservation_id: uuid.UUID,
+        status: ReservationStatus,
+        expected: Collection[ReservationStatus] | None = None,
+    ) -> Reservation:
+        return await self._executor.run(self._repo.update_status, reservation_id, status, expected)
+
+    async def transition_ended(
+        self, from_status: ReservationStatus, to_status: ReservationStatus, ended_by: date
+    ) -> List[Reservation]:
+        return await self._executor.run(self._repo.transition_ended, from_status, to_status, ended_by)
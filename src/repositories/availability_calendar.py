@@ -0,0 +1,186 @@
+import calendar
+import threading
+import uuid
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterable, List, Tuple
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.availability_index import is_active
+
+_FREE = 0
+_BOOKED = 1
+
+
+class AvailabilityCalendar:
+    """
+    Day-granularity occupancy calendars for every caravan.
+
+    Each caravan has a `bytearray` with one byte per day of a rolling horizon
+    that starts today: 0 for a free night, 1 for a booked one. Active
+    reservations of a caravan never overlap, so marking and clearing their
+    nights keeps the bitmap exact. Single-day lookups are an index, and the
+    window searches run as `bytearray.find`, i.e. in C rather than Python.
+
+    The calendar is a ReservationListener: `load` the existing reservations and
+    subscribe it to a reservation repository to keep it up to date. The horizon
+    rolls forward on its own as days pass.
+    """
+    def __init__(self, horizon_days: int = 730, today: Callable[[], date] = date.today):
+        if horizon_days <= 0:
+            raise ValueError("Horizon must be at least one day.")
+        self._horizon = horizon_days
+        self._today = today
+        self._origin = today()
+        self._bitmaps: Dict[uuid.UUID, bytearray] = {}
+        # Active spans are kept so that nights entering the horizon as it
+        # rolls forward can be marked for bookings made long in advance.
+        self._spans: Dict[uuid.UUID, Tuple[uuid.UUID, date, date]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def origin(self) -> date:
+        """The first day covered by the calendar."""
+        with self._lock:
+            self._roll()
+            return self._origin
+
+    @property
+    def horizon_end(self) -> date:
+        """The first day after the calendar's horizon."""
+        return self.origin + timedelta(days=self._horizon)
+
+    def load(self, reservations: Iterable[Reservation]) -> None:
+        """Marks existing reservations, e.g. when attaching to a populated repository."""
+        with self._lock:
+            self._roll()
+            for reservation in reservations:
+                if is_active(reservation):
+                    self._spans[reservation.id] = (reservation.caravan_id, reservation.start_date, reservation.end_date)
+                    self._mark(reservation.caravan_id, reservation.start_date, reservation.end_date, _BOOKED)
+
+    def on_reservation_added(self, reservation: Reservation) -> None:
+        if not is_active(reservation):
+            return
+        with self._lock:
+            self._roll()
+            self._spans[reservation.id] = (reservation.caravan_id, reservation.start_date, reservation.end_date)
+            self._mark(reservation.caravan_id, reservation.start_date, reservation.end_date, _BOOKED)
+
+    def on_reservation_status_changed(self, reservation: Reservation, previous: ReservationStatus) -> None:
+        with self._lock:
+            self._roll()
+            span = (reservation.caravan_id, reservation.start_date, reservation.end_date)
+            if is_active(reservation) and reservation.id not in self._spans:
+                self._spans[reservation.id] = span
+                self._mark(*span, _BOOKED)
+            elif not is_active(reservation) and self._spans.pop(reservation.id, None) is not None:
+                self._mark(*span, _FREE)
+
+    def is_free(self, caravan_id: uuid.UUID, day: date) -> bool:
+        """
+        Returns True if the caravan is not booked for the night of `day`.
+
+        Raises:
+            ValueError: If the day lies outside the calendar's horizon.
+        """
+        with self._lock:
+            self._roll()
+            offset = self._offset(day)
+            if not 0 <= offset < self._horizon:
+                raise ValueError(f"Day {day} is outside the calendar horizon.")
+            bitmap = self._bitmaps.get(caravan_id)
+            return bitmap is None or bitmap[offset] == _FREE
+
+    def is_range_free(self, caravan_id: uuid.UUID, start_date: date, end_date: date) -> bool:
+        """
+        Returns True if every night in [start_date, end_date) is free.
+
+        Raises:
+            ValueError: If the range is empty or not inside the calendar's horizon.
+        """
+        with self._lock:
+            self._roll()
+            lo, hi = self._checked_span(start_date, end_date)
+            bitmap = self._bitmaps.get(caravan_id)
+            return bitmap is None or bitmap.find(_BOOKED, lo, hi) == -1
+
+    def first_free_window(self, caravan_id: uuid.UUID, nights: int, earliest: date | None = None) -> date | None:
+        """
+        Returns the first start date on or after `earliest` (default: today)
+        from which the caravan is free for `nights` consecutive nights, or
+        None if no such window fits in the horizon.
+
+        Raises:
+            ValueError: If `nights` is not positive.
+        """
+        if nights <= 0:
+            raise ValueError("Number of nights must be positive.")
+        with self._lock:
+            self._roll()
+            lo = max(0, self._offset(earliest)) if earliest is not None else 0
+            if lo + nights > self._horizon:
+                return None
+            bitmap = self._bitmaps.get(caravan_id)
+            found = lo if bitmap is None else bitmap.find(bytes(nights), lo)
+            return None if found == -1 else self._origin + timedelta(days=found)
+
+    def month_view(self, caravan_id: uuid.UUID, year: int, month: int) -> List[bool | None]:
+        """
+        Returns one entry per day of the month: True if the night is free,
+        False if it is booked, and None for days outside the horizon.
+        """
+        first = date(year, month, 1)
+        days = calendar.monthrange(year, month)[1]
+        with self._lock:
+            self._roll()
+            start = self._offset(first)
+            bitmap = self._bitmaps.get(caravan_id)
+            view: List[bool | None] = []
+            for offset in range(start, start + days):
+                if not 0 <= offset < self._horizon:
+                    view.append(None)
+                else:
+                    view.append(bitmap is None or bitmap[offset] == _FREE)
+            return view
+
+    def _offset(self, day: date) -> int:
+        return (day - self._origin).days
+
+    def _checked_span(self, start_date: date, end_date: date) -> Tuple[int, int]:
+        lo, hi = self._offset(start_date), self._offset(end_date)
+        if lo >= hi:
+            raise ValueError("End date must be after start date.")
+        if lo < 0 or hi > self._horizon:
+            raise ValueError(f"Range {start_date} - {end_date} is outside the calendar horizon.")
+        return lo, hi
+
+    def _mark(self, caravan_id: uuid.UUID, start_date: date, end_date: date, value: int) -> None:
+        lo = max(0, self._offset(start_date))
+        hi = min(self._horizon, self._offset(end_date))
+        if lo >= hi:
+            return
+        bitmap = self._bitmaps.get(caravan_id)
+        if bitmap is None:
+            bitmap = self._bitmaps[caravan_id] = bytearray(self._horizon)
+        bitmap[lo:hi] = bytes([value]) * (hi - lo)
+
+    def _roll(self) -> None:
+        """Moves the horizon forward to today, dropping past days. Caller holds the lock."""
+        today = self._today()
+        shift = (today - self._origin).days
+        if shift <= 0:
+            return
+        previous_end = self._origin + timedelta(days=self._horizon)
+        self._origin = today
+        if shift >= self._horizon:
+            for bitmap in self._bitmaps.values():
+                bitmap[:] = bytes(self._horizon)
+        else:
+            for bitmap in self._bitmaps.values():
+                del bitmap[:shift]
+                bitmap.extend(bytes(shift))
+        # Mark the nights that just entered the horizon, and forget finished stays.
+        for reservation_id, (caravan_id, start_date, end_date) in list(self._spans.items()):
+            if end_date <= today:
+                del self._spans[reservation_id]
+            elif end_date > previous_end:
+                self._mark(caravan_id, start_date, end_date, _BOOKED)
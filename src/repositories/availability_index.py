@@ -0,0 +1,68 @@
+import bisect
+from operator import attrgetter
+from datetime import date
+from typing import Iterable, List
+from src.models.reservation import Reservation, ReservationStatus
+
+# Reservations in these states no longer occupy the caravan.
+INACTIVE_STATUSES = frozenset({ReservationStatus.CANCELLED, ReservationStatus.REJECTED})
+
+
+def is_active(reservation: Reservation) -> bool:
+    """Returns True if the reservation still blocks its dates."""
+    return reservation.status not in INACTIVE_STATUSES
+
+
+class AvailabilityIndex:
+    """
+    Sorted index of the active reservations of a single caravan.
+
+    Active reservations of one caravan never overlap (the validator rejects
+    conflicting bookings), so the spans form a disjoint list ordered by start
+    date. An overlap check only needs to look at the last span starting before
+    the requested end date, which a binary search finds in O(log n).
+    """
+    def __init__(self):
+        self._starts: List[date] = []
+        self._reservations: List[Reservation] = []
+
+    def __len__(self) -> int:
+        return len(self._reservations)
+
+    @classmethod
+    def from_reservations(cls, reservations: Iterable[Reservation]) -> "AvailabilityIndex":
+        """Builds an index from active reservations in one sort instead of one insert each."""
+        index = cls()
+        index._reservations = sorted(reservations, key=attrgetter("start_date"))
+        index._starts = [r.start_date for r in index._reservations]
+        return index
+
+    def insert(self, reservation: Reservation) -> None:
+        """Adds an active reservation to the index."""
+        i = bisect.bisect_right(self._starts, reservation.start_date)
+        # Writers are serialized per caravan, but readers are not. Growing
+        # `_reservations` first (and shrinking it last in `remove`) keeps every
+        # position found in `_starts` a valid index for unlocked readers.
+        self._reservations.insert(i, reservation)
+        self._starts.insert(i, reservation.start_date)
+
+    def remove(self, reservation: Reservation) -> None:
+        """Removes a reservation from the index, if present."""
+        lo = bisect.bisect_left(self._starts, reservation.start_date)
+        hi = bisect.bisect_right(self._starts, reservation.start_date, lo)
+        for i in range(lo, hi):
+            if self._reservations[i].id == reservation.id:
+                del self._starts[i]
+                del self._reservations[i]
+                return
+
+    def find_overlap(self, start_date: date, end_date: date) -> Reservation | None:
+        """Returns an active reservation overlapping [start_date, end_date), if any."""
+        i = bisect.bisect_left(self._starts, end_date)
+        if i == 0:
+            return None
+        candidate = self._reservations[i - 1]
+        # Check for overlap: (StartA < EndB) and (EndA > StartB)
+        if candidate.end_date > start_date:
+            return candidate
+        return None
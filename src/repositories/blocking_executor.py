@@ -0,0 +1,28 @@
+import asyncio
+import functools
+from typing import Any, Callable, TypeVar
+
+T = TypeVar("T")
+
+
+class BlockingExecutor:
+    """
+    Runs synchronous repository and service calls from async code.
+
+    In-memory repositories never block, so their calls run inline on the
+    event loop, which avoids a thread hop per call. Repositories doing I/O
+    (such as SQLite) are offloaded to worker threads so the event loop stays
+    responsive.
+    """
+    def __init__(self, offload: bool):
+        self._offload = offload
+
+    @property
+    def offload(self) -> bool:
+        return self._offload
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Calls fn(*args, **kwargs), in a worker thread if offloading is enabled."""
+        if self._offload:
+            return await asyncio.to_thread(functools.partial(fn, *args, **kwargs))
+        return fn(*args, **kwargs)
@@ -0,0 +1,9 @@
+from typing import Protocol
+from src.models.caravan import Caravan, CaravanStatus
+
+
+class CaravanListener(Protocol):
+    """Observer notified by a caravan repository after each mutation."""
+    def on_caravan_added(self, caravan: Caravan) -> None: ...
+
+    def on_caravan_status_changed(self, caravan: Caravan, previous: CaravanStatus) -> None: ...
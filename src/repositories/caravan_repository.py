@@ -1,11 +1,112 @@
+import bisect
+import math
 import uuid
-from typing import Dict, List
-from src.models.caravan import Caravan
+from typing import Dict, Iterator, List, Set, Tuple
+from src.models.caravan import Caravan, CaravanStatus
+from src.models.geo import BoundingBox, GeoArea
+from src.repositories.caravan_listener import CaravanListener
+
+class _SortedIndex:
+    """Keeps caravan row numbers ordered by a numeric attribute for range lookups."""
+    def __init__(self):
+        self._keys: List[float] = []
+        self._rows: List[int] = []
+
+    def insert(self, key: float, row: int) -> None:
+        i = bisect.bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._rows.insert(i, row)
+
+    def span(self, low: float | None, high: float | None) -> tuple[int, int]:
+        """Returns the slice bounds of rows whose key lies in [low, high]."""
+        lo = 0 if low is None else bisect.bisect_left(self._keys, low)
+        hi = len(self._keys) if high is None else bisect.bisect_right(self._keys, high)
+        return lo, max(lo, hi)
+
+    def rows(self, lo: int, hi: int) -> List[int]:
+        return self._rows[lo:hi]
+
+
+class _GeoGrid:
+    """
+    Buckets caravan row numbers into fixed-size latitude/longitude cells, so
+    an area lookup only visits the cells its bounding box overlaps.
+    """
+    def __init__(self, cell_degrees: float = 0.25):
+        self._cell_degrees = cell_degrees
+        self._lat_cells = math.ceil(180 / cell_degrees)
+        self._lon_cells = math.ceil(360 / cell_degrees)
+        self._cells: Dict[Tuple[int, int], List[int]] = {}
+
+    def insert(self, latitude: float, longitude: float, row: int) -> None:
+        self._cells.setdefault(self._cell(latitude, longitude), []).append(row)
+
+    def cells(self, box: BoundingBox) -> List[Tuple[Tuple[int, int], List[int]]]:
+        """Returns the occupied cells overlapping the box, with their rows."""
+        (south, west), (north, east) = self._cell(box.south, box.west), self._cell(box.north, box.east)
+        lon_ranges = [(west, east)] if west <= east else [(west, self._lon_cells - 1), (0, east)]
+        cell_count = (north - south + 1) * sum(hi - lo + 1 for lo, hi in lon_ranges)
+        if cell_count > len(self._cells):
+            # A box wider than the occupied part of the grid: check each occupied cell instead.
+            return [
+                ((i, j), rows) for (i, j), rows in self._cells.items()
+                if south <= i <= north and any(lo <= j <= hi for lo, hi in lon_ranges)
+            ]
+        found = []
+        for i in range(south, north + 1):
+            for lo, hi in lon_ranges:
+                for j in range(lo, hi + 1):
+                    rows = self._cells.get((i, j))
+                    if rows:
+                        found.append(((i, j), rows))
+        return found
+
+    def inside(self, cell: Tuple[int, int], area: GeoArea) -> bool:
+        """
+        Returns True if the whole cell lies inside the area. Distances along a
+        cell's edges peak at its corners, so checking the corners is enough.
+        """
+        i, j = cell
+        south, west = i * self._cell_degrees - 90, j * self._cell_degrees - 180
+        north, east = min(90.0, south + self._cell_degrees), min(180.0, west + self._cell_degrees)
+        return all(area.contains(lat, lon) for lat in (south, north) for lon in (west, east))
+
+    def _cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        i = min(int((latitude + 90) / self._cell_degrees), self._lat_cells - 1)
+        j = min(int((longitude + 180) / self._cell_degrees), self._lon_cells - 1)
+        return i, j
+
 
 class CaravanRepository:
-    """Manages storage for Caravan objects in memory."""
+    """
+    Manages storage for Caravan objects in memory.
+
+    Besides the primary ID lookup, the repository maintains secondary indexes
+    so filtered listings do not need to scan the whole fleet:
+    a hash index on `location` and `status`, sorted indexes on `capacity`
+    and `daily_rate`, and a grid index on the coordinates of caravans that
+    have them. Indexes refer to caravans by row number (insertion order),
+    which also gives query results a stable order for pagination.
+
+    `version` is incremented on every mutation so callers can cheaply tell
+    whether anything they derived from the repository is still current, and
+    subscribed listeners are notified of every mutation.
+    """
     def __init__(self):
+        self._version = 0
         self._caravans: Dict[uuid.UUID, Caravan] = {}
+        self._rows: List[Caravan] = []
+        self._row_by_id: Dict[uuid.UUID, int] = {}
+        self._by_location: Dict[str, Set[int]] = {}
+        self._by_status: Dict[CaravanStatus, Set[int]] = {}
+        self._by_capacity = _SortedIndex()
+        self._by_daily_rate = _SortedIndex()
+        self._by_position = _GeoGrid()
+        self._listeners: List[CaravanListener] = []
+
+    def subscribe(self, listener: CaravanListener) -> None:
+        """Registers a listener to be notified of every future mutation."""
+        self._listeners.append(listener)
 
     def add(self, caravan: Caravan) -> None:
         """Adds a caravan to the repository."""
@@ -13,6 +114,24 @@ class CaravanRepository:
             raise ValueError(f"Caravan with ID {caravan.id} already exists.")
         self._caravans[caravan.id] = caravan
 
+        row = len(self._rows)
+        self._rows.append(caravan)
+        self._row_by_id[caravan.id] = row
+        self._by_location.setdefault(caravan.location, set()).add(row)
+        self._by_status.setdefault(caravan.status, set()).add(row)
+        self._by_capacity.insert(caravan.capacity, row)
+        self._by_daily_rate.insert(caravan.daily_rate, row)
+        if caravan.latitude is not None:
+            self._by_position.insert(caravan.latitude, caravan.longitude, row)
+        self._version += 1
+        for listener in self._listeners:
+            listener.on_caravan_added(caravan)
+
+    @property
+    def version(self) -> int:
+        """A counter that changes whenever a caravan is added or updated."""
+        return self._version
+
     def get_by_id(self, caravan_id: uuid.UUID) -> Caravan | None:
         """Retrieves a caravan by its unique ID."""
         return self._caravans.get(caravan_id)
@@ -20,3 +139,121 @@ class CaravanRepository:
     def get_all(self) -> List[Caravan]:
         """Returns a list of all caravans."""
         return list(self._caravans.values())
+
+    def iter_all(self) -> Iterator[Caravan]:
+        """Yields every caravan; a snapshot, so caravans added meanwhile are not seen."""
+        return iter(self.get_all())
+
+    def update_status(self, caravan_id: uuid.UUID, status: CaravanStatus) -> Caravan:
+        """
+        Changes the status of a stored caravan and keeps the status index in sync.
+
+        Raises:
+            ValueError: If the caravan cannot be found.
+        """
+        caravan = self._caravans.get(caravan_id)
+        if caravan is None:
+            raise ValueError(f"Caravan with ID {caravan_id} not found.")
+        row = self._row_by_id[caravan_id]
+        previous = caravan.status
+        self._by_status[previous].discard(row)
+        caravan.status = status
+        self._by_status.setdefault(status, set()).add(row)
+        self._version += 1
+        for listener in self._listeners:
+            listener.on_caravan_status_changed(caravan, previous)
+        return caravan
+
+    def query(
+        self,
+        location: str | None = None,
+        status: CaravanStatus | None = None,
+        min_capacity: int | None = None,
+        max_capacity: int | None = None,
+        min_daily_rate: float | None = None,
+        max_daily_rate: float | None = None,
+        area: GeoArea | None = None,
+        after: uuid.UUID | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> List[Caravan]:
+        """
+        Returns the caravans matching every given filter, in insertion order.
+
+        Each filter is resolved through its index and the candidate sets are
+        intersected starting from the smallest one. Range bounds are inclusive.
+        `area` (a radius or bounding box) only matches caravans with coordinates.
+        `after` is a cursor: only caravans stored after that caravan are returned.
+
+        Raises:
+            ValueError: If the `after` caravan cannot be found.
+        """
+        # Each candidate is (estimated size, resolver); resolvers either build the
+        # initial row set or narrow down an existing one.
+        candidates = []
+        if location is not None:
+            rows = self._by_location.get(location, set())
+            candidates.append((len(rows), rows))
+        if status is not None:
+            rows = self._by_status.get(status, set())
+            candidates.append((len(rows), rows))
+        if min_capacity is not None or max_capacity is not None:
+            lo, hi = self._by_capacity.span(min_capacity, max_capacity)
+            candidates.append((hi - lo, (self._by_capacity, lo, hi, "capacity", min_capacity, max_capacity)))
+        if min_daily_rate is not None or max_daily_rate is not None:
+            lo, hi = self._by_daily_rate.span(min_daily_rate, max_daily_rate)
+            candidates.append((hi - lo, (self._by_daily_rate, lo, hi, "daily_rate", min_daily_rate, max_daily_rate)))
+        if area is not None:
+            cells = self._by_position.cells(area.bounding_box())
+            candidates.append((sum(len(rows) for _, rows in cells), (cells, area)))
+
+        if not candidates:
+            rows = range(len(self._rows))
+        else:
+            candidates.sort(key=lambda c: c[0])
+            result: Set[int] | None = None
+            for _, candidate in candidates:
+                if isinstance(candidate, set):
+                    result = set(candidate) if result is None else result & candidate
+                elif len(candidate) == 2:
+                    cells, area = candidate
+                    if result is None:
+                        result = set()
+                        for cell, rows in cells:
+                            # Rows in cells straddling the area's edge are checked exactly.
+                            if not self._by_position.inside(cell, area):
+                                rows = [r for r in rows if area.contains(self._rows[r].latitude, self._rows[r].longitude)]
+                            result.update(rows)
+                    else:
+                        result = {
+                            row for row in result
+                            if self._rows[row].latitude is not None
+                            and area.contains(self._rows[row].latitude, self._rows[row].longitude)
+                        }
+                else:
+                    index, lo, hi, attribute, low, high = candidate
+                    if result is None:
+                        result = set(index.rows(lo, hi))
+                    else:
+                        # The running result is already the smaller side, so
+                        # checking the attribute directly beats slicing the index.
+                        result = {
+                            row for row in result
+                            if (low is None or getattr(self._rows[row], attribute) >= low)
+                            and (high is None or getattr(self._rows[row], attribute) <= high)
+                        }
+                if not result:
+                    return []
+            rows = sorted(result)
+
+        if after is not None:
+            after_row = self._row_by_id.get(after)
+            if after_row is None:
+                raise ValueError(f"Caravan with ID {after} not found.")
+            rows = rows[bisect.bisect_right(rows, after_row):]
+
+        if limit is None:
+            selected = rows[offset:]
+        else:
+            selected = rows[offset:offset + limit]
+        return [self._rows[row] for row in selected]
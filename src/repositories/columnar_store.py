@@ -0,0 +1,153 @@
+import bisect
+import threading
+import uuid
+from array import array
+from datetime import date
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.availability_index import INACTIVE_STATUSES
+
+_STATUS_CODES: Dict[ReservationStatus, int] = {status: code for code, status in enumerate(ReservationStatus)}
+_ACTIVE_CODES = frozenset(code for status, code in _STATUS_CODES.items() if status not in INACTIVE_STATUSES)
+
+
+class ColumnarReservationStore:
+    """
+    Column-oriented copy of the reservation data for aggregate queries.
+
+    Each reservation is a row across typed `array` columns: caravan code,
+    start and end day ordinals, total price and status code. Aggregates scan
+    these compact columns instead of walking Reservation objects, which keeps
+    report queries over millions of reservations fast.
+
+    The store is a ReservationListener: subscribe it to a reservation
+    repository (after `load`-ing the existing data) and it stays in sync.
+    Appends may come from other threads while a query scans; a query only
+    reads the rows that were stored when it started.
+    """
+    def __init__(self):
+        self._caravan_codes: Dict[uuid.UUID, int] = {}
+        self._caravan_ids: List[uuid.UUID] = []
+        self._row_by_id: Dict[uuid.UUID, int] = {}
+        self._caravan = array("l")
+        self._start = array("l")
+        self._end = array("l")
+        self._price = array("d")
+        self._status = array("b")
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._start)
+
+    def load(self, reservations: Iterable[Reservation]) -> None:
+        """Appends existing reservations, e.g. when attaching to a populated repository."""
+        with self._lock:
+            for reservation in reservations:
+                self._append(reservation)
+
+    def on_reservation_added(self, reservation: Reservation) -> None:
+        with self._lock:
+            self._append(reservation)
+
+    def _append(self, reservation: Reservation) -> None:
+        """Adds a row unless the reservation is already stored. Caller holds the lock."""
+        if reservation.id in self._row_by_id:
+            return
+        code = self._caravan_codes.get(reservation.caravan_id)
+        if code is None:
+            code = len(self._caravan_ids)
+            self._caravan_codes[reservation.caravan_id] = code
+            self._caravan_ids.append(reservation.caravan_id)
+        self._row_by_id[reservation.id] = len(self._start)
+        self._caravan.append(code)
+        self._start.append(reservation.start_date.toordinal())
+        self._end.append(reservation.end_date.toordinal())
+        self._price.append(reservation.total_price)
+        self._status.append(_STATUS_CODES[reservation.status])
+
+    def on_reservation_status_changed(self, reservation: Reservation, previous: ReservationStatus) -> None:
+        with self._lock:
+            row = self._row_by_id.get(reservation.id)
+            if row is not None:
+                self._status[row] = _STATUS_CODES[reservation.status]
+
+    def occupied_nights(self, start_date: date, end_date: date) -> Dict[uuid.UUID, int]:
+        """
+        Returns, per caravan, the number of nights in [start_date, end_date)
+        covered by active reservations. Caravans without any are omitted.
+        """
+        lo, hi = start_date.toordinal(), end_date.toordinal()
+        caravan_ids, rows = self._snapshot()
+        totals = [0] * len(caravan_ids)
+        active = _ACTIVE_CODES
+        for caravan, start, end, status in rows(self._caravan, self._start, self._end, self._status):
+            if start < hi and end > lo and status in active:
+                totals[caravan] += (end if end < hi else hi) - (start if start > lo else lo)
+        return {caravan_ids[code]: nights for code, nights in enumerate(totals) if nights}
+
+    def occupied_nights_by_month(self, start_date: date, end_date: date) -> Dict[uuid.UUID, Dict[str, int]]:
+        """
+        Returns, per caravan, the occupied nights of each calendar month
+        ("YYYY-MM") that intersects [start_date, end_date), in one pass over
+        the columns.
+        """
+        keys, bounds = [], []  # bounds[i] is the first day ordinal of month i, then the range end
+        month_start = start_date
+        while month_start < end_date:
+            keys.append(f"{month_start.year:04d}-{month_start.month:02d}")
+            bounds.append(month_start.toordinal())
+            if month_start.month == 12:
+                month_start = date(month_start.year + 1, 1, 1)
+            else:
+                month_start = date(month_start.year, month_start.month + 1, 1)
+        lo, hi = start_date.toordinal(), end_date.toordinal()
+        bounds.append(hi)
+
+        caravan_ids, rows = self._snapshot()
+        totals = [[0] * len(caravan_ids) for _ in keys]
+        active = _ACTIVE_CODES
+        for caravan, start, end, status in rows(self._caravan, self._start, self._end, self._status):
+            if start < hi and end > lo and status in active:
+                # Clip the stay to the range once, then split its nights across the months it spans.
+                start, end = (start if start > lo else lo), (end if end < hi else hi)
+                month = bisect.bisect_right(bounds, start) - 1
+                while start < end:
+                    month_end = bounds[month + 1]
+                    totals[month][caravan] += (end if end < month_end else month_end) - start
+                    start, month = month_end, month + 1
+
+        result: Dict[uuid.UUID, Dict[str, int]] = {}
+        for key, month_totals in zip(keys, totals):
+            for code, nights in enumerate(month_totals):
+                if nights:
+                    result.setdefault(caravan_ids[code], {})[key] = nights
+        return result
+
+    def revenue(self, start_date: date, end_date: date) -> Dict[uuid.UUID, float]:
+        """
+        Returns, per caravan, the revenue earned in [start_date, end_date) by
+        active reservations. A reservation's price is spread evenly over its
+        nights, so stays crossing the range boundary count pro rata.
+        """
+        lo, hi = start_date.toordinal(), end_date.toordinal()
+        caravan_ids, rows = self._snapshot()
+        totals = [0.0] * len(caravan_ids)
+        active = _ACTIVE_CODES
+        for caravan, start, end, price, status in rows(
+            self._caravan, self._start, self._end, self._price, self._status
+        ):
+            if start < hi and end > lo and status in active:
+                nights = (end if end < hi else hi) - (start if start > lo else lo)
+                totals[caravan] += price * nights / (end - start)
+        return {caravan_ids[code]: amount for code, amount in enumerate(totals) if amount}
+
+    def _snapshot(self) -> Tuple[List[uuid.UUID], Callable[..., Iterator[tuple]]]:
+        """
+        Returns the caravan IDs and a function zipping columns over the rows
+        stored now. A row and its caravan code are added together under the
+        lock, so every row in the snapshot has a code in the ID list.
+        """
+        with self._lock:
+            rows, caravan_ids = len(self._start), list(self._caravan_ids)
+        return caravan_ids, lambda *columns: islice(zip(*columns), rows)
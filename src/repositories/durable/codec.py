@@ -0,0 +1,129 @@
+import json
+import struct
+import uuid
+from datetime import date
+from typing import Any, Dict
+from src.models.caravan import Caravan, CaravanStatus
+from src.models.interning import intern_date
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.user import User, UserRole
+
+# Enums are stored by their position in the declaration.
+RESERVATION_STATUSES = list(ReservationStatus)
+RESERVATION_STATUS_CODES = {status: code for code, status in enumerate(RESERVATION_STATUSES)}
+CARAVAN_STATUSES = list(CaravanStatus)
+CARAVAN_STATUS_CODES = {status: code for code, status in enumerate(CARAVAN_STATUSES)}
+
+_RESERVATION = struct.Struct("<16s16s16sIIdB")
+_STATUS_CHANGE = struct.Struct("<16sB")
+
+_new_object = object.__new__
+_set_attribute = object.__setattr__
+
+
+def _dumps(data: Any) -> bytes:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def uuid_from_int(value: int) -> uuid.UUID:
+    """
+    Builds a UUID from its integer value without the argument checks of
+    `uuid.UUID(...)`, which dominate when millions are decoded at startup.
+    """
+    result = _new_object(uuid.UUID)
+    _set_attribute(result, "int", value)
+    _set_attribute(result, "is_safe", uuid.SafeUUID.unknown)
+    return result
+
+
+def encode_user(user: User) -> bytes:
+    return _dumps(user_to_dict(user))
+
+
+def user_to_dict(user: User) -> Dict[str, Any]:
+    return {
+        "id": str(user.id),
+        "name": user.name,
+        "contact": user.contact,
+        "role": user.role.value,
+        "identity_verified": user.identity_verified,
+    }
+
+
+def decode_user(payload: bytes | Dict[str, Any]) -> User:
+    data = json.loads(payload) if isinstance(payload, bytes) else payload
+    return User(
+        id=uuid.UUID(data["id"]),
+        name=data["name"],
+        contact=data["contact"],
+        role=UserRole(data["role"]),
+        identity_verified=data["identity_verified"],
+    )
+
+
+def encode_caravan(caravan: Caravan) -> bytes:
+    return _dumps(caravan_to_dict(caravan))
+
+
+def caravan_to_dict(caravan: Caravan) -> Dict[str, Any]:
+    return {
+        "id": str(caravan.id),
+        "host_id": str(caravan.host_id),
+        "name": caravan.name,
+        "location": caravan.location,
+        "capacity": caravan.capacity,
+        "daily_rate": caravan.daily_rate,
+        "amenities": list(caravan.amenities),
+        "photos": list(caravan.photos),
+        "status": caravan.status.value,
+        "latitude": caravan.latitude,
+        "longitude": caravan.longitude,
+    }
+
+
+def decode_caravan(payload: bytes | Dict[str, Any]) -> Caravan:
+    data = json.loads(payload) if isinstance(payload, bytes) else payload
+    return Caravan(
+        id=uuid.UUID(data["id"]),
+        host_id=uuid.UUID(data["host_id"]),
+        name=data["name"],
+        location=data["location"],
+        capacity=data["capacity"],
+        daily_rate=data["daily_rate"],
+        amenities=list(data["amenities"]),
+        photos=list(data["photos"]),
+        status=CaravanStatus(data["status"]),
+        # Journals and snapshots written before caravans had coordinates lack them.
+        latitude=data.get("latitude"),
+        longitude=data.get("longitude"),
+    )
+
+
+def encode_reservation(reservation: Reservation) -> bytes:
+    return _RESERVATION.pack(
+        reservation.id.bytes, reservation.guest_id.bytes, reservation.caravan_id.bytes,
+        reservation.start_date.toordinal(), reservation.end_date.toordinal(),
+        reservation.total_price, RESERVATION_STATUS_CODES[reservation.status],
+    )
+
+
+def decode_reservation(payload: bytes) -> Reservation:
+    id_, guest_id, caravan_id, start, end, price, status = _RESERVATION.unpack(payload)
+    return Reservation(
+        id=uuid.UUID(bytes=id_),
+        guest_id=uuid.UUID(bytes=guest_id),
+        caravan_id=uuid.UUID(bytes=caravan_id),
+        start_date=intern_date(date.fromordinal(start)),
+        end_date=intern_date(date.fromordinal(end)),
+        total_price=price,
+        status=RESERVATION_STATUSES[status],
+    )
+
+
+def encode_status_change(entity_id: uuid.UUID, code: int) -> bytes:
+    return _STATUS_CHANGE.pack(entity_id.bytes, code)
+
+
+def decode_status_change(payload: bytes) -> tuple[uuid.UUID, int]:
+    entity_id, code = _STATUS_CHANGE.unpack(payload)
+    return uuid.UUID(bytes=entity_id), code
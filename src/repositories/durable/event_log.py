@@ -0,0 +1,82 @@
+import os
+import struct
+import threading
+from typing import Iterator, Tuple
+
+# Each record is a type byte and a payload length, followed by the payload.
+_HEADER = struct.Struct("<BI")
+
+
+class EventLog:
+    """
+    An append-only file of binary records with batched fsync.
+
+    `append` only buffers the record; a background thread flushes and fsyncs
+    the file at most every `sync_interval` seconds, so a burst of mutations
+    shares one fsync (group commit). A crash loses at most the last interval
+    of records, and `sync` makes everything appended so far durable at once.
+    """
+    def __init__(self, path: str, sync_interval: float = 0.05):
+        self._path = path
+        self._sync_interval = sync_interval
+        self._file = open(path, "ab", buffering=1 << 16)
+        self._dirty = False
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread = threading.Thread(target=self._sync_loop, name="event-log-sync", daemon=True)
+        self._thread.start()
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def append(self, kind: int, payload: bytes) -> None:
+        """Appends one record; it becomes durable with the next sync."""
+        with self._lock:
+            if self._closed.is_set():
+                raise RuntimeError("Event log is closed.")
+            self._file.write(_HEADER.pack(kind, len(payload)))
+            self._file.write(payload)
+            self._dirty = True
+
+    def sync(self) -> None:
+        """Flushes and fsyncs every record appended so far."""
+        with self._lock:
+            if not self._dirty or self._file.closed:
+                return
+            self._file.flush()
+            self._dirty = False
+            fd = self._file.fileno()
+        # Appends may continue into the buffer while the disk catches up.
+        os.fsync(fd)
+
+    def close(self) -> None:
+        """Stops the sync thread, makes every record durable and closes the file."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._thread.join()
+        self.sync()
+        with self._lock:
+            self._file.close()
+
+    def _sync_loop(self) -> None:
+        while not self._closed.wait(self._sync_interval):
+            self.sync()
+
+    @staticmethod
+    def read(path: str) -> Iterator[Tuple[int, bytes]]:
+        """
+        Yields the (kind, payload) records of a log file in order. A record
+        cut short by a crash ends the log.
+        """
+        with open(path, "rb") as f:
+            data = f.read()
+        offset, end = 0, len(data)
+        while offset + _HEADER.size <= end:
+            kind, length = _HEADER.unpack_from(data, offset)
+            offset += _HEADER.size
+            if offset + length > end:
+                return
+            yield kind, data[offset:offset + length]
+            offset += length
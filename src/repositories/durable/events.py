@@ -0,0 +1,93 @@
+from typing import Iterable, Iterator, Tuple
+from src.models.caravan import Caravan, CaravanStatus
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.user import User
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.repositories.durable import codec
+
+USER_ADDED = 1
+CARAVAN_ADDED = 2
+CARAVAN_STATUS_CHANGED = 3
+RESERVATION_ADDED = 4
+RESERVATION_STATUS_CHANGED = 5
+
+
+class EventRecorder:
+    """
+    Base class for listeners that record repository mutations as binary events.
+
+    Subscribe an instance to the user, caravan and reservation repositories;
+    every mutation is encoded and handed to `_record` as a (kind, payload)
+    pair that `apply_event` can later replay.
+    """
+    def on_user_added(self, user: User) -> None:
+        self._record(USER_ADDED, codec.encode_user(user))
+
+    def on_caravan_added(self, caravan: Caravan) -> None:
+        self._record(CARAVAN_ADDED, codec.encode_caravan(caravan))
+
+    def on_caravan_status_changed(self, caravan: Caravan, previous: CaravanStatus) -> None:
+        self._record(CARAVAN_STATUS_CHANGED, codec.encode_status_change(
+            caravan.id, codec.CARAVAN_STATUS_CODES[caravan.status]
+        ))
+
+    def on_reservation_added(self, reservation: Reservation) -> None:
+        self._record(RESERVATION_ADDED, codec.encode_reservation(reservation))
+
+    def on_reservation_status_changed(self, reservation: Reservation, previous: ReservationStatus) -> None:
+        self._record(RESERVATION_STATUS_CHANGED, codec.encode_status_change(
+            reservation.id, codec.RESERVATION_STATUS_CODES[reservation.status]
+        ))
+
+    def _record(self, kind: int, payload: bytes) -> None:
+        raise NotImplementedError
+
+
+def state_events(
+    users: Iterable[User], caravans: Iterable[Caravan], reservations: Iterable[Reservation]
+) -> Iterator[Tuple[int, bytes]]:
+    """Yields the events that rebuild the given state in empty repositories."""
+    for user in users:
+        yield USER_ADDED, codec.encode_user(user)
+    for caravan in caravans:
+        yield CARAVAN_ADDED, codec.encode_caravan(caravan)
+    for reservation in reservations:
+        yield RESERVATION_ADDED, codec.encode_reservation(reservation)
+
+
+def apply_event(
+    kind: int,
+    payload: bytes,
+    user_repo: UserRepository,
+    caravan_repo: CaravanRepository,
+    reservation_repo: ReservationRepository,
+) -> None:
+    """
+    Applies one recorded event to the repositories. Events carry the new
+    state rather than a delta, so applying an event twice is harmless.
+
+    Raises:
+        ValueError: If the event kind is unknown.
+    """
+    if kind == USER_ADDED:
+        user = codec.decode_user(payload)
+        if user_repo.get_by_id(user.id) is None:
+            user_repo.add(user)
+    elif kind == CARAVAN_ADDED:
+        caravan = codec.decode_caravan(payload)
+        if caravan_repo.get_by_id(caravan.id) is None:
+            caravan_repo.add(caravan)
+    elif kind == CARAVAN_STATUS_CHANGED:
+        caravan_id, code = codec.decode_status_change(payload)
+        caravan_repo.update_status(caravan_id, codec.CARAVAN_STATUSES[code])
+    elif kind == RESERVATION_ADDED:
+        reservation = codec.decode_reservation(payload)
+        if reservation_repo.get_by_id(reservation.id) is None:
+            reservation_repo.add(reservation)
+    elif kind == RESERVATION_STATUS_CHANGED:
+        reservation_id, code = codec.decode_status_change(payload)
+        reservation_repo.update_status(reservation_id, codec.RESERVATION_STATUSES[code])
+    else:
+        raise ValueError(f"Unknown event type {kind}.")
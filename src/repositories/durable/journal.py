@@ -0,0 +1,160 @@
+import gc
+import glob
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.repositories.durable.event_log import EventLog
+from src.repositories.durable.events import EventRecorder, apply_event
+from src.repositories.durable.snapshot import read_snapshot, write_snapshot
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILE = "snapshot.bin"
+
+
+@contextmanager
+def _collector_paused():
+    """
+    Pauses the cyclic garbage collector. Bulk loading allocates millions of
+    objects without creating garbage, and every collection triggered along
+    the way would rescan all of them.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+class Journal(EventRecorder):
+    """
+    Makes the in-memory repositories durable.
+
+    The journal listens to the user, caravan and reservation repositories and
+    appends every mutation to an event log in `directory`. `snapshot` writes
+    the whole state in a compact binary form and starts a new log segment,
+    so on startup `recover` loads the latest snapshot and replays only the
+    segments written after it.
+
+    A mutation may land in both a snapshot and the log segment that follows
+    it, so replaying an event is idempotent.
+    """
+    def __init__(
+        self,
+        directory: str,
+        user_repo: UserRepository,
+        caravan_repo: CaravanRepository,
+        reservation_repo: ReservationRepository,
+        sync_interval: float = 0.05,
+        snapshot_interval: float | None = None,
+    ):
+        self._directory = directory
+        self._user_repo = user_repo
+        self._caravan_repo = caravan_repo
+        self._reservation_repo = reservation_repo
+        self._sync_interval = sync_interval
+        self._snapshot_interval = snapshot_interval
+        self._log: EventLog | None = None
+        self._log_seq = 0
+        # Serializes snapshots and segment rotation against appends.
+        self._lock = threading.RLock()
+        self._closed = threading.Event()
+        self._snapshot_thread: threading.Thread | None = None
+
+    def recover(self) -> None:
+        """
+        Restores the repositories from the snapshot and the log segments after
+        it, then starts journaling their mutations. Call once, on empty repositories.
+        """
+        os.makedirs(self._directory, exist_ok=True)
+        snapshot_path = os.path.join(self._directory, SNAPSHOT_FILE)
+        first_seq = 0
+        if os.path.exists(snapshot_path):
+            with _collector_paused():
+                snapshot = read_snapshot(snapshot_path)
+                for user in snapshot.users:
+                    self._user_repo.add(user)
+                for caravan in snapshot.caravans:
+                    self._caravan_repo.add(caravan)
+                self._reservation_repo.restore(snapshot.reservations)
+                first_seq = snapshot.log_seq
+                del snapshot
+            # The restored objects live as long as the process; keeping them out
+            # of future collections avoids rescanning millions of them.
+            gc.freeze()
+
+        segments = self._segments()
+        replayed = 0
+        for seq, path in segments:
+            if seq >= first_seq:
+                for kind, payload in EventLog.read(path):
+                    apply_event(kind, payload, self._user_repo, self._caravan_repo, self._reservation_repo)
+                    replayed += 1
+        logger.info("Recovered state from %s, replaying %d events.", self._directory, replayed)
+
+        # Each run appends to a fresh segment, leaving any torn tail behind.
+        self._log_seq = max([first_seq] + [seq + 1 for seq, _ in segments])
+        self._log = EventLog(self._segment_path(self._log_seq), self._sync_interval)
+        self._user_repo.subscribe(self)
+        self._caravan_repo.subscribe(self)
+        self._reservation_repo.subscribe(self)
+
+        if self._snapshot_interval:
+            self._snapshot_thread = threading.Thread(target=self._snapshot_loop, name="journal-snapshot", daemon=True)
+            self._snapshot_thread.start()
+
+    def snapshot(self) -> None:
+        """
+        Writes a snapshot of the current state and drops the log segments it covers.
+        """
+        with self._lock:
+            # Everything logged before the rotation is part of the state read below.
+            self._log.close()
+            self._log_seq += 1
+            self._log = EventLog(self._segment_path(self._log_seq), self._sync_interval)
+            seq = self._log_seq
+        write_snapshot(
+            os.path.join(self._directory, SNAPSHOT_FILE), seq,
+            self._user_repo.get_all(), self._caravan_repo.get_all(), self._reservation_repo.get_all(),
+        )
+        for old_seq, path in self._segments():
+            if old_seq < seq:
+                os.remove(path)
+
+    def sync(self) -> None:
+        """Makes every mutation journaled so far durable."""
+        with self._lock:
+            self._log.sync()
+
+    def close(self) -> None:
+        """Stops journaling and makes every journaled mutation durable."""
+        self._closed.set()
+        if self._snapshot_thread is not None:
+            self._snapshot_thread.join()
+        with self._lock:
+            if self._log is not None:
+                self._log.close()
+
+    def _record(self, kind: int, payload: bytes) -> None:
+        with self._lock:
+            self._log.append(kind, payload)
+
+    def _segments(self) -> list[tuple[int, str]]:
+        paths = glob.glob(os.path.join(self._directory, "events-*.log"))
+        return sorted((int(os.path.basename(p)[7:-4]), p) for p in paths)
+
+    def _segment_path(self, seq: int) -> str:
+        return os.path.join(self._directory, f"events-{seq:08d}.log")
+
+    def _snapshot_loop(self) -> None:
+        while not self._closed.wait(self._snapshot_interval):
+            try:
+                self.snapshot()
+            except Exception:
+                logger.exception("Snapshot failed.")
@@ -0,0 +1,147 @@
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Sequence
+from src.models.caravan import Caravan
+from src.models.interning import intern_date
+from src.models.reservation import Reservation
+from src.models.user import User
+from src.repositories.durable.codec import (
+    RESERVATION_STATUSES, RESERVATION_STATUS_CODES,
+    caravan_to_dict, decode_caravan, decode_user, uuid_from_int, user_to_dict,
+)
+
+MAGIC = b"CSSNAP01"
+# magic, first log segment not covered, users JSON size, caravans JSON size,
+# reservation count, size of the shared guest/caravan ID table
+_HEADER = struct.Struct("<8sQQQQQ")
+
+
+@dataclass
+class Snapshot:
+    """The full repository state as of the start of log segment `log_seq`."""
+    log_seq: int
+    users: List[User]
+    caravans: List[Caravan]
+    reservations: List[Reservation]
+
+
+def _column(typecode: str, values) -> bytes:
+    column = array(typecode, values)
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column.tobytes()
+
+
+def _read_column(typecode: str, buffer, offset: int, count: int) -> tuple[array, int]:
+    column = array(typecode)
+    end = offset + count * column.itemsize
+    column.frombytes(buffer[offset:end])
+    if sys.byteorder != "little":
+        column.byteswap()
+    return column, end
+
+
+def write_snapshot(
+    path: str,
+    log_seq: int,
+    users: Sequence[User],
+    caravans: Sequence[Caravan],
+    reservations: Sequence[Reservation],
+) -> None:
+    """
+    Writes a snapshot atomically: to a temporary file that replaces `path`
+    only once it is fully on disk.
+
+    Reservations are stored column by column. Guest and caravan IDs repeat
+    across many reservations, so they are stored once in a table and the
+    columns refer to them by number.
+    """
+    users_blob = json.dumps([user_to_dict(u) for u in users], ensure_ascii=False).encode()
+    caravans_blob = json.dumps([caravan_to_dict(c) for c in caravans], ensure_ascii=False).encode()
+    table = {}
+    guests = _column("I", [table.setdefault(r.guest_id, len(table)) for r in reservations])
+    caravan_refs = _column("I", [table.setdefault(r.caravan_id, len(table)) for r in reservations])
+
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(MAGIC, log_seq, len(users_blob), len(caravans_blob), len(reservations), len(table)))
+        f.write(users_blob)
+        f.write(caravans_blob)
+        f.write(b"".join(u.bytes for u in table))
+        f.write(b"".join(r.id.bytes for r in reservations))
+        f.write(guests)
+        f.write(caravan_refs)
+        f.write(_column("I", [r.start_date.toordinal() for r in reservations]))
+        f.write(_column("I", [r.end_date.toordinal() for r in reservations]))
+        f.write(_column("d", [r.total_price for r in reservations]))
+        f.write(_column("B", [RESERVATION_STATUS_CODES[r.status] for r in reservations]))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+    _fsync_directory(os.path.dirname(path) or ".")
+
+
+def read_snapshot(path: str) -> Snapshot:
+    """
+    Reads a snapshot written by `write_snapshot`. The file is memory-mapped,
+    and each column is copied out in one piece before the objects are built.
+
+    Raises:
+        ValueError: If the file is not a snapshot.
+    """
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+        magic, log_seq, users_size, caravans_size, count, table_size = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a CaravanShare snapshot.")
+        offset = _HEADER.size
+        users = [decode_user(d) for d in json.loads(buffer[offset:offset + users_size])]
+        offset += users_size
+        caravans = [decode_caravan(d) for d in json.loads(buffer[offset:offset + caravans_size])]
+        offset += caravans_size
+
+        from_bytes = int.from_bytes
+        # Share the ID objects of the stored users and caravans, as ReservationService does.
+        known = {u.id: u.id for u in users}
+        known.update((c.id, c.id) for c in caravans)
+        table = [
+            known.get(i, i) for i in
+            (uuid_from_int(from_bytes(buffer[j:j + 16], "big")) for j in range(offset, offset + 16 * table_size, 16))
+        ]
+        offset += 16 * table_size
+        ids = [from_bytes(buffer[i:i + 16], "big") for i in range(offset, offset + 16 * count, 16)]
+        offset += 16 * count
+        guests, offset = _read_column("I", buffer, offset, count)
+        caravan_refs, offset = _read_column("I", buffer, offset, count)
+        starts, offset = _read_column("I", buffer, offset, count)
+        ends, offset = _read_column("I", buffer, offset, count)
+        prices, offset = _read_column("d", buffer, offset, count)
+        statuses, offset = _read_column("B", buffer, offset, count)
+
+    # Only a few thousand distinct days occur, so every date object is shared.
+    dates = {o: intern_date(date.fromordinal(o)) for o in set(starts) | set(ends)}
+    reservations = list(map(
+        Reservation,
+        map(table.__getitem__, guests),
+        map(table.__getitem__, caravan_refs),
+        map(dates.__getitem__, starts),
+        map(dates.__getitem__, ends),
+        prices,
+        map(uuid_from_int, ids),
+        map(RESERVATION_STATUSES.__getitem__, statuses),
+    ))
+    return Snapshot(log_seq, users, caravans, reservations)
+
+
+def _fsync_directory(path: str) -> None:
+    """Makes a rename inside the directory durable."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
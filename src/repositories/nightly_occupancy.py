@@ -0,0 +1,94 @@
+import threading
+from datetime import date, timedelta
+from typing import Callable, Dict, Iterable
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.availability_index import INACTIVE_STATUSES, is_active
+from src.repositories.search_index import CaravanSearchIndex
+
+
+class NightlyOccupancy:
+    """
+    Which caravans are booked on each night, as one bitset per night.
+
+    Bit `seq` of a night's bitset is set if the caravan the search index holds
+    as `seq` has an active reservation covering that night, so the caravans
+    booked at any time in a date range are the OR of its nights' bitsets: a
+    handful of whole-fleet operations in C rather than a lookup per caravan.
+    Only nights from today on are kept; the search never looks at the past.
+
+    The occupancy is a ReservationListener: `load` the existing reservations
+    and subscribe it to a reservation repository. Caravans must be in the
+    search index before their reservations arrive; reservations of caravans
+    it does not know are ignored, so they read as free.
+    """
+    def __init__(self, index: CaravanSearchIndex, today: Callable[[], date] = date.today):
+        self._index = index
+        self._today = today
+        self._nights: Dict[date, bytearray] = {}
+        self._pruned = today()
+        self._lock = threading.Lock()
+
+    def load(self, reservations: Iterable[Reservation]) -> None:
+        """Marks existing reservations, e.g. when attaching to a populated repository."""
+        for reservation in reservations:
+            self.on_reservation_added(reservation)
+
+    def on_reservation_added(self, reservation: Reservation) -> None:
+        if is_active(reservation):
+            self._mark(reservation, True)
+
+    def on_reservation_status_changed(self, reservation: Reservation, previous: ReservationStatus) -> None:
+        if (previous not in INACTIVE_STATUSES) != is_active(reservation):
+            self._mark(reservation, is_active(reservation))
+
+    def booked_between(self, start_date: date, end_date: date) -> int:
+        """
+        Returns a bitmask with bit `seq` set for every indexed caravan booked
+        on at least one night in [start_date, end_date).
+        """
+        mask = 0
+        with self._lock:
+            nights = self._nights
+            if len(nights) <= (end_date - start_date).days:
+                for day, bitset in nights.items():
+                    if start_date <= day < end_date:
+                        mask |= int.from_bytes(bitset, "little")
+            else:
+                day = start_date
+                while day < end_date:
+                    bitset = nights.get(day)
+                    if bitset is not None:
+                        mask |= int.from_bytes(bitset, "little")
+                    day += timedelta(days=1)
+        return mask
+
+    def _mark(self, reservation: Reservation, booked: bool) -> None:
+        seq = self._index.seq_of(reservation.caravan_id)
+        if seq is None:
+            return
+        byte, bit = seq >> 3, 1 << (seq & 7)
+        today = self._today()
+        with self._lock:
+            if today > self._pruned:
+                self._prune(today)
+            day = max(reservation.start_date, today)
+            while day < reservation.end_date:
+                bitset = self._nights.get(day)
+                if bitset is None:
+                    if not booked:
+                        day += timedelta(days=1)
+                        continue
+                    bitset = self._nights[day] = bytearray()
+                if len(bitset) <= byte:
+                    bitset.extend(bytes(byte + 1 - len(bitset)))
+                if booked:
+                    bitset[byte] |= bit
+                else:
+                    bitset[byte] &= ~bit & 0xFF
+                day += timedelta(days=1)
+
+    def _prune(self, today: date) -> None:
+        """Drops the nights before today. Caller holds the lock."""
+        for day in [day for day in self._nights if day < today]:
+            del self._nights[day]
+        self._pruned = today
@@ -0,0 +1,62 @@
+import threading
+import uuid
+from typing import Collection, Dict, List
+from src.models.payment import Payment, PaymentStatus
+from src.exceptions.payment import InvalidPaymentStatusError
+
+class PaymentRepository:
+    """
+    Manages the storage and retrieval of payment data.
+    This is an in-memory implementation, indexed by payment and by reservation.
+    """
+    def __init__(self):
+        self._payments: Dict[uuid.UUID, Payment] = {}
+        self._payments_by_reservation: Dict[uuid.UUID, List[Payment]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, payment: Payment) -> None:
+        """Adds a new payment to the repository."""
+        with self._lock:
+            if payment.id in self._payments:
+                raise ValueError(f"Payment with id {payment.id} already exists.")
+            self._payments[payment.id] = payment
+            self._payments_by_reservation.setdefault(payment.reservation_id, []).append(payment)
+
+    def get_by_id(self, payment_id: uuid.UUID) -> Payment | None:
+        """Retrieves a payment by its unique ID."""
+        return self._payments.get(payment_id)
+
+    def get_for_reservation(self, reservation_id: uuid.UUID) -> List[Payment]:
+        """Retrieves the payments of a reservation, oldest first."""
+        with self._lock:
+            return list(self._payments_by_reservation.get(reservation_id, []))
+
+    def get_all(self) -> List[Payment]:
+        """Retrieves all payments."""
+        with self._lock:
+            return list(self._payments.values())
+
+    def update_status(
+        self,
+        payment_id: uuid.UUID,
+        status: PaymentStatus,
+        expected: Collection[PaymentStatus] | None = None,
+    ) -> Payment:
+        """
+        Changes the status of a stored payment. If `expected` is given, the
+        change is only made when the current status is one of those.
+
+        Raises:
+            ValueError: If the payment cannot be found.
+            InvalidPaymentStatusError: If the current status is not an expected one.
+        """
+        with self._lock:
+            payment = self._payments.get(payment_id)
+            if payment is None:
+                raise ValueError(f"Payment with id {payment_id} not found.")
+            if expected is not None and payment.status not in expected:
+                raise InvalidPaymentStatusError(
+                    f"Payment cannot change from {payment.status.value} to {status.value}."
+                )
+            payment.status = status
+            return payment
@@ -0,0 +1,58 @@
+import threading
+import uuid
+from typing import Dict, Iterable
+from src.models.review import Review, RatingSummary
+from src.repositories.caravan_repository import CaravanRepository
+
+_EMPTY = RatingSummary()
+
+
+class RatingIndex:
+    """
+    Keeps a running RatingSummary (count, sum, histogram) per review target.
+
+    A review of a caravan also counts toward the caravan's host, so a host's
+    rating covers all of their caravans. Each review updates the summaries
+    in O(1); reading one never touches the reviews themselves. `version`
+    changes with every review, for caches built on the summaries.
+
+    The index is a ReviewListener: `load` the existing reviews and subscribe
+    it to a review repository to keep it up to date.
+    """
+    def __init__(self, caravan_repo: CaravanRepository):
+        self._caravan_repo = caravan_repo
+        self._summaries: Dict[uuid.UUID, RatingSummary] = {}
+        self._version = 0
+        self._lock = threading.Lock()
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def load(self, reviews: Iterable[Review]) -> None:
+        """Indexes existing reviews, e.g. when attaching to a populated repository."""
+        for review in reviews:
+            self.on_review_added(review)
+
+    def on_review_added(self, review: Review) -> None:
+        caravan = self._caravan_repo.get_by_id(review.target_id)
+        with self._lock:
+            self._add(review.target_id, review.rating)
+            if caravan is not None and caravan.host_id != review.target_id:
+                self._add(caravan.host_id, review.rating)
+            self._version += 1
+
+    def summary(self, target_id: uuid.UUID) -> RatingSummary:
+        """Returns the rating summary of a caravan or host (empty if never rated)."""
+        return self._summaries.get(target_id, _EMPTY)
+
+    def sort_key(self, target_id: uuid.UUID) -> tuple:
+        """Orders targets best rated first, then most rated; unrated targets come last."""
+        summary = self._summaries.get(target_id)
+        if summary is None:
+            return (1, 0.0, 0)
+        return (0, -summary.total / summary.count, -summary.count)
+
+    def _add(self, target_id: uuid.UUID, rating: int) -> None:
+        # Summaries are immutable, so readers never see one half-updated.
+        self._summaries[target_id] = self._summaries.get(target_id, _EMPTY).with_rating(rating)
@@ -0,0 +1,242 @@
+import logging
+import os
+import queue
+import socket
+import struct
+import threading
+from multiprocessing.connection import Client, Connection
+from typing import List, Sequence
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation
+from src.models.user import User
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.repositories.durable.events import EventRecorder, apply_event, state_events
+
+logger = logging.getLogger(__name__)
+
+# Each event on the wire: sequence number, kind and payload length, then the payload.
+_RECORD = struct.Struct("<QBI")
+# Ends the initial state sent to a new subscriber.
+_STATE_END = 0
+# Events are sent in messages of up to this many records.
+_BATCH_SIZE = 4096
+
+SUBSCRIBE = "subscribe"
+
+
+class _Subscriber:
+    """One replica's event stream, sent by its own thread."""
+    def __init__(self, conn: Connection, seq: int, users: Sequence[User],
+                 caravans: Sequence[Caravan], reservations: Sequence[Reservation]):
+        self._conn = conn
+        self._seq = seq
+        self._state = (users, caravans, reservations)
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.alive = True
+        self._thread = threading.Thread(target=self._run, name="event-publisher", daemon=True)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def put(self, record: bytes) -> None:
+        self._queue.put(record)
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            self._send_state()
+            while True:
+                record = self._queue.get()
+                if record is None:
+                    return
+                batch = [record]
+                # Whatever queued up while the last message was sent goes out together.
+                while len(batch) < _BATCH_SIZE:
+                    try:
+                        record = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if record is None:
+                        self._conn.send_bytes(b"".join(batch))
+                        return
+                    batch.append(record)
+                self._conn.send_bytes(b"".join(batch))
+        except OSError:
+            logger.info("Replica disconnected.")
+        finally:
+            self.alive = False
+            self._conn.close()
+
+    def _send_state(self) -> None:
+        batch = []
+        for kind, payload in state_events(*self._state):
+            batch.append(_RECORD.pack(self._seq, kind, len(payload)) + payload)
+            if len(batch) == _BATCH_SIZE:
+                self._conn.send_bytes(b"".join(batch))
+                batch = []
+        batch.append(_RECORD.pack(self._seq, _STATE_END, 0))
+        self._conn.send_bytes(b"".join(batch))
+        self._state = None
+
+
+class EventPublisher(EventRecorder):
+    """
+    Streams the mutations of the owner's repositories to replica processes.
+
+    Subscribe the publisher to the user, caravan and reservation repositories.
+    Every event gets the next sequence number. A new subscriber first receives
+    the current state, then every later event in order. Each subscriber is
+    served by its own thread, so a slow replica never holds up the writer.
+    """
+    def __init__(
+        self,
+        user_repo: UserRepository,
+        caravan_repo: CaravanRepository,
+        reservation_repo: ReservationRepository,
+    ):
+        self._user_repo = user_repo
+        self._caravan_repo = caravan_repo
+        self._reservation_repo = reservation_repo
+        self._seq = 0
+        self._subscribers: List[_Subscriber] = []
+        self._lock = threading.Lock()
+
+    @property
+    def seq(self) -> int:
+        """The sequence number of the latest event."""
+        return self._seq
+
+    def add_subscriber(self, conn: Connection) -> None:
+        """
+        Starts streaming events to a replica connection. Call it from the
+        owner's writer thread, so that no mutation happens between capturing
+        the state and registering the subscriber.
+
+        The state is encoded later by the subscriber's thread. A reservation
+        changed in the meantime may be sent with its newer status, followed by
+        the status events leading to it; replicas converge all the same, since
+        every event carries the resulting state.
+        """
+        with self._lock:
+            subscriber = _Subscriber(
+                conn, self._seq,
+                self._user_repo.get_all(), self._caravan_repo.get_all(), self._reservation_repo.get_all(),
+            )
+            self._subscribers.append(subscriber)
+        subscriber.start()
+
+    def close(self) -> None:
+        """Sends the remaining events and disconnects all replicas."""
+        with self._lock:
+            subscribers, self._subscribers = self._subscribers, []
+        for subscriber in subscribers:
+            subscriber.close()
+
+    def _record(self, kind: int, payload: bytes) -> None:
+        with self._lock:
+            self._seq += 1
+            record = _RECORD.pack(self._seq, kind, len(payload)) + payload
+            if not all(s.alive for s in self._subscribers):
+                self._subscribers = [s for s in self._subscribers if s.alive]
+            for subscriber in self._subscribers:
+                subscriber.put(record)
+
+
+class ReplicaFeed:
+    """
+    Keeps local repositories in sync with an owner's EventPublisher.
+
+    `connect` loads the owner's current state into the (empty) repositories.
+    Attach listeners after that, then `start` applying later events in a
+    background thread. `wait_for` lets a caller that just wrote through the
+    owner see its own write locally.
+    """
+    def __init__(
+        self,
+        address: str,
+        user_repo: UserRepository,
+        caravan_repo: CaravanRepository,
+        reservation_repo: ReservationRepository,
+        authkey: bytes,
+    ):
+        self._address = address
+        self._authkey = authkey
+        self._user_repo = user_repo
+        self._caravan_repo = caravan_repo
+        self._reservation_repo = reservation_repo
+        self._conn: Connection | None = None
+        self._applied_seq = 0
+        self._caught_up = threading.Condition()
+        self._closing = False
+        self._thread: threading.Thread | None = None
+
+    @property
+    def applied_seq(self) -> int:
+        """The sequence number of the latest event applied locally."""
+        return self._applied_seq
+
+    def connect(self) -> None:
+        """Subscribes to the owner and loads its current state."""
+        self._conn = Client(self._address, authkey=self._authkey)
+        self._conn.send(SUBSCRIBE)
+        while not self._apply_message(self._conn.recv_bytes()):
+            pass
+
+    def start(self) -> None:
+        """Applies events from the owner in a background thread until closed."""
+        self._thread = threading.Thread(target=self._run, name="replica-feed", daemon=True)
+        self._thread.start()
+
+    def wait_for(self, seq: int, timeout: float | None = None) -> bool:
+        """Waits until event `seq` has been applied. Returns False on timeout."""
+        with self._caught_up:
+            return self._caught_up.wait_for(lambda: self._applied_seq >= seq, timeout)
+
+    def close(self) -> None:
+        """Disconnects from the owner and stops applying events."""
+        self._closing = True
+        if self._conn is None:
+            return
+        if self._thread is None:
+            self._conn.close()
+            return
+        # Closing the connection under a blocked read is unsafe; shutting the
+        # socket down wakes the reader with EOF, and the reader closes it.
+        with socket.socket(fileno=os.dup(self._conn.fileno())) as sock:
+            sock.shutdown(socket.SHUT_RDWR)
+        self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            while True:
+                self._apply_message(self._conn.recv_bytes())
+        except (EOFError, OSError):
+            if not self._closing:
+                logger.error("Lost the connection to the owner at %s; the replica is no longer updated.", self._address)
+        finally:
+            self._conn.close()
+
+    def _apply_message(self, data: bytes) -> bool:
+        """Applies one message of events. Returns True if it ends the initial state."""
+        offset, end = 0, len(data)
+        seq, state_end = 0, False
+        while offset < end:
+            seq, kind, length = _RECORD.unpack_from(data, offset)
+            offset += _RECORD.size
+            if kind == _STATE_END:
+                state_end = True
+            else:
+                apply_event(
+                    kind, data[offset:offset + length],
+                    self._user_repo, self._caravan_repo, self._reservation_repo,
+                )
+            offset += length
+        with self._caught_up:
+            self._applied_seq = max(self._applied_seq, seq)
+            self._caught_up.notify_all()
+        return state_end
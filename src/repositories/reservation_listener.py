@@ -0,0 +1,15 @@
+from typing import Protocol
+from src.models.reservation import Reservation, ReservationStatus
+
+
+class ReservationListener(Protocol):
+    """
+    Observer notified by a reservation repository after each mutation.
+
+    Listeners maintain derived structures (reports, calendars, secondary
+    indexes) incrementally. They are called while the caravan's booking lock
+    is held, so they must be fast and must not call back into booking.
+    """
+    def on_reservation_added(self, reservation: Reservation) -> None: ...
+
+    def on_reservation_status_changed(self, reservation: Reservation, previous: ReservationStatus) -> None: ...
@@ -1,31 +1,246 @@
-from typing import Dict, List
+import heapq
+import itertools
+import threading
+from contextlib import AbstractContextManager
+from datetime import date
+from typing import Collection, Dict, Iterable, Iterator, List, Tuple
 import uuid
-from src.models.reservation import Reservation
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.availability_index import AvailabilityIndex, INACTIVE_STATUSES, is_active
+from src.repositories.reservation_listener import ReservationListener
+from src.repositories.striped_lock import StripedLock
+from src.exceptions.reservation import BookingConflictError, InvalidStatusTransitionError
 
 class ReservationRepository:
     """
     Manages the storage and retrieval of reservation data.
     This is an in-memory implementation designed for efficient lookups.
+
+    Writes that must be atomic with a preceding check (validate-then-add,
+    status changes) are serialized per caravan through `lock_for`.
+    Subscribed listeners are notified of every mutation (Observer pattern).
     """
-    def __init__(self):
+    def __init__(self, lock_stripes: int = 64):
         # Provides O(1) lookup for a caravan's reservations
         self._reservations_by_caravan: Dict[uuid.UUID, List[Reservation]] = {}
         # Provides O(1) lookup for a specific reservation by its ID
         self._reservations_by_id: Dict[uuid.UUID, Reservation] = {}
+        # Provides O(log n) overlap checks against a caravan's active reservations
+        self._active_by_caravan: Dict[uuid.UUID, AvailabilityIndex] = {}
+        # Approved reservations by end date, so sweeping ended stays only visits those.
+        # Entries are not removed on status changes; stale ones are skipped when popped.
+        self._approved_by_end: List[Tuple[date, int, Reservation]] = []
+        self._approved_seq = itertools.count()
+        self._approved_lock = threading.Lock()
+        # Serializes writes per caravan while letting other caravans proceed
+        self._locks = StripedLock(lock_stripes)
+        self._listeners: List[ReservationListener] = []
+
+    def subscribe(self, listener: ReservationListener) -> None:
+        """Registers a listener to be notified of every future mutation."""
+        self._listeners.append(listener)
+
+    def lock_for(self, caravan_id: uuid.UUID) -> threading.RLock:
+        """
+        Returns the lock serializing bookings of the given caravan.
+        Hold it around a conflict check and the following `add`.
+        """
+        return self._locks.lock_for(caravan_id)
+
+    def lock_many(self, caravan_ids: Iterable[uuid.UUID]) -> AbstractContextManager:
+        """Returns a context manager holding the booking locks of several caravans at once."""
+        return self._locks.lock_many(caravan_ids)
 
     def add(self, reservation: Reservation) -> None:
         """Adds a new reservation to the repository."""
-        if reservation.id in self._reservations_by_id:
-            raise ValueError(f"Reservation with id {reservation.id} already exists.")
+        with self.lock_for(reservation.caravan_id):
+            if reservation.id in self._reservations_by_id:
+                raise ValueError(f"Reservation with id {reservation.id} already exists.")
+            self._insert(reservation)
+
+    def add_many(self, reservations: Iterable[Reservation]) -> None:
+        """
+        Adds several new reservations. Duplicate IDs are rejected before
+        anything is stored, so either all reservations are added or none.
+        The booking locks of all affected caravans are taken once for the
+        whole batch rather than once per reservation.
+        """
+        reservations = list(reservations)
+        with self.lock_many({reservation.caravan_id for reservation in reservations}):
+            seen = set()
+            for reservation in reservations:
+                if reservation.id in self._reservations_by_id or reservation.id in seen:
+                    raise ValueError(f"Reservation with id {reservation.id} already exists.")
+                seen.add(reservation.id)
+            for reservation in reservations:
+                self._insert(reservation)
 
+    def _insert(self, reservation: Reservation) -> None:
+        """Stores and indexes a reservation and notifies listeners. Caller holds its caravan's lock."""
         self._reservations_by_id[reservation.id] = reservation
-        
+
         self._reservations_by_caravan.setdefault(reservation.caravan_id, []).append(reservation)
 
+        if is_active(reservation):
+            self._active_by_caravan.setdefault(reservation.caravan_id, AvailabilityIndex()).insert(reservation)
+        if reservation.status == ReservationStatus.APPROVED:
+            self._push_approved(reservation)
+
+        for listener in self._listeners:
+            listener.on_reservation_added(reservation)
+
+    def restore(self, reservations: Iterable[Reservation]) -> None:
+        """
+        Bulk-loads reservations into an empty repository, e.g. from a snapshot.
+        Indexes are built in one pass per caravan; listeners are not notified.
+
+        Raises:
+            ValueError: If the repository already holds reservations.
+        """
+        if self._reservations_by_id:
+            raise ValueError("Reservations can only be restored into an empty repository.")
+        reservations = list(reservations)
+        self._reservations_by_id = {r.id: r for r in reservations}
+        by_caravan = self._reservations_by_caravan
+        for reservation in reservations:
+            caravan_reservations = by_caravan.get(reservation.caravan_id)
+            if caravan_reservations is None:
+                caravan_reservations = by_caravan[reservation.caravan_id] = []
+            caravan_reservations.append(reservation)
+        for caravan_id, caravan_reservations in by_caravan.items():
+            active = [r for r in caravan_reservations if is_active(r)]
+            if active:
+                self._active_by_caravan[caravan_id] = AvailabilityIndex.from_reservations(active)
+        self._approved_by_end = [
+            (r.end_date, next(self._approved_seq), r) for r in reservations if r.status == ReservationStatus.APPROVED
+        ]
+        heapq.heapify(self._approved_by_end)
+
     def get_by_id(self, reservation_id: uuid.UUID) -> Reservation | None:
         """Retrieves a reservation by its unique ID."""
         return self._reservations_by_id.get(reservation_id)
 
+    def get_all(self) -> List[Reservation]:
+        """Returns a list of all reservations."""
+        return list(self._reservations_by_id.values())
+
+    def iter_all(self) -> Iterator[Reservation]:
+        """Yields every reservation; a snapshot, so reservations added meanwhile are not seen."""
+        return iter(self.get_all())
+
     def get_for_caravan(self, caravan_id: uuid.UUID) -> List[Reservation]:
         """Retrieves all reservations for a specific caravan."""
         return self._reservations_by_caravan.get(caravan_id, [])
+
+    def find_conflict(self, caravan_id: uuid.UUID, start_date: date, end_date: date) -> Reservation | None:
+        """
+        Returns an active reservation of the caravan that overlaps
+        [start_date, end_date), or None if the dates are free.
+        """
+        index = self._active_by_caravan.get(caravan_id)
+        if index is None:
+            return None
+        return index.find_overlap(start_date, end_date)
+
+    def filter_available(self, caravans: Iterable[Caravan], start_date: date, end_date: date) -> List[Caravan]:
+        """
+        Returns the caravans that have no active reservation overlapping
+        [start_date, end_date), checking the whole set in one pass.
+        """
+        indexes = self._active_by_caravan
+        available = []
+        for caravan in caravans:
+            index = indexes.get(caravan.id)
+            if index is None or index.find_overlap(start_date, end_date) is None:
+                available.append(caravan)
+        return available
+
+    def update_status(
+        self,
+        reservation_id: uuid.UUID,
+        status: ReservationStatus,
+        expected: Collection[ReservationStatus] | None = None,
+    ) -> Reservation:
+        """
+        Changes the status of a stored reservation and keeps the availability
+        index in sync with it. If `expected` is given, the change is only made
+        when the current status is one of those, checked under the caravan's lock.
+
+        Raises:
+            ValueError: If the reservation cannot be found.
+            InvalidStatusTransitionError: If the current status is not an expected one.
+            BookingConflictError: If a cancelled or rejected reservation would be
+                reactivated while another active reservation overlaps its dates.
+        """
+        reservation = self._reservations_by_id.get(reservation_id)
+        if reservation is None:
+            raise ValueError(f"Reservation with id {reservation_id} not found.")
+
+        with self.lock_for(reservation.caravan_id):
+            if expected is not None and reservation.status not in expected:
+                raise InvalidStatusTransitionError(
+                    f"Reservation cannot change from {reservation.status.value} to {status.value}."
+                )
+            self._set_status(reservation, status)
+        return reservation
+
+    def transition_ended(
+        self, from_status: ReservationStatus, to_status: ReservationStatus, ended_by: date
+    ) -> List[Reservation]:
+        """
+        Moves every reservation in `from_status` whose stay ended on or before
+        `ended_by` to `to_status` in a single pass, and returns them. Approved
+        reservations are taken from an end-date heap, so the work grows with
+        the stays that ended rather than with every reservation stored.
+        """
+        if from_status == ReservationStatus.APPROVED:
+            candidates = []
+            with self._approved_lock:
+                heap = self._approved_by_end
+                while heap and heap[0][0] <= ended_by:
+                    reservation = heapq.heappop(heap)[2]
+                    if reservation.status == from_status:
+                        candidates.append(reservation)
+        else:
+            candidates = [
+                r for r in list(self._reservations_by_id.values())
+                if r.status == from_status and r.end_date <= ended_by
+            ]
+        changed = []
+        with self.lock_many({r.caravan_id for r in candidates}):
+            for reservation in candidates:
+                # The status may have changed before the locks were taken.
+                if reservation.status == from_status:
+                    self._set_status(reservation, to_status)
+                    changed.append(reservation)
+        return changed
+
+    def _push_approved(self, reservation: Reservation) -> None:
+        with self._approved_lock:
+            heapq.heappush(self._approved_by_end, (reservation.end_date, next(self._approved_seq), reservation))
+
+    def _set_status(self, reservation: Reservation, status: ReservationStatus) -> None:
+        """Applies a status change and notifies listeners. Caller holds the caravan's lock."""
+        if not is_active(reservation) and status not in INACTIVE_STATUSES:
+            # The index relies on active spans being disjoint, and the dates
+            # may have been booked by someone else since this one was released.
+            conflict = self.find_conflict(reservation.caravan_id, reservation.start_date, reservation.end_date)
+            if conflict is not None:
+                raise BookingConflictError(
+                    f"Caravan is already booked between {conflict.start_date} and {conflict.end_date}."
+                )
+        previous = reservation.status
+        was_active = is_active(reservation)
+        reservation.status = status
+        now_active = is_active(reservation)
+
+        if was_active and not now_active:
+            self._active_by_caravan[reservation.caravan_id].remove(reservation)
+        elif now_active and not was_active:
+            self._active_by_caravan.setdefault(reservation.caravan_id, AvailabilityIndex()).insert(reservation)
+        if status == ReservationStatus.APPROVED and previous != ReservationStatus.APPROVED:
+            self._push_approved(reservation)
+
+        for listener in self._listeners:
+            listener.on_reservation_status_changed(reservation, previous)
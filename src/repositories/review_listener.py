@@ -0,0 +1,7 @@
+from typing import Protocol
+from src.models.review import Review
+
+
+class ReviewListener(Protocol):
+    """Observer notified by a review repository after each review is added."""
+    def on_review_added(self, review: Review) -> None: ...
@@ -0,0 +1,74 @@
+import threading
+import uuid
+from typing import Dict, List
+from src.models.review import Review
+from src.repositories.review_listener import ReviewListener
+
+class ReviewRepository:
+    """
+    Manages the storage and retrieval of review data.
+    This is an in-memory implementation, indexed by review, target and reservation.
+    Subscribed listeners are notified of every added review (Observer pattern).
+    """
+    def __init__(self):
+        self._reviews: Dict[uuid.UUID, Review] = {}
+        # Each target's reviews in the order they were added
+        self._reviews_by_target: Dict[uuid.UUID, List[Review]] = {}
+        # The position of each review in its target's list, for cursors
+        self._positions: Dict[uuid.UUID, int] = {}
+        self._reviews_by_reservation: Dict[uuid.UUID, List[Review]] = {}
+        self._lock = threading.Lock()
+        self._listeners: List[ReviewListener] = []
+
+    def subscribe(self, listener: ReviewListener) -> None:
+        """Registers a listener to be notified of every future review."""
+        self._listeners.append(listener)
+
+    def add(self, review: Review) -> None:
+        """Adds a new review to the repository."""
+        with self._lock:
+            if review.id in self._reviews:
+                raise ValueError(f"Review with id {review.id} already exists.")
+            self._reviews[review.id] = review
+            target_reviews = self._reviews_by_target.setdefault(review.target_id, [])
+            self._positions[review.id] = len(target_reviews)
+            target_reviews.append(review)
+            self._reviews_by_reservation.setdefault(review.reservation_id, []).append(review)
+
+            for listener in self._listeners:
+                listener.on_review_added(review)
+
+    def get_by_id(self, review_id: uuid.UUID) -> Review | None:
+        """Retrieves a review by its unique ID."""
+        return self._reviews.get(review_id)
+
+    def get_all(self) -> List[Review]:
+        """Retrieves all reviews."""
+        with self._lock:
+            return list(self._reviews.values())
+
+    def get_for_reservation(self, reservation_id: uuid.UUID) -> List[Review]:
+        """Retrieves the reviews written about a reservation."""
+        with self._lock:
+            return list(self._reviews_by_reservation.get(reservation_id, []))
+
+    def get_for_target(
+        self, target_id: uuid.UUID, after: uuid.UUID | None = None, limit: int | None = None
+    ) -> List[Review]:
+        """
+        Returns the reviews of a target, newest first. `after` is a cursor:
+        only reviews older than that review are returned.
+
+        Raises:
+            ValueError: If the `after` review does not belong to the target.
+        """
+        with self._lock:
+            reviews = self._reviews_by_target.get(target_id, [])
+            end = len(reviews)
+            if after is not None:
+                position = self._positions.get(after)
+                if position is None or self._reviews[after].target_id != target_id:
+                    raise ValueError(f"Review with id {after} not found.")
+                end = position
+            start = 0 if limit is None else max(0, end - limit)
+            return reviews[start:end][::-1]
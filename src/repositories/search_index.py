@@ -0,0 +1,164 @@
+import bisect
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Tuple
+from src.models.caravan import Caravan, CaravanStatus
+from src.models.review import Review
+from src.repositories.rating_index import RatingIndex
+
+# Entries are ordered by descending score, then by arrival in the index.
+_Entry = Tuple[float, int]
+
+
+@dataclass(frozen=True)
+class SearchWeights:
+    """
+    How much each score term counts toward a caravan's search score.
+    Every term lies in [0, 1], so a score lies in [0, sum of the weights].
+    """
+    price: float = 0.3
+    capacity: float = 0.2
+    rating: float = 0.3
+    availability: float = 0.2
+
+
+class CaravanSearchIndex:
+    """
+    Keeps caravans ordered by the query-independent parts of their search score.
+
+    The price and rating terms do not depend on the query, so their weighted
+    sum (the base score) is computed once per caravan. Caravans are grouped by
+    capacity and price band, within each location and across the whole fleet,
+    and every group is kept sorted by base score. All caravans of a group share
+    a capacity fit, and a price range only needs the bands it overlaps, so a
+    search can merge the groups it needs best-first and stop as soon as no
+    remaining caravan could make its results. Hold `lock` while walking the
+    lists from `streams`.
+
+    The price term is `reference_rate / (reference_rate + daily_rate)`, so it
+    does not shift when caravans are added, and the bands are `price_bands`
+    equal slices of it. The rating term is the average rating over 5, with
+    `unrated_rating` standing in until a caravan is reviewed.
+
+    The index is a CaravanListener and a ReviewListener: `load` the existing
+    caravans, subscribe it to the caravan repository, and subscribe it to the
+    review repository after the RatingIndex it reads ratings from.
+    """
+    def __init__(
+        self,
+        ratings: RatingIndex | None = None,
+        weights: SearchWeights = SearchWeights(),
+        reference_rate: float = 150.0,
+        unrated_rating: float = 3.0,
+        price_bands: int = 32,
+    ):
+        self._ratings = ratings
+        self._weights = weights
+        self._reference_rate = reference_rate
+        self._unrated_rating = unrated_rating
+        self._price_bands = price_bands
+        self._caravans: List[Caravan] = []
+        self._seq_by_id: Dict[uuid.UUID, int] = {}
+        self._rating_terms: List[float] = []
+        # Location (None for the whole fleet) -> (capacity, price band) -> entries
+        self._groups: Dict[str | None, Dict[Tuple[int, int], List[_Entry]]] = {}
+        self.lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._caravans)
+
+    @property
+    def weights(self) -> SearchWeights:
+        return self._weights
+
+    def load(self, caravans: Iterable[Caravan]) -> None:
+        """Indexes existing caravans, e.g. when attaching to a populated repository."""
+        for caravan in caravans:
+            self.on_caravan_added(caravan)
+
+    def on_caravan_added(self, caravan: Caravan) -> None:
+        with self.lock:
+            seq = len(self._caravans)
+            self._caravans.append(caravan)
+            self._seq_by_id[caravan.id] = seq
+            rating_term = self._rating_term(caravan.id)
+            self._rating_terms.append(rating_term)
+            entry = (-self.price_term(caravan.daily_rate) - rating_term, seq)
+            for location in (None, caravan.location):
+                groups = self._groups.setdefault(location, {})
+                bisect.insort(groups.setdefault(self._group_of(caravan), []), entry)
+
+    def on_caravan_status_changed(self, caravan: Caravan, previous: CaravanStatus) -> None:
+        # Status is checked when a search visits the caravan; only keep the latest copy.
+        with self.lock:
+            seq = self._seq_by_id.get(caravan.id)
+            if seq is not None:
+                self._caravans[seq] = caravan
+
+    def on_review_added(self, review: Review) -> None:
+        with self.lock:
+            seq = self._seq_by_id.get(review.target_id)
+            if seq is None:
+                return  # A review of a host; hosts are not ranked.
+            caravan = self._caravans[seq]
+            old, new = self._rating_terms[seq], self._rating_term(caravan.id)
+            if new == old:
+                return
+            self._rating_terms[seq] = new
+            price = self.price_term(caravan.daily_rate)
+            for location in (None, caravan.location):
+                entries = self._groups[location][self._group_of(caravan)]
+                del entries[bisect.bisect_left(entries, (-price - old, seq))]
+                bisect.insort(entries, (-price - new, seq))
+
+    def price_term(self, daily_rate: float) -> float:
+        """Returns the weighted price term for a daily rate."""
+        return self._weights.price * self._reference_rate / (self._reference_rate + daily_rate)
+
+    def base_score(self, seq: int) -> float:
+        """Returns the weighted price and rating terms of the caravan indexed as `seq`."""
+        return self.price_term(self._caravans[seq].daily_rate) + self._rating_terms[seq]
+
+    def caravan_at(self, seq: int) -> Caravan:
+        return self._caravans[seq]
+
+    def seq_of(self, caravan_id: uuid.UUID) -> int | None:
+        """Returns the sequence number the caravan is indexed as, or None if it is not indexed."""
+        return self._seq_by_id.get(caravan_id)
+
+    def streams(
+        self,
+        location: str | None = None,
+        min_daily_rate: float | None = None,
+        max_daily_rate: float | None = None,
+    ) -> List[Tuple[int, List[_Entry]]]:
+        """
+        Returns (capacity, entries) for every group in `location` (or the whole
+        fleet) whose price band overlaps the rate range. Entries are keyed by
+        -base score and may still lie outside the range at the band edges.
+        The lists are live: hold `lock` while walking them.
+        """
+        # A higher rate means a lower price term, so the bounds swap.
+        lowest = 0 if max_daily_rate is None else self._band(max_daily_rate)
+        highest = self._price_bands if min_daily_rate is None else self._band(min_daily_rate)
+        return [
+            (capacity, entries)
+            for (capacity, band), entries in self._groups.get(location, {}).items()
+            if lowest <= band <= highest
+        ]
+
+    def _group_of(self, caravan: Caravan) -> Tuple[int, int]:
+        return caravan.capacity, self._band(caravan.daily_rate)
+
+    def _band(self, daily_rate: float) -> int:
+        return int(self._price_bands * self._reference_rate / (self._reference_rate + max(0.0, daily_rate)))
+
+    def _rating_term(self, caravan_id: uuid.UUID) -> float:
+        rating = self._unrated_rating
+        if self._ratings is not None:
+            summary = self._ratings.summary(caravan_id)
+            if summary.count:
+                rating = summary.total / summary.count
+        return self._weights.rating * rating / 5
+
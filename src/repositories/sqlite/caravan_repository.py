@@ -0,0 +1,163 @@
+import json
+import sqlite3
+import uuid
+from typing import Iterator, List
+from src.models.caravan import Caravan, CaravanStatus
+from src.models.geo import GeoArea, GeoCircle
+from src.repositories.caravan_listener import CaravanListener
+from src.repositories.sqlite.connection_pool import SQLiteConnectionPool
+
+_COLUMNS = "id, host_id, name, location, capacity, daily_rate, amenities, photos, status, latitude, longitude"
+
+
+def _to_caravan(row: tuple) -> Caravan:
+    return Caravan(
+        id=uuid.UUID(row[0]),
+        host_id=uuid.UUID(row[1]),
+        name=row[2],
+        location=row[3],
+        capacity=row[4],
+        daily_rate=row[5],
+        amenities=json.loads(row[6]),
+        photos=json.loads(row[7]),
+        status=CaravanStatus(row[8]),
+        latitude=row[9],
+        longitude=row[10],
+    )
+
+
+class SQLiteCaravanRepository:
+    """
+    Stores Caravan objects in a SQLite database; a drop-in for CaravanRepository.
+
+    Filters in `query` are pushed down to SQL and served by the column indexes.
+    The version counter lives in the database so every process sharing the
+    file observes the same value.
+    """
+    def __init__(self, pool: SQLiteConnectionPool):
+        self._pool = pool
+        self._listeners: List[CaravanListener] = []
+
+    def subscribe(self, listener: CaravanListener) -> None:
+        """Registers a listener to be notified of every future mutation in this process."""
+        self._listeners.append(listener)
+
+    def add(self, caravan: Caravan) -> None:
+        """Adds a caravan to the repository."""
+        try:
+            with self._pool.transaction() as conn:
+                conn.execute(
+                    f"INSERT INTO caravans ({_COLUMNS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        str(caravan.id), str(caravan.host_id), caravan.name, caravan.location,
+                        caravan.capacity, caravan.daily_rate, json.dumps(caravan.amenities),
+                        json.dumps(caravan.photos), caravan.status.value,
+                        caravan.latitude, caravan.longitude,
+                    ),
+                )
+                conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'caravans_version'")
+        except sqlite3.IntegrityError:
+            raise ValueError(f"Caravan with ID {caravan.id} already exists.")
+        for listener in self._listeners:
+            listener.on_caravan_added(caravan)
+
+    @property
+    def version(self) -> int:
+        """A counter that changes whenever a caravan is added or updated."""
+        with self._pool.connection() as conn:
+            return conn.execute("SELECT value FROM meta WHERE key = 'caravans_version'").fetchone()[0]
+
+    def get_by_id(self, caravan_id: uuid.UUID) -> Caravan | None:
+        """Retrieves a caravan by its unique ID."""
+        with self._pool.connection() as conn:
+            row = conn.execute(f"SELECT {_COLUMNS} FROM caravans WHERE id = ?", (str(caravan_id),)).fetchone()
+        return _to_caravan(row) if row else None
+
+    def get_all(self) -> List[Caravan]:
+        """Returns a list of all caravans."""
+        with self._pool.connection() as conn:
+            rows = conn.execute(f"SELECT {_COLUMNS} FROM caravans ORDER BY seq").fetchall()
+        return [_to_caravan(row) for row in rows]
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Caravan]:
+        """Yields every caravan in insertion order, reading `batch_size` rows at a time."""
+        for row in self._pool.scan("caravans", _COLUMNS, batch_size):
+            yield _to_caravan(row)
+
+    def update_status(self, caravan_id: uuid.UUID, status: CaravanStatus) -> Caravan:
+        """
+        Changes the status of a stored caravan.
+
+        Raises:
+            ValueError: If the caravan cannot be found.
+        """
+        with self._pool.transaction() as conn:
+            previous = conn.execute("SELECT status FROM caravans WHERE id = ?", (str(caravan_id),)).fetchone()
+            if previous is None:
+                raise ValueError(f"Caravan with ID {caravan_id} not found.")
+            conn.execute("UPDATE caravans SET status = ? WHERE id = ?", (status.value, str(caravan_id)))
+            conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'caravans_version'")
+            row = conn.execute(f"SELECT {_COLUMNS} FROM caravans WHERE id = ?", (str(caravan_id),)).fetchone()
+        caravan = _to_caravan(row)
+        for listener in self._listeners:
+            listener.on_caravan_status_changed(caravan, CaravanStatus(previous[0]))
+        return caravan
+
+    def query(
+        self,
+        location: str | None = None,
+        status: CaravanStatus | None = None,
+        min_capacity: int | None = None,
+        max_capacity: int | None = None,
+        min_daily_rate: float | None = None,
+        max_daily_rate: float | None = None,
+        area: GeoArea | None = None,
+        after: uuid.UUID | None = None,
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> List[Caravan]:
+        """
+        Returns the caravans matching every given filter, in insertion order.
+        Range bounds are inclusive; `after` is a pagination cursor. `area` is
+        narrowed by its bounding box on the position index, then checked exactly.
+
+        Raises:
+            ValueError: If the `after` caravan cannot be found.
+        """
+        clauses, params = [], []
+        for column, op, value in (
+            ("location", "=", location),
+            ("status", "=", status.value if status is not None else None),
+            ("capacity", ">=", min_capacity),
+            ("capacity", "<=", max_capacity),
+            ("daily_rate", ">=", min_daily_rate),
+            ("daily_rate", "<=", max_daily_rate),
+        ):
+            if value is not None:
+                clauses.append(f"{column} {op} ?")
+                params.append(value)
+        if area is not None:
+            box = area.bounding_box()
+            clauses.append("latitude BETWEEN ? AND ?")
+            params += [box.south, box.north]
+            clauses.append("longitude BETWEEN ? AND ?" if box.west <= box.east else "(longitude >= ? OR longitude <= ?)")
+            params += [box.west, box.east]
+            if isinstance(area, GeoCircle):
+                clauses.append("distance_km(?, ?, latitude, longitude) <= ?")
+                params += [area.latitude, area.longitude, area.radius_km]
+
+        with self._pool.connection() as conn:
+            if after is not None:
+                row = conn.execute("SELECT seq FROM caravans WHERE id = ?", (str(after),)).fetchone()
+                if row is None:
+                    raise ValueError(f"Caravan with ID {after} not found.")
+                clauses.append("seq > ?")
+                params.append(row[0])
+
+            sql = f"SELECT {_COLUMNS} FROM caravans"
+            if clauses:
+                sql += " WHERE " + " AND ".join(clauses)
+            sql += " ORDER BY seq LIMIT ? OFFSET ?"
+            params += [-1 if limit is None else limit, offset]
+            rows = conn.execute(sql, params).fetchall()
+        return [_to_caravan(row) for row in rows]
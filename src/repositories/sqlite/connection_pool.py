@@ -0,0 +1,175 @@
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterator, List
+from src.models.geo import haversine_km
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    name TEXT NOT NULL,
+    contact TEXT NOT NULL,
+    role TEXT NOT NULL,
+    identity_verified INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS caravans (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    host_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    location TEXT NOT NULL,
+    capacity INTEGER NOT NULL,
+    daily_rate REAL NOT NULL,
+    amenities TEXT NOT NULL,
+    photos TEXT NOT NULL,
+    status TEXT NOT NULL,
+    latitude REAL,
+    longitude REAL
+);
+CREATE INDEX IF NOT EXISTS idx_caravans_location ON caravans (location);
+CREATE INDEX IF NOT EXISTS idx_caravans_status ON caravans (status);
+CREATE INDEX IF NOT EXISTS idx_caravans_capacity ON caravans (capacity);
+CREATE INDEX IF NOT EXISTS idx_caravans_daily_rate ON caravans (daily_rate);
+
+CREATE TABLE IF NOT EXISTS reservations (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    guest_id TEXT NOT NULL,
+    caravan_id TEXT NOT NULL,
+    start_date TEXT NOT NULL,
+    end_date TEXT NOT NULL,
+    total_price REAL NOT NULL,
+    status TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_reservations_caravan
+    ON reservations (caravan_id, start_date, end_date);
+-- Cancelled and rejected reservations never block dates, so they are left
+-- out of the index the overlap check runs on.
+CREATE INDEX IF NOT EXISTS idx_reservations_active
+    ON reservations (caravan_id, start_date, end_date)
+    WHERE status NOT IN ('cancelled', 'rejected');
+-- Lets the lifecycle sweep find reservations that ended in a given status.
+CREATE INDEX IF NOT EXISTS idx_reservations_status_end ON reservations (status, end_date);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('caravans_version', 0);
+"""
+
+# Columns added after the first release; older database files gain them on open.
+MIGRATIONS = [
+    ("caravans", "latitude", "REAL"),
+    ("caravans", "longitude", "REAL"),
+]
+
+# Indexes on migrated columns can only be created once the columns exist.
+POST_MIGRATION_SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_caravans_position ON caravans (latitude, longitude);
+"""
+
+
+class SQLiteConnectionPool:
+    """
+    A fixed-size pool of connections to one SQLite database file.
+
+    Connections run in autocommit mode with WAL journaling, so readers never
+    block the single writer; `transaction()` opens an explicit write
+    transaction. SQLite caches compiled statements per connection, so reusing
+    pooled connections with constant SQL text gives prepared-statement reuse.
+    """
+    def __init__(self, path: str, size: int = 8, timeout: float = 30.0):
+        if path == ":memory:" or path.startswith("file::memory:"):
+            raise ValueError("SQLiteConnectionPool needs a database file; in-memory databases are per-connection.")
+        self._path = path
+        self._timeout = timeout
+        self._pool: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._connections: List[sqlite3.Connection] = []
+        self._closed = False
+        self._lock = threading.Lock()
+
+        for _ in range(size):
+            conn = self._connect()
+            self._connections.append(conn)
+            self._pool.put(conn)
+
+        with self.connection() as conn:
+            conn.executescript(SCHEMA)
+            for table, column, column_type in MIGRATIONS:
+                existing = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+                if column not in existing:
+                    conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+            conn.executescript(POST_MIGRATION_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self._path,
+            timeout=self._timeout,
+            isolation_level=None,
+            check_same_thread=False,
+            cached_statements=256,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        # Used by radius queries; SQLite has no trigonometry built in everywhere.
+        conn.create_function("distance_km", 4, haversine_km, deterministic=True)
+        return conn
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrows a connection from the pool for the duration of the block."""
+        if self._closed:
+            raise RuntimeError("Connection pool is closed.")
+        conn = self._pool.get(timeout=self._timeout)
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrows a connection and runs the block in a write transaction,
+        committing on success and rolling back on error.
+        """
+        with self.connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+    def scan(self, table: str, columns: str, batch_size: int = 1000) -> Iterator[tuple]:
+        """
+        Yields the rows of a table in insertion order. Each page of
+        `batch_size` rows is a separate keyset query on `seq`, so large
+        tables are never read into memory at once and no connection is held
+        while the caller processes a page.
+        """
+        last = 0
+        while True:
+            with self.connection() as conn:
+                rows = conn.execute(
+                    f"SELECT seq, {columns} FROM {table} WHERE seq > ? ORDER BY seq LIMIT ?", (last, batch_size)
+                ).fetchall()
+            if not rows:
+                return
+            last = rows[-1][0]
+            for row in rows:
+                yield row[1:]
+
+    def close(self) -> None:
+        """Closes every pooled connection."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            for conn in self._connections:
+                conn.close()
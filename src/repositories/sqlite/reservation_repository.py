@@ -0,0 +1,241 @@
+import sqlite3
+import threading
+import uuid
+from contextlib import AbstractContextManager
+from datetime import date
+from typing import Collection, Iterable, Iterator, List
+from src.models.caravan import Caravan
+from src.models.interning import intern_date
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.availability_index import INACTIVE_STATUSES
+from src.repositories.reservation_listener import ReservationListener
+from src.repositories.sqlite.connection_pool import SQLiteConnectionPool
+from src.repositories.striped_lock import StripedLock
+from src.exceptions.reservation import BookingConflictError, InvalidStatusTransitionError
+
+_COLUMNS = "id, guest_id, caravan_id, start_date, end_date, total_price, status"
+_INACTIVE = ", ".join(f"'{s.value}'" for s in sorted(INACTIVE_STATUSES, key=lambda s: s.value))
+
+# Active reservations of a caravan never overlap, so only the latest one
+# starting before the requested end can conflict. Walking the partial index
+# idx_reservations_active backwards finds it in O(log n), like the in-memory
+# AvailabilityIndex. Overlap: (StartA < EndB) and (EndA > StartB).
+_LATEST_ACTIVE_BEFORE_SQL = (
+    "SELECT {columns} FROM reservations"
+    f" WHERE caravan_id = ? AND start_date < ? AND status NOT IN ({_INACTIVE})"
+    " ORDER BY start_date DESC LIMIT 1"
+)
+_OVERLAP_SQL = (
+    f"SELECT {_COLUMNS} FROM ({_LATEST_ACTIVE_BEFORE_SQL.format(columns=_COLUMNS)}) WHERE end_date > ?"
+)
+_GUARDED_INSERT_SQL = (
+    f"INSERT INTO reservations ({_COLUMNS})"
+    " SELECT ?, ?, ?, ?, ?, ?, ?"
+    f" WHERE ? IN ({_INACTIVE}) OR NOT EXISTS ("
+    f"  SELECT 1 FROM ({_LATEST_ACTIVE_BEFORE_SQL.format(columns='end_date')}) WHERE end_date > ?)"
+)
+# SQLite limits the number of bound parameters per statement.
+_IN_CHUNK = 500
+
+
+def _to_reservation(row: tuple) -> Reservation:
+    return Reservation(
+        id=uuid.UUID(row[0]),
+        guest_id=uuid.UUID(row[1]),
+        caravan_id=uuid.UUID(row[2]),
+        start_date=intern_date(date.fromisoformat(row[3])),
+        end_date=intern_date(date.fromisoformat(row[4])),
+        total_price=row[5],
+        status=ReservationStatus(row[6]),
+    )
+
+
+class SQLiteReservationRepository:
+    """
+    Stores reservations in a SQLite database; a drop-in for ReservationRepository.
+
+    Dates are stored as ISO strings so they compare correctly in SQL. The
+    overlap check runs as one query on a partial index that only covers
+    active reservations, and `add` repeats it inside the INSERT so that
+    processes sharing the database file cannot double-book either.
+    """
+    def __init__(self, pool: SQLiteConnectionPool, lock_stripes: int = 64):
+        self._pool = pool
+        self._locks = StripedLock(lock_stripes)
+        self._listeners: List[ReservationListener] = []
+
+    def subscribe(self, listener: ReservationListener) -> None:
+        """Registers a listener to be notified of every future mutation in this process."""
+        self._listeners.append(listener)
+
+    def lock_for(self, caravan_id: uuid.UUID) -> threading.RLock:
+        """
+        Returns the lock serializing bookings of the given caravan in this process.
+        Hold it around a conflict check and the following `add`.
+        """
+        return self._locks.lock_for(caravan_id)
+
+    def lock_many(self, caravan_ids: Iterable[uuid.UUID]) -> AbstractContextManager:
+        """Returns a context manager holding the booking locks of several caravans at once."""
+        return self._locks.lock_many(caravan_ids)
+
+    def add(self, reservation: Reservation) -> None:
+        """
+        Adds a new reservation to the repository.
+
+        Raises:
+            ValueError: If a reservation with the same ID exists.
+            BookingConflictError: If an active reservation overlaps its dates.
+        """
+        self.add_many([reservation])
+
+    def add_many(self, reservations: Iterable[Reservation]) -> None:
+        """
+        Adds several new reservations in a single transaction; if any of them
+        fails, none are stored.
+
+        Raises:
+            ValueError: If a reservation with the same ID exists.
+            BookingConflictError: If an active reservation overlaps its dates.
+        """
+        reservations = list(reservations)
+        with self._pool.transaction() as conn:
+            for reservation in reservations:
+                caravan_id = str(reservation.caravan_id)
+                start, end = reservation.start_date.isoformat(), reservation.end_date.isoformat()
+                try:
+                    inserted = conn.execute(_GUARDED_INSERT_SQL, (
+                        str(reservation.id), str(reservation.guest_id), caravan_id, start, end,
+                        reservation.total_price, reservation.status.value,
+                        reservation.status.value, caravan_id, end, start,
+                    )).rowcount
+                except sqlite3.IntegrityError:
+                    raise ValueError(f"Reservation with id {reservation.id} already exists.")
+                if not inserted:
+                    raise BookingConflictError(
+                        f"Caravan is already booked between {reservation.start_date} and {reservation.end_date}."
+                    )
+        for reservation in reservations:
+            for listener in self._listeners:
+                listener.on_reservation_added(reservation)
+
+    def get_by_id(self, reservation_id: uuid.UUID) -> Reservation | None:
+        """Retrieves a reservation by its unique ID."""
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM reservations WHERE id = ?", (str(reservation_id),)
+            ).fetchone()
+        return _to_reservation(row) if row else None
+
+    def get_all(self) -> List[Reservation]:
+        """Returns a list of all reservations."""
+        with self._pool.connection() as conn:
+            rows = conn.execute(f"SELECT {_COLUMNS} FROM reservations ORDER BY seq").fetchall()
+        return [_to_reservation(row) for row in rows]
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[Reservation]:
+        """Yields every reservation in insertion order, reading `batch_size` rows at a time."""
+        for row in self._pool.scan("reservations", _COLUMNS, batch_size):
+            yield _to_reservation(row)
+
+    def get_for_caravan(self, caravan_id: uuid.UUID) -> List[Reservation]:
+        """Retrieves all reservations for a specific caravan."""
+        with self._pool.connection() as conn:
+            rows = conn.execute(
+                f"SELECT {_COLUMNS} FROM reservations WHERE caravan_id = ? ORDER BY seq", (str(caravan_id),)
+            ).fetchall()
+        return [_to_reservation(row) for row in rows]
+
+    def find_conflict(self, caravan_id: uuid.UUID, start_date: date, end_date: date) -> Reservation | None:
+        """
+        Returns an active reservation of the caravan that overlaps
+        [start_date, end_date), or None if the dates are free.
+        """
+        with self._pool.connection() as conn:
+            row = conn.execute(
+                _OVERLAP_SQL, (str(caravan_id), end_date.isoformat(), start_date.isoformat())
+            ).fetchone()
+        return _to_reservation(row) if row else None
+
+    def filter_available(self, caravans: Iterable[Caravan], start_date: date, end_date: date) -> List[Caravan]:
+        """
+        Returns the caravans that have no active reservation overlapping
+        [start_date, end_date), querying the candidates in large chunks.
+        """
+        caravans = list(caravans)
+        booked = set()
+        with self._pool.connection() as conn:
+            for i in range(0, len(caravans), _IN_CHUNK):
+                chunk = [str(c.id) for c in caravans[i:i + _IN_CHUNK]]
+                placeholders = ", ".join("?" * len(chunk))
+                rows = conn.execute(
+                    "SELECT DISTINCT caravan_id FROM reservations"
+                    f" WHERE caravan_id IN ({placeholders}) AND start_date < ? AND end_date > ?"
+                    f" AND status NOT IN ({_INACTIVE})",
+                    (*chunk, end_date.isoformat(), start_date.isoformat()),
+                ).fetchall()
+                booked.update(row[0] for row in rows)
+        return [c for c in caravans if str(c.id) not in booked]
+
+    def update_status(
+        self,
+        reservation_id: uuid.UUID,
+        status: ReservationStatus,
+        expected: Collection[ReservationStatus] | None = None,
+    ) -> Reservation:
+        """
+        Changes the status of a stored reservation. If `expected` is given,
+        the change is only made when the current status is one of those,
+        checked in the same write transaction.
+
+        Raises:
+            ValueError: If the reservation cannot be found.
+            InvalidStatusTransitionError: If the current status is not an expected one.
+            BookingConflictError: If a cancelled or rejected reservation would be
+                reactivated while another active reservation overlaps its dates.
+        """
+        with self._pool.transaction() as conn:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM reservations WHERE id = ?", (str(reservation_id),)
+            ).fetchone()
+            if row is None:
+                raise ValueError(f"Reservation with id {reservation_id} not found.")
+            reservation = _to_reservation(row)
+            if expected is not None and reservation.status not in expected:
+                raise InvalidStatusTransitionError(
+                    f"Reservation cannot change from {reservation.status.value} to {status.value}."
+                )
+            if reservation.status in INACTIVE_STATUSES and status not in INACTIVE_STATUSES:
+                # Overlap lookups rely on active spans being disjoint.
+                conflict = conn.execute(_OVERLAP_SQL, (
+                    str(reservation.caravan_id), reservation.end_date.isoformat(), reservation.start_date.isoformat(),
+                )).fetchone()
+                if conflict is not None:
+                    conflict = _to_reservation(conflict)
+                    raise BookingConflictError(
+                        f"Caravan is already booked between {conflict.start_date} and {conflict.end_date}."
+                    )
+            conn.execute("UPDATE reservations SET status = ? WHERE id = ?", (status.value, str(reservation_id)))
+        previous = reservation.status
+        reservation.status = status
+        for listener in self._listeners:
+            listener.on_reservation_status_changed(reservation, previous)
+        return reservation
+
+    def transition_ended(
+        self, from_status: ReservationStatus, to_status: ReservationStatus, ended_by: date
+    ) -> List[Reservation]:
+        """
+        Moves every reservation in `from_status` whose stay ended on or before
+        `ended_by` to `to_status` with a single UPDATE, and returns them.
+        """
+        with self._pool.transaction() as conn:
+            rows = conn.execute(
+                f"UPDATE reservations SET status = ? WHERE status = ? AND end_date <= ? RETURNING {_COLUMNS}",
+                (to_status.value, from_status.value, ended_by.isoformat()),
+            ).fetchall()
+        changed = [_to_reservation(row) for row in rows]
+        for reservation in changed:
+            for listener in self._listeners:
+                listener.on_reservation_status_changed(reservation, from_status)
+        return changed
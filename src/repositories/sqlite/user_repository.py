@@ -0,0 +1,51 @@
+import sqlite3
+import uuid
+from typing import Iterator, List
+from src.models.user import User, UserRole
+from src.repositories.sqlite.connection_pool import SQLiteConnectionPool
+
+_COLUMNS = "id, name, contact, role, identity_verified"
+
+
+def _to_user(row: tuple) -> User:
+    return User(
+        id=uuid.UUID(row[0]),
+        name=row[1],
+        contact=row[2],
+        role=UserRole(row[3]),
+        identity_verified=bool(row[4]),
+    )
+
+
+class SQLiteUserRepository:
+    """Stores User objects in a SQLite database; a drop-in for UserRepository."""
+    def __init__(self, pool: SQLiteConnectionPool):
+        self._pool = pool
+
+    def add(self, user: User) -> None:
+        """Adds a user to the repository."""
+        try:
+            with self._pool.transaction() as conn:
+                conn.execute(
+                    f"INSERT INTO users ({_COLUMNS}) VALUES (?, ?, ?, ?, ?)",
+                    (str(user.id), user.name, user.contact, user.role.value, int(user.identity_verified)),
+                )
+        except sqlite3.IntegrityError:
+            raise ValueError(f"User with ID {user.id} already exists.")
+
+    def get_by_id(self, user_id: uuid.UUID) -> User | None:
+        """Retrieves a user by their unique ID."""
+        with self._pool.connection() as conn:
+            row = conn.execute(f"SELECT {_COLUMNS} FROM users WHERE id = ?", (str(user_id),)).fetchone()
+        return _to_user(row) if row else None
+
+    def get_all(self) -> List[User]:
+        """Returns a list of all users."""
+        with self._pool.connection() as conn:
+            rows = conn.execute(f"SELECT {_COLUMNS} FROM users ORDER BY seq").fetchall()
+        return [_to_user(row) for row in rows]
+
+    def iter_all(self, batch_size: int = 1000) -> Iterator[User]:
+        """Yields every user in insertion order, reading `batch_size` rows at a time."""
+        for row in self._pool.scan("users", _COLUMNS, batch_size):
+            yield _to_user(row)
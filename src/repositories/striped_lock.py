@@ -0,0 +1,41 @@
+import threading
+from contextlib import contextmanager
+from typing import Hashable, Iterable, Iterator, List
+
+
+class StripedLock:
+    """
+    A fixed table of re-entrant locks selected by hashing a key.
+
+    Operations on the same key always share a lock, while operations on
+    different keys usually land on different stripes and can run in parallel.
+    A table of one stripe behaves like a single global lock.
+    """
+    def __init__(self, stripes: int = 64):
+        if stripes < 1:
+            raise ValueError("A striped lock needs at least one stripe.")
+        self._locks: List[threading.RLock] = [threading.RLock() for _ in range(stripes)]
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+    def lock_for(self, key: Hashable) -> threading.RLock:
+        """Returns the lock guarding the given key."""
+        return self._locks[hash(key) % len(self._locks)]
+
+    @contextmanager
+    def lock_many(self, keys: Iterable[Hashable]) -> Iterator[None]:
+        """
+        Holds the locks of all given keys for the duration of the block.
+        Stripes are acquired in table order, so concurrent callers cannot deadlock.
+        """
+        stripes = sorted({hash(key) % len(self._locks) for key in keys})
+        acquired = []
+        try:
+            for stripe in stripes:
+                self._locks[stripe].acquire()
+                acquired.append(self._locks[stripe])
+            yield
+        finally:
+            for lock in reversed(acquired):
+                lock.release()
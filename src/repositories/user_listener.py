@@ -0,0 +1,7 @@
+from typing import Protocol
+from src.models.user import User
+
+
+class UserListener(Protocol):
+    """Observer notified by a user repository after each mutation."""
+    def on_user_added(self, user: User) -> None: ...
@@ -1,17 +1,25 @@
 import uuid
-from typing import Dict, List
+from typing import Dict, Iterator, List
 from src.models.user import User
+from src.repositories.user_listener import UserListener
 
 class UserRepository:
     """Manages storage for User objects in memory."""
     def __init__(self):
         self._users: Dict[uuid.UUID, User] = {}
+        self._listeners: List[UserListener] = []
+
+    def subscribe(self, listener: UserListener) -> None:
+        """Registers a listener to be notified of every future mutation."""
+        self._listeners.append(listener)
 
     def add(self, user: User) -> None:
         """Adds a user to the repository."""
         if user.id in self._users:
             raise ValueError(f"User with ID {user.id} already exists.")
         self._users[user.id] = user
+        for listener in self._listeners:
+            listener.on_user_added(user)
 
     def get_by_id(self, user_id: uuid.UUID) -> User | None:
         """Retrieves a user by their unique ID."""
@@ -20,3 +28,7 @@ class UserRepository:
     def get_all(self) -> List[User]:
         """Returns a list of all users."""
         return list(self._users.values())
+
+    def iter_all(self) -> Iterator[User]:
+        """Yields every user; a snapshot, so users added meanwhile are not seen."""
+        return iter(self.get_all())
@@ -0,0 +1,160 @@
+import bisect
+import threading
+import uuid
+from datetime import date
+from typing import Dict, Iterable, List, Tuple
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.caravan_repository import CaravanRepository
+
+# Entries are ordered by start date, then by arrival in the index.
+_Key = Tuple[int, int]
+
+
+class _SortedReservations:
+    """The reservation IDs of one user, ordered by key."""
+    def __init__(self):
+        self._keys: List[_Key] = []
+        self._ids: List[uuid.UUID] = []
+
+    def insert(self, key: _Key, reservation_id: uuid.UUID) -> None:
+        i = bisect.bisect_right(self._keys, key)
+        self._keys.insert(i, key)
+        self._ids.insert(i, reservation_id)
+
+    def extend(self, entries: List[Tuple[_Key, uuid.UUID]]) -> None:
+        """Adds many entries at once with a single sort (keys are unique)."""
+        merged = sorted(list(zip(self._keys, self._ids)) + entries)
+        self._keys = [key for key, _ in merged]
+        self._ids = [reservation_id for _, reservation_id in merged]
+
+    def select(self, low: _Key | None, high: _Key | None, limit: int | None) -> List[uuid.UUID]:
+        """Returns the IDs with low < key < high, at most `limit` of them."""
+        lo = 0 if low is None else bisect.bisect_right(self._keys, low)
+        hi = len(self._keys) if high is None else bisect.bisect_left(self._keys, high)
+        if limit is not None:
+            hi = min(hi, lo + limit)
+        return self._ids[lo:hi]
+
+
+class UserReservationIndex:
+    """
+    Indexes reservations by guest and by host, each ordered by start date.
+
+    A host's reservations across all of their caravans live in one sorted
+    list, so listing them is a binary search plus a slice no matter how many
+    caravans the host owns. The host of a reservation is looked up once, when
+    it is indexed (a caravan never changes hands).
+
+    The index is a ReservationListener: `load` the existing reservations and
+    subscribe it to a reservation repository to keep it up to date.
+    """
+    def __init__(self, caravan_repo: CaravanRepository):
+        self._caravan_repo = caravan_repo
+        self._reservations: Dict[uuid.UUID, Reservation] = {}
+        self._keys: Dict[uuid.UUID, _Key] = {}
+        self._by_guest: Dict[uuid.UUID, _SortedReservations] = {}
+        self._by_host: Dict[uuid.UUID, _SortedReservations] = {}
+        self._lock = threading.Lock()
+
+    def load(self, reservations: Iterable[Reservation]) -> None:
+        """
+        Indexes existing reservations, e.g. when attaching to a populated
+        repository. Each caravan's host is looked up once and each user's
+        list is sorted once, rather than inserting reservations one by one.
+        """
+        hosts: Dict[uuid.UUID, uuid.UUID | None] = {}
+        by_guest: Dict[uuid.UUID, List[Tuple[_Key, uuid.UUID]]] = {}
+        by_host: Dict[uuid.UUID, List[Tuple[_Key, uuid.UUID]]] = {}
+        with self._lock:
+            for reservation in reservations:
+                if reservation.id in self._keys:
+                    continue
+                if reservation.caravan_id not in hosts:
+                    caravan = self._caravan_repo.get_by_id(reservation.caravan_id)
+                    hosts[reservation.caravan_id] = caravan.host_id if caravan is not None else None
+                key = (reservation.start_date.toordinal(), len(self._keys))
+                self._keys[reservation.id] = key
+                self._reservations[reservation.id] = reservation
+                by_guest.setdefault(reservation.guest_id, []).append((key, reservation.id))
+                host_id = hosts[reservation.caravan_id]
+                if host_id is not None:
+                    by_host.setdefault(host_id, []).append((key, reservation.id))
+            for index, entries in ((self._by_guest, by_guest), (self._by_host, by_host)):
+                for user_id, added in entries.items():
+                    index.setdefault(user_id, _SortedReservations()).extend(added)
+
+    def on_reservation_added(self, reservation: Reservation) -> None:
+        caravan = self._caravan_repo.get_by_id(reservation.caravan_id)
+        with self._lock:
+            if reservation.id in self._keys:
+                return
+            key = (reservation.start_date.toordinal(), len(self._keys))
+            self._keys[reservation.id] = key
+            self._reservations[reservation.id] = reservation
+            self._by_guest.setdefault(reservation.guest_id, _SortedReservations()).insert(key, reservation.id)
+            if caravan is not None:
+                self._by_host.setdefault(caravan.host_id, _SortedReservations()).insert(key, reservation.id)
+
+    def on_reservation_status_changed(self, reservation: Reservation, previous: ReservationStatus) -> None:
+        with self._lock:
+            if reservation.id in self._reservations:
+                # Repositories that load rows into new objects report a fresh copy.
+                self._reservations[reservation.id] = reservation
+
+    def for_guest(
+        self,
+        guest_id: uuid.UUID,
+        start_from: date | None = None,
+        start_before: date | None = None,
+        after: uuid.UUID | None = None,
+        limit: int | None = None,
+    ) -> List[Reservation]:
+        """
+        Returns the guest's reservations ordered by start date, optionally
+        limited to stays starting in [start_from, start_before). `after` is a
+        cursor: only reservations ordered after that reservation are returned.
+
+        Raises:
+            ValueError: If the `after` reservation cannot be found.
+        """
+        return self._select(self._by_guest, guest_id, start_from, start_before, after, limit)
+
+    def for_host(
+        self,
+        host_id: uuid.UUID,
+        start_from: date | None = None,
+        start_before: date | None = None,
+        after: uuid.UUID | None = None,
+        limit: int | None = None,
+    ) -> List[Reservation]:
+        """
+        Returns the reservations on all of the host's caravans, like `for_guest`.
+
+        Raises:
+            ValueError: If the `after` reservation cannot be found.
+        """
+        return self._select(self._by_host, host_id, start_from, start_before, after, limit)
+
+    def _select(
+        self,
+        index: Dict[uuid.UUID, _SortedReservations],
+        user_id: uuid.UUID,
+        start_from: date | None,
+        start_before: date | None,
+        after: uuid.UUID | None,
+        limit: int | None,
+    ) -> List[Reservation]:
+        # Every key for a day lies between (ordinal, -1) and (ordinal, <any seq>),
+        # so open bounds on those sentinels give inclusive/exclusive date filters.
+        low = None if start_from is None else (start_from.toordinal(), -1)
+        high = None if start_before is None else (start_before.toordinal(), -1)
+        with self._lock:
+            if after is not None:
+                cursor = self._keys.get(after)
+                if cursor is None:
+                    raise ValueError(f"Reservation with id {after} not found.")
+                low = cursor if low is None else max(low, cursor)
+            entries = index.get(user_id)
+            if entries is None:
+                return []
+            return [self._reservations[i] for i in entries.select(low, high, limit)]
@@ -0,0 +1,80 @@
+from datetime import date
+from typing import List, Sequence
+import uuid
+from src.models.reservation import Reservation
+from src.repositories.async_repositories import AsyncReservationRepository
+from src.repositories.blocking_executor import BlockingExecutor
+from src.services.reservation_service import ReservationService, BookingRequest, BookingResult, BulkMode
+
+class AsyncReservationService:
+    """
+    Async counterpart of ReservationService for use from async API handlers.
+
+    Booking logic is not duplicated: each booking runs the synchronous
+    service as one unit through the executor. This keeps the per-caravan
+    lock from ever being held across an `await`, while reads go through the
+    async repository.
+    """
+    def __init__(
+        self,
+        service: ReservationService,
+        reservation_repo: AsyncReservationRepository,
+        executor: BlockingExecutor,
+    ):
+        self._service = service
+        self._reservation_repo = reservation_repo
+        self._executor = executor
+
+    async def create_reservation(
+        self,
+        guest_id: uuid.UUID,
+        caravan_id: uuid.UUID,
+        start_date: date,
+        end_date: date,
+        idempotency_key: str | None = None,
+    ) -> Reservation:
+        """
+        Creates and stores a new reservation after validating the request;
+        see ReservationService.create_reservation for `idempotency_key`.
+
+        Raises:
+            ValueError: If the guest or caravan cannot be found.
+            ReservationError: If the reservation request is invalid.
+        """
+        return await self._executor.run(
+            self._service.create_reservation, guest_id, caravan_id, start_date, end_date, idempotency_key
+        )
+
+    async def create_reservations_bulk(
+        self, requests: Sequence[BookingRequest], mode: BulkMode = BulkMode.BEST_EFFORT
+    ) -> List[BookingResult]:
+        """Creates many reservations in one call; see ReservationService.create_reservations_bulk."""
+        return await self._executor.run(self._service.create_reservations_bulk, requests, mode)
+
+    async def approve_reservation(self, reservation_id: uuid.UUID) -> Reservation:
+        """Approves a pending reservation; see ReservationService.approve_reservation."""
+        return await self._executor.run(self._service.approve_reservation, reservation_id)
+
+    async def reject_reservation(self, reservation_id: uuid.UUID) -> Reservation:
+        """Rejects a pending reservation; see ReservationService.reject_reservation."""
+        return await self._executor.run(self._service.reject_reservation, reservation_id)
+
+    async def cancel_reservation(self, reservation_id: uuid.UUID) -> Reservation:
+        """Cancels a reservation; see ReservationService.cancel_reservation."""
+        return await self._executor.run(self._service.cancel_reservation, reservation_id)
+
+    async def complete_reservation(self, reservation_id: uuid.UUID) -> Reservation:
+        """Completes an ended reservation; see ReservationService.complete_reservation."""
+        return await self._executor.run(self._service.complete_reservation, reservation_id)
+
+    async def complete_past_reservations(self, today: date | None = None) -> List[Reservation]:
+        """Completes all ended reservations; see ReservationService.complete_past_reservations."""
+        return await self._executor.run(self._service.complete_past_reservations, today)
+
+    async def get_by_id(self, reservation_id: uuid.UUID) -> Reservation | None:
+        """Retrieves a reservation by its unique ID."""
+        return await self._reservation_repo.get_by_id(reservation_id)
+
+    async def get_for_caravan(self, caravan_id: uuid.UUID) -> List[Reservation]:
+        """Retrieves all reservations for a specific caravan."""
+        return await self._reservation_repo.get_for_caravan(caravan_id)
@@ -0,0 +1,49 @@
+from datetime import date
+from typing import List
+from src.models.caravan import Caravan, CaravanStatus
+from src.models.geo import GeoArea, GeoCircle
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.exceptions.reservation import InvalidDateError
+
+class AvailabilityService:
+    """
+    Answers date-range availability questions across the whole fleet.
+    """
+    def __init__(self, caravan_repo: CaravanRepository, reservation_repo: ReservationRepository):
+        self._caravan_repo = caravan_repo
+        self._reservation_repo = reservation_repo
+
+    def find_available_caravans(
+        self,
+        start_date: date,
+        end_date: date,
+        location: str | None = None,
+        min_capacity: int | None = None,
+        area: GeoArea | None = None,
+    ) -> List[Caravan]:
+        """
+        Returns every bookable caravan that is free between start_date and end_date.
+
+        Attribute and area filters are resolved through the caravan repository's
+        indexes, then the remaining candidates are checked against the reservation
+        index in a single pass. Within a radius, the nearest caravans come first.
+
+        Raises:
+            InvalidDateError: If the date range is invalid.
+        """
+        if start_date >= end_date:
+            raise InvalidDateError("End date must be after start date.")
+        if start_date < date.today():
+            raise InvalidDateError("Start date cannot be in the past.")
+
+        candidates = self._caravan_repo.query(
+            location=location,
+            status=CaravanStatus.AVAILABLE,
+            min_capacity=min_capacity,
+            area=area,
+        )
+        available = self._reservation_repo.filter_available(candidates, start_date, end_date)
+        if isinstance(area, GeoCircle):
+            available.sort(key=lambda c: area.distance_km(c.latitude, c.longitude))
+        return available
@@ -0,0 +1,478 @@
+import csv
+import io
+import json
+import math
+import uuid
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
+from src.models.caravan import Caravan, CaravanStatus
+from src.models.interning import intern_date
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.user import User, UserRole
+from src.repositories.availability_index import is_active
+from src.exceptions.reservation import ReservationError
+
+ENTITIES = ("users", "caravans", "reservations")
+FORMATS = ("ndjson", "csv")
+
+# Field order of exported records, and the CSV header.
+COLUMNS: Dict[str, Sequence[str]] = {
+    "users": ("id", "name", "contact", "role", "identity_verified"),
+    "caravans": (
+        "id", "host_id", "name", "location", "capacity", "daily_rate",
+        "amenities", "photos", "status", "latitude", "longitude",
+    ),
+    "reservations": ("id", "guest_id", "caravan_id", "start_date", "end_date", "total_price", "status"),
+}
+
+# CSV has no lists; amenities and photos are joined with this separator.
+LIST_SEPARATOR = ";"
+
+
+@dataclass
+class ImportReport:
+    """The outcome of an import: counts, and the first few rejected lines with the reason."""
+    imported: int = 0
+    rejected: int = 0
+    errors: List[Tuple[int, str]] = field(default_factory=list)
+
+
+# --- Export ---
+
+def _user_values(user: User) -> list:
+    return [str(user.id), user.name, user.contact, user.role.value, user.identity_verified]
+
+
+def _caravan_values(caravan: Caravan) -> list:
+    return [
+        str(caravan.id), str(caravan.host_id), caravan.name, caravan.location, caravan.capacity,
+        caravan.daily_rate, list(caravan.amenities), list(caravan.photos), caravan.status.value,
+        caravan.latitude, caravan.longitude,
+    ]
+
+
+def _reservation_values(reservation: Reservation) -> list:
+    return [
+        str(reservation.id), str(reservation.guest_id), str(reservation.caravan_id),
+        reservation.start_date.isoformat(), reservation.end_date.isoformat(),
+        reservation.total_price, reservation.status.value,
+    ]
+
+
+_VALUES: Dict[str, Callable[[Any], list]] = {
+    "users": _user_values,
+    "caravans": _caravan_values,
+    "reservations": _reservation_values,
+}
+
+
+def _csv_cell(value: Any) -> Any:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, list):
+        return LIST_SEPARATOR.join(value)
+    return value
+
+
+def export_records(entity: str, items: Iterable[Any], fmt: str, chunk_size: int = 1000) -> Iterator[str]:
+    """
+    Encodes entities as NDJSON or CSV (with a header row). Text is yielded
+    every `chunk_size` records, so an export of any size holds only one
+    chunk in memory when `items` is itself lazy (see the repositories'
+    `iter_all`).
+
+    Raises:
+        ValueError: If the entity or format is not supported.
+    """
+    _check(entity, fmt)
+    values = _VALUES[entity]
+    columns = COLUMNS[entity]
+    buffer = io.StringIO()
+    if fmt == "csv":
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(columns)
+
+        def write(item: Any) -> None:
+            writer.writerow([_csv_cell(value) for value in values(item)])
+    else:
+        encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+        def write(item: Any) -> None:
+            buffer.write(encode(dict(zip(columns, values(item)))))
+            buffer.write("\n")
+    pending = 0
+    for item in items:
+        write(item)
+        pending += 1
+        if pending == chunk_size:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+# --- Import ---
+
+def _check(entity: str, fmt: str) -> None:
+    if entity not in ENTITIES:
+        raise ValueError(f"Unknown entity '{entity}'; expected one of {', '.join(ENTITIES)}.")
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown format '{fmt}'; expected one of {', '.join(FORMATS)}.")
+
+
+def _required(record: Dict[str, Any], key: str) -> Any:
+    value = record.get(key)
+    if value is None or value == "":
+        raise ValueError(f"Missing field '{key}'.")
+    return value
+
+
+def _text(record: Dict[str, Any], key: str) -> str:
+    return str(_required(record, key))
+
+
+def _id(record: Dict[str, Any]) -> uuid.UUID:
+    # Records without an ID are new and get one; migrated records keep theirs.
+    return uuid.uuid4() if record.get("id") in (None, "") else uuid.UUID(_text(record, "id"))
+
+
+def _flag(record: Dict[str, Any], key: str) -> bool:
+    value = record.get(key)
+    if value is None or value == "" or isinstance(value, bool):
+        return bool(value)
+    text = str(value).lower()
+    if text in ("true", "1", "yes"):
+        return True
+    if text in ("false", "0", "no"):
+        return False
+    raise ValueError(f"Field '{key}' must be true or false, not '{value}'.")
+
+
+def _list(record: Dict[str, Any], key: str) -> List[str]:
+    value = record.get(key)
+    if value is None or value == "":
+        return []
+    if isinstance(value, list):
+        return [str(v) for v in value]
+    return str(value).split(LIST_SEPARATOR)
+
+
+def _number(record: Dict[str, Any], key: str) -> float:
+    # float() accepts "nan" and "inf" (and NDJSON NaN/Infinity), which would
+    # corrupt the sorted rate index and the report sums.
+    value = float(_required(record, key))
+    if not math.isfinite(value):
+        raise ValueError(f"Field '{key}' must be a finite number, not '{record[key]}'.")
+    return value
+
+
+def _optional_number(record: Dict[str, Any], key: str) -> float | None:
+    value = record.get(key)
+    return None if value is None or value == "" else _number(record, key)
+
+
+class _ParsedValues:
+    """
+    The references and dates parsed in the current batch, by their text.
+    A batch names few distinct hosts, guests, caravans and days, so each is
+    parsed once and records referring to it share one object.
+    """
+    def __init__(self):
+        self._uuids: Dict[str, uuid.UUID] = {}
+        self._dates: Dict[str, date] = {}
+
+    def uuid(self, record: Dict[str, Any], key: str) -> uuid.UUID:
+        text = _text(record, key)
+        value = self._uuids.get(text)
+        if value is None:
+            value = self._uuids[text] = uuid.UUID(text)
+        return value
+
+    def date(self, record: Dict[str, Any], key: str) -> date:
+        text = _text(record, key)
+        value = self._dates.get(text)
+        if value is None:
+            value = self._dates[text] = intern_date(date.fromisoformat(text))
+        return value
+
+    def clear(self) -> None:
+        self._uuids.clear()
+        self._dates.clear()
+
+
+def _to_user(record: Dict[str, Any], values: _ParsedValues) -> User:
+    return User(
+        id=_id(record),
+        name=_text(record, "name"),
+        contact=_text(record, "contact"),
+        role=UserRole(_required(record, "role")),
+        identity_verified=_flag(record, "identity_verified"),
+    )
+
+
+def _to_caravan(record: Dict[str, Any], values: _ParsedValues) -> Caravan:
+    capacity = int(_required(record, "capacity"))
+    daily_rate = _number(record, "daily_rate")
+    if capacity <= 0:
+        raise ValueError("Capacity must be positive.")
+    if daily_rate < 0:
+        raise ValueError("Daily rate must not be negative.")
+    return Caravan(
+        id=_id(record),
+        host_id=values.uuid(record, "host_id"),
+        name=_text(record, "name"),
+        location=_text(record, "location"),
+        capacity=capacity,
+        daily_rate=daily_rate,
+        amenities=_list(record, "amenities"),
+        photos=_list(record, "photos"),
+        status=CaravanStatus(record.get("status") or CaravanStatus.AVAILABLE.value),
+        latitude=_optional_number(record, "latitude"),
+        longitude=_optional_number(record, "longitude"),
+    )
+
+
+def _to_reservation(record: Dict[str, Any], values: _ParsedValues) -> Reservation:
+    start_date, end_date = values.date(record, "start_date"), values.date(record, "end_date")
+    if end_date <= start_date:
+        raise ValueError("End date must be after start date.")
+    total_price = _number(record, "total_price")
+    if total_price < 0:
+        raise ValueError("Total price must not be negative.")
+    return Reservation(
+        id=_id(record),
+        guest_id=values.uuid(record, "guest_id"),
+        caravan_id=values.uuid(record, "caravan_id"),
+        start_date=start_date,
+        end_date=end_date,
+        total_price=total_price,
+        status=ReservationStatus(record.get("status") or ReservationStatus.PENDING.value),
+    )
+
+
+_DECODERS: Dict[str, Callable[[Dict[str, Any], _ParsedValues], Any]] = {
+    "users": _to_user,
+    "caravans": _to_caravan,
+    "reservations": _to_reservation,
+}
+
+
+class BulkImporter:
+    """
+    Loads users, caravans and reservations from NDJSON or CSV streams.
+
+    Records are parsed and validated one at a time but stored in batches of
+    `batch_size`. Within a batch the referenced users and caravans are looked
+    up once, and reservations are checked for booking conflicts, against
+    the repository and against each other, under a single acquisition of
+    the affected caravans' locks before `add_many` stores them together.
+    Records that fail validation or conflict are rejected individually and
+    reported with their line number; the rest of the stream is still loaded.
+
+    Imported records keep their IDs and statuses, and past dates are
+    accepted, so the importer is suited to migrating existing data.
+    """
+    def __init__(self, user_repo, caravan_repo, reservation_repo, batch_size: int = 5000, max_errors: int = 100):
+        if batch_size <= 0:
+            raise ValueError("Batch size must be positive.")
+        self._user_repo = user_repo
+        self._caravan_repo = caravan_repo
+        self._reservation_repo = reservation_repo
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+
+    def start(self, entity: str, fmt: str) -> "ImportSession":
+        """
+        Begins importing one stream; feed its lines to the returned session.
+
+        Raises:
+            ValueError: If the entity or format is not supported.
+        """
+        _check(entity, fmt)
+        return ImportSession(self, entity, fmt)
+
+    def import_lines(self, entity: str, fmt: str, lines: Iterable[str]) -> ImportReport:
+        """
+        Imports a whole stream of lines, such as an open file, and returns
+        the report. Only one batch of records is held in memory at a time.
+
+        Raises:
+            ValueError: If the entity or format is not supported.
+        """
+        session = self.start(entity, fmt)
+        session.feed(lines)
+        return session.finish()
+
+    # --- Storing one batch ---
+
+    def _store_users(self, batch: List[Tuple[int, User]], session: "ImportSession") -> None:
+        for line, user in batch:
+            try:
+                self._user_repo.add(user)
+                session.report.imported += 1
+            except ValueError as e:
+                session.reject(line, str(e))
+
+    def _store_caravans(self, batch: List[Tuple[int, Caravan]], session: "ImportSession") -> None:
+        hosts: Dict[uuid.UUID, bool] = {}
+        for line, caravan in batch:
+            if caravan.host_id not in hosts:
+                host = self._user_repo.get_by_id(caravan.host_id)
+                hosts[caravan.host_id] = host is not None and host.role is UserRole.HOST
+            if not hosts[caravan.host_id]:
+                session.reject(line, f"Host {caravan.host_id} not found.")
+                continue
+            try:
+                self._caravan_repo.add(caravan)
+                session.report.imported += 1
+            except ValueError as e:
+                session.reject(line, str(e))
+
+    def _store_reservations(self, batch: List[Tuple[int, Reservation]], session: "ImportSession") -> None:
+        by_caravan: Dict[uuid.UUID, List[Tuple[int, Reservation]]] = {}
+        for entry in batch:
+            by_caravan.setdefault(entry[1].caravan_id, []).append(entry)
+        # Rejections are reported in line order once the batch is done.
+        rejected: List[Tuple[int, str]] = []
+        guests: Dict[uuid.UUID, bool] = {}
+        seen = set()
+        for caravan_id, group in list(by_caravan.items()):
+            if self._caravan_repo.get_by_id(caravan_id) is None:
+                rejected.extend((line, f"Caravan {caravan_id} not found.") for line, _ in group)
+                del by_caravan[caravan_id]
+                continue
+            kept = []
+            for line, reservation in group:
+                known = guests.get(reservation.guest_id)
+                if known is None:
+                    known = guests[reservation.guest_id] = self._user_repo.get_by_id(reservation.guest_id) is not None
+                if not known:
+                    rejected.append((line, f"Guest {reservation.guest_id} not found."))
+                elif reservation.id in seen or self._reservation_repo.get_by_id(reservation.id) is not None:
+                    rejected.append((line, f"Reservation with id {reservation.id} already exists."))
+                else:
+                    seen.add(reservation.id)
+                    kept.append((line, reservation))
+            by_caravan[caravan_id] = kept
+
+        accepted: List[Tuple[int, Reservation]] = []
+        with self._reservation_repo.lock_many(by_caravan):
+            for caravan_id, group in by_caravan.items():
+                # Sorted by start date, an active reservation overlaps an
+                # earlier accepted one of the batch iff it starts before the
+                # latest end seen so far.
+                group.sort(key=lambda entry: entry[1].start_date)
+                booked_until: date | None = None
+                for line, reservation in group:
+                    if is_active(reservation):
+                        if booked_until is not None and reservation.start_date < booked_until:
+                            rejected.append((line, "Overlaps another reservation in the import."))
+                            continue
+                        if self._reservation_repo.find_conflict(
+                            caravan_id, reservation.start_date, reservation.end_date
+                        ) is not None:
+                            rejected.append((line, "Caravan is already booked for these dates."))
+                            continue
+                        if booked_until is None or reservation.end_date > booked_until:
+                            booked_until = reservation.end_date
+                    accepted.append((line, reservation))
+            try:
+                self._reservation_repo.add_many(reservation for _, reservation in accepted)
+                session.report.imported += len(accepted)
+            except (ValueError, ReservationError) as e:
+                # Only possible if another writer raced the checks above.
+                rejected.extend((line, f"Batch rejected: {e}") for line, _ in accepted)
+        for line, reason in sorted(rejected):
+            session.reject(line, reason)
+
+
+_STORES = {
+    "users": BulkImporter._store_users,
+    "caravans": BulkImporter._store_caravans,
+    "reservations": BulkImporter._store_reservations,
+}
+
+
+class ImportSession:
+    """
+    The import of one stream, fed line by line in any number of `feed`
+    calls, e.g. as the chunks of a request body arrive. Line numbers in the
+    report count from the start of the stream (for CSV, the header is line 1).
+
+    A CSV record must not span `feed` calls, i.e. quoted fields must not
+    contain line breaks where the stream is split.
+    """
+    def __init__(self, importer: BulkImporter, entity: str, fmt: str):
+        self.report = ImportReport()
+        self._importer = importer
+        self._decode = _DECODERS[entity]
+        self._store = _STORES[entity]
+        self._fmt = fmt
+        self._line = 0
+        self._header: List[str] | None = None
+        self._batch: List[Tuple[int, Any]] = []
+        self._values = _ParsedValues()
+
+    def feed(self, lines: Iterable[str]) -> None:
+        """Parses and validates the lines, storing every full batch of records."""
+        for line, record in self._records(lines):
+            try:
+                item = self._decode(record, self._values)
+            except (ValueError, TypeError, AttributeError) as e:
+                self.reject(line, str(e))
+                continue
+            self._batch.append((line, item))
+            if len(self._batch) >= self._importer.batch_size:
+                self._flush()
+
+    def finish(self) -> ImportReport:
+        """Stores the last partial batch and returns the report."""
+        self._flush()
+        return self.report
+
+    def reject(self, line: int, reason: str) -> None:
+        self.report.rejected += 1
+        if len(self.report.errors) < self._importer.max_errors:
+            self.report.errors.append((line, reason))
+
+    def _flush(self) -> None:
+        batch, self._batch = self._batch, []
+        self._values.clear()
+        if batch:
+            self._store(self._importer, batch, self)
+
+    def _records(self, lines: Iterable[str]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        if self._fmt == "ndjson":
+            for text in lines:
+                self._line += 1
+                if not text.strip():
+                    continue
+                try:
+                    record = json.loads(text)
+                except ValueError as e:
+                    self.reject(self._line, f"Invalid JSON: {e}")
+                    continue
+                if not isinstance(record, dict):
+                    self.reject(self._line, "Expected a JSON object.")
+                    continue
+                yield self._line, record
+            return
+        reader = csv.reader(lines)
+        offset = self._line
+        for row in reader:
+            self._line = offset + reader.line_num
+            if not row:
+                continue
+            if self._header is None:
+                self._header = [name.strip() for name in row]
+                continue
+            if len(row) != len(self._header):
+                self.reject(self._line, f"Expected {len(self._header)} columns, got {len(row)}.")
+                continue
+            yield self._line, dict(zip(self._header, row))
+        self._line = offset + reader.line_num
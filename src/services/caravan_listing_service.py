@@ -0,0 +1,249 @@
+import bisect
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+from src.models.caravan import Caravan, CaravanStatus
+from src.models.geo import GeoArea
+from src.models.review import Review
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.rating_index import RatingIndex
+from src.services.serialization import dumps, to_jsonable
+
+# Rating order entries: the RatingIndex sort key, then arrival in the service.
+_Entry = Tuple[tuple, int]
+
+
+@dataclass(frozen=True)
+class CaravanQuery:
+    """The filters of a caravan listing request; hashable so it can key caches."""
+    location: str | None = None
+    min_capacity: int | None = None
+    max_capacity: int | None = None
+    min_daily_rate: float | None = None
+    max_daily_rate: float | None = None
+    area: GeoArea | None = None
+    sort_by_rating: bool = False
+
+
+@dataclass(frozen=True)
+class CaravanPage:
+    """A serialized page of caravans plus the cursor for the next page, if any."""
+    body: bytes
+    next_cursor: str | None
+
+
+class CaravanListingService:
+    """
+    Serves caravan listings as pre-serialized JSON.
+
+    Each caravan is encoded once and reused across requests, and whole pages
+    are cached per repository version. Because the repository version changes
+    on every mutation, a cache entry can never be served stale and the version
+    doubles as the listing's ETag.
+
+    With a RatingIndex, each caravan carries its rating summary and listings
+    can be sorted by rating; the index's version then joins the cache key.
+    Caravans are then also kept in rating order, re-placed as reviews arrive,
+    so a page starts at its cursor's position by bisection instead of sorting
+    the fleet. For that the service is a CaravanListener and a ReviewListener:
+    `load` the existing caravans, subscribe it to the caravan repository, and
+    subscribe it to the review repository after the RatingIndex.
+    """
+    def __init__(
+        self,
+        caravan_repo: CaravanRepository,
+        page_cache_size: int = 256,
+        ratings: RatingIndex | None = None,
+        max_page_size: int = 500,
+    ):
+        self._caravan_repo = caravan_repo
+        self._max_page_size = max_page_size
+        self._ratings = ratings
+        self._page_cache_size = page_cache_size
+        self._page_cache: "OrderedDict[Tuple, CaravanPage]" = OrderedDict()
+        self._page_cache_version = self._version()
+        # Caravans only change through the repository's status updates and new
+        # reviews, so the encoded form is keyed on the status and rating it was
+        # produced with.
+        self._encoded: Dict[uuid.UUID, Tuple[Any, bytes]] = {}
+        self._lock = threading.Lock()
+        self._caravans: List[Caravan] = []
+        self._seq_by_id: Dict[uuid.UUID, int] = {}
+        self._entries: List[_Entry] = []
+        self._by_rating: List[_Entry] = []
+        self._order_lock = threading.Lock()
+
+    def load(self, caravans: Iterable[Caravan]) -> None:
+        """Orders existing caravans by rating, e.g. when attaching to a populated repository."""
+        for caravan in caravans:
+            self.on_caravan_added(caravan)
+
+    def on_caravan_added(self, caravan: Caravan) -> None:
+        if self._ratings is None:
+            return
+        with self._order_lock:
+            seq = len(self._caravans)
+            self._caravans.append(caravan)
+            self._seq_by_id[caravan.id] = seq
+            entry = (self._ratings.sort_key(caravan.id), seq)
+            self._entries.append(entry)
+            bisect.insort(self._by_rating, entry)
+
+    def on_caravan_status_changed(self, caravan: Caravan, previous: CaravanStatus) -> None:
+        # The status does not move a caravan in the rating order; only keep the latest copy.
+        with self._order_lock:
+            seq = self._seq_by_id.get(caravan.id)
+            if seq is not None:
+                self._caravans[seq] = caravan
+
+    def on_review_added(self, review: Review) -> None:
+        if self._ratings is None:
+            return
+        with self._order_lock:
+            seq = self._seq_by_id.get(review.target_id)
+            if seq is None:
+                return  # A review of a host; hosts are not listed.
+            old, new = self._entries[seq], (self._ratings.sort_key(review.target_id), seq)
+            if new == old:
+                return
+            self._entries[seq] = new
+            del self._by_rating[bisect.bisect_left(self._by_rating, old)]
+            bisect.insort(self._by_rating, new)
+
+    def etag(self) -> str:
+        """Returns the entity tag describing the current state of the listing."""
+        return 'W/"caravans-' + "-".join(map(str, self._version())) + '"'
+
+    def get_page(self, query: CaravanQuery, cursor: str | None = None, limit: int | None = None) -> CaravanPage:
+        """
+        Returns one page of caravans matching the query, starting after `cursor`.
+        Without a `limit` the whole listing is returned; a given limit is
+        capped at the maximum page size.
+
+        Raises:
+            ValueError: If the limit is not positive, or the cursor is malformed or unknown.
+        """
+        if limit is not None:
+            if limit <= 0:
+                raise ValueError("Limit must be positive.")
+            limit = min(limit, self._max_page_size)
+        version = self._version()
+        key = (query, cursor, limit)
+        with self._lock:
+            if self._page_cache_version != version:
+                self._page_cache.clear()
+                self._page_cache_version = version
+            page = self._page_cache.get(key)
+            if page is not None:
+                self._page_cache.move_to_end(key)
+                return page
+
+        caravans = self._query(query, cursor, None if limit is None else limit + 1)
+        next_cursor = None
+        if limit is not None and len(caravans) > limit:
+            caravans = caravans[:limit]
+            next_cursor = str(caravans[-1].id)
+        page = CaravanPage(b"[" + b",".join(self._encode(c) for c in caravans) + b"]", next_cursor)
+
+        with self._lock:
+            if self._page_cache_version == version:
+                self._page_cache[key] = page
+                if len(self._page_cache) > self._page_cache_size:
+                    self._page_cache.popitem(last=False)
+        return page
+
+    def stream(self, query: CaravanQuery, cursor: str | None = None, batch_size: int = 500) -> Iterator[bytes]:
+        """
+        Yields the matching caravans as NDJSON chunks of up to `batch_size` lines,
+        fetching one batch from the repository at a time.
+
+        Raises:
+            ValueError: If the cursor is malformed or unknown.
+        """
+        while True:
+            caravans = self._query(query, cursor, batch_size)
+            if not caravans:
+                return
+            yield b"".join(self._encode(c) + b"\n" for c in caravans)
+            if len(caravans) < batch_size:
+                return
+            cursor = str(caravans[-1].id)
+
+    def _version(self) -> Tuple[int, ...]:
+        if self._ratings is None:
+            return (self._caravan_repo.version,)
+        return (self._caravan_repo.version, self._ratings.version)
+
+    def _query(self, query: CaravanQuery, cursor: str | None, limit: int | None) -> List[Caravan]:
+        after = uuid.UUID(cursor) if cursor else None
+        if query.sort_by_rating and self._ratings is not None:
+            return self._query_by_rating(query, after, limit)
+        return self._caravan_repo.query(
+            location=query.location,
+            min_capacity=query.min_capacity,
+            max_capacity=query.max_capacity,
+            min_daily_rate=query.min_daily_rate,
+            max_daily_rate=query.max_daily_rate,
+            area=query.area,
+            after=after,
+            limit=limit,
+        )
+
+    def _query_by_rating(self, query: CaravanQuery, after: uuid.UUID | None, limit: int | None) -> List[Caravan]:
+        """
+        Walks the rating order from the cursor's entry. With filters, the
+        matches come from the repository indexes; the walk then skips the
+        rest, unless the matches are so few that ordering just them is cheaper.
+        """
+        matches = None
+        if replace(query, sort_by_rating=False) != CaravanQuery():
+            matches = self._caravan_repo.query(
+                location=query.location,
+                min_capacity=query.min_capacity,
+                max_capacity=query.max_capacity,
+                min_daily_rate=query.min_daily_rate,
+                max_daily_rate=query.max_daily_rate,
+                area=query.area,
+            )
+        with self._order_lock:
+            cursor = None
+            if after is not None:
+                seq = self._seq_by_id.get(after)
+                if seq is None:
+                    raise ValueError(f"Caravan with ID {after} not found.")
+                cursor = self._entries[seq]
+            seqs = None if matches is None else {self._seq_by_id[c.id] for c in matches if c.id in self._seq_by_id}
+            entries = self._by_rating
+            # Reaching `limit` matches walks about limit * fleet / matches entries.
+            if seqs is not None and (limit is None or limit * len(entries) > len(seqs) ** 2):
+                entries, seqs = sorted(self._entries[seq] for seq in seqs), None
+            start = 0 if cursor is None else bisect.bisect_right(entries, cursor)
+            if seqs is None:
+                selected = entries[start:] if limit is None else entries[start:start + limit]
+            else:
+                selected = []
+                for i in range(start, len(entries)):
+                    entry = entries[i]
+                    if entry[1] in seqs:
+                        selected.append(entry)
+                        if len(selected) == limit:
+                            break
+            return [self._caravans[seq] for _, seq in selected]
+
+    def _encode(self, caravan: Caravan) -> bytes:
+        summary = None if self._ratings is None else self._ratings.summary(caravan.id)
+        state = (caravan.status, summary)
+        cached = self._encoded.get(caravan.id)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+        if summary is None:
+            encoded = dumps(caravan)
+        else:
+            encoded = dumps({
+                **to_jsonable(caravan),
+                "rating": {"average": summary.average, "count": summary.count},
+            })
+        self._encoded[caravan.id] = (state, encoded)
+        return encoded
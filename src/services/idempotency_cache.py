@@ -0,0 +1,108 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Tuple, Type
+from src.exceptions.reservation import ReservationError, IdempotencyKeyMismatchError
+
+
+class IdempotencyCache:
+    """
+    Remembers the outcome of requests by idempotency key, so a retried
+    request gets the original outcome instead of being executed again.
+
+    Outcomes are kept for `ttl_seconds` and at most `max_entries` of them,
+    oldest first out. A duplicate arriving while the first request is still
+    running waits for its outcome rather than running concurrently.
+
+    Only results and the exceptions listed in `cached_errors` are stored;
+    any other failure lets the next retry run the request again.
+    """
+    def __init__(
+        self,
+        ttl_seconds: float = 24 * 3600,
+        max_entries: int = 100_000,
+        cached_errors: Tuple[Type[BaseException], ...] = (ReservationError, ValueError),
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._cached_errors = cached_errors
+        self._clock = clock
+        # key -> (expiry, fingerprint, future holding the outcome), in insertion order
+        self._entries: "OrderedDict[Hashable, Tuple[float, Hashable, Future]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, Tuple[Hashable, Future]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def run(self, key: Hashable, fingerprint: Hashable, fn: Callable[[], Any]) -> Any:
+        """
+        Returns fn()'s outcome for `key`, calling fn only if no outcome is
+        stored or pending. `fingerprint` identifies the request; reusing a
+        key for a different request is an error.
+
+        Raises:
+            IdempotencyKeyMismatchError: If the key was used with another fingerprint.
+        """
+        with self._lock:
+            now = self._clock()
+            self._expire(now)
+            entry = self._entries.get(key)
+            if entry is not None:
+                _, stored_fingerprint, future = entry
+            elif key in self._in_flight:
+                stored_fingerprint, future = self._in_flight[key]
+            else:
+                stored_fingerprint, future = fingerprint, None
+            if stored_fingerprint != fingerprint:
+                raise IdempotencyKeyMismatchError("This idempotency key was already used for a different request.")
+            if future is None:
+                future = Future()
+                self._in_flight[key] = (fingerprint, future)
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            error = future.exception()
+            if error is None:
+                return future.result()
+            raise _replay(error)
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._finish(key, fingerprint, future, isinstance(e, self._cached_errors))
+            future.set_exception(e)
+            raise
+        self._finish(key, fingerprint, future, True)
+        future.set_result(result)
+        return result
+
+    def _finish(self, key: Hashable, fingerprint: Hashable, future: Future, store: bool) -> None:
+        with self._lock:
+            del self._in_flight[key]
+            if store:
+                self._entries[key] = (self._clock() + self._ttl, fingerprint, future)
+                while len(self._entries) > self._max_entries:
+                    self._entries.popitem(last=False)
+
+    def _expire(self, now: float) -> None:
+        # Entries are inserted with a fixed TTL, so they also expire in insertion order.
+        while self._entries:
+            expiry = next(iter(self._entries.values()))[0]
+            if expiry > now:
+                return
+            self._entries.popitem(last=False)
+
+
+def _replay(error: BaseException) -> BaseException:
+    # Raising the stored instance itself would append every replay's frames to
+    # its shared traceback, so each replay raises a copy without one.
+    try:
+        return copy.copy(error)
+    except TypeError:
+        return error.with_traceback(None)
@@ -0,0 +1,170 @@
+import bisect
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# Upper bounds in seconds, from a dictionary lookup to a slow HTTP request.
+DEFAULT_BUCKETS = (
+    1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4,
+    1e-3, 2.5e-3, 5e-3, 1e-2, 2.5e-2, 5e-2, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+
+class Counter:
+    """A monotonically increasing count."""
+    def __init__(self):
+        self._value = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def value(self) -> float:
+        return self._value
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def _samples(self, name: str, labels: _Labels) -> Iterable[Tuple[str, _Labels, float]]:
+        yield name, labels, self._value
+
+
+class Histogram:
+    """Counts observations (in seconds) per bucket, and keeps their sum."""
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self._bounds = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        return self._sum
+
+    def observe(self, value: float) -> None:
+        i = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[i] += 1
+            self._sum += value
+
+    def _samples(self, name: str, labels: _Labels) -> Iterable[Tuple[str, _Labels, float]]:
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        cumulative = 0
+        for bound, count in zip(self._bounds + (float("inf"),), counts):
+            cumulative += count
+            le = "+Inf" if bound == float("inf") else repr(bound)
+            yield f"{name}_bucket", labels + (("le", le),), cumulative
+        yield f"{name}_sum", labels, total
+        yield f"{name}_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """
+    Holds named counters and histograms, each family split by label values,
+    and renders them in the Prometheus text exposition format.
+
+    `instrument` times methods of existing objects (services, validators,
+    repositories) without changing their code. While `enabled` is False the
+    wrappers only check that flag, so instrumentation can stay in place and
+    be switched on and off at runtime.
+    """
+    def __init__(self, enabled: bool = True, namespace: str = "caravanshare"):
+        self.enabled = enabled
+        self._namespace = namespace
+        # name -> (help, type, label values -> metric)
+        self._families: Dict[str, Tuple[str, str, Dict[_Labels, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, help: str, **labels: str) -> Counter:
+        """Returns the counter with these labels, creating it on first use."""
+        return self._get(name, help, "counter", Counter, labels)
+
+    def histogram(self, name: str, help: str, **labels: str) -> Histogram:
+        """Returns the histogram with these labels, creating it on first use."""
+        return self._get(name, help, "histogram", Histogram, labels)
+
+    def instrument(self, obj: Any, component: str, methods: Iterable[str]) -> None:
+        """
+        Replaces the named methods on `obj` with wrappers that record their
+        duration in `method_duration_seconds` and count the exceptions they
+        raise, by type, in `errors_total`. Leading underscores are dropped
+        from the method label.
+        """
+        for name in methods:
+            method = getattr(obj, name)
+            label = name.lstrip("_")
+            histogram = self.histogram(
+                "method_duration_seconds", "Time spent in instrumented methods.",
+                component=component, method=label,
+            )
+            setattr(obj, name, self._timed(method, histogram, component, label))
+
+    def render(self) -> str:
+        """Returns every metric in the Prometheus text format."""
+        with self._lock:
+            families = [(name, help, kind, dict(metrics)) for name, (help, kind, metrics) in self._families.items()]
+        lines: List[str] = []
+        for name, help, kind, metrics in sorted(families):
+            full_name = f"{self._namespace}_{name}"
+            lines.append(f"# HELP {full_name} {help}")
+            lines.append(f"# TYPE {full_name} {kind}")
+            for labels, metric in sorted(metrics.items()):
+                for sample, sample_labels, value in metric._samples(full_name, labels):
+                    lines.append(f"{sample}{_format_labels(sample_labels)} {_format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+    def _get(self, name: str, help: str, kind: str, factory: Callable[[], Any], labels: Dict[str, str]):
+        key = tuple(sorted(labels.items()))
+        family = self._families.get(name)
+        if family is not None:
+            metric = family[2].get(key)
+            if metric is not None:
+                return metric
+        with self._lock:
+            help_, kind_, metrics = self._families.setdefault(name, (help, kind, {}))
+            if kind_ != kind:
+                raise ValueError(f"Metric {name} is already registered as a {kind_}.")
+            return metrics.setdefault(key, factory())
+
+    def _timed(self, method: Callable, histogram: Histogram, component: str, label: str) -> Callable:
+        registry = self
+        clock = time.perf_counter
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            if not registry.enabled:
+                return method(*args, **kwargs)
+            started = clock()
+            try:
+                return method(*args, **kwargs)
+            except Exception as e:
+                registry.counter(
+                    "errors_total", "Exceptions raised by instrumented methods, by type.",
+                    component=component, method=label, error=type(e).__name__,
+                ).inc()
+                raise
+            finally:
+                histogram.observe(clock() - started)
+
+        return timed
+
+
+def _format_labels(labels: _Labels) -> str:
+    if not labels:
+        return ""
+    escaped = (
+        f'{key}="' + value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"') + '"'
+        for key, value in labels
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
@@ -0,0 +1,59 @@
+import asyncio
+import uuid
+from enum import Enum
+from typing import Collection, List, Protocol, Sequence
+from src.models.payment import Payment
+from src.exceptions.payment import PaymentGatewayError
+
+
+class GatewayOutcome(Enum):
+    APPROVED = "approved"  # Settled
+    DECLINED = "declined"  # Refused for good; retrying will not help
+    RETRY = "retry"        # Temporarily refused; try again later
+
+
+class PaymentGateway(Protocol):
+    """
+    A payment provider that settles payments in batches.
+
+    Both methods return one outcome per payment, in order, and raise
+    PaymentGatewayError when the whole call failed and may be retried.
+    """
+    async def charge(self, payments: Sequence[Payment]) -> List[GatewayOutcome]: ...
+
+    async def refund(self, payments: Sequence[Payment]) -> List[GatewayOutcome]: ...
+
+
+class FakePaymentGateway:
+    """
+    An in-process gateway for development and tests.
+
+    Every call takes `latency` seconds. Payments of the reservations in
+    `declined` are declined, and the first `failures` calls fail as a whole.
+    The batches it received are kept in `charges` and `refunds`.
+    """
+    def __init__(self, latency: float = 0.0, declined: Collection[uuid.UUID] = (), failures: int = 0):
+        self.latency = latency
+        self.declined = set(declined)
+        self.failures = failures
+        self.charges: List[List[uuid.UUID]] = []
+        self.refunds: List[List[uuid.UUID]] = []
+
+    async def charge(self, payments: Sequence[Payment]) -> List[GatewayOutcome]:
+        await self._call()
+        self.charges.append([p.id for p in payments])
+        return [
+            GatewayOutcome.DECLINED if p.reservation_id in self.declined else GatewayOutcome.APPROVED
+            for p in payments
+        ]
+
+    async def refund(self, payments: Sequence[Payment]) -> List[GatewayOutcome]:
+        await self._call()
+        self.refunds.append([p.id for p in payments])
+        return [GatewayOutcome.APPROVED] * len(payments)
+
+    async def _call(self) -> None:
+        await asyncio.sleep(self.latency)
+        if self.failures > 0:
+            self.failures -= 1
+            raise PaymentGatewayError("Gateway unavailable.")
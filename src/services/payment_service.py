@@ -0,0 +1,225 @@
+import asyncio
+import logging
+import threading
+import uuid
+from typing import Awaitable, Callable, Dict, List, Sequence, Tuple
+from src.models.payment import Payment, PaymentStatus
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.payment_repository import PaymentRepository
+from src.services.payment_gateway import GatewayOutcome, PaymentGateway
+from src.exceptions.payment import InvalidPaymentStatusError, PaymentGatewayError
+
+logger = logging.getLogger(__name__)
+
+_CHARGE = "charge"
+_REFUND = "refund"
+# A queued gateway call: the action and the payment it applies to.
+_Job = Tuple[str, uuid.UUID]
+
+# Reservation statuses after which the guest must not be charged.
+_CALLED_OFF = frozenset({ReservationStatus.CANCELLED, ReservationStatus.REJECTED})
+
+
+class PaymentService:
+    """
+    Charges guests for their reservations without holding up booking.
+
+    The service is a ReservationListener. Each new pending reservation gets a
+    pending Payment whose charge is queued for a background task on the event
+    loop, so the booking call returns at once. The task collects queued jobs
+    for up to `batch_window` seconds (at most `batch_size` of them) and
+    settles them with one gateway call. Transient failures are retried with exponential
+    backoff, up to `max_attempts` attempts.
+
+    When a reservation is cancelled or rejected, a payment that has not been
+    charged yet is voided, and one that has is refunded through the same queue.
+    """
+    def __init__(
+        self,
+        payment_repo: PaymentRepository,
+        gateway: PaymentGateway,
+        batch_size: int = 100,
+        batch_window: float = 0.05,
+        max_attempts: int = 5,
+        retry_delay: float = 1.0,
+    ):
+        self._payment_repo = payment_repo
+        self._gateway = gateway
+        self._batch_size = batch_size
+        self._batch_window = batch_window
+        self._max_attempts = max_attempts
+        self._retry_delay = retry_delay
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._queue: asyncio.Queue | None = None
+        self._task: asyncio.Task | None = None
+        # Jobs queued while the service is not running
+        self._backlog: List[_Job] = []
+        self._attempts: Dict[_Job, int] = {}
+        self._retries: Dict[_Job, asyncio.TimerHandle] = {}
+        self._lock = threading.Lock()
+
+    def get_for_reservation(self, reservation_id: uuid.UUID) -> List[Payment]:
+        """Retrieves the payments of a reservation, oldest first."""
+        return self._payment_repo.get_for_reservation(reservation_id)
+
+    def start(self) -> None:
+        """Starts settling payments in the background on the running event loop."""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue()
+        with self._lock:
+            self._loop = asyncio.get_running_loop()
+            backlog, self._backlog = self._backlog, []
+        for job in backlog:
+            self._queue.put_nowait(job)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self, timeout: float = 5.0) -> None:
+        """
+        Settles the queued jobs (waiting at most `timeout` seconds) and stops.
+        Jobs waiting for a retry are dropped; their payments stay pending.
+        """
+        if self._task is None:
+            return
+        with self._lock:
+            self._loop = None
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning("Stopped with %d payment jobs unsettled.", self._queue.qsize())
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        for handle in self._retries.values():
+            handle.cancel()
+        self._retries.clear()
+        self._task = None
+
+    # --- ReservationListener ---
+
+    def on_reservation_added(self, reservation: Reservation) -> None:
+        if reservation.status is not ReservationStatus.PENDING:
+            # Imported history (e.g. completed stays) was settled before it arrived here.
+            return
+        payment = Payment(reservation_id=reservation.id, amount=reservation.total_price)
+        self._payment_repo.add(payment)
+        self._enqueue((_CHARGE, payment.id))
+
+    def on_reservation_status_changed(self, reservation: Reservation, previous: ReservationStatus) -> None:
+        if reservation.status not in _CALLED_OFF:
+            return
+        for payment in self._payment_repo.get_for_reservation(reservation.id):
+            if payment.status is PaymentStatus.PENDING:
+                try:
+                    # A charge still in flight is refunded once it succeeds.
+                    self._payment_repo.update_status(payment.id, PaymentStatus.CANCELLED, (PaymentStatus.PENDING,))
+                    continue
+                except InvalidPaymentStatusError:
+                    pass  # Settled in the meantime
+            if payment.status is PaymentStatus.COMPLETED:
+                self._enqueue((_REFUND, payment.id))
+
+    def _enqueue(self, job: _Job) -> None:
+        # Listeners run on whichever thread made the booking.
+        with self._lock:
+            if self._loop is None:
+                self._backlog.append(job)
+                return
+            loop = self._loop
+        loop.call_soon_threadsafe(self._queue.put_nowait, job)
+
+    # --- Settlement ---
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+            self._drain(batch)
+            if len(batch) < self._batch_size and self._batch_window > 0:
+                await asyncio.sleep(self._batch_window)
+                self._drain(batch)
+            try:
+                await self._settle(batch)
+            except Exception:
+                logger.exception("Settling %d payment jobs failed.", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _drain(self, batch: List[_Job]) -> None:
+        while len(batch) < self._batch_size and not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+
+    async def _settle(self, batch: Sequence[_Job]) -> None:
+        charges, refunds = [], []
+        for action, payment_id in batch:
+            payment = self._payment_repo.get_by_id(payment_id)
+            if payment is None:
+                continue
+            if action == _CHARGE and payment.status is PaymentStatus.PENDING:
+                charges.append(payment)
+            elif action == _REFUND and payment.status in (PaymentStatus.COMPLETED, PaymentStatus.CANCELLED):
+                refunds.append(payment)
+        if charges:
+            await self._call(_CHARGE, self._gateway.charge, charges)
+        if refunds:
+            await self._call(_REFUND, self._gateway.refund, refunds)
+
+    async def _call(
+        self,
+        action: str,
+        method: Callable[[Sequence[Payment]], Awaitable[List[GatewayOutcome]]],
+        payments: List[Payment],
+    ) -> None:
+        try:
+            outcomes = await method(payments)
+        except PaymentGatewayError as e:
+            logger.warning("Payment gateway %s of %d payments failed: %s", action, len(payments), e)
+            outcomes = [GatewayOutcome.RETRY] * len(payments)
+        for payment, outcome in zip(payments, outcomes):
+            job = (action, payment.id)
+            if outcome is GatewayOutcome.RETRY:
+                self._retry(job)
+                continue
+            self._attempts.pop(job, None)
+            if outcome is GatewayOutcome.APPROVED:
+                self._approved(job)
+            else:
+                self._declined(job)
+
+    def _approved(self, job: _Job) -> None:
+        action, payment_id = job
+        if action == _REFUND:
+            self._payment_repo.update_status(payment_id, PaymentStatus.REFUNDED)
+            return
+        try:
+            self._payment_repo.update_status(payment_id, PaymentStatus.COMPLETED, (PaymentStatus.PENDING,))
+        except InvalidPaymentStatusError:
+            # Voided while the charge was in flight: give the money back.
+            self._queue.put_nowait((_REFUND, payment_id))
+
+    def _declined(self, job: _Job) -> None:
+        action, payment_id = job
+        if action == _REFUND:
+            logger.error("Refund of payment %s was declined; it needs manual handling.", payment_id)
+            return
+        try:
+            self._payment_repo.update_status(payment_id, PaymentStatus.FAILED, (PaymentStatus.PENDING,))
+        except InvalidPaymentStatusError:
+            pass  # Voided in the meantime; nothing was charged.
+
+    def _retry(self, job: _Job) -> None:
+        attempt = self._attempts.get(job, 0) + 1
+        if attempt >= self._max_attempts:
+            self._attempts.pop(job, None)
+            logger.error("Giving up on %s of payment %s after %d attempts.", job[0], job[1], attempt)
+            self._declined(job)
+            return
+        self._attempts[job] = attempt
+        delay = self._retry_delay * 2 ** (attempt - 1)
+        self._retries[job] = asyncio.get_running_loop().call_later(delay, self._requeue, job)
+
+    def _requeue(self, job: _Job) -> None:
+        del self._retries[job]
+        self._queue.put_nowait(job)
@@ -0,0 +1,224 @@
+import calendar
+import math
+import threading
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, FrozenSet, Iterable, List, Protocol, Sequence, Tuple
+from src.models.caravan import Caravan
+from src.exceptions.reservation import InvalidDateError
+
+
+class PricingRule(Protocol):
+    """
+    One step of the pricing pipeline. `apply` adjusts the per-night prices of
+    a stay in place; `prices[i]` is the price of the night of start_date + i.
+    """
+    def apply(self, caravan: Caravan, start_date: date, prices: List[float]) -> None:
+        ...
+
+
+@dataclass(frozen=True)
+class WeekendMultiplier:
+    """Multiplies the price of the nights starting on the given weekdays (default: Friday, Saturday)."""
+    multiplier: float
+    weekdays: FrozenSet[int] = frozenset({4, 5})
+
+    def apply(self, caravan: Caravan, start_date: date, prices: List[float]) -> None:
+        first = start_date.weekday()
+        for weekday in self.weekdays:
+            # Nights on one weekday are every 7th entry, so each is a single slice.
+            offset = (weekday - first) % 7
+            prices[offset::7] = [p * self.multiplier for p in prices[offset::7]]
+
+
+@dataclass(frozen=True)
+class SeasonalMultiplier:
+    """Multiplies the price of the nights falling in the given months (1-12)."""
+    months: FrozenSet[int]
+    multiplier: float
+
+    def apply(self, caravan: Caravan, start_date: date, prices: List[float]) -> None:
+        # Walk the stay month by month and scale whole in-season slices.
+        lo, year, month, day = 0, start_date.year, start_date.month, start_date.day
+        while lo < len(prices):
+            hi = min(len(prices), lo + calendar.monthrange(year, month)[1] - day + 1)
+            if month in self.months:
+                prices[lo:hi] = [p * self.multiplier for p in prices[lo:hi]]
+            lo, day = hi, 1
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+
+
+@dataclass(frozen=True)
+class LengthOfStayDiscount:
+    """Discounts every night by `discount` (e.g. 0.1 for 10%) for stays of at least `min_nights`."""
+    min_nights: int
+    discount: float
+
+    def apply(self, caravan: Caravan, start_date: date, prices: List[float]) -> None:
+        if len(prices) >= self.min_nights:
+            factor = 1.0 - self.discount
+            prices[:] = [p * factor for p in prices]
+
+
+@dataclass(frozen=True)
+class LocationSurcharge:
+    """Adds a fixed amount per night for caravans in the given location."""
+    location: str
+    amount: float
+
+    def apply(self, caravan: Caravan, start_date: date, prices: List[float]) -> None:
+        if caravan.location == self.location:
+            prices[:] = [p + self.amount for p in prices]
+
+
+# Rule names for `rules_from_config`.
+_RULE_TYPES = {
+    "weekend": WeekendMultiplier,
+    "seasonal": SeasonalMultiplier,
+    "length_of_stay": LengthOfStayDiscount,
+    "location": LocationSurcharge,
+}
+
+
+def rules_from_config(entries: Iterable[Dict[str, Any]]) -> List[PricingRule]:
+    """
+    Builds a rule pipeline from plain records such as
+    `{"rule": "seasonal", "months": [7, 8], "multiplier": 1.3}`, in order.
+    The other keys are the rule's fields.
+
+    Raises:
+        ValueError: If a rule name is unknown or its fields do not match.
+    """
+    rules = []
+    for entry in entries:
+        fields = dict(entry)
+        name = fields.pop("rule", None)
+        if name not in _RULE_TYPES:
+            raise ValueError(f"Unknown pricing rule '{name}'.")
+        for key in ("weekdays", "months"):
+            if key in fields:
+                fields[key] = frozenset(fields[key])
+        try:
+            rules.append(_RULE_TYPES[name](**fields))
+        except TypeError as e:
+            raise ValueError(f"Invalid fields for pricing rule '{name}': {e}") from None
+    return rules
+
+
+@dataclass(frozen=True)
+class Quote:
+    """The price of a stay, night by night."""
+    caravan_id: uuid.UUID
+    start_date: date
+    end_date: date
+    nightly_prices: Tuple[float, ...]
+    total_price: float
+
+
+class PricingEngine:
+    """
+    Prices stays by running the caravan's daily rate through a pipeline of rules.
+
+    Rules are applied in order. Quotes are memoized in an LRU cache keyed on
+    the caravan, the rule-set version and the date range; replacing the rules
+    bumps the version, so cached quotes never outlive the rules they were
+    computed with. `price` keeps only the totals, in a cache of its own, so
+    pricing bookings does not pin their night-by-night prices. Without rules a
+    stay costs `nights * daily_rate`.
+    """
+    def __init__(self, rules: Sequence[PricingRule] = (), cache_size: int = 4096):
+        self._rules: Tuple[PricingRule, ...] = tuple(rules)
+        self._version = 0
+        self._cache_size = cache_size
+        self._cache: "OrderedDict[Tuple, Quote]" = OrderedDict()
+        self._totals: "OrderedDict[Tuple, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def rules(self) -> Tuple[PricingRule, ...]:
+        return self._rules
+
+    @property
+    def version(self) -> int:
+        """A counter that changes whenever the rule set is replaced."""
+        return self._version
+
+    def set_rules(self, rules: Sequence[PricingRule]) -> None:
+        """Replaces the rule pipeline and invalidates every cached quote."""
+        with self._lock:
+            self._rules = tuple(rules)
+            self._version += 1
+            self._cache.clear()
+            self._totals.clear()
+
+    def quote(self, caravan: Caravan, start_date: date, end_date: date, max_nights: int | None = None) -> Quote:
+        """
+        Returns the price of staying in the caravan from start_date to end_date.
+        The work and the size of the quote grow with the stay, so callers
+        pricing untrusted ranges should pass `max_nights`.
+
+        Raises:
+            InvalidDateError: If the end date is not after the start date, or
+                the stay is longer than `max_nights`.
+        """
+        nights = _nights(start_date, end_date, max_nights)
+        key, version, rules, quote = self._lookup(self._cache, caravan, start_date, end_date)
+        if quote is not None:
+            return quote
+
+        nightly = _nightly_prices(rules, caravan, start_date, nights)
+        quote = Quote(caravan.id, start_date, end_date, nightly, round(math.fsum(nightly), 2))
+        self._store(self._cache, key, version, quote)
+        return quote
+
+    def price(self, caravan: Caravan, start_date: date, end_date: date, max_nights: int | None = None) -> float:
+        """
+        Returns the total price of a stay, the same as its quote's `total_price`.
+
+        Raises:
+            InvalidDateError: If the end date is not after the start date, or
+                the stay is longer than `max_nights`.
+        """
+        nights = _nights(start_date, end_date, max_nights)
+        key, version, rules, total = self._lookup(self._totals, caravan, start_date, end_date)
+        if total is not None:
+            return total
+
+        total = round(math.fsum(_nightly_prices(rules, caravan, start_date, nights)), 2)
+        self._store(self._totals, key, version, total)
+        return total
+
+    def _lookup(self, cache: OrderedDict, caravan: Caravan, start_date: date, end_date: date) -> Tuple:
+        with self._lock:
+            version = self._version
+            # The rate and location are part of the key as the rules depend on them.
+            key = (caravan.id, caravan.daily_rate, caravan.location, version, start_date, end_date)
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+            return key, version, self._rules, cached
+
+    def _store(self, cache: OrderedDict, key: Tuple, version: int, value) -> None:
+        with self._lock:
+            if self._version == version:
+                cache[key] = value
+                if len(cache) > self._cache_size:
+                    cache.popitem(last=False)
+
+
+def _nights(start_date: date, end_date: date, max_nights: int | None) -> int:
+    nights = (end_date - start_date).days
+    if nights <= 0:
+        raise InvalidDateError("End date must be after start date.")
+    if max_nights is not None and nights > max_nights:
+        raise InvalidDateError(f"Stay must not be longer than {max_nights} nights.")
+    return nights
+
+
+def _nightly_prices(rules: Sequence[PricingRule], caravan: Caravan, start_date: date, nights: int) -> Tuple[float, ...]:
+    prices = [caravan.daily_rate] * nights
+    for rule in rules:
+        rule.apply(caravan, start_date, prices)
+    return tuple(round(p, 2) for p in prices)
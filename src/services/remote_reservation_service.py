@@ -0,0 +1,106 @@
+import logging
+import queue
+import uuid
+from datetime import date
+from multiprocessing.connection import Client, Connection
+from typing import Any, List, Sequence
+from src.models.reservation import Reservation
+from src.repositories.replication import ReplicaFeed
+from src.services.reservation_owner import COMMANDS
+from src.services.reservation_service import BookingRequest, BookingResult, BulkMode
+
+logger = logging.getLogger(__name__)
+
+
+class RemoteReservationService:
+    """
+    Stands in for ReservationService in a worker process.
+
+    Every write is executed by the ReservationOwner. A call returns once the
+    worker's replica has applied the events of that write, so a request that
+    follows on the same worker reads its own write. Connections to the owner
+    are pooled, one per concurrent caller.
+    """
+    def __init__(self, address: str, feed: ReplicaFeed, authkey: bytes, timeout: float = 5.0):
+        self._address = address
+        self._feed = feed
+        self._authkey = authkey
+        self._timeout = timeout
+        self._idle: queue.SimpleQueue = queue.SimpleQueue()
+
+    def create_reservation(
+        self,
+        guest_id: uuid.UUID,
+        caravan_id: uuid.UUID,
+        start_date: date,
+        end_date: date,
+        idempotency_key: str | None = None,
+    ) -> Reservation:
+        """See ReservationService.create_reservation. Idempotency keys are tracked by the owner."""
+        return self._call("create_reservation", guest_id, caravan_id, start_date, end_date, idempotency_key)
+
+    def create_reservations_bulk(
+        self, requests: Sequence[BookingRequest], mode: BulkMode = BulkMode.BEST_EFFORT
+    ) -> List[BookingResult]:
+        """See ReservationService.create_reservations_bulk."""
+        return self._call("create_reservations_bulk", list(requests), mode)
+
+    def approve_reservation(self, reservation_id: uuid.UUID) -> Reservation:
+        """See ReservationService.approve_reservation."""
+        return self._call("approve_reservation", reservation_id)
+
+    def reject_reservation(self, reservation_id: uuid.UUID) -> Reservation:
+        """See ReservationService.reject_reservation."""
+        return self._call("reject_reservation", reservation_id)
+
+    def cancel_reservation(self, reservation_id: uuid.UUID) -> Reservation:
+        """See ReservationService.cancel_reservation."""
+        return self._call("cancel_reservation", reservation_id)
+
+    def complete_reservation(self, reservation_id: uuid.UUID) -> Reservation:
+        """See ReservationService.complete_reservation."""
+        return self._call("complete_reservation", reservation_id)
+
+    def complete_past_reservations(self, today: date | None = None) -> List[Reservation]:
+        """See ReservationService.complete_past_reservations."""
+        return self._call("complete_past_reservations", today)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    def _call(self, command: str, *args: Any) -> Any:
+        """
+        Runs a command on the owner and re-raises its exception, if any.
+
+        Raises:
+            ConnectionError: If the owner cannot be reached.
+        """
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            conn.send((command, args))
+            status, value, seq = conn.recv()
+        except (EOFError, OSError) as e:
+            conn.close()
+            raise ConnectionError(f"Lost the connection to the reservation owner at {self._address}.") from e
+        self._idle.put(conn)
+
+        if not self._feed.wait_for(seq, self._timeout):
+            logger.warning("Replica is behind the owner; returning before event %d was applied.", seq)
+        if status == "error":
+            raise value
+        return value
+
+    def _connect(self) -> Connection:
+        try:
+            conn = Client(self._address, authkey=self._authkey)
+        except OSError as e:
+            raise ConnectionError(f"Cannot reach the reservation owner at {self._address}.") from e
+        conn.send(COMMANDS)
+        return conn
@@ -0,0 +1,76 @@
+from datetime import date
+from typing import Dict
+import uuid
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.columnar_store import ColumnarReservationStore
+from src.exceptions.reservation import InvalidDateError
+
+class ReportingService:
+    """
+    Builds occupancy and revenue reports for hosts and operators from the
+    columnar reservation store.
+    """
+    def __init__(self, store: ColumnarReservationStore, caravan_repo: CaravanRepository):
+        self._store = store
+        self._caravan_repo = caravan_repo
+
+    def occupancy_rates(self, start_date: date, end_date: date) -> Dict[uuid.UUID, float]:
+        """
+        Returns the share of nights in [start_date, end_date) each caravan is
+        booked, for every caravan in the fleet.
+
+        Raises:
+            InvalidDateError: If the date range is invalid.
+        """
+        days = self._validate_range(start_date, end_date)
+        nights = self._store.occupied_nights(start_date, end_date)
+        return {c.id: nights.get(c.id, 0) / days for c in self._caravan_repo.get_all()}
+
+    def monthly_occupancy(self, start_date: date, end_date: date) -> Dict[uuid.UUID, Dict[str, int]]:
+        """
+        Returns the occupied nights per caravan and calendar month.
+
+        Raises:
+            InvalidDateError: If the date range is invalid.
+        """
+        self._validate_range(start_date, end_date)
+        return self._store.occupied_nights_by_month(start_date, end_date)
+
+    def revenue_by_location(self, start_date: date, end_date: date) -> Dict[str, float]:
+        """
+        Returns the revenue earned in the date range, summed per caravan location.
+
+        Raises:
+            InvalidDateError: If the date range is invalid.
+        """
+        self._validate_range(start_date, end_date)
+        totals: Dict[str, float] = {}
+        for caravan_id, amount in self._store.revenue(start_date, end_date).items():
+            caravan = self._caravan_repo.get_by_id(caravan_id)
+            if caravan is not None:
+                totals[caravan.location] = totals.get(caravan.location, 0.0) + amount
+        return totals
+
+    def host_payouts(self, start_date: date, end_date: date, commission_rate: float = 0.0) -> Dict[uuid.UUID, float]:
+        """
+        Returns what each host is owed for the date range, after deducting
+        the platform commission.
+
+        Raises:
+            InvalidDateError: If the date range is invalid.
+            ValueError: If the commission rate is not between 0 and 1.
+        """
+        self._validate_range(start_date, end_date)
+        if not 0.0 <= commission_rate <= 1.0:
+            raise ValueError("Commission rate must be between 0 and 1.")
+        totals: Dict[uuid.UUID, float] = {}
+        for caravan_id, amount in self._store.revenue(start_date, end_date).items():
+            caravan = self._caravan_repo.get_by_id(caravan_id)
+            if caravan is not None:
+                totals[caravan.host_id] = totals.get(caravan.host_id, 0.0) + amount * (1.0 - commission_rate)
+        return totals
+
+    def _validate_range(self, start_date: date, end_date: date) -> int:
+        if start_date >= end_date:
+            raise InvalidDateError("End date must be after start date.")
+        return (end_date - start_date).days
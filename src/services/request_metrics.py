@@ -0,0 +1,48 @@
+import time
+from src.services.metrics import MetricsRegistry
+from src.services.profiler import RequestProfiler
+
+
+class RequestMetricsMiddleware:
+    """
+    ASGI middleware that records every HTTP request's duration in
+    `http_request_duration_seconds`, labelled by method, route template and
+    status, and hands requests to an optional RequestProfiler.
+
+    The route template (e.g. "/api/caravans/{caravan_id}") comes from the
+    route the router matched, so label cardinality stays bounded; requests
+    no route matched are labelled "<unmatched>". It is a plain ASGI app
+    rather than a BaseHTTPMiddleware so the response is not buffered or
+    re-wrapped on the way out.
+    """
+    def __init__(self, app, registry: MetricsRegistry, profiler: RequestProfiler | None = None):
+        self._app = app
+        self._registry = registry
+        self._profiler = profiler
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or (not self._registry.enabled and self._profiler is None):
+            await self._app(scope, receive, send)
+            return
+        status = 500
+        sampler = self._profiler.start(scope) if self._profiler is not None else None
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            route = getattr(scope.get("route"), "path", "<unmatched>")
+            if self._registry.enabled:
+                self._registry.histogram(
+                    "http_request_duration_seconds", "Time to serve HTTP requests.",
+                    method=scope["method"], route=route, status=str(status),
+                ).observe(elapsed)
+            if sampler is not None:
+                self._profiler.finish(sampler, f"{scope['method']} {route}")
@@ -0,0 +1,51 @@
+import uuid
+from dataclasses import dataclass
+from datetime import date
+from typing import List
+from src.models.reservation import Reservation
+from src.models.user import User, UserRole
+from src.repositories.user_reservation_index import UserReservationIndex
+
+
+@dataclass(frozen=True)
+class ReservationPage:
+    """One page of a user's reservations plus the cursor for the next page, if any."""
+    reservations: List[Reservation]
+    next_cursor: str | None
+
+
+class ReservationListingService:
+    """
+    Lists reservations per user: the bookings a guest made, or the bookings
+    on every caravan a host owns, with start-date filters and cursor paging.
+    """
+    def __init__(self, index: UserReservationIndex, max_page_size: int = 500):
+        self._index = index
+        self._max_page_size = max_page_size
+
+    def list_for_user(
+        self,
+        user: User,
+        start_from: date | None = None,
+        start_before: date | None = None,
+        cursor: str | None = None,
+        limit: int = 50,
+    ) -> ReservationPage:
+        """
+        Returns one page of the user's reservations ordered by start date,
+        starting after `cursor`. Hosts see the reservations on their caravans.
+
+        Raises:
+            ValueError: If the cursor is malformed or unknown, or the limit is not positive.
+        """
+        if limit <= 0:
+            raise ValueError("Limit must be positive.")
+        limit = min(limit, self._max_page_size)
+        after = uuid.UUID(cursor) if cursor else None
+        select = self._index.for_host if user.role == UserRole.HOST else self._index.for_guest
+        reservations = select(user.id, start_from, start_before, after, limit + 1)
+        next_cursor = None
+        if len(reservations) > limit:
+            reservations = reservations[:limit]
+            next_cursor = str(reservations[-1].id)
+        return ReservationPage(reservations, next_cursor)
@@ -0,0 +1,176 @@
+import logging
+import os
+import queue
+import secrets
+import stat
+import threading
+from concurrent.futures import Future
+from multiprocessing.connection import Connection, Listener
+from typing import Any, Callable
+from src.repositories.replication import SUBSCRIBE, EventPublisher
+from src.services.reservation_service import ReservationService
+
+logger = logging.getLogger(__name__)
+
+COMMANDS = "commands"
+
+# The ReservationService methods workers may call.
+_ALLOWED_COMMANDS = frozenset({
+    "create_reservation",
+    "create_reservations_bulk",
+    "approve_reservation",
+    "reject_reservation",
+    "cancel_reservation",
+    "complete_reservation",
+    "complete_past_reservations",
+})
+
+
+def load_or_create_authkey(path: str) -> bytes:
+    """
+    Returns the authkey stored at `path`, first writing a random one if the
+    file does not exist. The file is created readable by this user only.
+
+    Raises:
+        PermissionError: If an existing file is not private to this user.
+    """
+    try:
+        return read_authkey(path)
+    except FileNotFoundError:
+        pass
+    key = secrets.token_hex(32).encode()
+    # O_EXCL refuses a file someone else slipped in since the read above.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | os.O_NOFOLLOW, 0o600)
+    with os.fdopen(fd, "wb") as file:
+        file.write(key)
+    return key
+
+
+def read_authkey(path: str) -> bytes:
+    """
+    Reads the authkey an owner stored at `path`.
+
+    Raises:
+        FileNotFoundError: If there is no key file.
+        PermissionError: If the file is not owned by this user or is accessible to others.
+    """
+    fd = os.open(path, os.O_RDONLY | os.O_NOFOLLOW)
+    with os.fdopen(fd, "rb") as file:
+        status = os.fstat(fd)
+        if status.st_uid != os.getuid() or status.st_mode & (stat.S_IRWXG | stat.S_IRWXO):
+            raise PermissionError(f"Key file {path} must be owned by this user and private to it.")
+        return file.read().strip()
+
+
+class ReservationOwner:
+    """
+    Owns the authoritative repositories for a group of worker processes.
+
+    Workers keep replicas fed by the owner's EventPublisher and serve reads
+    from them. Every write is sent here over a local socket and run by a
+    single writer thread, so booking checks never race across processes.
+    Each reply carries the sequence number of the last event the write
+    produced, letting the worker wait until its replica reflects the write.
+
+    Commands arrive pickled, so only authenticated peers may connect: every
+    connection must prove it knows `authkey`, and the socket is made
+    accessible to this user only.
+    """
+    def __init__(
+        self,
+        service: ReservationService,
+        publisher: EventPublisher,
+        address: str,
+        authkey: bytes,
+    ):
+        if not authkey:
+            raise ValueError("An authkey is required.")
+        self._service = service
+        self._publisher = publisher
+        self._address = address
+        self._authkey = authkey
+        self._listener: Listener | None = None
+        self._writes: queue.SimpleQueue = queue.SimpleQueue()
+        self._writer = threading.Thread(target=self._write_loop, name="owner-writer", daemon=True)
+
+    def start(self) -> None:
+        """Starts accepting workers on the socket."""
+        if os.path.exists(self._address):
+            # Left behind by an owner that did not shut down cleanly.
+            os.unlink(self._address)
+        self._listener = Listener(self._address, family="AF_UNIX", authkey=self._authkey)
+        os.chmod(self._address, 0o600)
+        self._writer.start()
+        threading.Thread(target=self._accept_loop, name="owner-accept", daemon=True).start()
+        logger.info("Reservation owner listening on %s.", self._address)
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> Future:
+        """Runs fn(*args) on the writer thread, after every write submitted before it."""
+        future: Future = Future()
+        self._writes.put((fn, args, future))
+        return future
+
+    def close(self) -> None:
+        """Stops accepting workers, finishes queued writes and disconnects the replicas."""
+        if self._listener is not None:
+            self._listener.close()
+        self._writes.put(None)
+        self._writer.join()
+        self._publisher.close()
+
+    def _write_loop(self) -> None:
+        while True:
+            item = self._writes.get()
+            if item is None:
+                return
+            fn, args, future = item
+            try:
+                future.set_result(fn(*args))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def _accept_loop(self) -> None:
+        while True:
+            try:
+                conn = self._listener.accept()
+            except OSError:
+                return  # The listener was closed.
+            except Exception:
+                logger.exception("Rejected a connection.")
+                continue
+            threading.Thread(target=self._serve, args=(conn,), name="owner-connection", daemon=True).start()
+
+    def _serve(self, conn: Connection) -> None:
+        try:
+            role = conn.recv()
+            if role == SUBSCRIBE:
+                self.submit(self._publisher.add_subscriber, conn).result()
+            elif role == COMMANDS:
+                self._serve_commands(conn)
+            else:
+                conn.close()
+        except (EOFError, OSError):
+            conn.close()
+
+    def _serve_commands(self, conn: Connection) -> None:
+        """Answers (command, args) requests with ("ok" | "error", value, seq) replies."""
+        with conn:
+            while True:
+                command, args = conn.recv()
+                if command not in _ALLOWED_COMMANDS:
+                    conn.send(("error", ValueError(f"Unknown command {command!r}."), self._publisher.seq))
+                    continue
+                reply = self.submit(self._run_command, getattr(self._service, command), args).result()
+                try:
+                    conn.send(reply)
+                except Exception:
+                    # The result or exception could not be pickled.
+                    conn.send(("error", RuntimeError(repr(reply[1])), reply[2]))
+
+    def _run_command(self, method: Callable[..., Any], args: tuple) -> tuple[str, Any, int]:
+        try:
+            outcome = ("ok", method(*args))
+        except Exception as e:
+            outcome = ("error", e)
+        # Nothing else writes until this returns, so seq is the write's last event.
+        return (*outcome, self._publisher.seq)
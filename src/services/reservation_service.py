@@ -1,11 +1,50 @@
+from dataclasses import dataclass
 from datetime import date
+from enum import Enum
+from typing import Dict, List, Sequence
 import uuid
-from src.models.reservation import Reservation
+from src.models.caravan import Caravan
+from src.models.interning import intern_date
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.user import User
 from src.repositories.reservation_repository import ReservationRepository
 from src.repositories.caravan_repository import CaravanRepository
 from src.repositories.user_repository import UserRepository
 from src.services.reservation_validator import ReservationValidator
-from src.exceptions.reservation import ReservationError
+from src.services.pricing_engine import PricingEngine
+from src.services.idempotency_cache import IdempotencyCache
+from src.exceptions.reservation import ReservationError, BookingConflictError, InvalidStatusTransitionError
+
+@dataclass(frozen=True)
+class BookingRequest:
+    """A single booking inside a bulk reservation request."""
+    guest_id: uuid.UUID
+    caravan_id: uuid.UUID
+    start_date: date
+    end_date: date
+
+@dataclass
+class BookingResult:
+    """The outcome of one BookingRequest: the created reservation or an error message."""
+    request: BookingRequest
+    reservation: Reservation | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.reservation is not None
+
+class BulkMode(Enum):
+    ATOMIC = "atomic"            # Create every reservation or none of them
+    BEST_EFFORT = "best_effort"  # Create the valid reservations, report the rest
+
+# The statuses a reservation may move to, each with the statuses it may come from.
+_ALLOWED_TRANSITIONS: Dict[ReservationStatus, frozenset] = {
+    ReservationStatus.APPROVED: frozenset({ReservationStatus.PENDING}),
+    ReservationStatus.REJECTED: frozenset({ReservationStatus.PENDING}),
+    ReservationStatus.CANCELLED: frozenset({ReservationStatus.PENDING, ReservationStatus.APPROVED}),
+    ReservationStatus.COMPLETED: frozenset({ReservationStatus.APPROVED}),
+}
 
 class ReservationService:
     """
@@ -17,22 +56,44 @@ class ReservationService:
         caravan_repo: CaravanRepository,
         user_repo: UserRepository,
         validator: ReservationValidator,
+        pricing_engine: PricingEngine | None = None,
+        idempotency_cache: IdempotencyCache | None = None,
     ):
         self._reservation_repo = reservation_repo
         self._caravan_repo = caravan_repo
         self._user_repo = user_repo
         self._validator = validator
+        self._pricing_engine = pricing_engine or PricingEngine()
+        self._idempotency_cache = idempotency_cache or IdempotencyCache()
 
     def create_reservation(
-        self, guest_id: uuid.UUID, caravan_id: uuid.UUID, start_date: date, end_date: date
+        self,
+        guest_id: uuid.UUID,
+        caravan_id: uuid.UUID,
+        start_date: date,
+        end_date: date,
+        idempotency_key: str | None = None,
     ) -> Reservation:
         """
         Creates and stores a new reservation after validating the request.
 
+        With an `idempotency_key`, a retry of the same request by the same
+        guest returns the original reservation (or raises the original
+        error) without validating again, even while the first attempt is
+        still running.
+
         Raises:
             ValueError: If the guest or caravan cannot be found.
             ReservationError: If the reservation request is invalid.
+            IdempotencyKeyMismatchError: If the key was used for a different request.
         """
+        if idempotency_key is not None:
+            return self._idempotency_cache.run(
+                (guest_id, idempotency_key),
+                (caravan_id, start_date, end_date),
+                lambda: self.create_reservation(guest_id, caravan_id, start_date, end_date),
+            )
+
         guest = self._user_repo.get_by_id(guest_id)
         if not guest:
             raise ValueError(f"Guest with ID {guest_id} not found.")
@@ -41,31 +102,173 @@ class ReservationService:
         if not caravan:
             raise ValueError(f"Caravan with ID {caravan_id} not found.")
 
-        # 1. Validation: Delegate to the validator service.
-        self._validator.execute(caravan, start_date, end_date)
+        # Validation and storage happen under the caravan's lock so that two
+        # concurrent requests cannot both pass the conflict check.
+        with self._reservation_repo.lock_for(caravan_id):
+            # 1. Validation: Delegate to the validator service.
+            self._validator.execute(caravan, start_date, end_date)
+
+            # 2. Calculation: Determine the total price.
+            total_price = self._calculate_price(caravan, start_date, end_date)
+
+            # 3. Creation: Instantiate the new reservation object.
+            # A Factory pattern could be used here if creation becomes more complex.
+            # IDs are taken from the stored entities and dates are interned, so
+            # reservations share these objects instead of holding their own copies.
+            new_reservation = Reservation(
+                guest_id=guest.id,
+                caravan_id=caravan.id,
+                start_date=intern_date(start_date),
+                end_date=intern_date(end_date),
+                total_price=total_price,
+            )
+
+            # 4. Storage: Persist the new reservation.
+            self._reservation_repo.add(new_reservation)
+
+        # Payment is started by PaymentService, which listens to the repository
+        # (Observer pattern); notifications to the host/guest could follow suit.
+
+        return new_reservation
+
+    def create_reservations_bulk(
+        self, requests: Sequence[BookingRequest], mode: BulkMode = BulkMode.BEST_EFFORT
+    ) -> List[BookingResult]:
+        """
+        Creates many reservations in one call and returns one result per
+        request, in request order.
+
+        Requests are grouped by caravan and sorted by start date, so a single
+        sweep per caravan detects conflicts with existing reservations (via the
+        validator) and with earlier requests of the same batch. All involved
+        caravans are locked for the whole batch. In ATOMIC mode nothing is
+        stored unless every request succeeds.
+        """
+        results = [BookingResult(request=r) for r in requests]
+        guests: Dict[uuid.UUID, User | None] = {}
+        caravans: Dict[uuid.UUID, Caravan | None] = {}
+        by_caravan: Dict[uuid.UUID, List[BookingResult]] = {}
+
+        for result in results:
+            request = result.request
+            if request.guest_id not in guests:
+                guests[request.guest_id] = self._user_repo.get_by_id(request.guest_id)
+            if guests[request.guest_id] is None:
+                result.error = f"Guest with ID {request.guest_id} not found."
+                continue
+            if request.caravan_id not in caravans:
+                caravans[request.caravan_id] = self._caravan_repo.get_by_id(request.caravan_id)
+            if caravans[request.caravan_id] is None:
+                result.error = f"Caravan with ID {request.caravan_id} not found."
+                continue
+            by_caravan.setdefault(request.caravan_id, []).append(result)
+
+        with self._reservation_repo.lock_many(by_caravan):
+            for caravan_id, group in by_caravan.items():
+                caravan = caravans[caravan_id]
+                group.sort(key=lambda r: r.request.start_date)
+                # Latest end date among the accepted requests of this caravan;
+                # since the group is sorted by start, any overlap with an
+                # earlier request shows up as a start before this date.
+                booked_until: date | None = None
+                for result in group:
+                    request = result.request
+                    try:
+                        self._validator.execute(caravan, request.start_date, request.end_date)
+                        if booked_until is not None and request.start_date < booked_until:
+                            raise BookingConflictError(
+                                "Caravan is already booked by another request in this batch "
+                                f"until {booked_until}."
+                            )
+                        total_price = self._calculate_price(caravan, request.start_date, request.end_date)
+                    except ReservationError as e:
+                        result.error = str(e)
+                        continue
+                    result.reservation = Reservation(
+                        guest_id=guests[request.guest_id].id,
+                        caravan_id=caravan.id,
+                        start_date=intern_date(request.start_date),
+                        end_date=intern_date(request.end_date),
+                        total_price=total_price,
+                    )
+                    booked_until = request.end_date
+
+            created = [r.reservation for r in results if r.reservation is not None]
+            if mode == BulkMode.ATOMIC and len(created) != len(results):
+                for result in results:
+                    if result.reservation is not None:
+                        result.reservation = None
+                        result.error = "Not created because another request in the batch failed."
+                return results
+
+            self._reservation_repo.add_many(created)
+        return results
+
+    def approve_reservation(self, reservation_id: uuid.UUID) -> Reservation:
+        """
+        Approves a pending reservation.
+
+        Raises:
+            ValueError: If the reservation cannot be found.
+            InvalidStatusTransitionError: If the reservation is not pending.
+        """
+        return self._transition(reservation_id, ReservationStatus.APPROVED)
+
+    def reject_reservation(self, reservation_id: uuid.UUID) -> Reservation:
+        """
+        Rejects a pending reservation, releasing its dates.
+
+        Raises:
+            ValueError: If the reservation cannot be found.
+            InvalidStatusTransitionError: If the reservation is not pending.
+        """
+        return self._transition(reservation_id, ReservationStatus.REJECTED)
+
+    def cancel_reservation(self, reservation_id: uuid.UUID) -> Reservation:
+        """
+        Cancels a pending or approved reservation, releasing its dates.
+
+        Raises:
+            ValueError: If the reservation cannot be found.
+            InvalidStatusTransitionError: If the reservation is already closed.
+        """
+        return self._transition(reservation_id, ReservationStatus.CANCELLED)
+
+    def complete_reservation(self, reservation_id: uuid.UUID) -> Reservation:
+        """
+        Marks an approved reservation whose stay has ended as completed.
+
+        Raises:
+            ValueError: If the reservation cannot be found.
+            InvalidStatusTransitionError: If the reservation is not approved or has not ended yet.
+        """
+        reservation = self._reservation_repo.get_by_id(reservation_id)
+        if reservation is None:
+            raise ValueError(f"Reservation with id {reservation_id} not found.")
+        if reservation.end_date > date.today():
+            raise InvalidStatusTransitionError("Reservation cannot be completed before its end date.")
+        return self._transition(reservation_id, ReservationStatus.COMPLETED)
+
+    def complete_past_reservations(self, today: date | None = None) -> List[Reservation]:
+        """
+        Completes every approved reservation that ended on or before `today`
+        (default: the current date) in one bulk update, and returns them.
+        """
+        return self._reservation_repo.transition_ended(
+            ReservationStatus.APPROVED, ReservationStatus.COMPLETED, today or date.today()
+        )
 
-        # 2. Calculation: Determine the total price.
+    def _transition(self, reservation_id: uuid.UUID, status: ReservationStatus) -> Reservation:
+        # The repository checks the current status and applies the change
+        # atomically, so concurrent transitions cannot both succeed.
+        return self._reservation_repo.update_status(
+            reservation_id, status, expected=_ALLOWED_TRANSITIONS[status]
+        )
+
+    def _calculate_price(self, caravan: Caravan, start_date: date, end_date: date) -> float:
+        """Returns the total price of a stay."""
         duration_days = (end_date - start_date).days
         if duration_days <= 0:
             # This case should be caught by the validator, but as a safeguard:
             raise ReservationError("Reservation must be for at least one day.")
-        total_price = duration_days * caravan.daily_rate
-
-        # 3. Creation: Instantiate the new reservation object.
-        # A Factory pattern could be used here if creation becomes more complex.
-        new_reservation = Reservation(
-            guest_id=guest_id,
-            caravan_id=caravan_id,
-            start_date=start_date,
-            end_date=end_date,
-            total_price=total_price,
-        )
-
-        # 4. Storage: Persist the new reservation.
-        self._reservation_repo.add(new_reservation)
-
-        # In a real application, this is where you might trigger other processes,
-        # such as payment processing or sending notifications to the host/guest
-        # (potentially using an Observer pattern).
-        
-        return new_reservation
+        return self._pricing_engine.price(caravan, start_date, end_date)
@@ -0,0 +1,48 @@
+import asyncio
+import logging
+from src.services.async_reservation_service import AsyncReservationService
+
+logger = logging.getLogger(__name__)
+
+
+class ReservationSweeper:
+    """
+    Periodically completes approved reservations whose stay has ended.
+
+    Each sweep is one bulk transition in the repository rather than an
+    update per reservation, so it stays cheap however many stays ended.
+    """
+    def __init__(self, service: AsyncReservationService, interval_seconds: float = 3600.0):
+        self._service = service
+        self._interval = interval_seconds
+        self._task: asyncio.Task | None = None
+
+    async def sweep(self) -> int:
+        """Runs one sweep and returns the number of reservations completed."""
+        completed = await self._service.complete_past_reservations()
+        if completed:
+            logger.info("Completed %d ended reservations.", len(completed))
+        return len(completed)
+
+    def start(self) -> None:
+        """Starts sweeping in the background on the running event loop."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stops the background sweeps."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception:
+                logger.exception("Reservation sweep failed.")
+            await asyncio.sleep(self._interval)
@@ -7,11 +7,14 @@ from src.exceptions.reservation import (
     CaravanNotAvailableError,
     BookingConflictError,
 )
-from src.models.reservation import ReservationStatus
+
+# Pricing and calendar work grow with the length of a stay, so bookings are capped.
+MAX_STAY_NIGHTS = 365
 
 class ReservationValidator:
-    def __init__(self, reservation_repo: ReservationRepository):
+    def __init__(self, reservation_repo: ReservationRepository, max_nights: int = MAX_STAY_NIGHTS):
         self._reservation_repo = reservation_repo
+        self._max_nights = max_nights
 
     def execute(self, caravan: Caravan, start_date: date, end_date: date) -> None:
         """
@@ -26,6 +29,8 @@ class ReservationValidator:
         """Ensures reservation dates are logical."""
         if start_date >= end_date:
             raise InvalidDateError("End date must be after start date.")
+        if (end_date - start_date).days > self._max_nights:
+            raise InvalidDateError(f"Stay must not be longer than {self._max_nights} nights.")
         if start_date < date.today():
             raise InvalidDateError("Start date cannot be in the past.")
 
@@ -36,13 +41,9 @@ class ReservationValidator:
 
     def _validate_booking_conflict(self, caravan_id: uuid.UUID, start_date: date, end_date: date) -> None:
         """Checks for overlapping reservations to prevent double booking."""
-        reservations = self._reservation_repo.get_for_caravan(caravan_id)
-        
-        for r in reservations:
-            if r.status in [ReservationStatus.CANCELLED, ReservationStatus.REJECTED]:
-                continue
-            # Check for overlap: (StartA < EndB) and (EndA > StartB)
-            if r.start_date < end_date and r.end_date > start_date:
-                raise BookingConflictError(
-                    f"Caravan is already booked between {r.start_date} and {r.end_date}."
-                )
+        # Cancelled and rejected reservations are excluded by the repository's index.
+        r = self._reservation_repo.find_conflict(caravan_id, start_date, end_date)
+        if r is not None:
+            raise BookingConflictError(
+                f"Caravan is already booked between {r.start_date} and {r.end_date}."
+            )
@@ -0,0 +1,88 @@
+import uuid
+from dataclasses import dataclass
+from typing import List
+from src.models.reservation import ReservationStatus
+from src.models.review import Review, RatingSummary
+from src.repositories.rating_index import RatingIndex
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.review_repository import ReviewRepository
+from src.exceptions.review import DuplicateReviewError, ReviewNotAllowedError
+
+
+@dataclass(frozen=True)
+class ReviewPage:
+    """One page of a target's reviews, its rating summary, and the cursor for the next page, if any."""
+    summary: RatingSummary
+    reviews: List[Review]
+    next_cursor: str | None
+
+
+class ReviewService:
+    """
+    Records guests' reviews of their stays and serves them with rating summaries.
+    """
+    def __init__(
+        self,
+        review_repo: ReviewRepository,
+        reservation_repo: ReservationRepository,
+        ratings: RatingIndex,
+        max_page_size: int = 100,
+    ):
+        self._review_repo = review_repo
+        self._reservation_repo = reservation_repo
+        self._ratings = ratings
+        self._max_page_size = max_page_size
+
+    def review_stay(self, reservation_id: uuid.UUID, author_id: uuid.UUID, rating: int, comment: str) -> Review:
+        """
+        Records the guest's review of the caravan they stayed in. The rating
+        also counts toward the caravan's host.
+
+        Raises:
+            ValueError: If the reservation cannot be found or the rating is not 1-5.
+            ReviewNotAllowedError: If the author is not the guest or the stay is not completed.
+            DuplicateReviewError: If the guest already reviewed this stay.
+        """
+        reservation = self._reservation_repo.get_by_id(reservation_id)
+        if reservation is None:
+            raise ValueError(f"Reservation with ID {reservation_id} not found.")
+        if reservation.guest_id != author_id:
+            raise ReviewNotAllowedError("Only the guest of a reservation can review it.")
+        if reservation.status != ReservationStatus.COMPLETED:
+            raise ReviewNotAllowedError("Only completed stays can be reviewed.")
+
+        review = Review(
+            reservation_id=reservation.id,
+            author_id=author_id,
+            target_id=reservation.caravan_id,
+            rating=rating,
+            comment=comment,
+        )
+        # One review per stay; the check and the insert share the caravan's lock.
+        with self._reservation_repo.lock_for(reservation.caravan_id):
+            if self._review_repo.get_for_reservation(reservation.id):
+                raise DuplicateReviewError("This stay has already been reviewed.")
+            self._review_repo.add(review)
+        return review
+
+    def summary(self, target_id: uuid.UUID) -> RatingSummary:
+        """Returns the rating summary of a caravan or host."""
+        return self._ratings.summary(target_id)
+
+    def list_reviews(self, target_id: uuid.UUID, cursor: str | None = None, limit: int = 20) -> ReviewPage:
+        """
+        Returns one page of the target's reviews, newest first, starting after `cursor`.
+
+        Raises:
+            ValueError: If the cursor is malformed or unknown, or the limit is not positive.
+        """
+        if limit <= 0:
+            raise ValueError("Limit must be positive.")
+        limit = min(limit, self._max_page_size)
+        after = uuid.UUID(cursor) if cursor else None
+        reviews = self._review_repo.get_for_target(target_id, after, limit + 1)
+        next_cursor = None
+        if len(reviews) > limit:
+            reviews = reviews[:limit]
+            next_cursor = str(reviews[-1].id)
+        return ReviewPage(self._ratings.summary(target_id), reviews, next_cursor)
@@ -0,0 +1,196 @@
+import heapq
+from itertools import compress
+from dataclasses import dataclass
+from datetime import date
+from typing import Callable, Iterator, List
+from src.models.caravan import Caravan, CaravanStatus
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.nightly_occupancy import NightlyOccupancy
+from src.repositories.search_index import CaravanSearchIndex
+from src.exceptions.reservation import InvalidDateError
+
+
+@dataclass(frozen=True)
+class SearchQuery:
+    """What a guest is looking for. Guests and the price range are hard filters."""
+    start_date: date | None = None
+    end_date: date | None = None
+    guests: int | None = None
+    location: str | None = None
+    min_daily_rate: float | None = None
+    max_daily_rate: float | None = None
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    caravan: Caravan
+    score: float
+
+
+class SearchService:
+    """
+    Ranks bookable caravans for a query and returns the best k.
+
+    A caravan's score is the weighted sum of four terms in [0, 1]: price,
+    rating, capacity fit (guests over capacity, so a caravan of the right
+    size beats a needlessly large one) and availability for the requested dates.
+
+    Instead of scoring and sorting the whole fleet, the search merges the
+    index's groups (one per capacity and price band) best-first, keyed by an
+    upper bound on each caravan's score, and keeps the k best caravans seen
+    in a min-heap. It stops once the best remaining bound cannot beat the
+    k-th result, so availability is only checked for the caravans visited.
+
+    With a NightlyOccupancy, a dated search first reads which caravans are
+    booked on the requested nights from it, then ranks the free caravans and
+    the booked ones separately. Booked caravans cannot earn the availability
+    term, so their bound leaves it out and the second merge stops early even
+    when the dates are sold out; when few caravans are free they are scored
+    directly instead of merged.
+    """
+    def __init__(
+        self,
+        reservation_repo: ReservationRepository,
+        index: CaravanSearchIndex,
+        max_results: int = 100,
+        occupancy: NightlyOccupancy | None = None,
+    ):
+        self._reservation_repo = reservation_repo
+        self._index = index
+        self._max_results = max_results
+        self._occupancy = occupancy
+
+    def search(self, query: SearchQuery, k: int = 20) -> List[SearchResult]:
+        """
+        Returns up to `k` available caravans matching the query, best score first.
+
+        Raises:
+            InvalidDateError: If only one date is given or the date range is invalid.
+            ValueError: If k is not positive.
+        """
+        if k <= 0:
+            raise ValueError("The number of results must be positive.")
+        k = min(k, self._max_results)
+        dated = query.start_date is not None
+        if dated != (query.end_date is not None):
+            raise InvalidDateError("Both start and end dates are required.")
+        if dated:
+            if query.start_date >= query.end_date:
+                raise InvalidDateError("End date must be after start date.")
+            if query.start_date < date.today():
+                raise InvalidDateError("Start date cannot be in the past.")
+
+        index = self._index
+        availability = index.weights.availability
+        booked = None
+        if dated and self._occupancy is not None:
+            booked = self._occupancy.booked_between(query.start_date, query.end_date)
+
+        best: List[tuple] = []  # (score, -sequence, caravan): the k best so far, worst on top
+        with index.lock:
+            if not dated:
+                self._merge(query, availability, best, k, lambda seq, caravan: availability)
+            elif booked is None:
+                self._merge(query, availability, best, k, lambda seq, caravan: self._free_bonus(query, caravan))
+            else:
+                size = len(index)
+                free = ~booked & ((1 << size) - 1)
+                booked_bytes = booked.to_bytes(max(size + 7, booked.bit_length() + 7) // 8, "little")
+                is_booked = lambda seq: booked_bytes[seq >> 3] >> (seq & 7) & 1
+                free_count = free.bit_count()
+                # Visiting k * size / free_count entries of the merge costs more than scoring every free caravan.
+                if free_count * free_count <= k * size:
+                    for seq in _set_bits(free, size):
+                        caravan = index.caravan_at(seq)
+                        if _matches(query, caravan):
+                            fit = self._fit(query, caravan.capacity)
+                            score = index.base_score(seq) + fit + self._free_bonus(query, caravan)
+                            _offer(best, k, (score, -seq, caravan))
+                else:
+                    self._merge(query, availability, best, k, lambda seq, caravan: (
+                        None if is_booked(seq) else self._free_bonus(query, caravan)
+                    ))
+                self._merge(query, 0.0, best, k, lambda seq, caravan: 0.0 if is_booked(seq) else None)
+
+        best.sort(key=lambda item: item[:2], reverse=True)
+        return [SearchResult(caravan, score) for score, _, caravan in best]
+
+    def _merge(
+        self,
+        query: SearchQuery,
+        slack: float,
+        best: List[tuple],
+        k: int,
+        bonus: Callable[[int, Caravan], float | None],
+    ) -> None:
+        """
+        Walks the query's groups best-first and offers each visited caravan to
+        `best`. A group's entries are keyed by base score; its capacity fit is
+        fixed and `bonus(seq, caravan)` adds at most `slack`, or returns None
+        to skip the caravan. Caller holds the index lock.
+        """
+        index = self._index
+        frontier = []  # (-upper bound, sequence, position, entries, fit)
+        for capacity, entries in index.streams(query.location, query.min_daily_rate, query.max_daily_rate):
+            if not entries or (query.guests is not None and capacity < query.guests):
+                continue
+            fit = self._fit(query, capacity)
+            key, seq = entries[0]
+            frontier.append((key - fit - slack, seq, 0, entries, fit))
+        heapq.heapify(frontier)
+
+        while frontier:
+            negative_bound, seq, position, entries, fit = frontier[0]
+            if len(best) == k and -negative_bound <= best[0][0]:
+                break
+            position += 1
+            if position < len(entries):
+                key, next_seq = entries[position]
+                heapq.heapreplace(frontier, (key - fit - slack, next_seq, position, entries, fit))
+            else:
+                heapq.heappop(frontier)
+
+            caravan = index.caravan_at(seq)
+            if not _matches(query, caravan):
+                continue
+            extra = bonus(seq, caravan)
+            if extra is not None:
+                _offer(best, k, (index.base_score(seq) + fit + extra, -seq, caravan))
+
+    def _fit(self, query: SearchQuery, capacity: int) -> float:
+        return self._index.weights.capacity * (min(1.0, query.guests / capacity) if query.guests else 1.0)
+
+    def _free_bonus(self, query: SearchQuery, caravan: Caravan) -> float:
+        # The occupancy ignores reservations it saw before the caravan was indexed, so free is confirmed here.
+        if self._reservation_repo.find_conflict(caravan.id, query.start_date, query.end_date) is None:
+            return self._index.weights.availability
+        return 0.0
+
+
+def _matches(query: SearchQuery, caravan: Caravan) -> bool:
+    """Applies the hard filters the index's groups only approximate."""
+    return (
+        caravan.status is CaravanStatus.AVAILABLE
+        and (query.location is None or caravan.location == query.location)
+        and (query.guests is None or caravan.capacity >= query.guests)
+        and (query.min_daily_rate is None or caravan.daily_rate >= query.min_daily_rate)
+        and (query.max_daily_rate is None or caravan.daily_rate <= query.max_daily_rate)
+    )
+
+
+def _offer(best: List[tuple], k: int, item: tuple) -> None:
+    if len(best) < k:
+        heapq.heappush(best, item)
+    elif item[:2] > best[0][:2]:
+        heapq.heapreplace(best, item)
+
+
+def _set_bits(mask: int, size: int) -> Iterator[int]:
+    """Yields the positions of the bits set in `mask`, lowest first."""
+    data = mask.to_bytes((size + 7) // 8, "little")
+    for i in compress(range(len(data)), data):
+        byte = data[i]
+        while byte:
+            low = byte & -byte
+            yield i * 8 + low.bit_length() - 1
+            byte ^= low
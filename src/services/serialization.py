@@ -0,0 +1,32 @@
+import json
+import uuid
+from dataclasses import fields
+from enum import Enum
+from typing import Any, Dict
+
+
+def to_jsonable(obj: Any) -> Dict[str, Any]:
+    """Converts a domain dataclass into a JSON-compatible dict, field by field."""
+    result = {}
+    for f in fields(obj):
+        value = getattr(obj, f.name)
+        if isinstance(value, uuid.UUID):
+            value = str(value)
+        elif isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, list):
+            value = list(value)
+        elif hasattr(value, "isoformat"):
+            value = value.isoformat()
+        result[f.name] = value
+    return result
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Encodes a JSON-compatible structure to compact UTF-8 bytes. Domain
+    dataclasses nested anywhere in it are converted with `to_jsonable`.
+    """
+    return json.dumps(
+        obj, ensure_ascii=False, separators=(",", ":"), default=to_jsonable
+    ).encode()
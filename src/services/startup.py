@@ -0,0 +1,99 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from typing import Callable, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+class Startup:
+    """
+    Runs the application's wiring off the event loop, so the server accepts
+    connections and answers health checks while repositories load.
+
+    `load` builds and connects every component; `warm_up` then fills caches
+    so the first requests do not pay for it. `ready` turns true once both
+    have finished; if either raises, the exception is kept in `error`.
+    """
+    def __init__(self, load: Callable[[], None], warm_up: Callable[[], None] | None = None):
+        self._load = load
+        self._warm_up = warm_up
+        self._ready = threading.Event()
+        self._started = time.perf_counter()
+        self.error: BaseException | None = None
+        self.load_seconds: float | None = None
+        self.warm_up_seconds: float | None = None
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def run(self) -> None:
+        """Loads and warms up on the calling thread, unless that already happened."""
+        if self.ready:
+            return
+        started = time.perf_counter()
+        try:
+            self._load()
+            loaded = time.perf_counter()
+            self.load_seconds = loaded - started
+            if self._warm_up is not None:
+                self._warm_up()
+            self.warm_up_seconds = time.perf_counter() - loaded
+        except BaseException as e:
+            self.error = e
+            raise
+        self._ready.set()
+        logger.info("Ready: loaded in %.2fs, warmed up in %.2fs", self.load_seconds, self.warm_up_seconds)
+
+    async def start(self) -> None:
+        """Runs `run` in a worker thread and returns when it has finished; failures are logged, not raised."""
+        if self.ready:
+            return
+        self._started = time.perf_counter()
+        try:
+            await asyncio.to_thread(self.run)
+        except Exception:
+            logger.exception("Startup failed")
+
+    def status(self) -> dict:
+        """Returns the startup state for health checks."""
+        if self.error is not None:
+            return {"status": "failed", "detail": f"{type(self.error).__name__}: {self.error}"}
+        if not self.ready:
+            return {"status": "starting", "elapsed_seconds": round(time.perf_counter() - self._started, 3)}
+        return {
+            "status": "ready",
+            "load_seconds": round(self.load_seconds, 3),
+            "warm_up_seconds": round(self.warm_up_seconds, 3),
+        }
+
+
+class ReadinessGate:
+    """
+    ASGI middleware answering 503 (with Retry-After) to every HTTP request
+    except the `exempt` paths until startup is ready, so handlers never see
+    half-wired dependencies.
+    """
+    def __init__(self, app, startup: Startup, exempt: Iterable[str] = ()):
+        self._app = app
+        self._startup = startup
+        self._exempt = frozenset(exempt)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self._startup.ready or scope["path"] in self._exempt:
+            await self._app(scope, receive, send)
+            return
+        body = json.dumps({"detail": "Service is starting.", **self._startup.status()}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 503,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", b"1"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
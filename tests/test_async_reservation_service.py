@@ -0,0 +1,69 @@
+import unittest
+import uuid
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.user import User, UserRole
+from src.repositories.async_repositories import AsyncReservationRepository
+from src.repositories.blocking_executor import BlockingExecutor
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.services.async_reservation_service import AsyncReservationService
+from src.services.reservation_service import ReservationService, BookingRequest
+from src.services.reservation_validator import ReservationValidator
+from src.exceptions.reservation import BookingConflictError
+
+class TestAsyncReservationService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        """Set up the async service on top of real in-memory components."""
+        self.reservation_repo = ReservationRepository()
+        self.caravan_repo = CaravanRepository()
+        self.user_repo = UserRepository()
+        self.sync_service = ReservationService(
+            self.reservation_repo, self.caravan_repo, self.user_repo,
+            ReservationValidator(self.reservation_repo),
+        )
+        self.guest = User(name="Guest", contact="guest@example.com", role=UserRole.GUEST)
+        self.user_repo.add(self.guest)
+        self.caravan = Caravan(host_id=uuid.uuid4(), name="A", location="Seoul", capacity=4, daily_rate=100.0)
+        self.caravan_repo.add(self.caravan)
+        self.start_date = date.today() + timedelta(days=5)
+        self.end_date = self.start_date + timedelta(days=3)
+
+    def _service(self, offload: bool) -> AsyncReservationService:
+        executor = BlockingExecutor(offload=offload)
+        return AsyncReservationService(
+            self.sync_service, AsyncReservationRepository(self.reservation_repo, executor), executor
+        )
+
+    async def test_create_reservation_inline_and_offloaded(self):
+        """Should create reservations the same way whether or not calls are offloaded."""
+        for offset, offload in ((0, False), (10, True)):
+            service = self._service(offload)
+            start = self.start_date + timedelta(days=offset)
+            reservation = await service.create_reservation(
+                self.guest.id, self.caravan.id, start, start + timedelta(days=2)
+            )
+            self.assertEqual(reservation.total_price, 200.0)
+            self.assertEqual(await service.get_by_id(reservation.id), reservation)
+        self.assertEqual(len(await service.get_for_caravan(self.caravan.id)), 2)
+
+    async def test_errors_propagate(self):
+        """Should raise the same exceptions as the synchronous service."""
+        service = self._service(offload=True)
+        await service.create_reservation(self.guest.id, self.caravan.id, self.start_date, self.end_date)
+        with self.assertRaises(BookingConflictError):
+            await service.create_reservation(self.guest.id, self.caravan.id, self.start_date, self.end_date)
+
+    async def test_bulk_creation(self):
+        """Should delegate bulk creation to the synchronous service."""
+        service = self._service(offload=False)
+        results = await service.create_reservations_bulk([
+            BookingRequest(self.guest.id, self.caravan.id, self.start_date, self.end_date),
+        ])
+        self.assertTrue(results[0].ok)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import unittest
+import uuid
+from datetime import date, timedelta
+
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.availability_calendar import AvailabilityCalendar
+from src.repositories.reservation_repository import ReservationRepository
+
+class TestAvailabilityCalendar(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a repository with a subscribed calendar and a controllable clock."""
+        self.today = date(2030, 1, 1)
+        self.calendar = AvailabilityCalendar(horizon_days=60, today=lambda: self.today)
+        self.repo = ReservationRepository()
+        self.repo.subscribe(self.calendar)
+        self.caravan_id = uuid.uuid4()
+
+    def _book(self, start, end, status=ReservationStatus.APPROVED) -> Reservation:
+        reservation = Reservation(
+            guest_id=uuid.uuid4(), caravan_id=self.caravan_id,
+            start_date=start, end_date=end, total_price=100.0, status=status,
+        )
+        self.repo.add(reservation)
+        return reservation
+
+    def test_booked_nights_are_not_free(self):
+        """Should mark every night of a booking, but not its checkout day."""
+        self._book(date(2030, 1, 10), date(2030, 1, 13))
+        self.assertTrue(self.calendar.is_free(self.caravan_id, date(2030, 1, 9)))
+        self.assertFalse(self.calendar.is_free(self.caravan_id, date(2030, 1, 12)))
+        self.assertTrue(self.calendar.is_free(self.caravan_id, date(2030, 1, 13)))
+        self.assertFalse(self.calendar.is_range_free(self.caravan_id, date(2030, 1, 5), date(2030, 1, 11)))
+        self.assertTrue(self.calendar.is_range_free(self.caravan_id, date(2030, 1, 13), date(2030, 1, 20)))
+
+    def test_cancellation_frees_nights(self):
+        """Should clear the nights of a reservation once it is cancelled."""
+        reservation = self._book(date(2030, 1, 10), date(2030, 1, 13))
+        self.repo.update_status(reservation.id, ReservationStatus.CANCELLED)
+        self.assertTrue(self.calendar.is_range_free(self.caravan_id, date(2030, 1, 10), date(2030, 1, 13)))
+
+    def test_first_free_window(self):
+        """Should skip gaps that are too short for the requested stay."""
+        self._book(date(2030, 1, 1), date(2030, 1, 5))
+        self._book(date(2030, 1, 7), date(2030, 1, 10))
+        self.assertEqual(self.calendar.first_free_window(self.caravan_id, 2), date(2030, 1, 5))
+        self.assertEqual(self.calendar.first_free_window(self.caravan_id, 3), date(2030, 1, 10))
+        self.assertIsNone(self.calendar.first_free_window(self.caravan_id, 61))
+
+    def test_month_view(self):
+        """Should report each day of the month, with None past the horizon."""
+        self._book(date(2030, 2, 27), date(2030, 3, 2))
+        view = self.calendar.month_view(self.caravan_id, 2030, 2)
+        self.assertEqual(len(view), 28)
+        self.assertEqual(view[25:], [True, False, False])
+        march = self.calendar.month_view(self.caravan_id, 2030, 3)
+        self.assertEqual(march[0], False)
+        self.assertIsNone(march[-1])  # 2030-03-31 lies beyond the 60-day horizon
+
+    def test_horizon_rolls_forward(self):
+        """Should drop past days and pick up bookings that enter the horizon."""
+        self._book(date(2030, 1, 2), date(2030, 1, 4))
+        self._book(date(2030, 3, 1), date(2030, 3, 5))  # starts beyond the horizon
+        self.today += timedelta(days=30)
+        self.assertEqual(self.calendar.origin, date(2030, 1, 31))
+        self.assertFalse(self.calendar.is_free(self.caravan_id, date(2030, 3, 1)))
+        self.assertFalse(self.calendar.is_free(self.caravan_id, date(2030, 3, 4)))
+        with self.assertRaises(ValueError):
+            self.calendar.is_free(self.caravan_id, date(2030, 1, 2))
+
+class TestCalendarEndpoint(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """Load the API's dependencies once and pick one of its seeded caravans."""
+        from fastapi.testclient import TestClient
+        import api
+
+        api.startup.run()
+        cls.client = TestClient(api.app)
+        cls.caravan_id = api.caravan_repo.get_all()[0].id
+
+    def test_out_of_range_year_is_a_bad_request(self):
+        """Should answer 400 rather than 500 for years a date cannot hold."""
+        for year in (0, 10000):
+            with self.subTest(year=year):
+                response = self.client.get(f"/api/caravans/{self.caravan_id}/calendar?year={year}&month=1")
+                self.assertEqual(response.status_code, 400)
+        response = self.client.get(f"/api/caravans/{self.caravan_id}/calendar?year=2030&month=1")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()["available"]), 31)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import unittest
+import uuid
+from datetime import date, timedelta
+
+from src.services.availability_service import AvailabilityService
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.models.caravan import Caravan, CaravanStatus
+from src.models.reservation import Reservation, ReservationStatus
+from src.exceptions.reservation import InvalidDateError
+
+class TestAvailabilityService(unittest.TestCase):
+
+    def setUp(self):
+        """Set up in-memory repositories with a small fleet for each test."""
+        self.caravan_repo = CaravanRepository()
+        self.reservation_repo = ReservationRepository()
+        self.service = AvailabilityService(self.caravan_repo, self.reservation_repo)
+
+        host_id = uuid.uuid4()
+        self.seoul_small = Caravan(host_id=host_id, name="Small", location="Seoul", capacity=2, daily_rate=80.0)
+        self.seoul_large = Caravan(host_id=host_id, name="Large", location="Seoul", capacity=6, daily_rate=200.0)
+        self.busan = Caravan(host_id=host_id, name="Coast", location="Busan", capacity=4, daily_rate=120.0)
+        for caravan in (self.seoul_small, self.seoul_large, self.busan):
+            self.caravan_repo.add(caravan)
+
+        self.start_date = date.today() + timedelta(days=10)
+        self.end_date = date.today() + timedelta(days=15)
+
+    def _book(self, caravan: Caravan, status: ReservationStatus = ReservationStatus.PENDING) -> None:
+        self.reservation_repo.add(Reservation(
+            guest_id=uuid.uuid4(),
+            caravan_id=caravan.id,
+            start_date=self.start_date + timedelta(days=1),
+            end_date=self.start_date + timedelta(days=3),
+            total_price=200.0,
+            status=status,
+        ))
+
+    def test_excludes_booked_caravans(self):
+        """Should only return caravans without an overlapping active reservation."""
+        self._book(self.seoul_small)
+        self._book(self.busan, status=ReservationStatus.CANCELLED)
+        result = self.service.find_available_caravans(self.start_date, self.end_date)
+        self.assertEqual(result, [self.seoul_large, self.busan])
+
+    def test_applies_location_and_capacity_filters(self):
+        """Should filter candidates by location and minimum capacity."""
+        result = self.service.find_available_caravans(
+            self.start_date, self.end_date, location="Seoul", min_capacity=4
+        )
+        self.assertEqual(result, [self.seoul_large])
+
+    def test_excludes_caravans_not_available_for_booking(self):
+        """Should skip caravans whose status is not AVAILABLE."""
+        self.caravan_repo.update_status(self.busan.id, CaravanStatus.MAINTENANCE)
+        result = self.service.find_available_caravans(self.start_date, self.end_date, location="Busan")
+        self.assertEqual(result, [])
+
+    def test_invalid_date_range(self):
+        """Should raise InvalidDateError if the end date is not after the start date."""
+        with self.assertRaisesRegex(InvalidDateError, "End date must be after start date."):
+            self.service.find_available_caravans(self.end_date, self.start_date)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import uuid
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.user import User, UserRole
+from src.repositories.user_repository import UserRepository
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.sqlite.connection_pool import SQLiteConnectionPool
+from src.repositories.sqlite.user_repository import SQLiteUserRepository
+from src.repositories.sqlite.caravan_repository import SQLiteCaravanRepository
+from src.repositories.sqlite.reservation_repository import SQLiteReservationRepository
+from src.services.bulk_transfer import BulkImporter, export_records
+
+class TestBulkTransfer(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a populated source store and an empty target store."""
+        self.source = (UserRepository(), CaravanRepository(), ReservationRepository())
+        users, caravans, reservations = self.source
+        self.host = User(name="Host, \"Seoul\"", contact="host@example.com", role=UserRole.HOST, identity_verified=True)
+        self.guest = User(name="게스트", contact="guest@example.com", role=UserRole.GUEST)
+        users.add(self.host)
+        users.add(self.guest)
+        self.caravan = Caravan(
+            host_id=self.host.id, name="Camper", location="Seoul", capacity=4, daily_rate=150.0,
+            amenities=["kitchen", "wifi"], latitude=37.5, longitude=127.0,
+        )
+        caravans.add(self.caravan)
+        caravans.add(Caravan(host_id=self.host.id, name="Van", location="Busan", capacity=2, daily_rate=80.0))
+        self.base = date(2020, 1, 1)
+        for i in range(5):
+            reservations.add(self._reservation(i * 3, 2, status=ReservationStatus.COMPLETED))
+        self.target = (UserRepository(), CaravanRepository(), ReservationRepository())
+        self.importer = BulkImporter(*self.target, batch_size=2)
+
+    def _reservation(self, offset, nights, status=ReservationStatus.PENDING) -> Reservation:
+        start = self.base + timedelta(days=offset)
+        return Reservation(
+            guest_id=self.guest.id, caravan_id=self.caravan.id, start_date=start,
+            end_date=start + timedelta(days=nights), total_price=100.0 * nights, status=status,
+        )
+
+    def _export(self, entity, fmt, repo):
+        return list(export_records(entity, repo.iter_all(), fmt, chunk_size=2))
+
+    def test_round_trip_in_both_formats(self):
+        """Should reproduce every entity exactly through export and import in NDJSON and CSV."""
+        for fmt in ("ndjson", "csv"):
+            with self.subTest(fmt=fmt):
+                target = (UserRepository(), CaravanRepository(), ReservationRepository())
+                importer = BulkImporter(*target, batch_size=2)
+                for entity, source, copy in zip(("users", "caravans", "reservations"), self.source, target):
+                    text = "".join(self._export(entity, fmt, source))
+                    report = importer.import_lines(entity, fmt, text.splitlines(keepends=True))
+                    self.assertEqual((report.imported, report.rejected), (len(source.get_all()), 0))
+                    self.assertEqual(copy.get_all(), source.get_all())
+
+    def test_export_is_chunked(self):
+        """Should yield one chunk per `chunk_size` records, the CSV header in the first."""
+        chunks = self._export("reservations", "csv", self.source[2])
+        self.assertEqual(len(chunks), 3)
+        self.assertTrue(chunks[0].startswith("id,guest_id,caravan_id,start_date,end_date,total_price,status\n"))
+        self.assertEqual(sum(chunk.count("\n") for chunk in chunks), 6)
+
+    def test_rejects_invalid_lines_and_keeps_going(self):
+        """Should report bad records with their line number and import the rest."""
+        users = [
+            json.dumps({"name": "A", "contact": "a@example.com", "role": "guest"}),
+            "{not json",
+            json.dumps({"name": "B", "role": "guest"}),
+            "",
+            json.dumps({"name": "C", "contact": "c@example.com", "role": "admin"}),
+            json.dumps({"id": str(self.guest.id), "name": "D", "contact": "d@example.com", "role": "guest"}),
+            json.dumps({"id": str(self.guest.id), "name": "D", "contact": "d@example.com", "role": "guest"}),
+        ]
+        report = self.importer.import_lines("users", "ndjson", users)
+        self.assertEqual((report.imported, report.rejected), (2, 4))
+        self.assertEqual([line for line, _ in report.errors], [2, 3, 5, 7])
+        self.assertIn("contact", report.errors[1][1])
+        self.assertIn("already exists", report.errors[3][1])
+
+    def test_rejects_non_finite_numbers(self):
+        """Should reject NaN and infinite rates, prices and coordinates with their line number."""
+        self.target[0].add(self.host)
+        host_id = self.host.id
+        lines = [
+            "id,host_id,name,location,capacity,daily_rate,latitude,longitude\n",
+            f",{host_id},A,Seoul,4,100,,\n",
+            f",{host_id},B,Seoul,4,nan,,\n",
+            f",{host_id},C,Seoul,4,inf,,\n",
+            f",{host_id},D,Seoul,4,50,nan,127.0\n",
+        ]
+        report = self.importer.import_lines("caravans", "csv", lines)
+        self.assertEqual((report.imported, report.rejected), (1, 3))
+        self.assertEqual([line for line, _ in report.errors], [3, 4, 5])
+        self.assertIn("daily_rate", report.errors[0][1])
+        self.assertEqual([c.daily_rate for c in self.target[1].query(min_daily_rate=60, max_daily_rate=160)], [100.0])
+
+        self.target[0].add(self.guest)
+        self.target[1].add(self.caravan)
+        reservation = self._reservation(0, 2)
+        record = json.loads("".join(export_records("reservations", [reservation], "ndjson")))
+        record["total_price"] = float("nan")
+        report = self.importer.import_lines("reservations", "ndjson", [json.dumps(record)])
+        self.assertEqual(report.rejected, 1)
+        self.assertIn("total_price", report.errors[0][1])
+
+    def test_reservations_respect_booking_conflicts(self):
+        """Should reject overlaps with stored reservations and within the stream, across batches, but not cancelled ones."""
+        users, caravans, reservations = self.target
+        users.add(self.guest)
+        users.add(self.host)
+        caravans.add(self.caravan)
+        reservations.add(self._reservation(0, 3))
+        # The importer stores batches of two records.
+        rows = [
+            self._reservation(2, 2),                                     # overlaps the stored one
+            self._reservation(10, 4),
+            self._reservation(5, 2),
+            self._reservation(6, 1),                                     # overlaps line 4 in the same batch
+            self._reservation(11, 2, status=ReservationStatus.CANCELLED),
+            self._reservation(12, 2),                                    # overlaps line 3 from an earlier batch
+        ]
+        lines = "".join(export_records("reservations", rows, "csv")).splitlines(keepends=True)
+        report = self.importer.import_lines("reservations", "csv", lines)
+        self.assertEqual((report.imported, report.rejected), (3, 3))
+        self.assertEqual([line for line, _ in report.errors], [2, 5, 7])
+        self.assertEqual(len(reservations.get_all()), 4)
+
+    def test_reservations_need_known_guest_and_caravan(self):
+        """Should reject reservations whose guest or caravan has not been imported."""
+        self.target[0].add(self.guest)
+        unknown = Reservation(
+            guest_id=self.guest.id, caravan_id=uuid.uuid4(), start_date=self.base,
+            end_date=self.base + timedelta(days=1), total_price=10.0,
+        )
+        text = "".join(export_records("reservations", [unknown], "ndjson"))
+        report = self.importer.import_lines("reservations", "ndjson", text.splitlines())
+        self.assertEqual(report.rejected, 1)
+        self.assertIn("Caravan", report.errors[0][1])
+
+    def test_sessions_accept_a_stream_in_pieces(self):
+        """Should keep the CSV header and line numbers across feed calls."""
+        lines = "".join(self._export("users", "csv", self.source[0])).splitlines(keepends=True)
+        lines.insert(2, "not,enough\n")
+        session = self.importer.start("users", "csv")
+        for line in lines:
+            session.feed([line])
+        report = session.finish()
+        self.assertEqual((report.imported, report.rejected), (2, 1))
+        self.assertEqual(report.errors[0][0], 3)
+
+    def test_sqlite_import_and_paged_export(self):
+        """Should import into SQLite and export it back through keyset pages."""
+        tmpdir = tempfile.mkdtemp()
+        pool = SQLiteConnectionPool(os.path.join(tmpdir, "caravanshare.db"), size=2)
+        try:
+            target = (SQLiteUserRepository(pool), SQLiteCaravanRepository(pool), SQLiteReservationRepository(pool))
+            importer = BulkImporter(*target, batch_size=2)
+            for entity, source in zip(("users", "caravans", "reservations"), self.source):
+                text = "".join(self._export(entity, "ndjson", source))
+                importer.import_lines(entity, "ndjson", text.splitlines())
+            self.assertEqual(list(target[2].iter_all(batch_size=2)), self.source[2].get_all())
+        finally:
+            pool.close()
+            shutil.rmtree(tmpdir)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import json
+import unittest
+import uuid
+
+from src.services.caravan_listing_service import CaravanListingService, CaravanQuery
+from src.repositories.caravan_repository import CaravanRepository
+from src.models.caravan import Caravan, CaravanStatus
+
+class TestCaravanListingService(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a repository with a few caravans and a listing service for each test."""
+        self.repo = CaravanRepository()
+        host_id = uuid.uuid4()
+        self.caravans = [
+            Caravan(host_id=host_id, name=f"Caravan {i}", location="Seoul", capacity=4, daily_rate=100.0 + i)
+            for i in range(5)
+        ]
+        for caravan in self.caravans:
+            self.repo.add(caravan)
+        self.service = CaravanListingService(self.repo)
+
+    def test_get_page_serializes_caravans(self):
+        """Should produce the same JSON shape as the dataclass fields."""
+        page = self.service.get_page(CaravanQuery())
+        items = json.loads(page.body)
+        self.assertEqual(len(items), 5)
+        self.assertEqual(items[0]["id"], str(self.caravans[0].id))
+        self.assertEqual(items[0]["status"], "available")
+        self.assertIsNone(page.next_cursor)
+
+    def test_cursor_pagination_walks_all_pages(self):
+        """Should follow next_cursor until every caravan has been returned exactly once."""
+        names, cursor = [], None
+        while True:
+            page = self.service.get_page(CaravanQuery(), cursor, limit=2)
+            names += [item["name"] for item in json.loads(page.body)]
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual(names, [c.name for c in self.caravans])
+
+    def test_pages_are_cached_until_the_repository_changes(self):
+        """Should reuse a cached page and rebuild it after a status change."""
+        first = self.service.get_page(CaravanQuery())
+        self.assertIs(self.service.get_page(CaravanQuery()), first)
+
+        etag = self.service.etag()
+        self.repo.update_status(self.caravans[0].id, CaravanStatus.MAINTENANCE)
+        self.assertNotEqual(self.service.etag(), etag)
+
+        refreshed = self.service.get_page(CaravanQuery())
+        self.assertEqual(json.loads(refreshed.body)[0]["status"], "maintenance")
+
+    def test_stream_yields_ndjson_batches(self):
+        """Should stream every matching caravan as one JSON document per line."""
+        chunks = list(self.service.stream(CaravanQuery(), batch_size=2))
+        self.assertEqual(len(chunks), 3)
+        lines = b"".join(chunks).splitlines()
+        self.assertEqual([json.loads(line)["name"] for line in lines], [c.name for c in self.caravans])
+
+    def test_invalid_cursor(self):
+        """Should raise ValueError for a cursor that does not name a known caravan."""
+        with self.assertRaises(ValueError):
+            self.service.get_page(CaravanQuery(), cursor=str(uuid.uuid4()))
+
+    def test_limit_must_be_positive_and_is_capped(self):
+        """Should reject a limit below one and cut large limits to the maximum page size."""
+        for limit in (0, -1):
+            with self.assertRaises(ValueError):
+                self.service.get_page(CaravanQuery(), limit=limit)
+        service = CaravanListingService(self.repo, max_page_size=2)
+        page = service.get_page(CaravanQuery(), limit=1000)
+        self.assertEqual(len(json.loads(page.body)), 2)
+        self.assertIsNotNone(page.next_cursor)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import uuid
+
+from src.repositories.caravan_repository import CaravanRepository
+from src.models.caravan import Caravan, CaravanStatus
+
+class TestCaravanRepository(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a repository with a small mixed fleet for each test."""
+        self.repo = CaravanRepository()
+        host_id = uuid.uuid4()
+        specs = [
+            ("A", "Seoul", 2, 80.0),
+            ("B", "Seoul", 4, 150.0),
+            ("C", "Busan", 4, 120.0),
+            ("D", "Seoul", 6, 250.0),
+            ("E", "Busan", 8, 300.0),
+        ]
+        self.caravans = {}
+        for name, location, capacity, rate in specs:
+            caravan = Caravan(host_id=host_id, name=name, location=location, capacity=capacity, daily_rate=rate)
+            self.repo.add(caravan)
+            self.caravans[name] = caravan
+
+    def _names(self, caravans):
+        return [c.name for c in caravans]
+
+    def test_query_without_filters_returns_all_in_insertion_order(self):
+        """Should behave like get_all when no filter is given."""
+        self.assertEqual(self._names(self.repo.query()), ["A", "B", "C", "D", "E"])
+
+    def test_query_by_location(self):
+        """Should return only caravans at the given location."""
+        self.assertEqual(self._names(self.repo.query(location="Busan")), ["C", "E"])
+        self.assertEqual(self.repo.query(location="Jeju"), [])
+
+    def test_query_capacity_and_rate_ranges(self):
+        """Should apply inclusive range predicates on capacity and daily rate."""
+        self.assertEqual(self._names(self.repo.query(min_capacity=4, max_capacity=6)), ["B", "C", "D"])
+        self.assertEqual(self._names(self.repo.query(max_daily_rate=150.0)), ["A", "B", "C"])
+        self.assertEqual(
+            self._names(self.repo.query(location="Seoul", min_capacity=4, max_daily_rate=200.0)),
+            ["B"],
+        )
+
+    def test_query_pagination(self):
+        """Should apply offset and limit after filtering."""
+        self.assertEqual(self._names(self.repo.query(min_capacity=4, offset=1, limit=2)), ["C", "D"])
+        self.assertEqual(self._names(self.repo.query(min_capacity=4, offset=3)), ["E"])
+
+    def test_update_status_maintains_status_index(self):
+        """Should move the caravan between status buckets when its status changes."""
+        self.repo.update_status(self.caravans["B"].id, CaravanStatus.MAINTENANCE)
+        self.assertEqual(self.caravans["B"].status, CaravanStatus.MAINTENANCE)
+        self.assertEqual(
+            self._names(self.repo.query(location="Seoul", status=CaravanStatus.AVAILABLE)),
+            ["A", "D"],
+        )
+        self.assertEqual(self._names(self.repo.query(status=CaravanStatus.MAINTENANCE)), ["B"])
+
+    def test_update_status_unknown_caravan(self):
+        """Should raise ValueError if the caravan does not exist."""
+        with self.assertRaisesRegex(ValueError, "Caravan with ID .* not found"):
+            self.repo.update_status(uuid.uuid4(), CaravanStatus.MAINTENANCE)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import random
+import unittest
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.user import User, UserRole
+from src.models.reservation import ReservationStatus
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.services.reservation_service import ReservationService
+from src.services.reservation_validator import ReservationValidator
+from src.exceptions.reservation import BookingConflictError
+
+class TestConcurrentBooking(unittest.TestCase):
+
+    def setUp(self):
+        """Set up real in-memory components shared by all worker threads."""
+        self.user_repo = UserRepository()
+        self.caravan_repo = CaravanRepository()
+        self.reservation_repo = ReservationRepository()
+        self.service = ReservationService(
+            self.reservation_repo,
+            self.caravan_repo,
+            self.user_repo,
+            ReservationValidator(self.reservation_repo),
+        )
+        self.guest = User(name="Guest", contact="guest@example.com", role=UserRole.GUEST)
+        self.user_repo.add(self.guest)
+        host_id = uuid.uuid4()
+        self.caravans = [
+            Caravan(host_id=host_id, name=f"Caravan {i}", location="Seoul", capacity=4, daily_rate=100.0)
+            for i in range(8)
+        ]
+        for caravan in self.caravans:
+            self.caravan_repo.add(caravan)
+
+    def _attempt(self, caravan_id: uuid.UUID, start_date: date, end_date: date) -> bool:
+        try:
+            self.service.create_reservation(self.guest.id, caravan_id, start_date, end_date)
+            return True
+        except BookingConflictError:
+            return False
+
+    def test_overlapping_requests_never_double_book(self):
+        """Should accept at most one of each set of overlapping concurrent requests."""
+        rng = random.Random(7)
+        base = date.today() + timedelta(days=1)
+        requests = []
+        for _ in range(4000):
+            start = base + timedelta(days=rng.randint(0, 60))
+            requests.append((rng.choice(self.caravans).id, start, start + timedelta(days=rng.randint(1, 5))))
+
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            outcomes = list(pool.map(lambda r: self._attempt(*r), requests))
+
+        self.assertGreater(sum(outcomes), 0)
+        for caravan in self.caravans:
+            booked = sorted(
+                (r for r in self.reservation_repo.get_for_caravan(caravan.id)
+                 if r.status != ReservationStatus.CANCELLED),
+                key=lambda r: r.start_date,
+            )
+            for earlier, later in zip(booked, booked[1:]):
+                self.assertLessEqual(earlier.end_date, later.start_date,
+                                     f"Double booking on {caravan.name}")
+        self.assertEqual(sum(outcomes), sum(len(self.reservation_repo.get_for_caravan(c.id)) for c in self.caravans))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import random
+import unittest
+import uuid
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.geo import BoundingBox, GeoCircle, haversine_km
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.durable.codec import decode_caravan, encode_caravan
+from src.services.availability_service import AvailabilityService
+
+class TestGeoQueries(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a repository with caravans scattered over Korea and one without coordinates."""
+        self.repo = CaravanRepository()
+        self.host_id = uuid.uuid4()
+        rng = random.Random(3)
+        self.caravans = []
+        for i in range(500):
+            caravan = Caravan(
+                host_id=self.host_id, name=f"Van {i}", location="Korea", capacity=4, daily_rate=100.0,
+                latitude=rng.uniform(33.0, 38.6), longitude=rng.uniform(124.6, 131.0),
+            )
+            self.repo.add(caravan)
+            self.caravans.append(caravan)
+        self.repo.add(Caravan(host_id=self.host_id, name="Nowhere", location="Korea", capacity=4, daily_rate=100.0))
+
+    def test_haversine_distance(self):
+        """Should measure Seoul to Busan at about 325 km."""
+        self.assertAlmostEqual(haversine_km(37.5665, 126.9780, 35.1796, 129.0756), 325, delta=2)
+        self.assertEqual(haversine_km(10.0, 20.0, 10.0, 20.0), 0.0)
+
+    def test_radius_query_matches_brute_force(self):
+        """Should return exactly the caravans within the radius, in insertion order."""
+        for circle in (GeoCircle(37.5665, 126.9780, 50), GeoCircle(35.0, 128.0, 120), GeoCircle(0, 0, 10)):
+            expected = [c for c in self.caravans if haversine_km(circle.latitude, circle.longitude, c.latitude, c.longitude) <= circle.radius_km]
+            self.assertEqual(self.repo.query(area=circle), expected)
+
+    def test_bounding_box_query_combines_with_other_filters(self):
+        """Should intersect the box with the attribute indexes."""
+        box = BoundingBox(35.0, 126.0, 36.5, 128.5)
+        expected = [c for c in self.caravans if box.contains(c.latitude, c.longitude)]
+        self.assertEqual(self.repo.query(area=box), expected)
+        self.assertEqual(self.repo.query(area=box, location="Korea", limit=3), expected[:3])
+        self.assertEqual(self.repo.query(area=BoundingBox(-90, -180, 90, 180)), self.caravans)
+
+    def test_areas_across_the_antimeridian(self):
+        """Should wrap boxes and circles that cross longitude 180."""
+        repo = CaravanRepository()
+        east = Caravan(host_id=self.host_id, name="East", location="Fiji", capacity=2, daily_rate=50.0, latitude=-17.0, longitude=179.9)
+        west = Caravan(host_id=self.host_id, name="West", location="Fiji", capacity=2, daily_rate=50.0, latitude=-17.0, longitude=-179.9)
+        repo.add(east)
+        repo.add(west)
+        self.assertEqual(repo.query(area=BoundingBox(-18, 179, -16, -179)), [east, west])
+        self.assertEqual(repo.query(area=GeoCircle(-17.0, 180.0, 30)), [east, west])
+
+    def test_invalid_coordinates(self):
+        """Should reject out-of-range coordinates and half-given positions."""
+        with self.assertRaises(ValueError):
+            Caravan(host_id=self.host_id, name="X", location="Y", capacity=1, daily_rate=1.0, latitude=91.0, longitude=0.0)
+        with self.assertRaises(ValueError):
+            Caravan(host_id=self.host_id, name="X", location="Y", capacity=1, daily_rate=1.0, latitude=10.0)
+        with self.assertRaises(ValueError):
+            BoundingBox(10, 0, 5, 1)
+        with self.assertRaises(ValueError):
+            GeoCircle(0, 0, -1)
+
+    def test_available_caravans_nearest_first(self):
+        """Should leave out booked caravans and sort the rest by distance from the centre."""
+        reservations = ReservationRepository()
+        service = AvailabilityService(self.repo, reservations)
+        start = date.today() + timedelta(days=5)
+        circle = GeoCircle(36.0, 128.0, 80)
+        inside = self.repo.query(area=circle)
+        reservations.add(Reservation(
+            uuid.uuid4(), inside[0].id, start, start + timedelta(days=2), 200.0, status=ReservationStatus.APPROVED,
+        ))
+        found = service.find_available_caravans(start, start + timedelta(days=1), area=circle)
+        self.assertNotIn(inside[0], found)
+        self.assertEqual(set(c.id for c in found), set(c.id for c in inside[1:]))
+        distances = [circle.distance_km(c.latitude, c.longitude) for c in found]
+        self.assertEqual(distances, sorted(distances))
+
+    def test_codec_round_trips_coordinates(self):
+        """Should persist coordinates and accept records written before they existed."""
+        caravan = self.caravans[0]
+        self.assertEqual(decode_caravan(encode_caravan(caravan)), caravan)
+        legacy = {
+            "id": str(uuid.uuid4()), "host_id": str(self.host_id), "name": "Old", "location": "Seoul",
+            "capacity": 2, "daily_rate": 80.0, "amenities": [], "photos": [], "status": "available",
+        }
+        self.assertIsNone(decode_caravan(legacy).latitude)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,162 @@
+import threading
+import unittest
+from datetime import date, timedelta
+
+from src.services.idempotency_cache import IdempotencyCache
+from src.services.reservation_service import ReservationService
+from src.services.reservation_validator import ReservationValidator
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.user_repository import UserRepository
+from src.models.user import User, UserRole
+from src.models.caravan import Caravan
+from src.exceptions.reservation import BookingConflictError, IdempotencyKeyMismatchError
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+class TestIdempotencyCache(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = IdempotencyCache(ttl_seconds=60, max_entries=3, clock=self.clock)
+        self.calls = 0
+
+    def _work(self, value="done"):
+        def fn():
+            self.calls += 1
+            return value
+        return fn
+
+    def test_repeated_key_runs_once(self):
+        """A retried key should return the first result without running again."""
+        self.assertEqual(self.cache.run("k", "req", self._work("first")), "first")
+        self.assertEqual(self.cache.run("k", "req", self._work("second")), "first")
+        self.assertEqual(self.calls, 1)
+
+    def test_reused_key_with_other_request_is_rejected(self):
+        """A key should not be reusable for a different request."""
+        self.cache.run("k", "req", self._work())
+        with self.assertRaises(IdempotencyKeyMismatchError):
+            self.cache.run("k", "other", self._work())
+
+    def test_entries_expire(self):
+        """Outcomes should be forgotten after the TTL."""
+        self.cache.run("k", "req", self._work())
+        self.clock.now = 61
+        self.cache.run("k", "req", self._work())
+        self.assertEqual(self.calls, 2)
+
+    def test_size_is_bounded(self):
+        """The oldest outcomes should be evicted beyond max_entries."""
+        for key in "abcd":
+            self.cache.run(key, "req", self._work())
+        self.assertEqual(len(self.cache), 3)
+        self.cache.run("a", "req", self._work())
+        self.assertEqual(self.calls, 5)
+
+    def test_expected_errors_are_cached(self):
+        """Listed errors should be replayed; other failures should let a retry run again."""
+        def conflict():
+            self.calls += 1
+            raise BookingConflictError("taken")
+        for _ in range(2):
+            with self.assertRaises(BookingConflictError):
+                self.cache.run("k", "req", conflict)
+        self.assertEqual(self.calls, 1)
+
+        def crash():
+            self.calls += 1
+            raise RuntimeError("boom")
+        with self.assertRaises(RuntimeError):
+            self.cache.run("other", "req", crash)
+        self.cache.run("other", "req", self._work())
+        self.assertEqual(self.calls, 3)
+
+    def test_replayed_errors_do_not_grow_traceback(self):
+        """Each replay should raise a fresh copy of the stored error with its own short traceback."""
+        def conflict():
+            raise BookingConflictError("taken")
+        with self.assertRaises(BookingConflictError):
+            self.cache.run("k", "req", conflict)
+        replays = []
+        for _ in range(5):
+            with self.assertRaises(BookingConflictError) as caught:
+                self.cache.run("k", "req", conflict)
+            replays.append(caught.exception)
+        depths = []
+        for error in replays:
+            depth, tb = 0, error.__traceback__
+            while tb is not None:
+                depth, tb = depth + 1, tb.tb_next
+            depths.append(depth)
+        self.assertEqual(len(set(depths)), 1)
+        self.assertEqual(len({id(error) for error in replays}), 5)
+        self.assertEqual(str(replays[-1]), "taken")
+
+    def test_concurrent_duplicates_wait_for_first(self):
+        """Duplicates arriving while the first request runs should share its result."""
+        started, release = threading.Event(), threading.Event()
+        def slow():
+            self.calls += 1
+            started.set()
+            release.wait(5)
+            return "result"
+
+        results = []
+        first = threading.Thread(target=lambda: results.append(self.cache.run("k", "req", slow)))
+        first.start()
+        started.wait(5)
+        waiters = [
+            threading.Thread(target=lambda: results.append(self.cache.run("k", "req", slow)))
+            for _ in range(3)
+        ]
+        for waiter in waiters:
+            waiter.start()
+        release.set()
+        for thread in [first] + waiters:
+            thread.join(5)
+        self.assertEqual(results, ["result"] * 4)
+        self.assertEqual(self.calls, 1)
+
+class TestIdempotentReservation(unittest.TestCase):
+
+    def setUp(self):
+        self.user_repo, self.caravan_repo = UserRepository(), CaravanRepository()
+        self.reservation_repo = ReservationRepository()
+        self.service = ReservationService(
+            self.reservation_repo, self.caravan_repo, self.user_repo, ReservationValidator(self.reservation_repo)
+        )
+        self.guest = User(name="Guest", contact="guest@example.com", role=UserRole.GUEST)
+        self.user_repo.add(self.guest)
+        self.caravan = Caravan(host_id=self.guest.id, name="Van", location="Seoul", capacity=4, daily_rate=100.0)
+        self.caravan_repo.add(self.caravan)
+        self.start = date.today() + timedelta(days=10)
+
+    def _create(self, key, nights=2):
+        return self.service.create_reservation(
+            self.guest.id, self.caravan.id, self.start, self.start + timedelta(days=nights), idempotency_key=key
+        )
+
+    def test_retry_returns_original_reservation(self):
+        """A retry with the same key should not conflict with its own booking."""
+        first = self._create("retry-1")
+        self.assertIs(self._create("retry-1"), first)
+        self.assertEqual(len(self.reservation_repo.get_all()), 1)
+
+    def test_without_key_a_retry_conflicts(self):
+        self._create(None)
+        with self.assertRaises(BookingConflictError):
+            self._create(None)
+
+    def test_key_reused_for_other_dates(self):
+        self._create("retry-1")
+        with self.assertRaises(IdempotencyKeyMismatchError):
+            self._create("retry-1", nights=3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+import threading
+import time
+import unittest
+import uuid
+from datetime import date, timedelta
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.models.caravan import Caravan
+from src.models.user import User, UserRole
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.services.metrics import MetricsRegistry
+from src.services.profiler import RequestProfiler, StackSampler
+from src.services.request_metrics import RequestMetricsMiddleware
+from src.services.reservation_service import ReservationService
+from src.services.reservation_validator import ReservationValidator
+from src.exceptions.reservation import BookingConflictError, InvalidDateError
+
+class TestMetrics(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an instrumented reservation service."""
+        self.metrics = MetricsRegistry()
+        self.user_repo = UserRepository()
+        self.caravan_repo = CaravanRepository()
+        self.reservation_repo = ReservationRepository()
+        validator = ReservationValidator(self.reservation_repo)
+        self.metrics.instrument(validator, "reservation_validator", ["_validate_dates", "_validate_booking_conflict"])
+        self.metrics.instrument(self.reservation_repo, "reservation_repository", ["add", "find_conflict"])
+        self.service = ReservationService(self.reservation_repo, self.caravan_repo, self.user_repo, validator)
+        self.metrics.instrument(self.service, "reservation_service", ["create_reservation"])
+
+        self.guest = User(name="Guest", contact="guest@test.com", role=UserRole.GUEST)
+        self.user_repo.add(self.guest)
+        self.caravan = Caravan(host_id=uuid.uuid4(), name="Van", location="Seoul", capacity=4, daily_rate=100.0)
+        self.caravan_repo.add(self.caravan)
+        self.start = date.today() + timedelta(days=5)
+
+    def book(self, start: date, end: date):
+        return self.service.create_reservation(self.guest.id, self.caravan.id, start, end)
+
+    def duration(self, component: str, method: str):
+        return self.metrics.histogram("method_duration_seconds", "", component=component, method=method)
+
+    def test_times_instrumented_methods(self):
+        """Should record one observation per call, including calls made through other instrumented objects."""
+        self.book(self.start, self.start + timedelta(days=2))
+        self.book(self.start + timedelta(days=3), self.start + timedelta(days=4))
+        self.assertEqual(self.duration("reservation_service", "create_reservation").count, 2)
+        self.assertEqual(self.duration("reservation_validator", "validate_booking_conflict").count, 2)
+        self.assertEqual(self.duration("reservation_repository", "add").count, 2)
+        self.assertGreater(self.duration("reservation_service", "create_reservation").sum, 0)
+
+    def test_counts_errors_by_type(self):
+        """Should count each ReservationError subclass separately and re-raise it."""
+        self.book(self.start, self.start + timedelta(days=2))
+        with self.assertRaises(BookingConflictError):
+            self.book(self.start, self.start + timedelta(days=1))
+        with self.assertRaises(InvalidDateError):
+            self.book(self.start, self.start)
+        errors = lambda error: self.metrics.counter(
+            "errors_total", "", component="reservation_service", method="create_reservation", error=error,
+        ).value
+        self.assertEqual(errors("BookingConflictError"), 1)
+        self.assertEqual(errors("InvalidDateError"), 1)
+        self.assertEqual(self.duration("reservation_service", "create_reservation").count, 3)
+
+    def test_disabled_registry_records_nothing(self):
+        """Should pass calls straight through while disabled and resume when re-enabled."""
+        self.metrics.enabled = False
+        reservation = self.book(self.start, self.start + timedelta(days=2))
+        self.assertEqual(self.reservation_repo.get_by_id(reservation.id), reservation)
+        self.assertEqual(self.duration("reservation_service", "create_reservation").count, 0)
+        self.metrics.enabled = True
+        self.book(self.start + timedelta(days=3), self.start + timedelta(days=4))
+        self.assertEqual(self.duration("reservation_service", "create_reservation").count, 1)
+
+    def test_renders_prometheus_text(self):
+        """Should render cumulative buckets, sum and count with escaped labels."""
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency.", route='/a"b')
+        for value in (0.0005, 0.003, 10.0):
+            histogram.observe(value)
+        registry.counter("events_total", "Events.").inc(2)
+        lines = registry.render().splitlines()
+        self.assertIn("# TYPE caravanshare_latency_seconds histogram", lines)
+        self.assertIn('caravanshare_latency_seconds_bucket{route="/a\\"b",le="0.0005"} 1', lines)
+        self.assertIn('caravanshare_latency_seconds_bucket{route="/a\\"b",le="0.005"} 2', lines)
+        self.assertIn('caravanshare_latency_seconds_bucket{route="/a\\"b",le="+Inf"} 3', lines)
+        self.assertIn('caravanshare_latency_seconds_count{route="/a\\"b"} 3', lines)
+        self.assertIn("caravanshare_events_total 2", lines)
+        with self.assertRaises(ValueError):
+            registry.counter("latency_seconds", "Latency.")
+
+    def test_middleware_labels_requests_by_route_template(self):
+        """Should label HTTP durations by route template and status, and profile requests on demand."""
+        app = FastAPI()
+
+        @app.get("/items/{item_id}")
+        async def get_item(item_id: int):
+            return {"id": item_id}
+
+        registry = MetricsRegistry()
+        profiler = RequestProfiler()
+        app.add_middleware(RequestMetricsMiddleware, registry=registry, profiler=profiler)
+        client = TestClient(app)
+        client.get("/items/1")
+        client.get("/items/2", headers={"X-Profile": "1"})
+        client.get("/items/x")
+        client.get("/missing")
+        requests = lambda route, status: registry.histogram(
+            "http_request_duration_seconds", "", method="GET", route=route, status=status,
+        ).count
+        self.assertEqual(requests("/items/{item_id}", "200"), 2)
+        self.assertEqual(requests("/items/{item_id}", "422"), 1)
+        self.assertEqual(requests("<unmatched>", "404"), 1)
+        self.assertEqual([label for label, _ in profiler.recent], ["GET /items/{item_id}"])
+
+    def test_stack_sampler_sees_the_busy_function(self):
+        """Should collect collapsed stacks of the sampled thread."""
+        def spin_for_a_while():
+            deadline = time.perf_counter() + 0.1
+            while time.perf_counter() < deadline:
+                pass
+
+        sampler = StackSampler(threading.get_ident(), interval=0.002).start()
+        spin_for_a_while()
+        stacks = sampler.stop()
+        self.assertTrue(stacks)
+        self.assertTrue(any("spin_for_a_while" in stack.rsplit(";", 1)[-1] for stack in stacks))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import asyncio
+import unittest
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.payment import PaymentStatus
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.user import User, UserRole
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.payment_repository import PaymentRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.services.payment_gateway import FakePaymentGateway
+from src.services.payment_service import PaymentService
+from src.services.reservation_service import ReservationService
+from src.services.reservation_validator import ReservationValidator
+
+class TestPaymentService(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        """Set up a reservation service whose bookings are paid through a fake gateway."""
+        self.reservation_repo = ReservationRepository()
+        self.caravan_repo = CaravanRepository()
+        self.user_repo = UserRepository()
+        self.service = ReservationService(
+            self.reservation_repo, self.caravan_repo, self.user_repo,
+            ReservationValidator(self.reservation_repo),
+        )
+        self.guest = User(name="Guest", contact="guest@example.com", role=UserRole.GUEST)
+        self.user_repo.add(self.guest)
+        self.caravan = Caravan(host_id=self.guest.id, name="A", location="Seoul", capacity=4, daily_rate=100.0)
+        self.caravan_repo.add(self.caravan)
+        self.start = date.today() + timedelta(days=5)
+
+        self.gateway = FakePaymentGateway()
+        self.payments = PaymentService(
+            PaymentRepository(), self.gateway, batch_size=10, batch_window=0.01, retry_delay=0.01
+        )
+        self.reservation_repo.subscribe(self.payments)
+
+    async def asyncTearDown(self):
+        await self.payments.stop()
+
+    def _book(self, offset=0):
+        start = self.start + timedelta(days=offset * 3)
+        return self.service.create_reservation(self.guest.id, self.caravan.id, start, start + timedelta(days=2))
+
+    def _status(self, reservation):
+        return [p.status for p in self.payments.get_for_reservation(reservation.id)]
+
+    async def _settled(self):
+        """Waits until every queued and retried job has been handled."""
+        for _ in range(200):
+            await asyncio.sleep(0.01)
+            await self.payments._queue.join()
+            if not self.payments._retries and self.payments._queue.empty():
+                return
+
+    async def test_booking_creates_pending_payment_settled_later(self):
+        """Booking should only queue the charge; the background task settles it."""
+        self.gateway.latency = 0.05
+        self.payments.start()
+        reservation = self._book()
+        self.assertEqual(self._status(reservation), [PaymentStatus.PENDING])
+        await self._settled()
+        self.assertEqual(self._status(reservation), [PaymentStatus.COMPLETED])
+        self.assertEqual(self.payments.get_for_reservation(reservation.id)[0].amount, reservation.total_price)
+
+    async def test_charges_are_batched(self):
+        """Payments queued together should be settled in one gateway call."""
+        reservations = [self._book(i) for i in range(25)]
+        self.payments.start()
+        await self._settled()
+        self.assertEqual([len(batch) for batch in self.gateway.charges], [10, 10, 5])
+        self.assertTrue(all(self._status(r) == [PaymentStatus.COMPLETED] for r in reservations))
+
+    async def test_transient_failures_are_retried(self):
+        """A failed gateway call should be retried with backoff."""
+        self.gateway.failures = 2
+        self.payments.start()
+        reservation = self._book()
+        await self._settled()
+        self.assertEqual(self._status(reservation), [PaymentStatus.COMPLETED])
+        self.assertEqual(len(self.gateway.charges), 1)
+
+    async def test_gives_up_after_max_attempts(self):
+        self.gateway.failures = 10
+        self.payments.start()
+        reservation = self._book()
+        await self._settled()
+        self.assertEqual(self._status(reservation), [PaymentStatus.FAILED])
+
+    async def test_declined_payment_fails(self):
+        reservation = self._book()
+        self.gateway.declined.add(reservation.id)
+        self.payments.start()
+        await self._settled()
+        self.assertEqual(self._status(reservation), [PaymentStatus.FAILED])
+
+    async def test_cancel_before_settlement_voids_payment(self):
+        """A reservation cancelled before it was charged should never be charged."""
+        reservation = self._book()
+        self.service.cancel_reservation(reservation.id)
+        self.payments.start()
+        await self._settled()
+        self.assertEqual(self._status(reservation), [PaymentStatus.CANCELLED])
+        self.assertEqual(self.gateway.charges, [])
+
+    async def test_cancel_after_settlement_refunds(self):
+        self.payments.start()
+        reservation = self._book()
+        await self._settled()
+        self.service.cancel_reservation(reservation.id)
+        await self._settled()
+        self.assertEqual(self._status(reservation), [PaymentStatus.REFUNDED])
+        self.assertEqual(len(self.gateway.refunds), 1)
+
+    async def test_cancel_during_charge_refunds(self):
+        """A charge that succeeds after the reservation was cancelled should be refunded."""
+        self.gateway.latency = 0.05
+        self.payments.start()
+        reservation = self._book()
+        await asyncio.sleep(0.03)  # The charge is now in flight.
+        self.service.cancel_reservation(reservation.id)
+        await self._settled()
+        self.assertEqual(self._status(reservation), [PaymentStatus.REFUNDED])
+
+    async def test_imported_history_is_not_charged(self):
+        """Reservations added in a later status (e.g. imported) should not be charged."""
+        completed = Reservation(
+            guest_id=self.guest.id, caravan_id=self.caravan.id, start_date=date(2020, 1, 1),
+            end_date=date(2020, 1, 3), total_price=200.0, status=ReservationStatus.COMPLETED,
+        )
+        self.reservation_repo.add(completed)
+        self.payments.start()
+        await self._settled()
+        self.assertEqual(self._status(completed), [])
+        self.assertEqual(self.gateway.charges, [])
+
+if __name__ == '__main__':
+    unittest.main()
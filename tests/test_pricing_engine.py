@@ -0,0 +1,85 @@
+import unittest
+import uuid
+from datetime import date
+
+from src.models.caravan import Caravan
+from src.services.pricing_engine import (
+    PricingEngine, WeekendMultiplier, SeasonalMultiplier, LengthOfStayDiscount, LocationSurcharge, rules_from_config,
+)
+from src.exceptions.reservation import InvalidDateError
+
+class TestPricingEngine(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a caravan with a round daily rate."""
+        self.caravan = Caravan(host_id=uuid.uuid4(), name="C", location="Seoul", capacity=4, daily_rate=100.0)
+
+    def test_without_rules_uses_daily_rate(self):
+        """Should charge the daily rate for every night when no rules are configured."""
+        quote = PricingEngine().quote(self.caravan, date(2030, 1, 1), date(2030, 1, 4))
+        self.assertEqual(quote.nightly_prices, (100.0, 100.0, 100.0))
+        self.assertEqual(quote.total_price, 300.0)
+
+    def test_weekend_multiplier(self):
+        """Should raise the price of Friday and Saturday nights only."""
+        engine = PricingEngine([WeekendMultiplier(1.5)])
+        # 2030-01-02 is a Wednesday; the stay covers Wed through the next Tuesday.
+        quote = engine.quote(self.caravan, date(2030, 1, 2), date(2030, 1, 9))
+        self.assertEqual(quote.nightly_prices, (100.0, 100.0, 150.0, 150.0, 100.0, 100.0, 100.0))
+
+    def test_seasonal_multiplier_spans_months(self):
+        """Should apply the season to the nights inside it when a stay crosses months."""
+        engine = PricingEngine([SeasonalMultiplier(frozenset({7}), 2.0)])
+        quote = engine.quote(self.caravan, date(2030, 6, 29), date(2030, 7, 2))
+        self.assertEqual(quote.nightly_prices, (100.0, 100.0, 200.0))
+
+    def test_rules_are_applied_in_order(self):
+        """Should discount long stays after adding the location surcharge."""
+        engine = PricingEngine([LocationSurcharge("Seoul", 20.0), LengthOfStayDiscount(7, 0.25)])
+        self.assertEqual(engine.price(self.caravan, date(2030, 1, 1), date(2030, 1, 7)), 6 * 120.0)
+        self.assertEqual(engine.price(self.caravan, date(2030, 1, 1), date(2030, 1, 8)), 7 * 90.0)
+
+    def test_quotes_are_cached_until_rules_change(self):
+        """Should reuse cached quotes and drop them when the rule set is replaced."""
+        engine = PricingEngine()
+        first = engine.quote(self.caravan, date(2030, 1, 1), date(2030, 1, 3))
+        self.assertIs(engine.quote(self.caravan, date(2030, 1, 1), date(2030, 1, 3)), first)
+        engine.set_rules([LocationSurcharge("Seoul", 50.0)])
+        self.assertEqual(engine.quote(self.caravan, date(2030, 1, 1), date(2030, 1, 3)).total_price, 300.0)
+
+    def test_price_matches_quote_without_caching_it(self):
+        """Should return the quote's total from price() and cache only the total."""
+        engine = PricingEngine([WeekendMultiplier(1.5), LengthOfStayDiscount(7, 0.1)])
+        total = engine.price(self.caravan, date(2030, 1, 2), date(2030, 1, 12))
+        self.assertEqual(engine._cache, {})
+        self.assertEqual(total, engine.quote(self.caravan, date(2030, 1, 2), date(2030, 1, 12)).total_price)
+        with self.assertRaises(InvalidDateError):
+            engine.price(self.caravan, date(2030, 1, 1), date(2031, 1, 2), max_nights=365)
+
+    def test_rules_from_config(self):
+        """Should build rules in order from plain records and reject unknown ones."""
+        rules = rules_from_config([
+            {"rule": "seasonal", "months": [7, 8], "multiplier": 1.3},
+            {"rule": "length_of_stay", "min_nights": 7, "discount": 0.1},
+        ])
+        self.assertEqual(rules, [SeasonalMultiplier(frozenset({7, 8}), 1.3), LengthOfStayDiscount(7, 0.1)])
+        with self.assertRaises(ValueError):
+            rules_from_config([{"rule": "surge", "multiplier": 2.0}])
+        with self.assertRaises(ValueError):
+            rules_from_config([{"rule": "weekend", "factor": 2.0}])
+
+    def test_invalid_range(self):
+        """Should raise InvalidDateError if the end date is not after the start date."""
+        with self.assertRaises(InvalidDateError):
+            PricingEngine().quote(self.caravan, date(2030, 1, 3), date(2030, 1, 3))
+
+    def test_max_nights(self):
+        """Should quote stays up to `max_nights` and raise InvalidDateError beyond it."""
+        engine = PricingEngine()
+        quote = engine.quote(self.caravan, date(2030, 1, 1), date(2030, 1, 31), max_nights=30)
+        self.assertEqual(len(quote.nightly_prices), 30)
+        with self.assertRaises(InvalidDateError):
+            engine.quote(self.caravan, date(2030, 1, 1), date(9999, 12, 31), max_nights=30)
+
+if __name__ == '__main__':
+    unittest.main()
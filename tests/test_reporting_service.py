@@ -0,0 +1,95 @@
+import random
+import unittest
+import uuid
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation, ReservationStatus
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.columnar_store import ColumnarReservationStore
+from src.repositories.reservation_repository import ReservationRepository
+from src.services.reporting_service import ReportingService
+from src.exceptions.reservation import InvalidDateError
+
+class TestReportingService(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a repository with a subscribed columnar store and two caravans."""
+        self.caravan_repo = CaravanRepository()
+        self.reservation_repo = ReservationRepository()
+        self.store = ColumnarReservationStore()
+        self.reservation_repo.subscribe(self.store)
+        self.service = ReportingService(self.store, self.caravan_repo)
+
+        self.host_a, self.host_b = uuid.uuid4(), uuid.uuid4()
+        self.seoul = Caravan(host_id=self.host_a, name="A", location="Seoul", capacity=4, daily_rate=100.0)
+        self.busan = Caravan(host_id=self.host_b, name="B", location="Busan", capacity=4, daily_rate=50.0)
+        self.caravan_repo.add(self.seoul)
+        self.caravan_repo.add(self.busan)
+
+    def _book(self, caravan, start, end, status=ReservationStatus.APPROVED) -> Reservation:
+        reservation = Reservation(
+            guest_id=uuid.uuid4(), caravan_id=caravan.id, start_date=start, end_date=end,
+            total_price=(end - start).days * caravan.daily_rate, status=status,
+        )
+        self.reservation_repo.add(reservation)
+        return reservation
+
+    def test_occupancy_rates_clip_to_range(self):
+        """Should count only the nights inside the range, for every caravan."""
+        self._book(self.seoul, date(2030, 1, 28), date(2030, 2, 3))  # 3 nights in January
+        self._book(self.seoul, date(2030, 1, 10), date(2030, 1, 13))
+        rates = self.service.occupancy_rates(date(2030, 1, 1), date(2030, 2, 1))
+        self.assertAlmostEqual(rates[self.seoul.id], 7 / 31)
+        self.assertEqual(rates[self.busan.id], 0.0)
+
+    def test_monthly_occupancy(self):
+        """Should split occupied nights by calendar month."""
+        self._book(self.seoul, date(2030, 1, 28), date(2030, 2, 3))
+        monthly = self.service.monthly_occupancy(date(2030, 1, 1), date(2030, 3, 1))
+        self.assertEqual(monthly[self.seoul.id], {"2030-01": 4, "2030-02": 2})
+
+    def test_monthly_occupancy_matches_per_month_counts(self):
+        """Should agree with counting each month separately, for stays clipped by the range and spanning months."""
+        rng = random.Random(3)
+        caravans = [self.seoul, self.busan]
+        for _ in range(200):
+            caravan = rng.choice(caravans)
+            start = date(2029, 11, 1) + timedelta(days=rng.randint(0, 200))
+            end = start + timedelta(days=rng.randint(1, 70))
+            if not self.reservation_repo.find_conflict(caravan.id, start, end):
+                self._book(caravan, start, end)
+        start, end = date(2029, 12, 15), date(2030, 4, 10)
+        monthly = self.store.occupied_nights_by_month(start, end)
+        month_starts = [start, date(2030, 1, 1), date(2030, 2, 1), date(2030, 3, 1), date(2030, 4, 1), end]
+        for month_start, month_end in zip(month_starts, month_starts[1:]):
+            key = f"{month_start.year:04d}-{month_start.month:02d}"
+            for caravan_id, nights in self.store.occupied_nights(month_start, month_end).items():
+                self.assertEqual(monthly[caravan_id][key], nights)
+        self.assertEqual(
+            sum(sum(months.values()) for months in monthly.values()),
+            sum(self.store.occupied_nights(start, end).values()),
+        )
+
+    def test_status_changes_are_reflected(self):
+        """Should drop a reservation from reports once it is cancelled."""
+        reservation = self._book(self.busan, date(2030, 1, 5), date(2030, 1, 9))
+        self.assertEqual(self.service.revenue_by_location(date(2030, 1, 1), date(2030, 2, 1)), {"Busan": 200.0})
+        self.reservation_repo.update_status(reservation.id, ReservationStatus.CANCELLED)
+        self.assertEqual(self.service.revenue_by_location(date(2030, 1, 1), date(2030, 2, 1)), {})
+
+    def test_host_payouts_prorate_and_deduct_commission(self):
+        """Should spread revenue over nights and apply the commission."""
+        self._book(self.seoul, date(2030, 1, 30), date(2030, 2, 3))  # 2 of 4 nights in January
+        self._book(self.busan, date(2030, 1, 5), date(2030, 1, 7))
+        payouts = self.service.host_payouts(date(2030, 1, 1), date(2030, 2, 1), commission_rate=0.1)
+        self.assertAlmostEqual(payouts[self.host_a], 200.0 * 0.9)
+        self.assertAlmostEqual(payouts[self.host_b], 100.0 * 0.9)
+
+    def test_invalid_range(self):
+        """Should raise InvalidDateError if the end date is not after the start date."""
+        with self.assertRaises(InvalidDateError):
+            self.service.occupancy_rates(date(2030, 2, 1), date(2030, 1, 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import os
+import shutil
+import stat
+import tempfile
+import unittest
+from datetime import date, timedelta
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+
+from src.models.caravan import Caravan
+from src.models.reservation import ReservationStatus
+from src.models.user import User, UserRole
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.replication import EventPublisher, ReplicaFeed
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_repository import UserRepository
+from src.repositories.user_reservation_index import UserReservationIndex
+from src.services.remote_reservation_service import RemoteReservationService
+from src.services.reservation_owner import ReservationOwner, load_or_create_authkey
+from src.services.reservation_service import ReservationService
+from src.services.reservation_validator import ReservationValidator
+from src.exceptions.reservation import BookingConflictError, InvalidStatusTransitionError
+
+class TestReservationOwner(unittest.TestCase):
+
+    def setUp(self):
+        """Start an owner with some state, and connect two worker replicas to it."""
+        self.directory = tempfile.mkdtemp()
+        self.address = os.path.join(self.directory, "owner.sock")
+        self.authkey = load_or_create_authkey(self.address + ".key")
+
+        user_repo, caravan_repo, reservation_repo = UserRepository(), CaravanRepository(), ReservationRepository()
+        self.host = User(name="Host", contact="host@example.com", role=UserRole.HOST)
+        self.guest = User(name="Guest", contact="guest@example.com", role=UserRole.GUEST)
+        user_repo.add(self.host)
+        user_repo.add(self.guest)
+        self.caravan = Caravan(host_id=self.host.id, name="Van", location="Seoul", capacity=4, daily_rate=100.0)
+        caravan_repo.add(self.caravan)
+
+        publisher = EventPublisher(user_repo, caravan_repo, reservation_repo)
+        for repo in (user_repo, caravan_repo, reservation_repo):
+            repo.subscribe(publisher)
+        service = ReservationService(reservation_repo, caravan_repo, user_repo, ReservationValidator(reservation_repo))
+        self.owner_reservations = reservation_repo
+        self.owner = ReservationOwner(service, publisher, self.address, self.authkey)
+        self.owner.start()
+
+        self.start = date.today() + timedelta(days=10)
+        self.workers = [self._worker() for _ in range(2)]
+
+    def tearDown(self):
+        for worker in self.workers:
+            worker["service"].close()
+            worker["feed"].close()
+        self.owner.close()
+        shutil.rmtree(self.directory)
+
+    def _worker(self):
+        repos = (UserRepository(), CaravanRepository(), ReservationRepository())
+        feed = ReplicaFeed(self.address, *repos, self.authkey)
+        feed.connect()
+        index = UserReservationIndex(repos[1])
+        index.load(repos[2].get_all())
+        repos[2].subscribe(index)
+        feed.start()
+        return {
+            "repos": repos,
+            "feed": feed,
+            "index": index,
+            "service": RemoteReservationService(self.address, feed, self.authkey),
+        }
+
+    def _book(self, worker, offset=0, nights=2):
+        start = self.start + timedelta(days=offset)
+        return worker["service"].create_reservation(
+            self.guest.id, self.caravan.id, start, start + timedelta(days=nights)
+        )
+
+    def test_replica_starts_with_owner_state(self):
+        """A new replica should receive the users and caravans the owner already has."""
+        user_repo, caravan_repo, _ = self.workers[0]["repos"]
+        self.assertEqual(len(user_repo.get_all()), 2)
+        self.assertEqual(caravan_repo.get_by_id(self.caravan.id).name, "Van")
+
+    def test_write_is_visible_on_writing_worker_immediately(self):
+        """A worker should read its own write as soon as the call returns."""
+        reservation = self._book(self.workers[0])
+        _, _, reservation_repo = self.workers[0]["repos"]
+        self.assertIsNotNone(reservation_repo.get_by_id(reservation.id))
+        self.assertEqual(self.workers[0]["index"].for_guest(self.guest.id)[0].id, reservation.id)
+        self.assertIsNotNone(self.owner_reservations.get_by_id(reservation.id))
+
+    def test_write_reaches_other_workers(self):
+        """Every replica should eventually apply a write made through another worker."""
+        reservation = self._book(self.workers[0])
+        other = self.workers[1]
+        self.assertTrue(other["feed"].wait_for(self.workers[0]["feed"].applied_seq, timeout=5))
+        self.assertIsNotNone(other["repos"][2].get_by_id(reservation.id))
+
+    def test_conflicting_bookings_across_workers(self):
+        """Overlapping bookings through different workers should conflict at the owner."""
+        self._book(self.workers[0])
+        with self.assertRaises(BookingConflictError):
+            self._book(self.workers[1], offset=1)
+
+    def test_status_change_replicates(self):
+        """Status transitions should run at the owner and reach the replicas."""
+        reservation = self._book(self.workers[0])
+        self.workers[1]["service"].approve_reservation(reservation.id)
+        self.assertEqual(
+            self.workers[1]["repos"][2].get_by_id(reservation.id).status, ReservationStatus.APPROVED
+        )
+        with self.assertRaises(InvalidStatusTransitionError):
+            self.workers[0]["service"].reject_reservation(reservation.id)
+
+    def test_late_replica_catches_up(self):
+        """A replica connecting after writes should see the current statuses."""
+        reservation = self._book(self.workers[0])
+        self.workers[0]["service"].cancel_reservation(reservation.id)
+        late = self._worker()
+        self.workers.append(late)
+        self.assertEqual(late["repos"][2].get_by_id(reservation.id).status, ReservationStatus.CANCELLED)
+        # The cancelled stay no longer blocks the dates.
+        self._book(late)
+
+    def test_socket_and_key_are_private(self):
+        """Only the owner's user should be able to reach the socket or read the key."""
+        self.assertEqual(stat.S_IMODE(os.stat(self.address).st_mode), 0o600)
+        self.assertEqual(stat.S_IMODE(os.stat(self.address + ".key").st_mode), 0o600)
+
+    def test_connection_without_the_key_is_refused(self):
+        """A client that does not know the authkey should never get to send a command."""
+        with self.assertRaises(AuthenticationError):
+            Client(self.address, authkey=b"not the key")
+        with self.assertRaises(ValueError):
+            ReservationOwner(None, None, self.address, b"")
+
+    def test_key_file_is_reused_and_must_be_private(self):
+        """The owner should keep an existing key and refuse one others can read."""
+        path = self.address + ".key"
+        self.assertEqual(load_or_create_authkey(path), self.authkey)
+        os.chmod(path, 0o644)
+        with self.assertRaises(PermissionError):
+            load_or_create_authkey(path)
+
+if __name__ == '__main__':
+    unittest.main()
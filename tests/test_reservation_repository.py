@@ -0,0 +1,141 @@
+import unittest
+import uuid
+from datetime import date, timedelta
+
+from src.repositories.reservation_repository import ReservationRepository
+from src.models.reservation import Reservation, ReservationStatus
+from src.exceptions.reservation import BookingConflictError, InvalidStatusTransitionError
+
+class TestReservationRepository(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an empty repository and a caravan ID for each test."""
+        self.repo = ReservationRepository()
+        self.caravan_id = uuid.uuid4()
+        self.base = date(2030, 1, 1)
+
+    def _reservation(self, start_offset: int, nights: int, **kwargs) -> Reservation:
+        start = self.base + timedelta(days=start_offset)
+        return Reservation(
+            guest_id=uuid.uuid4(),
+            caravan_id=self.caravan_id,
+            start_date=start,
+            end_date=start + timedelta(days=nights),
+            total_price=100.0 * nights,
+            **kwargs,
+        )
+
+    def test_find_conflict_detects_overlap(self):
+        """Should return the reservation that overlaps the requested dates."""
+        existing = self._reservation(10, 5)
+        self.repo.add(existing)
+        self.assertIs(self.repo.find_conflict(self.caravan_id, self.base + timedelta(days=12),
+                                              self.base + timedelta(days=20)), existing)
+        self.assertIs(self.repo.find_conflict(self.caravan_id, self.base + timedelta(days=5),
+                                              self.base + timedelta(days=11)), existing)
+
+    def test_find_conflict_allows_adjacent_ranges(self):
+        """Should treat end dates as exclusive, so back-to-back bookings do not conflict."""
+        self.repo.add(self._reservation(10, 5))
+        self.repo.add(self._reservation(20, 5))
+        self.assertIsNone(self.repo.find_conflict(self.caravan_id, self.base + timedelta(days=15),
+                                                  self.base + timedelta(days=20)))
+        self.assertIsNone(self.repo.find_conflict(self.caravan_id, self.base,
+                                                  self.base + timedelta(days=10)))
+
+    def test_find_conflict_ignores_other_caravans(self):
+        """Should only consider reservations of the requested caravan."""
+        self.repo.add(self._reservation(10, 5))
+        self.assertIsNone(self.repo.find_conflict(uuid.uuid4(), self.base + timedelta(days=10),
+                                                  self.base + timedelta(days=15)))
+
+    def test_inactive_reservations_are_not_indexed(self):
+        """Should skip cancelled and rejected reservations when they are added."""
+        self.repo.add(self._reservation(10, 5, status=ReservationStatus.CANCELLED))
+        self.repo.add(self._reservation(10, 5, status=ReservationStatus.REJECTED))
+        self.assertIsNone(self.repo.find_conflict(self.caravan_id, self.base + timedelta(days=10),
+                                                  self.base + timedelta(days=15)))
+        self.assertEqual(len(self.repo.get_for_caravan(self.caravan_id)), 2)
+
+    def test_update_status_maintains_index(self):
+        """Should remove a reservation from the index when it is cancelled, and restore it on reactivation."""
+        existing = self._reservation(10, 5)
+        self.repo.add(existing)
+        start, end = self.base + timedelta(days=11), self.base + timedelta(days=12)
+
+        self.repo.update_status(existing.id, ReservationStatus.CANCELLED)
+        self.assertEqual(existing.status, ReservationStatus.CANCELLED)
+        self.assertIsNone(self.repo.find_conflict(self.caravan_id, start, end))
+
+        self.repo.update_status(existing.id, ReservationStatus.APPROVED)
+        self.assertIs(self.repo.find_conflict(self.caravan_id, start, end), existing)
+
+    def test_reactivation_into_booked_dates_is_refused(self):
+        """Should not reactivate a cancelled reservation whose dates were booked since."""
+        cancelled = self._reservation(10, 5)
+        self.repo.add(cancelled)
+        self.repo.update_status(cancelled.id, ReservationStatus.CANCELLED)
+        later = self._reservation(12, 5)
+        self.repo.add(later)
+        self.repo.add(self._reservation(20, 2))
+
+        with self.assertRaises(BookingConflictError):
+            self.repo.update_status(cancelled.id, ReservationStatus.APPROVED)
+        self.assertEqual(cancelled.status, ReservationStatus.CANCELLED)
+        self.assertIs(self.repo.find_conflict(self.caravan_id, self.base + timedelta(days=16),
+                                              self.base + timedelta(days=18)), later)
+
+    def test_update_status_unknown_reservation(self):
+        """Should raise ValueError if the reservation does not exist."""
+        with self.assertRaisesRegex(ValueError, "Reservation with id .* not found"):
+            self.repo.update_status(uuid.uuid4(), ReservationStatus.CANCELLED)
+
+    def test_update_status_checks_expected_status(self):
+        """Should refuse the change if the current status is not an expected one."""
+        existing = self._reservation(10, 5, status=ReservationStatus.CANCELLED)
+        self.repo.add(existing)
+        with self.assertRaises(InvalidStatusTransitionError):
+            self.repo.update_status(existing.id, ReservationStatus.APPROVED, expected={ReservationStatus.PENDING})
+        self.assertEqual(existing.status, ReservationStatus.CANCELLED)
+
+    def test_transition_ended(self):
+        """Should move only the reservations in the given status that have ended."""
+        ended = self._reservation(0, 3, status=ReservationStatus.APPROVED)
+        pending = self._reservation(3, 2)
+        ongoing = self._reservation(5, 10, status=ReservationStatus.APPROVED)
+        for reservation in (ended, pending, ongoing):
+            self.repo.add(reservation)
+
+        changed = self.repo.transition_ended(
+            ReservationStatus.APPROVED, ReservationStatus.COMPLETED, self.base + timedelta(days=7)
+        )
+        self.assertEqual(changed, [ended])
+        self.assertEqual(ended.status, ReservationStatus.COMPLETED)
+        self.assertEqual(pending.status, ReservationStatus.PENDING)
+        self.assertEqual(ongoing.status, ReservationStatus.APPROVED)
+
+    def test_transition_ended_follows_status_changes(self):
+        """Should sweep reservations approved after being stored, skip cancelled ones and restored ones too."""
+        approved_later = self._reservation(0, 2)
+        cancelled = self._reservation(2, 2, status=ReservationStatus.APPROVED)
+        reapproved = self._reservation(4, 2, status=ReservationStatus.APPROVED)
+        for reservation in (approved_later, cancelled, reapproved):
+            self.repo.add(reservation)
+        self.repo.update_status(approved_later.id, ReservationStatus.APPROVED)
+        self.repo.update_status(cancelled.id, ReservationStatus.CANCELLED)
+        self.repo.update_status(reapproved.id, ReservationStatus.CANCELLED)
+        self.repo.update_status(reapproved.id, ReservationStatus.APPROVED)
+
+        ended_by = self.base + timedelta(days=10)
+        changed = self.repo.transition_ended(ReservationStatus.APPROVED, ReservationStatus.COMPLETED, ended_by)
+        self.assertEqual(changed, [approved_later, reapproved])
+        self.assertEqual(cancelled.status, ReservationStatus.CANCELLED)
+        self.assertEqual(self.repo.transition_ended(ReservationStatus.APPROVED, ReservationStatus.COMPLETED, ended_by), [])
+
+        restored = ReservationRepository()
+        ended = self._reservation(0, 1, status=ReservationStatus.APPROVED)
+        restored.restore([ended, self._reservation(20, 1, status=ReservationStatus.APPROVED)])
+        self.assertEqual(restored.transition_ended(ReservationStatus.APPROVED, ReservationStatus.COMPLETED, ended_by), [ended])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,17 +3,22 @@ from unittest.mock import Mock, MagicMock
 import uuid
 from datetime import date, timedelta
 
-from src.services.reservation_service import ReservationService
+from src.services.reservation_service import ReservationService, BookingRequest, BulkMode
+from src.services.reservation_validator import ReservationValidator
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.user_repository import UserRepository
 from src.models.user import User, UserRole
 from src.models.caravan import Caravan
-from src.models.reservation import Reservation
-from src.exceptions.reservation import BookingConflictError
+from src.models.reservation import Reservation, ReservationStatus
+from src.exceptions.reservation import BookingConflictError, InvalidDateError, InvalidStatusTransitionError
 
 class TestReservationService(unittest.TestCase):
 
     def setUp(self):
         """Set up mock components for each test."""
-        self.mock_res_repo = Mock()
+        # MagicMock so that lock_for() returns a usable context manager
+        self.mock_res_repo = MagicMock()
         self.mock_caravan_repo = Mock()
         self.mock_user_repo = Mock()
         self.mock_validator = Mock()
@@ -95,5 +100,122 @@ class TestReservationService(unittest.TestCase):
         # Verify that the 'add' method was NOT called, ensuring no reservation is saved
         self.mock_res_repo.add.assert_not_called()
 
+class TestReservationServiceBulk(unittest.TestCase):
+
+    def setUp(self):
+        """Set up real in-memory components for bulk creation tests."""
+        self.reservation_repo = ReservationRepository()
+        self.caravan_repo = CaravanRepository()
+        self.user_repo = UserRepository()
+        self.service = ReservationService(
+            self.reservation_repo, self.caravan_repo, self.user_repo,
+            ReservationValidator(self.reservation_repo),
+        )
+        self.guest = User(name="Test Guest", contact="test@guest.com", role=UserRole.GUEST)
+        self.user_repo.add(self.guest)
+        self.caravan = Caravan(host_id=uuid.uuid4(), name="A", location="Seoul", capacity=4, daily_rate=100.0)
+        self.other = Caravan(host_id=uuid.uuid4(), name="B", location="Busan", capacity=4, daily_rate=50.0)
+        self.caravan_repo.add(self.caravan)
+        self.caravan_repo.add(self.other)
+        self.base = date.today() + timedelta(days=10)
+
+    def _request(self, caravan, start_offset, nights, guest_id=None):
+        start = self.base + timedelta(days=start_offset)
+        return BookingRequest(guest_id or self.guest.id, caravan.id, start, start + timedelta(days=nights))
+
+    def test_best_effort_reports_conflicts_within_the_batch(self):
+        """Should create non-overlapping requests and report overlaps, in request order."""
+        requests = [
+            self._request(self.caravan, 5, 3),
+            self._request(self.caravan, 0, 3),
+            self._request(self.caravan, 2, 2),   # overlaps the second request
+            self._request(self.other, 2, 2),
+        ]
+        results = self.service.create_reservations_bulk(requests)
+
+        self.assertEqual([r.ok for r in results], [True, True, False, True])
+        self.assertIn("another request in this batch", results[2].error)
+        self.assertEqual(results[3].reservation.total_price, 2 * 50.0)
+        self.assertEqual(len(self.reservation_repo.get_for_caravan(self.caravan.id)), 2)
+
+    def test_conflicts_with_existing_reservations(self):
+        """Should reject requests overlapping reservations stored before the batch."""
+        existing = self._request(self.caravan, 0, 5)
+        self.service.create_reservation(existing.guest_id, existing.caravan_id, existing.start_date, existing.end_date)
+        results = self.service.create_reservations_bulk([self._request(self.caravan, 3, 1)])
+        self.assertFalse(results[0].ok)
+        self.assertIn("already booked", results[0].error)
+
+    def test_atomic_mode_creates_nothing_on_failure(self):
+        """Should store no reservation if any request in an atomic batch fails."""
+        requests = [
+            self._request(self.caravan, 0, 3),
+            self._request(self.other, 0, 3, guest_id=uuid.uuid4()),
+        ]
+        results = self.service.create_reservations_bulk(requests, mode=BulkMode.ATOMIC)
+
+        self.assertFalse(any(r.ok for r in results))
+        self.assertIn("Guest with ID", results[1].error)
+        self.assertIn("another request in the batch failed", results[0].error)
+        self.assertEqual(self.reservation_repo.get_for_caravan(self.caravan.id), [])
+
+    def test_over_long_booking_is_rejected(self):
+        """Should refuse a booking longer than the maximum stay before pricing it."""
+        with self.assertRaises(InvalidDateError):
+            self.service.create_reservation(self.guest.id, self.caravan.id, self.base, date(9999, 12, 31))
+        self.assertEqual(self.reservation_repo.get_for_caravan(self.caravan.id), [])
+
+class TestReservationLifecycle(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a real in-memory repository holding one pending reservation."""
+        self.reservation_repo = ReservationRepository()
+        self.service = ReservationService(
+            self.reservation_repo, CaravanRepository(), UserRepository(),
+            ReservationValidator(self.reservation_repo),
+        )
+        self.caravan_id = uuid.uuid4()
+        self.reservation = self._add(date.today() + timedelta(days=5), 3)
+
+    def _add(self, start, nights, status=ReservationStatus.PENDING) -> Reservation:
+        reservation = Reservation(
+            guest_id=uuid.uuid4(), caravan_id=self.caravan_id, start_date=start,
+            end_date=start + timedelta(days=nights), total_price=100.0 * nights, status=status,
+        )
+        self.reservation_repo.add(reservation)
+        return reservation
+
+    def test_approve_then_cancel_releases_dates(self):
+        """Should allow pending -> approved -> cancelled and free the dates."""
+        r = self.reservation
+        self.assertEqual(self.service.approve_reservation(r.id).status, ReservationStatus.APPROVED)
+        self.assertEqual(self.service.cancel_reservation(r.id).status, ReservationStatus.CANCELLED)
+        self.assertIsNone(self.reservation_repo.find_conflict(self.caravan_id, r.start_date, r.end_date))
+
+    def test_invalid_transitions_are_refused(self):
+        """Should not reject an approved reservation or reopen a cancelled one."""
+        self.service.approve_reservation(self.reservation.id)
+        with self.assertRaises(InvalidStatusTransitionError):
+            self.service.reject_reservation(self.reservation.id)
+        self.service.cancel_reservation(self.reservation.id)
+        with self.assertRaises(InvalidStatusTransitionError):
+            self.service.approve_reservation(self.reservation.id)
+
+    def test_complete_requires_ended_stay(self):
+        """Should only complete approved reservations whose end date has passed."""
+        self.service.approve_reservation(self.reservation.id)
+        with self.assertRaises(InvalidStatusTransitionError):
+            self.service.complete_reservation(self.reservation.id)
+        past = self._add(date.today() - timedelta(days=10), 3, status=ReservationStatus.APPROVED)
+        self.assertEqual(self.service.complete_reservation(past.id).status, ReservationStatus.COMPLETED)
+
+    def test_complete_past_reservations(self):
+        """Should complete every approved reservation that has ended, and nothing else."""
+        ended = [self._add(date.today() - timedelta(days=30 - i * 5), 3, status=ReservationStatus.APPROVED)
+                 for i in range(3)]
+        completed = self.service.complete_past_reservations()
+        self.assertCountEqual(completed, ended)
+        self.assertEqual(self.reservation.status, ReservationStatus.PENDING)
+
 if __name__ == '__main__':
     unittest.main()
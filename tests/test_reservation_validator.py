@@ -1,8 +1,8 @@
 import unittest
-from unittest.mock import Mock
 import uuid
 from datetime import date, timedelta
 from src.services.reservation_validator import ReservationValidator
+from src.repositories.reservation_repository import ReservationRepository
 from src.models.caravan import Caravan, CaravanStatus
 from src.models.reservation import Reservation, ReservationStatus
 from src.exceptions.reservation import (
@@ -14,9 +14,9 @@ from src.exceptions.reservation import (
 class TestReservationValidator(unittest.TestCase):
 
     def setUp(self):
-        """Set up a mock repository and validator for each test."""
-        self.mock_repo = Mock()
-        self.validator = ReservationValidator(self.mock_repo)
+        """Set up an in-memory repository and validator for each test."""
+        self.repo = ReservationRepository()
+        self.validator = ReservationValidator(self.repo)
         
         self.caravan = Caravan(
             id=uuid.uuid4(),
@@ -33,7 +33,6 @@ class TestReservationValidator(unittest.TestCase):
 
     def test_execute_success_with_no_existing_reservations(self):
         """Should pass with valid inputs and no conflicts."""
-        self.mock_repo.get_for_caravan.return_value = []
         try:
             self.validator.execute(self.caravan, self.start_date, self.end_date)
         except Exception as e:
@@ -50,6 +49,12 @@ class TestReservationValidator(unittest.TestCase):
         with self.assertRaisesRegex(InvalidDateError, "Start date cannot be in the past."):
             self.validator.execute(self.caravan, past_date, self.start_date)
 
+    def test_validate_dates_stay_too_long(self):
+        """Should raise InvalidDateError if the stay is longer than the maximum."""
+        self.validator.execute(self.caravan, self.start_date, self.start_date + timedelta(days=365))
+        with self.assertRaisesRegex(InvalidDateError, "longer than 365 nights"):
+            self.validator.execute(self.caravan, self.start_date, date(9999, 12, 31))
+
     def test_validate_caravan_status_not_available(self):
         """Should raise CaravanNotAvailableError if caravan status is not AVAILABLE."""
         self.caravan.status = CaravanStatus.MAINTENANCE
@@ -66,7 +71,7 @@ class TestReservationValidator(unittest.TestCase):
             end_date=self.end_date - timedelta(days=1),   # Ends within the new request
             total_price=200.0,
         )
-        self.mock_repo.get_for_caravan.return_value = [existing_reservation]
+        self.repo.add(existing_reservation)
         
         with self.assertRaisesRegex(BookingConflictError, "Caravan is already booked"):
             self.validator.execute(self.caravan, self.start_date, self.end_date)
@@ -82,7 +87,7 @@ class TestReservationValidator(unittest.TestCase):
             total_price=200.0,
             status=ReservationStatus.CANCELLED,
         )
-        self.mock_repo.get_for_caravan.return_value = [cancelled_reservation]
+        self.repo.add(cancelled_reservation)
         
         try:
             self.validator.execute(self.caravan, self.start_date, self.end_date)
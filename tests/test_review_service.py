@@ -0,0 +1,172 @@
+import json
+import unittest
+import uuid
+from datetime import date
+
+from src.services.review_service import ReviewService
+from src.services.caravan_listing_service import CaravanListingService, CaravanQuery
+from src.repositories.review_repository import ReviewRepository
+from src.repositories.rating_index import RatingIndex
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.review import Review
+from src.exceptions.review import ReviewNotAllowedError, DuplicateReviewError
+
+class TestReviewService(unittest.TestCase):
+
+    def setUp(self):
+        """Set up one host with two caravans, and a review service with its rating index."""
+        self.caravan_repo = CaravanRepository()
+        self.reservation_repo = ReservationRepository()
+        self.review_repo = ReviewRepository()
+        self.ratings = RatingIndex(self.caravan_repo)
+        self.review_repo.subscribe(self.ratings)
+        self.service = ReviewService(self.review_repo, self.reservation_repo, self.ratings)
+
+        self.host_id = uuid.uuid4()
+        self.guest_id = uuid.uuid4()
+        self.caravans = [
+            Caravan(host_id=self.host_id, name=f"Caravan {i}", location="Seoul", capacity=4, daily_rate=100.0)
+            for i in range(3)
+        ]
+        for caravan in self.caravans:
+            self.caravan_repo.add(caravan)
+
+    def _stay(self, caravan: Caravan, status=ReservationStatus.COMPLETED, guest_id=None) -> Reservation:
+        reservation = Reservation(
+            caravan_id=caravan.id,
+            guest_id=guest_id or self.guest_id,
+            start_date=date(2030, 1, 1),
+            end_date=date(2030, 1, 3),
+            total_price=200.0,
+            status=status,
+        )
+        self.reservation_repo.add(reservation)
+        return reservation
+
+    def _review(self, caravan: Caravan, rating: int) -> Review:
+        return self.service.review_stay(self._stay(caravan).id, self.guest_id, rating, "")
+
+    def test_summary_tracks_count_average_and_histogram(self):
+        """Should update the caravan's summary with every review."""
+        for rating in (5, 4, 4):
+            self._review(self.caravans[0], rating)
+        summary = self.service.summary(self.caravans[0].id)
+        self.assertEqual(summary.count, 3)
+        self.assertEqual(summary.average, 4.33)
+        self.assertEqual(summary.histogram, (0, 0, 0, 2, 1))
+        self.assertIsNone(self.service.summary(self.caravans[1].id).average)
+
+    def test_host_summary_covers_all_caravans(self):
+        """Should count a review of any of the host's caravans toward the host."""
+        self._review(self.caravans[0], 5)
+        self._review(self.caravans[1], 3)
+        summary = self.service.summary(self.host_id)
+        self.assertEqual(summary.count, 2)
+        self.assertEqual(summary.average, 4.0)
+
+    def test_only_completed_stays_of_the_guest_can_be_reviewed(self):
+        """Should reject reviews of unfinished stays and of someone else's stay."""
+        pending = self._stay(self.caravans[0], ReservationStatus.PENDING)
+        with self.assertRaises(ReviewNotAllowedError):
+            self.service.review_stay(pending.id, self.guest_id, 5, "")
+        completed = self._stay(self.caravans[0])
+        with self.assertRaises(ReviewNotAllowedError):
+            self.service.review_stay(completed.id, uuid.uuid4(), 5, "")
+        with self.assertRaises(ValueError):
+            self.service.review_stay(uuid.uuid4(), self.guest_id, 5, "")
+
+    def test_stay_can_be_reviewed_once(self):
+        """Should refuse a second review of the same stay without changing the summary."""
+        reservation = self._stay(self.caravans[0])
+        self.service.review_stay(reservation.id, self.guest_id, 5, "")
+        with self.assertRaises(DuplicateReviewError):
+            self.service.review_stay(reservation.id, self.guest_id, 1, "")
+        self.assertEqual(self.service.summary(self.caravans[0].id).count, 1)
+
+    def test_list_reviews_pages_newest_first(self):
+        """Should follow next_cursor through the reviews from newest to oldest."""
+        written = [self._review(self.caravans[0], 1 + i % 5) for i in range(5)]
+        seen, cursor = [], None
+        while True:
+            page = self.service.list_reviews(self.caravans[0].id, cursor, limit=2)
+            seen += page.reviews
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual(seen, written[::-1])
+        self.assertEqual(page.summary.count, 5)
+        with self.assertRaises(ValueError):
+            self.service.list_reviews(self.caravans[1].id, str(written[0].id))
+
+    def test_rating_index_loads_existing_reviews(self):
+        """Should build the same summaries from an already populated repository."""
+        self._review(self.caravans[0], 2)
+        self._review(self.caravans[0], 4)
+        rebuilt = RatingIndex(self.caravan_repo)
+        rebuilt.load(self.review_repo.get_all())
+        self.assertEqual(rebuilt.summary(self.caravans[0].id), self.ratings.summary(self.caravans[0].id))
+        self.assertEqual(rebuilt.summary(self.host_id), self.ratings.summary(self.host_id))
+
+    def test_listing_includes_ratings_and_sorts_by_them(self):
+        """Should list caravans best rated first, unrated last, and refresh after new reviews."""
+        listing = CaravanListingService(self.caravan_repo, ratings=self.ratings)
+        listing.load(self.caravan_repo.get_all())
+        self.caravan_repo.subscribe(listing)
+        self.review_repo.subscribe(listing)
+        self._review(self.caravans[1], 5)
+        self._review(self.caravans[2], 3)
+        etag = listing.etag()
+
+        items = json.loads(listing.get_page(CaravanQuery(sort_by_rating=True)).body)
+        self.assertEqual([item["name"] for item in items], ["Caravan 1", "Caravan 2", "Caravan 0"])
+        self.assertEqual(items[0]["rating"], {"average": 5.0, "count": 1})
+        self.assertEqual(items[2]["rating"], {"average": None, "count": 0})
+
+        self._review(self.caravans[0], 5)
+        self._review(self.caravans[0], 5)
+        self.assertNotEqual(listing.etag(), etag)
+        page = listing.get_page(CaravanQuery(sort_by_rating=True), limit=1)
+        self.assertEqual(json.loads(page.body)[0]["rating"]["count"], 2)
+        rest = listing.get_page(CaravanQuery(sort_by_rating=True), page.next_cursor)
+        self.assertEqual([item["name"] for item in json.loads(rest.body)], ["Caravan 1", "Caravan 2"])
+
+    def test_rating_pages_follow_the_rating_order(self):
+        """Should page filtered and unfiltered listings in the order of a full sort, across new caravans and reviews."""
+        listing = CaravanListingService(self.caravan_repo, ratings=self.ratings)
+        listing.load(self.caravan_repo.get_all())
+        self.caravan_repo.subscribe(listing)
+        self.review_repo.subscribe(listing)
+        for i in range(12):
+            self.caravan_repo.add(Caravan(
+                host_id=self.host_id, name=f"Van {i}", location="Busan" if i % 4 else "Jeju", capacity=4, daily_rate=100.0,
+            ))
+        everything = self.caravan_repo.get_all()
+        for i, rating in enumerate((3, 5, 4, 5, 1, 3, 4, 2, 5)):
+            self._review(everything[i * 7 % len(everything)], rating)
+
+        def walk(query, limit):
+            names, cursor = [], None
+            while True:
+                page = listing.get_page(query, cursor, limit)
+                names += [item["name"] for item in json.loads(page.body)]
+                cursor = page.next_cursor
+                if cursor is None:
+                    return names
+
+        for location in (None, "Busan", "Jeju"):
+            expected = sorted(
+                (c for c in everything if location is None or c.location == location),
+                key=lambda c: self.ratings.sort_key(c.id),
+            )
+            query = CaravanQuery(location=location, sort_by_rating=True)
+            for limit in (1, 2, 5, None):
+                with self.subTest(location=location, limit=limit):
+                    self.assertEqual(walk(query, limit), [c.name for c in expected])
+        with self.assertRaises(ValueError):
+            listing.get_page(CaravanQuery(sort_by_rating=True), cursor=str(uuid.uuid4()))
+
+if __name__ == '__main__':
+    unittest.main()
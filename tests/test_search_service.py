@@ -0,0 +1,176 @@
+import random
+import unittest
+import uuid
+from datetime import date, timedelta
+
+from src.services.search_service import SearchService, SearchQuery
+from src.repositories.search_index import CaravanSearchIndex
+from src.repositories.nightly_occupancy import NightlyOccupancy
+from src.repositories.rating_index import RatingIndex
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.review_repository import ReviewRepository
+from src.models.caravan import Caravan, CaravanStatus
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.review import Review
+from src.exceptions.reservation import InvalidDateError
+
+class TestSearchService(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a search service over empty repositories with the index subscribed."""
+        self.caravan_repo = CaravanRepository()
+        self.reservation_repo = ReservationRepository()
+        self.review_repo = ReviewRepository()
+        self.ratings = RatingIndex(self.caravan_repo)
+        self.review_repo.subscribe(self.ratings)
+        self.index = CaravanSearchIndex(self.ratings)
+        self.caravan_repo.subscribe(self.index)
+        self.review_repo.subscribe(self.index)
+        self.service = SearchService(self.reservation_repo, self.index)
+        self.occupancy = NightlyOccupancy(self.index)
+        self.reservation_repo.subscribe(self.occupancy)
+        self.indexed = SearchService(self.reservation_repo, self.index, occupancy=self.occupancy)
+        self.start = date.today() + timedelta(days=10)
+
+    def _add(self, location="Seoul", capacity=4, daily_rate=100.0) -> Caravan:
+        caravan = Caravan(host_id=uuid.uuid4(), name="Van", location=location, capacity=capacity, daily_rate=daily_rate)
+        self.caravan_repo.add(caravan)
+        return caravan
+
+    def _rate(self, caravan: Caravan, rating: int) -> None:
+        self.review_repo.add(Review(uuid.uuid4(), uuid.uuid4(), caravan.id, rating, ""))
+
+    def _book(self, caravan: Caravan) -> Reservation:
+        reservation = Reservation(
+            uuid.uuid4(), caravan.id, self.start, self.start + timedelta(days=3), 300.0,
+            status=ReservationStatus.APPROVED,
+        )
+        self.reservation_repo.add(reservation)
+        return reservation
+
+    def test_ranks_by_price_rating_fit_and_availability(self):
+        """Should prefer cheaper, better rated, right-sized and free caravans."""
+        cheap = self._add(daily_rate=50.0)
+        pricey = self._add(daily_rate=400.0)
+        results = self.service.search(SearchQuery())
+        self.assertEqual([r.caravan for r in results], [cheap, pricey])
+
+        self._rate(pricey, 5)
+        self._rate(cheap, 1)
+        self.assertEqual(self.service.search(SearchQuery())[0].caravan, pricey)
+
+        self._book(pricey)
+        query = SearchQuery(start_date=self.start, end_date=self.start + timedelta(days=2))
+        self.assertEqual(self.service.search(query)[0].caravan, cheap)
+
+        small, large = self._add(capacity=2, daily_rate=75.0), self._add(capacity=8, daily_rate=75.0)
+        results = self.service.search(SearchQuery(guests=2))
+        self.assertEqual(results[0].caravan, small)
+        self.assertIn(large, [r.caravan for r in results])
+
+    def test_filters_are_hard(self):
+        """Should leave out caravans that are too small, outside the price range, elsewhere or not bookable."""
+        match = self._add(location="Busan", capacity=4, daily_rate=120.0)
+        self._add(location="Busan", capacity=2, daily_rate=120.0)
+        self._add(location="Busan", capacity=4, daily_rate=300.0)
+        self._add(location="Seoul", capacity=4, daily_rate=120.0)
+        closed = self._add(location="Busan", capacity=6, daily_rate=110.0)
+        self.caravan_repo.update_status(closed.id, CaravanStatus.MAINTENANCE)
+        query = SearchQuery(location="Busan", guests=3, min_daily_rate=100.0, max_daily_rate=200.0)
+        self.assertEqual([r.caravan for r in self.service.search(query)], [match])
+
+    def test_top_k_matches_full_sort(self):
+        """Should return exactly the k best of a brute-force ranking of the whole fleet."""
+        rng = random.Random(7)
+        for _ in range(300):
+            caravan = self._add(
+                location=rng.choice(["Seoul", "Busan"]),
+                capacity=rng.randint(2, 8),
+                daily_rate=rng.uniform(50, 400),
+            )
+            for _ in range(rng.randint(0, 2)):
+                self._rate(caravan, rng.randint(1, 5))
+            if rng.random() < 0.3:
+                self._book(caravan)
+        queries = [
+            SearchQuery(),
+            SearchQuery(guests=5, location="Busan"),
+            SearchQuery(start_date=self.start, end_date=self.start + timedelta(days=1), guests=2),
+            SearchQuery(min_daily_rate=150.0, max_daily_rate=250.0),
+        ]
+        self._assert_matches_full_sort(queries, k=10)
+
+    def test_sold_out_dates_with_occupancy(self):
+        """Should rank correctly whether the requested dates are free, sold out or nearly so."""
+        rng = random.Random(11)
+        caravans = [
+            self._add(location=rng.choice(["Seoul", "Busan"]), capacity=rng.randint(2, 8), daily_rate=rng.uniform(50, 400))
+            for _ in range(200)
+        ]
+        bookings = {caravan.id: self._book(caravan) for caravan in caravans}
+        query = SearchQuery(start_date=self.start + timedelta(days=1), end_date=self.start + timedelta(days=2))
+        self._assert_matches_full_sort([query, SearchQuery(start_date=query.start_date, end_date=query.end_date, guests=4)])
+        # A few free caravans among the booked ones, then a released booking.
+        for caravan in caravans[::40]:
+            self.reservation_repo.update_status(bookings[caravan.id].id, ReservationStatus.CANCELLED)
+        self._assert_matches_full_sort([query, SearchQuery(start_date=query.start_date, end_date=query.end_date, location="Busan")])
+        later = self.start + timedelta(days=30)
+        self._assert_matches_full_sort([SearchQuery(start_date=later, end_date=later + timedelta(days=2))])
+
+    def _assert_matches_full_sort(self, queries, k=20):
+        for service in (self.service, self.indexed):
+            for query in queries:
+                with self.subTest(occupancy=service is self.indexed, query=query):
+                    expected = sorted(
+                        (self._brute_force_score(query, c), c.id)
+                        for c in self.caravan_repo.get_all() if self._matches(query, c)
+                    )[::-1][:k]
+                    results = service.search(query, k=k)
+                    self.assertEqual([r.caravan.id for r in results], [caravan_id for _, caravan_id in expected])
+                    for result, (score, _) in zip(results, expected):
+                        self.assertAlmostEqual(result.score, score)
+
+    def _matches(self, query, caravan):
+        return (
+            (query.location is None or caravan.location == query.location)
+            and (query.guests is None or caravan.capacity >= query.guests)
+            and (query.min_daily_rate is None or caravan.daily_rate >= query.min_daily_rate)
+            and (query.max_daily_rate is None or caravan.daily_rate <= query.max_daily_rate)
+        )
+
+    def _brute_force_score(self, query, caravan):
+        weights = self.index.weights
+        summary = self.ratings.summary(caravan.id)
+        rating = summary.total / summary.count if summary.count else 3.0
+        free = query.start_date is None or self.reservation_repo.find_conflict(
+            caravan.id, query.start_date, query.end_date
+        ) is None
+        return (
+            weights.price * 150.0 / (150.0 + caravan.daily_rate)
+            + weights.rating * rating / 5
+            + weights.capacity * (min(1.0, query.guests / caravan.capacity) if query.guests else 1.0)
+            + weights.availability * free
+        )
+
+    def test_index_loads_existing_caravans(self):
+        """Should rank caravans that were added before the index was attached."""
+        repo = CaravanRepository()
+        caravan = Caravan(host_id=uuid.uuid4(), name="Van", location="Seoul", capacity=4, daily_rate=100.0)
+        repo.add(caravan)
+        index = CaravanSearchIndex()
+        index.load(repo.get_all())
+        service = SearchService(self.reservation_repo, index)
+        self.assertEqual([r.caravan for r in service.search(SearchQuery(location="Seoul"))], [caravan])
+
+    def test_invalid_queries(self):
+        """Should reject half-open or reversed date ranges and a non-positive k."""
+        with self.assertRaises(InvalidDateError):
+            self.service.search(SearchQuery(start_date=self.start))
+        with self.assertRaises(InvalidDateError):
+            self.service.search(SearchQuery(start_date=self.start, end_date=self.start))
+        with self.assertRaises(ValueError):
+            self.service.search(SearchQuery(), k=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import os
+import shutil
+import sqlite3
+import tempfile
+import unittest
+import uuid
+from unittest.mock import Mock
+from datetime import date, timedelta
+
+from src.repositories.sqlite.connection_pool import SQLiteConnectionPool
+from src.repositories.sqlite.user_repository import SQLiteUserRepository
+from src.repositories.sqlite.caravan_repository import SQLiteCaravanRepository
+from src.repositories.sqlite.reservation_repository import SQLiteReservationRepository
+from src.models.user import User, UserRole
+from src.models.caravan import Caravan, CaravanStatus
+from src.models.geo import BoundingBox, GeoCircle
+from src.models.reservation import Reservation, ReservationStatus
+from src.exceptions.reservation import BookingConflictError, InvalidStatusTransitionError
+
+class TestSQLiteRepositories(unittest.TestCase):
+
+    def setUp(self):
+        """Set up repositories on a fresh database file for each test."""
+        self.tmpdir = tempfile.mkdtemp()
+        self.path = os.path.join(self.tmpdir, "caravanshare.db")
+        self.pool = SQLiteConnectionPool(self.path, size=2)
+        self.users = SQLiteUserRepository(self.pool)
+        self.caravans = SQLiteCaravanRepository(self.pool)
+        self.reservations = SQLiteReservationRepository(self.pool)
+
+        self.host = User(name="Host", contact="host@example.com", role=UserRole.HOST)
+        self.users.add(self.host)
+        self.caravan = Caravan(
+            host_id=self.host.id, name="Camper", location="Seoul", capacity=4,
+            daily_rate=150.0, amenities=["kitchen"],
+        )
+        self.caravans.add(self.caravan)
+        self.base = date(2030, 1, 1)
+
+    def tearDown(self):
+        self.pool.close()
+        shutil.rmtree(self.tmpdir)
+
+    def _reservation(self, start_offset: int, nights: int, **kwargs) -> Reservation:
+        start = self.base + timedelta(days=start_offset)
+        return Reservation(
+            guest_id=uuid.uuid4(), caravan_id=self.caravan.id, start_date=start,
+            end_date=start + timedelta(days=nights), total_price=150.0 * nights, **kwargs,
+        )
+
+    def test_round_trips_entities(self):
+        """Should return equal objects after storing them."""
+        self.assertEqual(self.users.get_by_id(self.host.id), self.host)
+        self.assertEqual(self.caravans.get_by_id(self.caravan.id), self.caravan)
+        reservation = self._reservation(0, 3)
+        self.reservations.add(reservation)
+        self.assertEqual(self.reservations.get_by_id(reservation.id), reservation)
+        self.assertEqual(self.reservations.get_for_caravan(self.caravan.id), [reservation])
+
+    def test_duplicate_ids_are_rejected(self):
+        """Should raise ValueError like the in-memory repositories."""
+        with self.assertRaisesRegex(ValueError, "already exists"):
+            self.users.add(self.host)
+        with self.assertRaisesRegex(ValueError, "already exists"):
+            self.caravans.add(self.caravan)
+
+    def test_find_conflict_and_status_changes(self):
+        """Should detect overlaps with active reservations only."""
+        reservation = self._reservation(10, 5)
+        self.reservations.add(reservation)
+        start, end = self.base + timedelta(days=12), self.base + timedelta(days=13)
+        self.assertEqual(self.reservations.find_conflict(self.caravan.id, start, end), reservation)
+        self.assertIsNone(self.reservations.find_conflict(self.caravan.id, self.base + timedelta(days=15),
+                                                          self.base + timedelta(days=20)))
+
+        self.reservations.update_status(reservation.id, ReservationStatus.CANCELLED)
+        self.assertIsNone(self.reservations.find_conflict(self.caravan.id, start, end))
+
+    def test_reactivation_into_booked_dates_is_refused(self):
+        """Should not reactivate a cancelled reservation whose dates were booked since."""
+        cancelled = self._reservation(10, 5)
+        self.reservations.add(cancelled)
+        self.reservations.update_status(cancelled.id, ReservationStatus.CANCELLED)
+        later = self._reservation(12, 5)
+        self.reservations.add(later)
+
+        with self.assertRaises(BookingConflictError):
+            self.reservations.update_status(cancelled.id, ReservationStatus.APPROVED)
+        self.assertEqual(self.reservations.get_by_id(cancelled.id).status, ReservationStatus.CANCELLED)
+        self.assertEqual(self.reservations.find_conflict(self.caravan.id, self.base + timedelta(days=16),
+                                                         self.base + timedelta(days=18)), later)
+
+    def test_transition_ended(self):
+        """Should complete ended reservations in bulk and notify listeners."""
+        listener = Mock()
+        self.reservations.subscribe(listener)
+        ended = self._reservation(0, 3, status=ReservationStatus.APPROVED)
+        ongoing = self._reservation(5, 10, status=ReservationStatus.APPROVED)
+        self.reservations.add_many([ended, ongoing])
+
+        changed = self.reservations.transition_ended(
+            ReservationStatus.APPROVED, ReservationStatus.COMPLETED, self.base + timedelta(days=7)
+        )
+        self.assertEqual([r.id for r in changed], [ended.id])
+        self.assertEqual(self.reservations.get_by_id(ended.id).status, ReservationStatus.COMPLETED)
+        self.assertEqual(self.reservations.get_by_id(ongoing.id).status, ReservationStatus.APPROVED)
+        listener.on_reservation_status_changed.assert_called_once_with(changed[0], ReservationStatus.APPROVED)
+        with self.assertRaises(InvalidStatusTransitionError):
+            self.reservations.update_status(ended.id, ReservationStatus.CANCELLED, expected={ReservationStatus.APPROVED})
+
+    def test_add_rejects_overlapping_active_reservation(self):
+        """Should refuse to store a second active reservation over the same dates."""
+        self.reservations.add(self._reservation(10, 5))
+        with self.assertRaises(BookingConflictError):
+            self.reservations.add(self._reservation(12, 5))
+        self.reservations.add(self._reservation(12, 5, status=ReservationStatus.CANCELLED))
+        self.assertEqual(len(self.reservations.get_for_caravan(self.caravan.id)), 2)
+
+    def test_caravan_query_and_version(self):
+        """Should filter in SQL and bump the version on every change."""
+        other = Caravan(host_id=self.host.id, name="Van", location="Busan", capacity=2, daily_rate=90.0)
+        version = self.caravans.version
+        self.caravans.add(other)
+        self.assertGreater(self.caravans.version, version)
+
+        self.assertEqual(self.caravans.query(location="Busan"), [other])
+        self.assertEqual(self.caravans.query(min_capacity=3), [self.caravan])
+        self.assertEqual(self.caravans.query(after=self.caravan.id), [other])
+
+        self.caravans.update_status(other.id, CaravanStatus.MAINTENANCE)
+        self.assertEqual(self.caravans.query(status=CaravanStatus.AVAILABLE), [self.caravan])
+
+    def test_caravan_area_queries(self):
+        """Should match radius and bounding-box queries, skipping caravans without coordinates."""
+        seoul = Caravan(host_id=self.host.id, name="Seoul", location="Seoul", capacity=4, daily_rate=100.0,
+                        latitude=37.5665, longitude=126.9780)
+        busan = Caravan(host_id=self.host.id, name="Busan", location="Busan", capacity=4, daily_rate=100.0,
+                        latitude=35.1796, longitude=129.0756)
+        self.caravans.add(seoul)
+        self.caravans.add(busan)
+        self.assertEqual(self.caravans.get_by_id(seoul.id), seoul)
+        self.assertEqual(self.caravans.query(area=GeoCircle(37.45, 126.70, 30)), [seoul])
+        self.assertEqual(self.caravans.query(area=GeoCircle(37.45, 126.70, 400)), [seoul, busan])
+        self.assertEqual(self.caravans.query(area=BoundingBox(34, 128, 36, 130)), [busan])
+
+    def test_old_database_gains_position_columns(self):
+        """Should add the coordinate columns to a database created before they existed."""
+        self.pool.close()
+        path = os.path.join(self.tmpdir, "old.db")
+        conn = sqlite3.connect(path)
+        conn.executescript(
+            "CREATE TABLE caravans (seq INTEGER PRIMARY KEY, id TEXT NOT NULL UNIQUE, host_id TEXT NOT NULL,"
+            " name TEXT NOT NULL, location TEXT NOT NULL, capacity INTEGER NOT NULL, daily_rate REAL NOT NULL,"
+            " amenities TEXT NOT NULL, photos TEXT NOT NULL, status TEXT NOT NULL);"
+            f"INSERT INTO caravans VALUES (1, '{self.caravan.id}', '{self.host.id}', 'Camper', 'Seoul', 4, 150.0,"
+            " '[\"kitchen\"]', '[]', 'available');"
+        )
+        conn.close()
+        self.pool = SQLiteConnectionPool(path, size=1)
+        self.assertEqual(SQLiteCaravanRepository(self.pool).get_all(), [self.caravan])
+
+    def test_state_survives_reopening(self):
+        """Should keep stored data after the pool is closed and reopened."""
+        reservation = self._reservation(0, 2)
+        self.reservations.add(reservation)
+        self.pool.close()
+
+        self.pool = SQLiteConnectionPool(self.path, size=1)
+        self.assertEqual(SQLiteReservationRepository(self.pool).get_by_id(reservation.id), reservation)
+        self.assertEqual(SQLiteCaravanRepository(self.pool).get_all(), [self.caravan])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import asyncio
+import threading
+import unittest
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.services.startup import Startup, ReadinessGate
+
+class TestStartup(unittest.TestCase):
+
+    def test_runs_load_then_warm_up_once(self):
+        """Should load, then warm up, report ready and do nothing on later runs."""
+        calls = []
+        startup = Startup(lambda: calls.append("load"), lambda: calls.append("warm_up"))
+        self.assertFalse(startup.ready)
+        self.assertEqual(startup.status()["status"], "starting")
+        asyncio.run(startup.start())
+        startup.run()
+        self.assertTrue(startup.ready)
+        self.assertEqual(calls, ["load", "warm_up"])
+        self.assertEqual(startup.status()["status"], "ready")
+
+    def test_failure_is_reported_not_raised(self):
+        """Should keep the error and stay not ready when loading fails in the background."""
+        def load():
+            raise RuntimeError("disk unavailable")
+
+        startup = Startup(load)
+        with self.assertLogs("src.services.startup", "ERROR"):
+            asyncio.run(startup.start())
+        self.assertFalse(startup.ready)
+        self.assertIsInstance(startup.error, RuntimeError)
+        self.assertEqual(startup.status(), {"status": "failed", "detail": "RuntimeError: disk unavailable"})
+
+    def test_gate_answers_503_until_ready(self):
+        """Should reject requests except exempt paths while starting, then let everything through."""
+        release = threading.Event()
+        startup = Startup(release.wait)
+        app = FastAPI()
+
+        @app.get("/api/items")
+        async def items():
+            return []
+
+        @app.get("/health/live")
+        async def live():
+            return {"status": "ok"}
+
+        app.add_middleware(ReadinessGate, startup=startup, exempt=("/health/live",))
+        client = TestClient(app)
+        loader = threading.Thread(target=startup.run)
+        loader.start()
+        try:
+            response = client.get("/api/items")
+            self.assertEqual(response.status_code, 503)
+            self.assertEqual(response.headers["retry-after"], "1")
+            self.assertEqual(response.json()["status"], "starting")
+            self.assertEqual(client.get("/health/live").status_code, 200)
+        finally:
+            release.set()
+            loader.join()
+        self.assertEqual(client.get("/api/items").status_code, 200)
+
+if __name__ == '__main__':
+    unittest.main()
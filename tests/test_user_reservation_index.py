@@ -0,0 +1,96 @@
+import unittest
+import uuid
+from datetime import date, timedelta
+
+from src.models.caravan import Caravan
+from src.models.reservation import Reservation, ReservationStatus
+from src.models.user import User, UserRole
+from src.repositories.caravan_repository import CaravanRepository
+from src.repositories.reservation_repository import ReservationRepository
+from src.repositories.user_reservation_index import UserReservationIndex
+from src.services.reservation_listing_service import ReservationListingService
+
+class TestUserReservationIndex(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a host with two caravans and a subscribed index."""
+        self.caravan_repo = CaravanRepository()
+        self.reservation_repo = ReservationRepository()
+        self.index = UserReservationIndex(self.caravan_repo)
+        self.reservation_repo.subscribe(self.index)
+        self.service = ReservationListingService(self.index)
+
+        self.host = User(name="Host", contact="host@example.com", role=UserRole.HOST)
+        self.guest = User(name="Guest", contact="guest@example.com", role=UserRole.GUEST)
+        self.caravans = [
+            Caravan(host_id=self.host.id, name=f"C{i}", location="Seoul", capacity=4, daily_rate=100.0)
+            for i in range(2)
+        ]
+        for caravan in self.caravans:
+            self.caravan_repo.add(caravan)
+        self.base = date(2030, 1, 1)
+
+    def _book(self, caravan, start_offset, guest_id=None) -> Reservation:
+        start = self.base + timedelta(days=start_offset)
+        reservation = Reservation(
+            guest_id=guest_id or self.guest.id, caravan_id=caravan.id,
+            start_date=start, end_date=start + timedelta(days=2), total_price=200.0,
+        )
+        self.reservation_repo.add(reservation)
+        return reservation
+
+    def test_host_sees_reservations_across_caravans_in_start_order(self):
+        """Should merge the host's caravans into one list ordered by start date."""
+        later = self._book(self.caravans[0], 10)
+        earlier = self._book(self.caravans[1], 2)
+        other = self._book(self.caravans[1], 5, guest_id=uuid.uuid4())
+        self.assertEqual(self.index.for_host(self.host.id), [earlier, other, later])
+        self.assertEqual(self.index.for_guest(self.guest.id), [earlier, later])
+
+    def test_date_filters(self):
+        """Should treat start_from as inclusive and start_before as exclusive."""
+        reservations = [self._book(self.caravans[i % 2], i * 3) for i in range(5)]
+        selected = self.index.for_guest(
+            self.guest.id, start_from=self.base + timedelta(days=3), start_before=self.base + timedelta(days=9)
+        )
+        self.assertEqual(selected, reservations[1:3])
+
+    def test_pages_follow_cursor(self):
+        """Should walk every reservation exactly once, including same-day starts."""
+        reservations = [self._book(self.caravans[i % 2], (i // 2) * 3) for i in range(7)]
+        seen, cursor = [], None
+        while True:
+            page = self.service.list_for_user(self.host, cursor=cursor, limit=3)
+            seen.extend(page.reservations)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+        self.assertEqual([r.id for r in seen], [r.id for r in reservations])
+
+    def test_status_changes_are_visible(self):
+        """Should return reservations with their current status."""
+        reservation = self._book(self.caravans[0], 1)
+        self.reservation_repo.update_status(reservation.id, ReservationStatus.CANCELLED)
+        self.assertEqual(self.index.for_guest(self.guest.id)[0].status, ReservationStatus.CANCELLED)
+
+    def test_unknown_cursor(self):
+        """Should raise ValueError for a cursor that does not name a reservation."""
+        with self.assertRaises(ValueError):
+            self.service.list_for_user(self.guest, cursor=str(uuid.uuid4()))
+
+    def test_bulk_load_matches_incremental_indexing(self):
+        """Should order a bulk-loaded index like one built reservation by reservation, and merge later loads."""
+        other_guest = uuid.uuid4()
+        for i, offset in enumerate((9, 3, 3, 7, 1, 12)):
+            self._book(self.caravans[i % 2], offset, guest_id=other_guest if i % 3 == 0 else None)
+        reservations = self.reservation_repo.get_all()
+        loaded = UserReservationIndex(self.caravan_repo)
+        loaded.load(reservations[:4])
+        loaded.load(reservations[2:])
+        for user_id in (self.guest.id, other_guest):
+            self.assertEqual(loaded.for_guest(user_id), self.index.for_guest(user_id))
+        self.assertEqual(loaded.for_host(self.host.id), self.index.for_host(self.host.id))
+        self.assertEqual(len(loaded.for_host(self.host.id)), 6)
+
+if __name__ == '__main__':
+    unittest.main()